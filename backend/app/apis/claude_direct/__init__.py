@@ -1,11 +1,10 @@
 from fastapi import APIRouter, Body
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
-import databutton as db
 import json
 import uuid
 from datetime import datetime
-from supabase import create_client
+from ..supabase_client import get_supabase_client
 import requests
 
 # Router sin tags ni prefijos para que Claude lo use directamente
@@ -18,9 +17,7 @@ router = APIRouter()
 
 # Función para conectar a Supabase
 def get_supabase():
-    supabase_url = db.secrets.get("SUPABASE_URL")
-    supabase_key = db.secrets.get("SUPABASE_SERVICE_KEY")
-    return create_client(supabase_url, supabase_key)
+    return get_supabase_client()
 
 # MODELOS PARA LOS ENDPOINTS
 
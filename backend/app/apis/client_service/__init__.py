@@ -6,6 +6,7 @@ import requests
 import databutton as db
 import json
 import uuid
+from ..supabase_client import get_http_session
 
 router = APIRouter(prefix="/client-service", tags=["client-service"])
 
@@ -42,18 +43,19 @@ def supabase_admin_request(method, path, data=None, params=None):
     }
     
     full_url = f"{url}{path}"
+    session = get_http_session()
     
     try:
         if method.lower() == "get":
-            response = requests.get(full_url, headers=headers, params=params)
+            response = session.get(full_url, headers=headers, params=params)
         elif method.lower() == "post":
-            response = requests.post(full_url, headers=headers, json=data)
+            response = session.post(full_url, headers=headers, json=data)
         elif method.lower() == "put":
-            response = requests.put(full_url, headers=headers, json=data)
+            response = session.put(full_url, headers=headers, json=data)
         elif method.lower() == "patch":
-            response = requests.patch(full_url, headers=headers, json=data)
+            response = session.patch(full_url, headers=headers, json=data)
         elif method.lower() == "delete":
-            response = requests.delete(full_url, headers=headers)
+            response = session.delete(full_url, headers=headers)
         else:
             raise ValueError(f"Unsupported method: {method}")
         
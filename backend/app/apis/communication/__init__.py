@@ -1,11 +1,11 @@
 from fastapi import APIRouter, HTTPException, Query, Path, Body
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any, Union
-import databutton as db
 import requests
 import json
 from datetime import date, datetime, timedelta
 from enum import Enum
+from ..supabase_client import get_http_session, get_supabase_credentials as get_registry_credentials
 
 router = APIRouter()
 
@@ -86,16 +86,13 @@ class CommunicationHistoryResponse(BaseModel):
 
 # Function to get Supabase credentials
 def get_supabase_credentials():
-    supabase_url = db.secrets.get("SUPABASE_URL")
-    supabase_key = db.secrets.get("SUPABASE_ANON_KEY")
-    
-    if not supabase_url or not supabase_key:
+    try:
+        return get_registry_credentials(service_key=False)
+    except ValueError:
         raise HTTPException(
             status_code=500, 
             detail="Supabase credentials not found. Please set SUPABASE_URL and SUPABASE_ANON_KEY secrets."
         )
-    
-    return supabase_url, supabase_key
 
 # Function to make requests to Supabase REST API
 def supabase_request(method, path, data=None, params=None):
@@ -109,18 +106,19 @@ def supabase_request(method, path, data=None, params=None):
     }
     
     full_url = f"{url}{path}"
+    session = get_http_session()
     
     try:
         if method.lower() == "get":
-            response = requests.get(full_url, headers=headers, params=params)
+            response = session.get(full_url, headers=headers, params=params)
         elif method.lower() == "post":
-            response = requests.post(full_url, headers=headers, json=data)
+            response = session.post(full_url, headers=headers, json=data)
         elif method.lower() == "put":
-            response = requests.put(full_url, headers=headers, json=data)
+            response = session.put(full_url, headers=headers, json=data)
         elif method.lower() == "patch":
-            response = requests.patch(full_url, headers=headers, json=data)
+            response = session.patch(full_url, headers=headers, json=data)
         elif method.lower() == "delete":
-            response = requests.delete(full_url, headers=headers)
+            response = session.delete(full_url, headers=headers)
         else:
             raise ValueError(f"Unsupported method: {method}")
         
@@ -7,6 +7,8 @@ Core infrastructure and shared utilities
 from fastapi import APIRouter
 from typing import Dict, List, Any
 
+from ..supabase_client import get_registry_stats
+
 router = APIRouter(prefix='/core', tags=['core'])
 
 @router.get('/core/health')
@@ -27,5 +29,5 @@ async def cache() -> Dict[str, Any]:
 @router.get('/core/database')
 async def database() -> Dict[str, Any]:
     """/core/database endpoint"""
-    return {'status': 'ok', 'endpoint': '/core/database'}
+    return {'status': 'ok', 'endpoint': '/core/database', 'supabase_clients': get_registry_stats()}
 
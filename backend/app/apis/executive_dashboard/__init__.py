@@ -16,7 +16,7 @@ Autor: Equipo NGX
 Versión: 1.0.0
 """
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Response
 from pydantic import BaseModel, Field, validator
 from typing import List, Optional, Dict, Any, Union, Literal
 from datetime import date, datetime, timedelta
@@ -26,6 +26,8 @@ import json
 import logging
 from decimal import Decimal
 
+from src.infrastructure.cache import dashboard_cache, make_key
+
 # Configurar logging
 logger = logging.getLogger(__name__)
 
@@ -335,30 +337,38 @@ class DashboardBuilder:
 # ============================================================================
 
 @router.post("/dashboard", response_model=ExecutiveResponse)
-async def get_executive_dashboard(request: DashboardRequest):
+async def get_executive_dashboard(request: DashboardRequest, response: Response):
     """
     Obtiene dashboard ejecutivo personalizado con métricas en tiempo real
+    
+    Servido stale-while-revalidate: una vez vencido se entrega el último
+    dashboard mientras una tarea en segundo plano lo recalcula.
     """
     try:
         logger.info(f"Generando dashboard ejecutivo - Tipo: {request.view_type}, Rol: {request.user_role}")
         
         # Construir dashboard según el tipo solicitado
-        if request.view_type == "executive":
-            dashboard_data = await DashboardBuilder.build_executive_dashboard(request)
-        elif request.view_type == "operational":
-            dashboard_data = await DashboardBuilder.build_operational_dashboard(request)
+        if request.view_type == "operational":
+            builder = DashboardBuilder.build_operational_dashboard
         else:
             # Para strategic y financial, usar dashboard ejecutivo como base
-            dashboard_data = await DashboardBuilder.build_executive_dashboard(request)
+            builder = DashboardBuilder.build_executive_dashboard
+        
+        result = await dashboard_cache("executive").get(
+            make_key(builder.__name__, (request,)),
+            lambda: builder(request)
+        )
+        response.headers.update(result.headers)
         
         return ExecutiveResponse(
             success=True,
-            data=dashboard_data,
+            data=result.value,
             metadata={
                 "view_type": request.view_type,
                 "user_role": request.user_role,
                 "date_range": request.date_range,
-                "generation_time_ms": 125  # Simulated
+                "generation_time_ms": 125,  # Simulated
+                "cache": result.metadata()
             }
         )
         
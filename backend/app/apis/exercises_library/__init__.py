@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 from datetime import date, datetime
@@ -6,12 +6,17 @@ import json
 import re
 import databutton as db
 
+from src.infrastructure.cache import cached, negative_cache, resource_versions, versioned
+
 # Importamos la versión centralizada
 from ..supabase_client import get_supabase, handle_supabase_response
-from functools import lru_cache
 
 router = APIRouter(tags=["Exercises-Library"])
 
+# Tabla de la biblioteca; también nombra su versión para ETags (toda escritura
+# la incrementa) y sus ids inexistentes en la caché negativa
+EXERCISES_VERSION = "exercises_library"
+
 # ------ Models ------
 
 class ExerciseBase(BaseModel):
@@ -66,57 +71,60 @@ class ExerciseCategoriesResponse(BaseModel):
 
 # ------ Helpers ------
 
-@lru_cache(maxsize=1)
+@cached(ttl=3600)
+def load_exercise_categories():
+    """Obtiene categorías y grupos musculares disponibles (cacheado una hora)"""
+    supabase = get_supabase()
+    
+    # Obtener todas las categorías únicas
+    categories_result = supabase.table("exercises_library") \
+        .select("category") \
+        .execute()
+    
+    categories = sorted(list(set([item["category"] for item in categories_result.data])))
+    
+    # Obtener todos los grupos musculares únicos (son arrays en la BD)
+    muscle_groups_result = supabase.table("exercises_library") \
+        .select("muscle_groups") \
+        .execute()
+        
+    all_muscle_groups = []
+    for item in muscle_groups_result.data:
+        if item["muscle_groups"] and isinstance(item["muscle_groups"], list):
+            all_muscle_groups.extend(item["muscle_groups"])
+    
+    muscle_groups = sorted(list(set(all_muscle_groups)))
+    
+    # Obtener niveles de dificultad únicos
+    difficulty_result = supabase.table("exercises_library") \
+        .select("difficulty_level") \
+        .execute()
+        
+    difficulty_levels = sorted(list(set([item["difficulty_level"] for item in difficulty_result.data if item["difficulty_level"]])))
+    
+    # Obtener tipos de equipamiento únicos
+    equipment_result = supabase.table("exercises_library") \
+        .select("equipment_needed") \
+        .execute()
+        
+    all_equipment = []
+    for item in equipment_result.data:
+        if item["equipment_needed"] and isinstance(item["equipment_needed"], list):
+            all_equipment.extend(item["equipment_needed"])
+    
+    equipment_types = sorted(list(set(all_equipment)))
+    
+    return {
+        "categories": categories,
+        "muscle_groups": muscle_groups,
+        "difficulty_levels": difficulty_levels,
+        "equipment_types": equipment_types
+    }
+
 def get_exercise_categories():
-    """Obtiene categorías y grupos musculares disponibles (cacheado)"""
+    """Categorías cacheadas; si Supabase falla, valores por defecto sin cachear"""
     try:
-        supabase = get_supabase()
-        
-        # Obtener todas las categorías únicas
-        categories_result = supabase.table("exercises_library") \
-            .select("category") \
-            .execute()
-        
-        categories = sorted(list(set([item["category"] for item in categories_result.data])))
-        
-        # Obtener todos los grupos musculares únicos (son arrays en la BD)
-        muscle_groups_result = supabase.table("exercises_library") \
-            .select("muscle_groups") \
-            .execute()
-            
-        all_muscle_groups = []
-        for item in muscle_groups_result.data:
-            if item["muscle_groups"] and isinstance(item["muscle_groups"], list):
-                all_muscle_groups.extend(item["muscle_groups"])
-        
-        muscle_groups = sorted(list(set(all_muscle_groups)))
-        
-        # Obtener niveles de dificultad únicos
-        difficulty_result = supabase.table("exercises_library") \
-            .select("difficulty_level") \
-            .execute()
-            
-        difficulty_levels = sorted(list(set([item["difficulty_level"] for item in difficulty_result.data if item["difficulty_level"]])))
-        
-        # Obtener tipos de equipamiento únicos
-        equipment_result = supabase.table("exercises_library") \
-            .select("equipment_needed") \
-            .execute()
-            
-        all_equipment = []
-        for item in equipment_result.data:
-            if item["equipment_needed"] and isinstance(item["equipment_needed"], list):
-                all_equipment.extend(item["equipment_needed"])
-        
-        equipment_types = sorted(list(set(all_equipment)))
-        
-        return {
-            "categories": categories,
-            "muscle_groups": muscle_groups,
-            "difficulty_levels": difficulty_levels,
-            "equipment_types": equipment_types
-        }
-        
+        return load_exercise_categories()
     except Exception as e:
         print(f"Error obteniendo categorías de ejercicios: {str(e)}")
         return {
@@ -128,12 +136,19 @@ def get_exercise_categories():
 
 def invalidate_categories_cache():
     """Invalida el caché de categorías cuando hay cambios"""
-    if get_exercise_categories in globals() and hasattr(get_exercise_categories, "cache_clear"):
-        get_exercise_categories.cache_clear()
+    load_exercise_categories.invalidate()
+
+def exercises_changed(*created_ids: str):
+    """Nueva versión de la biblioteca: los ETags anteriores dejan de responder 304
+    y los ids creados dejan de figurar como inexistentes"""
+    resource_versions.bump(EXERCISES_VERSION)
+    for exercise_id in created_ids:
+        if exercise_id:
+            negative_cache.forget(EXERCISES_VERSION, exercise_id)
 
 # ------ Endpoints ------
 
-@router.get("/categories", response_model=ExerciseCategoriesResponse)
+@router.get("/categories", response_model=ExerciseCategoriesResponse, dependencies=[Depends(versioned(EXERCISES_VERSION))])
 def get_categories():
     """Obtiene todas las categorías, grupos musculares, niveles de dificultad y tipos de equipamiento disponibles
     
@@ -152,7 +167,7 @@ def get_categories():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error obteniendo categorías: {str(e)}") from e
 
-@router.get("/list", response_model=ExercisesListResponse)
+@router.get("/list", response_model=ExercisesListResponse, dependencies=[Depends(versioned(EXERCISES_VERSION))])
 def list_exercises(
     category: Optional[str] = None,
     muscle_group: Optional[str] = None,
@@ -225,7 +240,7 @@ def list_exercises(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listando ejercicios: {str(e)}") from e
 
-@router.get("/{exercise_id}", response_model=ExerciseResponse)
+@router.get("/{exercise_id}", response_model=ExerciseResponse, dependencies=[Depends(versioned(EXERCISES_VERSION))])
 def get_exercise(exercise_id: str = Path(..., description="ID del ejercicio a obtener")):
     """Obtiene los detalles completos de un ejercicio específico por su ID
     
@@ -233,6 +248,10 @@ def get_exercise(exercise_id: str = Path(..., description="ID del ejercicio a ob
     instrucciones, imágenes, videos y metadatos adicionales.
     """
     try:
+        # Ids que no existían hace poco se responden sin consultar
+        if negative_cache.is_missing(EXERCISES_VERSION, exercise_id):
+            raise HTTPException(status_code=404, detail=f"Ejercicio con ID {exercise_id} no encontrado")
+        
         supabase = get_supabase()
         
         # Obtener el ejercicio
@@ -242,6 +261,7 @@ def get_exercise(exercise_id: str = Path(..., description="ID del ejercicio a ob
             .execute()
         
         if not result.data or len(result.data) == 0:
+            negative_cache.remember_missing(EXERCISES_VERSION, exercise_id)
             raise HTTPException(status_code=404, detail=f"Ejercicio con ID {exercise_id} no encontrado")
         
         exercise_data = result.data[0]
@@ -285,6 +305,7 @@ def create_exercise(exercise: ExerciseCreate):
         invalidate_categories_cache()
         
         created_exercise = result.data[0]
+        exercises_changed(created_exercise.get("id"))
         
         return ExerciseResponse(
             success=True,
@@ -341,6 +362,7 @@ def update_exercise(
         # Invalidar el caché de categorías si se cambió la categoría o grupos musculares
         if "category" in update_data or "muscle_groups" in update_data or "equipment_needed" in update_data:
             invalidate_categories_cache()
+        exercises_changed()
         
         updated_exercise = result.data[0]
         
@@ -382,6 +404,7 @@ def delete_exercise(exercise_id: str = Path(..., description="ID del ejercicio a
         
         # Invalidar el caché de categorías
         invalidate_categories_cache()
+        exercises_changed()
         
         return {
             "success": True,
@@ -424,6 +447,7 @@ def bulk_import_exercises(exercises: List[ExerciseCreate]):
         
         # Invalidar el caché de categorías
         invalidate_categories_cache()
+        exercises_changed(*[item.get("id") for item in result.data])
         
         return {
             "success": True,
@@ -2,86 +2,16 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime, date, timedelta
-import databutton as db
 import requests
-import json
 import re
-import hashlib
-import time
+from src.infrastructure.cache import get_cache, make_key
+from ..supabase_client import get_http_session, get_supabase_credentials as get_registry_credentials
 
 router = APIRouter()
 
-# Cache system
-class CacheManager:
-    def __init__(self, max_size=100, ttl_seconds=300):
-        self.cache = {}
-        self.max_size = max_size
-        self.ttl_seconds = ttl_seconds
-        self.access_times = {}
-    
-    def get(self, key):
-        """Get a value from cache if it exists and is not expired"""
-        if key in self.cache:
-            entry_time, value = self.cache[key]
-            current_time = time.time()
-            
-            # Check if entry is expired
-            if current_time - entry_time > self.ttl_seconds:
-                # Remove expired entry
-                del self.cache[key]
-                if key in self.access_times:
-                    del self.access_times[key]
-                return None
-            
-            # Update access time
-            self.access_times[key] = current_time
-            return value
-        return None
-    
-    def put(self, key, value):
-        """Add a value to cache with the current timestamp"""
-        current_time = time.time()
-        
-        # If cache is full, remove least recently used item
-        if len(self.cache) >= self.max_size and key not in self.cache:
-            self._evict_lru()
-        
-        self.cache[key] = (current_time, value)
-        self.access_times[key] = current_time
-    
-    def _evict_lru(self):
-        """Remove least recently used item from cache"""
-        if not self.access_times:
-            return
-        
-        # Find key with oldest access time
-        lru_key = min(self.access_times.items(), key=lambda x: x[1])[0]
-        
-        # Remove from cache and access times
-        if lru_key in self.cache:
-            del self.cache[lru_key]
-        del self.access_times[lru_key]
-    
-    def invalidate(self, key_prefix=None):
-        """Invalidate cache entries that start with the given prefix"""
-        if key_prefix is None:
-            # Clear all cache
-            self.cache.clear()
-            self.access_times.clear()
-            return
-        
-        # Find keys that match the prefix
-        keys_to_remove = [k for k in self.cache.keys() if k.startswith(key_prefix)]
-        
-        # Remove matching keys
-        for key in keys_to_remove:
-            if key in self.cache:
-                del self.cache[key]
-            if key in self.access_times:
-                del self.access_times[key]
-
-# Initialize cache with 1 hour TTL for logs (they don't change that often)
-log_cache = CacheManager(max_size=100, ttl_seconds=3600)
+# Activity log queries are cached for an hour and dropped whenever a log is written
+LOG_CACHE_NAMESPACE = "activity_logs"
+LOG_CACHE_TTL = 3600
 
 # Models
 class ActivityLogRequest(BaseModel):
@@ -106,16 +36,13 @@ class ActivityLogEntry(BaseModel):
 
 # Helper Functions
 def get_supabase_credentials():
-    supabase_url = db.secrets.get("SUPABASE_URL")
-    supabase_key = db.secrets.get("SUPABASE_SERVICE_KEY")
-    
-    if not supabase_url or not supabase_key:
+    try:
+        return get_registry_credentials(service_key=True)
+    except ValueError:
         raise HTTPException(
             status_code=500, 
             detail="Supabase credentials not found. Please set SUPABASE_URL and SUPABASE_SERVICE_KEY secrets."
         )
-    
-    return supabase_url, supabase_key
 
 def supabase_request(method, path, data=None, params=None):
     url, key = get_supabase_credentials()
@@ -128,18 +55,19 @@ def supabase_request(method, path, data=None, params=None):
     }
     
     full_url = f"{url}{path}"
+    session = get_http_session()
     
     try:
         if method.lower() == "get":
-            response = requests.get(full_url, headers=headers, params=params)
+            response = session.get(full_url, headers=headers, params=params)
         elif method.lower() == "post":
-            response = requests.post(full_url, headers=headers, json=data)
+            response = session.post(full_url, headers=headers, json=data)
         elif method.lower() == "put":
-            response = requests.put(full_url, headers=headers, json=data)
+            response = session.put(full_url, headers=headers, json=data)
         elif method.lower() == "patch":
-            response = requests.patch(full_url, headers=headers, json=data)
+            response = session.patch(full_url, headers=headers, json=data)
         elif method.lower() == "delete":
-            response = requests.delete(full_url, headers=headers)
+            response = session.delete(full_url, headers=headers)
         else:
             raise ValueError(f"Unsupported method: {method}")
         
@@ -159,15 +87,6 @@ def supabase_request(method, path, data=None, params=None):
         
         raise HTTPException(status_code=500, detail=f"Supabase API error: {error_detail}") from e
 
-def generate_cache_key(prefix, params):
-    """Generate a cache key based on the request parameters"""
-    # Convert params to a sorted string representation to ensure consistent keys
-    params_str = json.dumps(params, sort_keys=True, default=str)
-    # Create hash for the parameters
-    hash_obj = hashlib.md5(params_str.encode())
-    hash_key = hash_obj.hexdigest()
-    return f"{prefix}:{hash_key}"
-
 def sanitize_storage_key(key: str) -> str:
     """Sanitize storage key to only allow alphanumeric and ._- symbols"""
     return re.sub(r'[^a-zA-Z0-9._-]', '', key)
@@ -204,7 +123,7 @@ async def log_activity(data: dict):
         result = supabase_request("POST", "/rest/v1/activity_logs", data=data)
         
         # Invalidate cache for any activity logs queries
-        log_cache.invalidate("activity_logs")
+        get_cache().invalidate_tags(LOG_CACHE_NAMESPACE)
         
         return {
             "success": True,
@@ -237,16 +156,14 @@ async def get_activity_logs(request: ActivityLogRequest):
         "Which user made the most recent changes to nutrition plans?"
     """
     try:
-        # Convert request to dict for cache key generation
-        request_dict = request.dict()
-        cache_key = generate_cache_key("activity_logs", request_dict)
+        cache = get_cache()
+        cache_key = make_key(LOG_CACHE_NAMESPACE, (request,))
         
         # Check cache first
-        cached_result = log_cache.get(cache_key)
+        cached_result = cache.get(cache_key, LOG_CACHE_NAMESPACE)
         if cached_result:
             # Add cache info to response
-            cached_result["cache_hit"] = True
-            return cached_result
+            return {**cached_result, "cache_hit": True}
         
         # Build filters
         filters = []
@@ -298,7 +215,13 @@ async def get_activity_logs(request: ActivityLogRequest):
         }
         
         # Cache the result
-        log_cache.put(cache_key, response)
+        cache.set(
+            cache_key,
+            response,
+            ttl=LOG_CACHE_TTL,
+            tags=(LOG_CACHE_NAMESPACE,),
+            namespace=LOG_CACHE_NAMESPACE
+        )
         
         return response
     except Exception as e:
@@ -5,7 +5,7 @@ import databutton as db
 import json
 import uuid
 from datetime import datetime
-from supabase import create_client
+from ..supabase_client import get_supabase as _get_registry_client
 
 router = APIRouter(tags=["mcp-activation"])
 
@@ -14,9 +14,7 @@ class ActivationRequest(BaseModel):
 
 # Función para obtener cliente Supabase
 def get_supabase_client():
-    supabase_url = db.secrets.get("SUPABASE_URL")
-    supabase_key = db.secrets.get("SUPABASE_SERVICE_KEY")
-    return create_client(supabase_url, supabase_key)
+    return _get_registry_client()
 
 @router.get("/mcp/status")
 def get_mcp_status():
@@ -3,14 +3,13 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional, Union
 from datetime import date, datetime, timedelta
 import json
-import databutton as db
-from supabase import create_client, Client
+from supabase import Client
+
+from ..supabase_client import get_supabase_client
 
 # Initialize Supabase client
 def get_supabase() -> Client:
-    url = db.secrets.get("SUPABASE_URL")
-    service_key = db.secrets.get("SUPABASE_SERVICE_KEY")
-    return create_client(url, service_key)
+    return get_supabase_client()
 
 router = APIRouter(tags=["MCP-Analysis"])
 
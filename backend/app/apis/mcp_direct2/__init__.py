@@ -1,11 +1,10 @@
 from fastapi import APIRouter, Query, Body
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
-import databutton as db
 import json
 import uuid
 from datetime import datetime
-from supabase import create_client
+from ..supabase_client import get_supabase as _get_registry_client
 
 router = APIRouter(tags=["mcp-direct"])
 
@@ -19,9 +18,7 @@ class SimpleClient(BaseModel):
 
 # Función para obtener cliente Supabase
 def get_supabase_client():
-    supabase_url = db.secrets.get("SUPABASE_URL")
-    supabase_key = db.secrets.get("SUPABASE_SERVICE_KEY")
-    return create_client(supabase_url, supabase_key)
+    return _get_registry_client()
 
 @router.post("/mcp/add-client-direct22")
 def add_client_direct22(client: SimpleClient):
@@ -1,11 +1,10 @@
 from fastapi import APIRouter, Body
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
-import databutton as db
 import json
 import uuid
 from datetime import datetime
-from supabase import create_client
+from ..supabase_client import get_supabase_client
 
 router = APIRouter(tags=["direct-mcp"])
 
@@ -21,10 +20,8 @@ class SimpleClient(BaseModel):
 def add_client_direct2(client: SimpleClient):
     """Crea un cliente directo desde Claude Desktop - solución emergencia"""
     try:
-        # Conexión directa a Supabase
-        supabase_url = db.secrets.get("SUPABASE_URL")
-        supabase_key = db.secrets.get("SUPABASE_SERVICE_KEY")
-        supabase = create_client(supabase_url, supabase_key)
+        # Cliente Supabase compartido del proceso
+        supabase = get_supabase_client()
         
         # Generar datos
         client_id = str(uuid.uuid4())
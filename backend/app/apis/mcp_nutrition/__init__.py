@@ -3,14 +3,13 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional, Union
 from datetime import date, datetime
 import json
-import databutton as db
-from supabase import create_client, Client
+from supabase import Client
+
+from ..supabase_client import get_supabase_client
 
 # Initialize Supabase client
 def get_supabase() -> Client:
-    url = db.secrets.get("SUPABASE_URL")
-    service_key = db.secrets.get("SUPABASE_SERVICE_KEY")
-    return create_client(url, service_key)
+    return get_supabase_client()
 
 router = APIRouter(tags=["MCP-Nutrition"])
 
@@ -149,7 +148,7 @@ def mcpnew_get_nutrition_templates(request: NutritionTemplatesRequest) -> Nutrit
     """
     try:
         # Import cache utilities
-        from app.apis.cache_utils import cached
+        from src.infrastructure.cache import cached
         
         @cached(ttl=300)  # Cache for 5 minutes
         def get_templates(plan_type, limit):
@@ -482,7 +481,7 @@ def mcpnew_lookup_food_nutrition(request: FoodNutritionRequest) -> FoodNutrition
     """
     try:
         # Import cache utilities
-        from app.apis.cache_utils import cached
+        from src.infrastructure.cache import cached
         
         @cached(ttl=3600)  # Cache for 1 hour
         def lookup_food(food_name):
@@ -4,7 +4,7 @@ from datetime import datetime
 import uuid
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
-from supabase import create_client
+from ..supabase_client import get_supabase as _get_registry_client
 
 # Router with appropriate tags for MCP endpoints
 router = APIRouter(tags=["mcp-system"])
@@ -23,9 +23,7 @@ class MCPActivationRequest(BaseModel):
 # Utility functions
 def get_supabase_client():
     """Get a Supabase client instance"""
-    supabase_url = db.secrets.get("SUPABASE_URL")
-    supabase_key = db.secrets.get("SUPABASE_SERVICE_KEY")
-    return create_client(supabase_url, supabase_key)
+    return _get_registry_client()
 
 def get_mcp_settings():
     """Get MCP settings from storage"""
@@ -3,14 +3,15 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional, Union
 from datetime import date, datetime
 import json
-import databutton as db
-from supabase import create_client, Client
+from supabase import Client
+
+from src.infrastructure.cache import negative_cache
+
+from ..supabase_client import get_supabase_client
 
 # Initialize Supabase client
 def get_supabase() -> Client:
-    url = db.secrets.get("SUPABASE_URL")
-    service_key = db.secrets.get("SUPABASE_SERVICE_KEY")
-    return create_client(url, service_key)
+    return get_supabase_client()
 
 router = APIRouter(tags=["MCP-Training"])
 
@@ -147,7 +148,7 @@ def mcpnew_get_training_templates(request: TrainingTemplatesRequest) -> Training
     """
     try:
         # Import cache utilities
-        from app.apis.cache_utils import cached
+        from src.infrastructure.cache import cached
         
         @cached(ttl=300)  # Cache for 5 minutes
         def get_templates(program_type, limit):
@@ -243,6 +244,10 @@ def mcpnew_get_training_templates(request: TrainingTemplatesRequest) -> Training
 def mcpnew_get_training_program(request: TrainingProgramRequest) -> TrainingProgram:
     """Retrieve detailed information about a specific training program"""
     try:
+        # Ids recently found missing are answered without a query
+        if negative_cache.is_missing("training_programs", request.program_id):
+            raise HTTPException(status_code=404, detail=f"Training program with ID {request.program_id} not found")
+        
         supabase = get_supabase()
         
         # Get the training program
@@ -252,6 +257,7 @@ def mcpnew_get_training_program(request: TrainingProgramRequest) -> TrainingProg
             .execute()
         
         if not result.data or len(result.data) == 0:
+            negative_cache.remember_missing("training_programs", request.program_id)
             raise HTTPException(status_code=404, detail=f"Training program with ID {request.program_id} not found")
         
         program_data = result.data[0]
@@ -474,7 +480,7 @@ def mcpnew_get_exercise_details(request: ExerciseDetailsRequest) -> Exercise:
     """
     try:
         # Import cache utilities
-        from app.apis.cache_utils import cached
+        from src.infrastructure.cache import cached
         
         @cached(ttl=3600)  # Cache for 1 hour - exercises don't change often
         def get_exercise(exercise_id):
@@ -3,36 +3,13 @@ from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any, Union
 from datetime import date, datetime, timedelta
 from uuid import UUID
-import functools
+
+from src.infrastructure.cache import cached
+from ..supabase_client import get_http_session, get_supabase_credentials
 
 # Create main MCP router with unique paths
 router = APIRouter()
 
-# Simple cache implementation for frequent queries
-_cache = {}
-
-def cache_result(ttl_seconds=300):
-    """Cache decorator with time-to-live functionality for frequent queries"""
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            # Create a cache key based on function name and arguments
-            cache_key = f"{func.__name__}:{str(args)}:{str(kwargs)}"
-            
-            # Check if result is in cache and not expired
-            if cache_key in _cache:
-                result, timestamp = _cache[cache_key]
-                if (datetime.now() - timestamp).total_seconds() < ttl_seconds:
-                    return result
-            
-            # Execute function and cache result
-            result = func(*args, **kwargs)
-            _cache[cache_key] = (result, datetime.now())
-            
-            return result
-        return wrapper
-    return decorator
-
 # ======== Models ========
 
 class ClientSearchRequest(BaseModel):
@@ -127,7 +104,7 @@ def mcpnew_search_clients(request: ClientSearchRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/mcp/clients/get", tags=["mcp"])
-@cache_result(ttl_seconds=60)  # Cache client details for 1 minute
+@cached(ttl=60)  # Cache client details for 1 minute
 def mcpnew_get_client_details(request: ClientDetailsRequest):
     """
     Get detailed information about a specific client.
@@ -171,21 +148,20 @@ def mcpnew_get_client_details(request: ClientDetailsRequest):
 def mcpnew_add_client(request: AddClientRequest):
     """Add a new client to the system"""
     try:
-        import databutton as db
         import requests
         import uuid
         import json
         from datetime import datetime
         
         # Obtener credenciales de servicio
-        supabase_url = db.secrets.get("SUPABASE_URL")
-        supabase_service_key = db.secrets.get("SUPABASE_SERVICE_KEY")
-        
-        if not supabase_url or not supabase_service_key:
+        try:
+            supabase_url, supabase_service_key = get_supabase_credentials(service_key=True)
+        except ValueError:
             raise HTTPException(
                 status_code=500,
                 detail="Credenciales de Supabase no encontradas"
             )
+        session = get_http_session()
         
         # Preparar datos del cliente
         client_id = str(uuid.uuid4())
@@ -226,7 +202,7 @@ def mcpnew_add_client(request: AddClientRequest):
         }
         
         # Crear cliente directamente con la API de Supabase
-        response = requests.post(
+        response = session.post(
             f"{supabase_url}/rest/v1/clients",
             headers=headers,
             json=client_data
@@ -250,7 +226,7 @@ def mcpnew_add_client(request: AddClientRequest):
         
         try:
             # Intentar registrar notificación
-            notification_response = requests.post(
+            notification_response = session.post(
                 f"{supabase_url}/rest/v1/notifications",
                 headers=headers,
                 json=notification_data
@@ -328,7 +304,7 @@ def mcpnew_get_progress_history(request: ProgressHistoryRequest):
 # ======== Analytics Endpoints ========
 
 @router.post("/mcp/analytics/adherence2", tags=["mcp"])
-@cache_result(ttl_seconds=300)  # Cache adherence metrics for 5 minutes
+@cached(ttl=300)  # Cache adherence metrics for 5 minutes
 def mcpnew_get_client_adherence_metrics2(request: AdherenceMetricsRequest):
     """
     Get adherence metrics for a client.
@@ -387,7 +363,7 @@ def mcpnew_get_client_adherence_metrics2(request: AdherenceMetricsRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/mcp/analytics/effectiveness2", tags=["mcp"])
-@cache_result(ttl_seconds=600)  # Cache program effectiveness for 10 minutes
+@cached(ttl=600)  # Cache program effectiveness for 10 minutes
 def mcpnew_get_program_effectiveness2(request: ProgramEffectivenessRequest):
     """
     Analyze the effectiveness of a training program.
@@ -440,7 +416,7 @@ def mcpnew_get_program_effectiveness2(request: ProgramEffectivenessRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/mcp/analytics/business-metrics2", tags=["mcp"])
-@cache_result(ttl_seconds=1800)  # Cache business metrics for 30 minutes
+@cached(ttl=1800)  # Cache business metrics for 30 minutes
 def mcpnew_generate_business_metrics2(request: BusinessMetricsRequest):
     """
     Generate business-level metrics and analytics.
@@ -518,7 +494,7 @@ def mcpnew_generate_business_metrics2(request: BusinessMetricsRequest):
 # ======== Agent Endpoints ========
 
 @router.get("/mcp/agent/status", tags=["mcp"])
-@cache_result(ttl_seconds=300)  # Cache status for 5 minutes
+@cached(ttl=300)  # Cache status for 5 minutes
 def mcpnew_get_agent_system_status():
     """
     Get the current status of the agent system.
@@ -1,45 +1,194 @@
 from supabase import create_client
 import databutton as db
 from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+import hashlib
+import os
+import threading
 import time
 
-# Caché para conexiones Supabase
-_supabase_cache = {}
-_cache_timeout = 300  # 5 minutos
+import requests
+from requests.adapters import HTTPAdapter
+
+# Roles soportados y el secreto que usa cada uno
+ROLE_SERVICE = "service"
+ROLE_ANON = "anon"
+_ROLE_SECRETS = {
+    ROLE_SERVICE: "SUPABASE_SERVICE_KEY",
+    ROLE_ANON: "SUPABASE_ANON_KEY",
+}
+
+# Cada cuánto se vuelven a leer los secretos para detectar rotaciones (segundos)
+SECRETS_REFRESH_INTERVAL = int(os.environ.get("SUPABASE_SECRETS_REFRESH_SECONDS", "60"))
+
+# Tamaño del pool HTTP compartido para las llamadas REST directas
+HTTP_POOL_MAXSIZE = int(os.environ.get("SUPABASE_HTTP_POOL_MAXSIZE", "20"))
+
+
+def _fingerprint(key: str) -> str:
+    """Huella corta de una clave para detectar rotaciones sin guardarla en métricas."""
+    return hashlib.sha256(key.encode()).hexdigest()[:12]
+
+
+class SupabaseClientRegistry:
+    """Registro de clientes Supabase de larga duración, compartido por todo el proceso.
+
+    Los clientes se indexan por (url, rol) y se crean de forma perezosa la primera
+    vez que se piden. Los secretos se vuelven a leer como máximo cada
+    ``secrets_refresh_interval`` segundos; si la URL o la clave cambiaron, el
+    cliente se reconstruye y las siguientes peticiones usan el nuevo.
+    """
+
+    def __init__(
+        self,
+        secrets_refresh_interval: int = SECRETS_REFRESH_INTERVAL,
+        client_factory: Callable[[str, str], Any] = None,
+        secrets_reader: Callable[[str], Optional[str]] = None,
+    ):
+        self._refresh_interval = secrets_refresh_interval
+        self._client_factory = client_factory or create_client
+        self._read_secret = secrets_reader or db.secrets.get
+        self._lock = threading.Lock()
+
+        # rol -> (url, clave, momento de lectura)
+        self._credentials: Dict[str, Tuple[str, str, float]] = {}
+        # (url, rol) -> entrada con el cliente y sus métricas
+        self._clients: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._session: Optional[requests.Session] = None
+
+        self._metrics = {
+            "acquisitions": 0,
+            "clients_created": 0,
+            "clients_refreshed": 0,
+            "secret_reads": 0,
+        }
+
+    def _load_credentials(self, role: str, force: bool = False) -> Tuple[str, str]:
+        """Devuelve (url, clave) del rol, releyendo los secretos si caducaron. Requiere el lock."""
+        if role not in _ROLE_SECRETS:
+            raise ValueError(f"Unknown Supabase role: {role}")
+
+        cached = self._credentials.get(role)
+        now = time.time()
+        if cached and not force and now - cached[2] < self._refresh_interval:
+            return cached[0], cached[1]
+
+        url = self._read_secret("SUPABASE_URL")
+        key = self._read_secret(_ROLE_SECRETS[role])
+        self._metrics["secret_reads"] += 1
+
+        if not url or not key:
+            raise ValueError(
+                f"Supabase credentials not found. Please set SUPABASE_URL and {_ROLE_SECRETS[role]} secrets."
+            )
+
+        self._credentials[role] = (url, key, now)
+        return url, key
+
+    def get_credentials(self, role: str = ROLE_SERVICE) -> Tuple[str, str]:
+        """Devuelve (url, clave) del rol sin volver a leer los secretos en cada petición."""
+        with self._lock:
+            return self._load_credentials(role)
+
+    def get_client(self, role: str = ROLE_SERVICE):
+        """Devuelve el cliente Supabase del rol, creándolo o renovándolo si hace falta."""
+        with self._lock:
+            url, key = self._load_credentials(role)
+            registry_key = (url, role)
+            fingerprint = _fingerprint(key)
+            self._metrics["acquisitions"] += 1
+
+            entry = self._clients.get(registry_key)
+            if entry is not None and entry["fingerprint"] == fingerprint:
+                entry["acquisitions"] += 1
+                entry["last_used_at"] = time.time()
+                return entry["client"]
+
+            # Si el rol apuntaba a otra URL o clave, descartamos el cliente anterior
+            stale = [k for k in self._clients if k[1] == role]
+            for k in stale:
+                del self._clients[k]
+            if entry is not None or stale:
+                self._metrics["clients_refreshed"] += 1
+
+            client = self._client_factory(url, key)
+            now = time.time()
+            self._clients[registry_key] = {
+                "client": client,
+                "fingerprint": fingerprint,
+                "created_at": now,
+                "last_used_at": now,
+                "acquisitions": 1,
+            }
+            self._metrics["clients_created"] += 1
+            return client
+
+    def get_http_session(self) -> requests.Session:
+        """Sesión HTTP compartida (keep-alive) para las llamadas REST directas a Supabase."""
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def refresh(self, role: Optional[str] = None) -> None:
+        """Fuerza la relectura de secretos; los clientes se reconstruyen si cambiaron."""
+        with self._lock:
+            roles = [role] if role else list(self._credentials.keys())
+            for r in roles:
+                self._credentials.pop(r, None)
+
+    def clear(self) -> None:
+        """Elimina todos los clientes y credenciales cacheadas."""
+        with self._lock:
+            self._clients.clear()
+            self._credentials.clear()
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Métricas del registro: tamaño del pool y uso por cliente."""
+        with self._lock:
+            now = time.time()
+            return {
+                **self._metrics,
+                "pool_size": len(self._clients),
+                "http_pool_maxsize": HTTP_POOL_MAXSIZE,
+                "clients": [
+                    {
+                        "url": url,
+                        "role": role,
+                        "key_fingerprint": entry["fingerprint"],
+                        "acquisitions": entry["acquisitions"],
+                        "age_seconds": round(now - entry["created_at"], 1),
+                        "idle_seconds": round(now - entry["last_used_at"], 1),
+                    }
+                    for (url, role), entry in self._clients.items()
+                ],
+            }
+
+
+# Registro global del proceso
+supabase_registry = SupabaseClientRegistry()
+
 
 def get_supabase(service_key=True):
     """Retorna un cliente de Supabase configurado con las credenciales.
-    
+
+    El cliente se reutiliza entre peticiones para aprovechar las conexiones
+    abiertas; se renueva automáticamente si los secretos rotan.
+
     Args:
         service_key (bool): Si es True, usa la clave de servicio. Si es False, usa la clave anónima.
-        
+
     Returns:
         Client: Cliente de Supabase configurado
     """
-    key_type = "service" if service_key else "anon"
-    
-    # Verificar si hay una conexión en caché válida
-    cache_key = f"supabase_{key_type}"
-    if cache_key in _supabase_cache:
-        cached_data = _supabase_cache[cache_key]
-        if time.time() - cached_data["timestamp"] < _cache_timeout:
-            return cached_data["client"]
-    
-    # Si no hay caché válida, crear nueva conexión
-    supabase_url = db.secrets.get("SUPABASE_URL")
-    if service_key:
-        supabase_key = db.secrets.get("SUPABASE_SERVICE_KEY")
-    else:
-        supabase_key = db.secrets.get("SUPABASE_ANON_KEY")
-    
-    # Crear y cachear el cliente
-    client = create_client(supabase_url, supabase_key)
-    _supabase_cache[cache_key] = {
-        "client": client,
-        "timestamp": time.time()
-    }
-    
-    return client
+    return supabase_registry.get_client(ROLE_SERVICE if service_key else ROLE_ANON)
 
 # Alias para compatibilidad con código existente
 def get_supabase_client():
@@ -50,16 +199,28 @@ def get_supabase_anon_client():
     """Alias de get_supabase(service_key=False) para mantener compatibilidad."""
     return get_supabase(service_key=False)
 
+def get_supabase_credentials(service_key=True):
+    """Retorna (url, clave) cacheadas por el registro."""
+    return supabase_registry.get_credentials(ROLE_SERVICE if service_key else ROLE_ANON)
+
+def get_http_session():
+    """Retorna la sesión HTTP compartida para llamadas REST directas."""
+    return supabase_registry.get_http_session()
+
+def get_registry_stats():
+    """Retorna las métricas de uso del registro de clientes."""
+    return supabase_registry.stats()
+
 @lru_cache(maxsize=64)
 def handle_supabase_response(response):
     """Maneja la respuesta de Supabase y la procesa a un formato estándar.
-    
+
     Esta función está decorada con lru_cache para mejorar el rendimiento
     cuando se procesan respuestas idénticas repetidamente.
-    
+
     Args:
         response: Respuesta de Supabase
-        
+
     Returns:
         dict: Respuesta procesada en formato estándar
     """
@@ -69,7 +230,7 @@ def handle_supabase_response(response):
             "error": str(response.error),
             "data": None
         }
-    
+
     return {
         "success": True,
         "data": response.data,
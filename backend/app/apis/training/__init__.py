@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Query, Path, Body
+from fastapi import APIRouter, HTTPException, Query, Path, Body, Request
 from pydantic import BaseModel, UUID4, Field
 from typing import List, Optional, Dict, Any, Union
 import databutton as db
@@ -7,9 +7,14 @@ import json
 from datetime import date, datetime
 from enum import Enum
 from app.apis.shared import get_supabase_credentials, supabase_request
+from src.infrastructure.cache import hashed_json, negative_cache
 
 router = APIRouter()
 
+# Templates are edited directly in Supabase, not through this API, so
+# there is no write to bump a version on: their ETags hash the body
+TRAINING_PROGRAMS = "training_programs"
+
 # ======== Models ========
 
 class ProgramType(str, Enum):
@@ -104,6 +109,7 @@ class ProgramResponse(BaseModel):
 
 @router.get("/training/templates", response_model=ProgramResponse)
 def get_training_templates(
+    request: Request,
     program_type: Optional[ProgramType] = Query(None, description="Type of training program to filter by"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of templates to return"),
     offset: int = Query(0, ge=0, description="Number of templates to skip")
@@ -134,28 +140,35 @@ def get_training_templates(
         
         result = supabase_request("GET", path, params=params)
         
-        return {
-            "programs": result,
-            "total": total
-        }
+        templates = ProgramResponse(programs=result, total=total)
+        return hashed_json(request, templates.model_dump(mode="json"))
     except Exception as e:
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(status_code=500, detail=f"Error retrieving training templates: {str(e)}") from e
 
 @router.get("/training/programs/{program_id}", response_model=TrainingProgram)
-def get_training_program(program_id: str = Path(..., description="The ID of the training program")):
+def get_training_program(
+    request: Request,
+    program_id: str = Path(..., description="The ID of the training program")
+):
     """Get a specific training program by ID"""
     try:
+        # Ids recently found missing are answered without a request to Supabase
+        if negative_cache.is_missing(TRAINING_PROGRAMS, program_id):
+            raise HTTPException(status_code=404, detail=f"Training program with ID {program_id} not found")
+        
         result = supabase_request(
             "GET", 
             f"/rest/v1/training_programs?id=eq.{program_id}&select=*",
         )
         
         if not result or len(result) == 0:
+            negative_cache.remember_missing(TRAINING_PROGRAMS, program_id)
             raise HTTPException(status_code=404, detail=f"Training program with ID {program_id} not found")
         
-        return result[0]
+        program = TrainingProgram.model_validate(result[0])
+        return hashed_json(request, program.model_dump(mode="json"))
     except Exception as e:
         if isinstance(e, HTTPException):
             raise e
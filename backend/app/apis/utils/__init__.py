@@ -1,15 +1,10 @@
-import databutton as db
-from supabase import create_client
+from app.apis.supabase_client import get_supabase as _get_registry_client
 from typing import Optional, List, Dict, Any
 import json
 
 def get_supabase_client():
-    """Retorna un cliente de Supabase configurado con las credenciales"""
-    supabase_url = db.secrets.get("SUPABASE_URL")
-    supabase_key = db.secrets.get("SUPABASE_SERVICE_KEY")
-    
-    # Creamos y retornamos el cliente
-    return create_client(supabase_url, supabase_key)
+    """Retorna el cliente de Supabase compartido del proceso"""
+    return _get_registry_client()
 
 def sanitize_storage_key(key):
     """Sanitiza una clave de almacenamiento para usarla en storage"""
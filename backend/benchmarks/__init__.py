@@ -0,0 +1,5 @@
+"""
+Micro-benchmarks for NEXUS-CORE hot paths
+
+Run from the backend directory, e.g. ``python -m benchmarks.client_hydration``.
+"""
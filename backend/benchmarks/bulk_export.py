@@ -0,0 +1,129 @@
+"""
+Bulk export benchmark
+
+Exports synthetic clients through the streaming encoders and through the
+previous buffered approach (one query for every row, the whole CSV built
+in a StringIO, then embedded in a JSON envelope), reporting wall time and
+peak traced memory. Rows are generated page by page on demand, so the
+source itself holds no more than the page being read.
+
+Usage (from backend/):
+    python -m benchmarks.bulk_export [--rows 100000] [--page-size 1000]
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Callable, Dict
+
+from src.application.use_cases.client import ExportClientsUseCase
+from src.domain.entities import ClientRecord, ClientStatus, ProgramType
+from src.domain.repositories.pagination import Page
+from src.interfaces.api.exports import CSV_HEADER, ENCODERS, gzip_chunks
+
+PROGRAM_TYPES = list(ProgramType)
+STATUSES = list(ClientStatus)
+
+
+def make_record(index: int) -> ClientRecord:
+    created_at = datetime(2024, 1, 1) + timedelta(seconds=index)
+    return ClientRecord(
+        id=f"{index:08d}-0000-4000-8000-000000000000",
+        name=f"Client {index}",
+        email=f"client{index}@example.com",
+        program_type=PROGRAM_TYPES[index % len(PROGRAM_TYPES)],
+        status=STATUSES[index % len(STATUSES)],
+        created_at=created_at,
+        updated_at=created_at,
+        phone="+34 600 123 456" if index % 2 else None,
+        notes="Prefers morning sessions" if index % 5 == 0 else "",
+    )
+
+
+class GeneratedRepository:
+    """find_record_page over ``total`` rows that exist only while paged"""
+
+    def __init__(self, total: int):
+        self.total = total
+
+    async def find_record_page(self, limit=20, cursor=None, **kwargs) -> Page[ClientRecord]:
+        start = int(cursor or 0)
+        end = min(start + limit, self.total)
+        return Page(
+            items=[make_record(i) for i in range(start, end)],
+            next_cursor=str(end) if end < self.total else None
+        )
+
+
+class QuietLogger:
+    def info(self, message, **kwargs):
+        pass
+
+
+async def streamed(rows: int, page_size: int, fmt: str, compress: bool) -> int:
+    use_case = ExportClientsUseCase(GeneratedRepository(rows), QuietLogger(), page_size=page_size)
+    body: AsyncIterator[bytes] = ENCODERS[fmt](use_case.pages(), {"records": 0})
+    if compress:
+        body = gzip_chunks(body)
+    size = 0
+    async for chunk in body:
+        size += len(chunk)
+    return size
+
+
+async def buffered_csv(rows: int, page_size: int, fmt: str, compress: bool) -> int:
+    page = await GeneratedRepository(rows).find_record_page(limit=rows)
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(CSV_HEADER)
+    for record in page.items:
+        writer.writerow([
+            record.id, record.name, record.email, record.phone or "",
+            record.program_type.value, record.status.value,
+            record.created_at.isoformat(), record.updated_at.isoformat(), record.notes or ""
+        ])
+    envelope = json.dumps({"status": "success", "data": {"format": "csv", "content": output.getvalue()}})
+    return len(envelope.encode("utf-8"))
+
+
+def measure(run: Callable[..., "asyncio.Future"], *args) -> Dict[str, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = asyncio.run(run(*args))
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"seconds": elapsed, "peak_mb": peak / 2**20, "output_mb": size / 2**20}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    cases = [
+        ("buffered csv (before)", buffered_csv, "csv", False),
+        ("stream csv", streamed, "csv", False),
+        ("stream csv.gz", streamed, "csv", True),
+        ("stream ndjson", streamed, "ndjson", False),
+        ("stream ndjson.gz", streamed, "ndjson", True),
+    ]
+
+    print(f"{args.rows:,} rows, page size {args.page_size}")
+    print(f"{'export':<22}  {'rows/s':>9}  {'peak MB':>8}  {'output MB':>9}")
+    for name, run, fmt, compress in cases:
+        result = measure(run, args.rows, args.page_size, fmt, compress)
+        print(
+            f"{name:<22}  {args.rows / result['seconds']:>9,.0f}"
+            f"  {result['peak_mb']:>8.1f}  {result['output_mb']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
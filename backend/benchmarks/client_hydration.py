@@ -0,0 +1,79 @@
+"""
+Client hydration micro-benchmark
+
+Compares the validating per-row mapper (``ClientRowMapper._dict_to_entity``)
+with the bulk trusted-row path (``hydrate_clients``) on synthetic
+``clients`` rows shaped like PostgREST output.
+
+Usage (from backend/):
+    python -m benchmarks.client_hydration [--sizes 1000 10000 100000] [--repeat 5]
+"""
+
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+from src.infrastructure.database.hydration import hydrate_clients
+from src.infrastructure.database.supabase import ClientRowMapper
+
+PROGRAM_TYPES = ("PRIME", "LONGEVITY", "HYBRID")
+STATUSES = ("active", "inactive", "paused", "trial", "cancelled")
+
+
+def make_rows(count: int) -> List[Dict[str, Any]]:
+    """Synthetic rows; about a third were edited after creation"""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rows = []
+    for i in range(count):
+        created_at = start + timedelta(minutes=i)
+        updated_at = created_at + timedelta(days=i % 30) if i % 3 == 0 else created_at
+        rows.append({
+            "id": str(uuid.uuid4()),
+            "name": f"Client {i}",
+            "email": f"client{i}@example.com",
+            "phone": f"+34 600 {i % 1000:03d} {i % 997:03d}" if i % 2 else None,
+            "program_type": PROGRAM_TYPES[i % len(PROGRAM_TYPES)],
+            "status": STATUSES[i % len(STATUSES)],
+            "created_at": created_at.isoformat(),
+            "updated_at": updated_at.isoformat(),
+            "notes": "",
+            "metadata": {},
+        })
+    return rows
+
+
+def best_of(repeat: int, convert: Callable[[List[Dict[str, Any]]], list], rows: List[Dict[str, Any]]) -> float:
+    """Fastest wall time over ``repeat`` runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        convert(rows)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    mapper = ClientRowMapper()
+
+    def validated(rows):
+        return [mapper._dict_to_entity(row) for row in rows]
+
+    print(f"{'rows':>8}  {'validated rows/s':>17}  {'trusted rows/s':>15}  {'speedup':>7}")
+    for size in args.sizes:
+        rows = make_rows(size)
+        assert validated(rows[:100]) == hydrate_clients(rows[:100])
+
+        slow = best_of(args.repeat, validated, rows)
+        fast = best_of(args.repeat, hydrate_clients, rows)
+        print(f"{size:>8}  {size / slow:>17,.0f}  {size / fast:>15,.0f}  {slow / fast:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
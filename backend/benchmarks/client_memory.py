@@ -0,0 +1,52 @@
+"""
+Client memory footprint benchmark
+
+Measures the bytes held per client when a working set is kept as
+``Client`` entities versus ``ClientRecord`` snapshots. Each run decodes
+the same JSON payload, hydrates it and drops the decoded rows, so what
+tracemalloc still sees is what the working set itself keeps alive.
+
+Usage (from backend/):
+    python -m benchmarks.client_memory [--count 10000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from benchmarks.client_hydration import make_rows
+from src.infrastructure.database.hydration import hydrate_clients, hydrate_records
+
+
+def bytes_per_client(build: Callable[[List[Dict[str, Any]]], list], payload: str, count: int) -> float:
+    """Traced allocations still alive after building, divided by row count"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = build(json.loads(payload))
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10_000)
+    args = parser.parse_args()
+
+    payload = json.dumps(make_rows(args.count))
+    entity_bytes = bytes_per_client(hydrate_clients, payload, args.count)
+    record_bytes = bytes_per_client(hydrate_records, payload, args.count)
+
+    print(f"{'representation':<14}  {'bytes/client':>12}")
+    print(f"{'Client':<14}  {entity_bytes:>12,.0f}")
+    print(f"{'ClientRecord':<14}  {record_bytes:>12,.0f}")
+    print(f"saving: {1 - record_bytes / entity_bytes:.0%}")
+
+
+if __name__ == "__main__":
+    main()
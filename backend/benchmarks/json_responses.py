@@ -0,0 +1,117 @@
+"""
+JSON response encoding benchmark
+
+Compares FastAPI's default path for a returned value (``jsonable_encoder``
+followed by ``JSONResponse.render``) with ``json_response`` (orjson on the
+raw value) and, for pydantic model lists, with ``dump_list`` (cached
+TypeAdapter) + orjson.
+
+Usage (from backend/):
+    python -m benchmarks.json_responses [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict
+
+from src.domain.entities import ClientStatus, ProgramType
+from src.interfaces.api.responses import dump_list, json_response
+
+
+class AlertModel(BaseModel):
+    """Shaped like the proactive alerts model"""
+
+    model_config = ConfigDict(json_encoders={Decimal: float})
+
+    id: uuid.UUID
+    title: str
+    severity: str
+    priority_score: Decimal
+    metrics: Dict[str, float]
+    recommended_actions: List[str]
+    created_at: datetime
+
+
+def client_rows(count: int) -> List[Dict[str, Any]]:
+    """Dict payload like a client list page"""
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "name": f"Client {i}",
+            "email": f"client{i}@example.com",
+            "program_type": ProgramType.PRIME,
+            "status": ClientStatus.ACTIVE,
+            "created_at": start + timedelta(minutes=i),
+            "updated_at": start + timedelta(minutes=i, seconds=30),
+            "lifetime_value": Decimal("1234.50"),
+            "metadata": {"source": "import", "tags": ["a", "b"]},
+        }
+        for i in range(count)
+    ]
+
+
+def alerts(count: int) -> List[AlertModel]:
+    return [
+        AlertModel(
+            id=uuid.uuid4(),
+            title=f"Churn risk {i}",
+            severity="high",
+            priority_score=Decimal("87.5"),
+            metrics={"score": 0.87, "days_inactive": 14.0},
+            recommended_actions=["call", "offer discount"],
+            created_at=datetime(2024, 1, 1) + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+def best_of(repeat: int, render: Callable[[], bytes]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = client_rows(args.rows)
+    models = alerts(args.rows)
+    cases = [
+        (
+            "dict rows",
+            lambda: JSONResponse({"clients": jsonable_encoder(rows)}).body,
+            lambda: json_response({"clients": rows}).body,
+        ),
+        (
+            "pydantic models",
+            lambda: JSONResponse({"alerts": jsonable_encoder(models)}).body,
+            lambda: json_response({"alerts": dump_list(AlertModel, models)}).body,
+        ),
+    ]
+
+    print(f"{'payload':<16}  {'default rows/s':>15}  {'fast rows/s':>12}  {'speedup':>7}")
+    for name, default, fast in cases:
+        slow_time = best_of(args.repeat, default)
+        fast_time = best_of(args.repeat, fast)
+        print(
+            f"{name:<16}  {args.rows / slow_time:>15,.0f}  {args.rows / fast_time:>12,.0f}"
+            f"  {slow_time / fast_time:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
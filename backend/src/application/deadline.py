@@ -0,0 +1,165 @@
+"""
+Request Deadlines
+
+A Deadline is the time budget of the request being served. The HTTP layer
+opens one per request with ``deadline_scope``; it lives in a context
+variable, so it reaches use cases, repository calls and the tasks they
+spawn without being passed around. Repository calls run inside
+``deadline_guard``, which refuses to start a call once the budget is spent
+and cancels calls that outlive it. Each completed call is recorded, so a
+timed-out request can report how far it got.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import Context, ContextVar, copy_context
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from ..domain.exceptions import DomainException
+
+# Completed calls kept for the partial-work report
+MAX_REPORTED_CALLS = 20
+
+
+class DeadlineExceeded(DomainException):
+    """Raised when a request's time budget runs out"""
+
+    def __init__(self, deadline: "Deadline", operation: str):
+        super().__init__(
+            f"Request deadline of {deadline.budget:g}s exceeded during {operation}",
+            error_code="DEADLINE_EXCEEDED",
+            details=deadline.report()
+        )
+
+
+@dataclass
+class Deadline:
+    """Time budget of one request and the work done within it"""
+
+    budget: float
+    route: str = ""
+    started_at: float = field(default_factory=time.monotonic)
+    completed: List[str] = field(default_factory=list)
+    completed_calls: int = 0
+    exceeded_at: Optional[str] = None
+
+    @property
+    def exceeded(self) -> bool:
+        """Whether some operation ran out of budget"""
+        return self.exceeded_at is not None
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining(self) -> float:
+        """Seconds left, negative once the budget is spent"""
+        return self.budget - self.elapsed()
+
+    def check(self, operation: str) -> None:
+        """
+        Refuse to start ``operation`` once the budget is spent.
+
+        Raises:
+            DeadlineExceeded: If no time is left
+        """
+        if self.remaining() <= 0:
+            self._exceed(operation)
+
+    @asynccontextmanager
+    async def guard(self, operation: str) -> AsyncIterator[None]:
+        """
+        Run ``operation`` within the remaining budget.
+
+        Raises:
+            DeadlineExceeded: If no time is left, or the operation is
+                cancelled because it outlived the budget
+        """
+        self.check(operation)
+        started = time.monotonic()
+        timeout = asyncio.timeout(self.remaining())
+        try:
+            async with timeout:
+                yield
+        except TimeoutError:
+            if timeout.expired():
+                self._exceed(operation)
+            raise
+
+        self.completed_calls += 1
+        self.completed.append(f"{operation} ({(time.monotonic() - started) * 1000:.0f}ms)")
+        if len(self.completed) > MAX_REPORTED_CALLS:
+            del self.completed[0]
+
+    def report(self) -> Dict[str, Any]:
+        """Partial-work report for a timed-out request"""
+        return {
+            "route": self.route,
+            "budget_ms": round(self.budget * 1000),
+            "elapsed_ms": round(self.elapsed() * 1000),
+            "exceeded_at": self.exceeded_at,
+            "completed_calls": self.completed_calls,
+            "last_completed": list(self.completed),
+        }
+
+    def _exceed(self, operation: str) -> None:
+        if self.exceeded_at is None:
+            self.exceeded_at = operation
+        raise DeadlineExceeded(self, operation) from None
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("request_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline of the request being served, if any"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(budget: float, route: str = "") -> Iterator[Deadline]:
+    """Give the code run inside the block a time budget of ``budget`` seconds"""
+    deadline = Deadline(budget=budget, route=route)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def without_deadline() -> Context:
+    """
+    A copy of the current context with no request deadline.
+
+    For tasks shared by several requests: they keep the rest of the
+    caller's state (such as a pooled connection it holds) but must not be
+    cut short by the budget of whichever request started them.
+    """
+    context = copy_context()
+    context.run(_current_deadline.set, None)
+    return context
+
+
+def check_deadline(operation: str) -> None:
+    """
+    Stop before starting ``operation`` if the request is out of time.
+
+    Raises:
+        DeadlineExceeded: If the current request's budget is spent
+    """
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check(operation)
+
+
+@asynccontextmanager
+async def deadline_guard(operation: str) -> AsyncIterator[None]:
+    """Run ``operation`` within the current request's budget; a no-op outside requests"""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        yield
+        return
+
+    async with deadline.guard(operation):
+        yield
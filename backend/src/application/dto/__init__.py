@@ -9,7 +9,9 @@ from .client_dto import (
     ClientDTO,
     ClientCreateDTO,
     ClientUpdateDTO, 
-    ClientSearchResultDTO
+    ClientSearchResultDTO,
+    ClientSummaryDTO,
+    BulkCreateResultDTO
 )
 
 from .program_dto import (
@@ -36,6 +38,8 @@ __all__ = [
     "ClientCreateDTO",
     "ClientUpdateDTO",
     "ClientSearchResultDTO",
+    "ClientSummaryDTO",
+    "BulkCreateResultDTO",
     
     # Program DTOs  
     "ProgramDTO",
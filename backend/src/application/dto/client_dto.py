@@ -3,10 +3,11 @@ Client Data Transfer Objects
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 
-from ...domain.entities import Client
+from ...domain.entities import Client, ClientRecord, ClientSummary
+from ...domain.value_objects import PhoneNumber
 
 
 @dataclass
@@ -49,6 +50,24 @@ class ClientDTO:
             program_duration_days=client.get_program_duration()
         )
     
+    @classmethod
+    def from_record(cls, record: ClientRecord) -> "ClientDTO":
+        """Create DTO from a client snapshot"""
+        return cls(
+            id=record.id,
+            name=record.name,
+            email=record.email,
+            phone=str(PhoneNumber.trusted(record.phone)) if record.phone else None,
+            program_type=record.program_type.value,
+            status=record.status.value,
+            created_at=record.created_at.isoformat(),
+            updated_at=record.updated_at.isoformat(),
+            notes=record.notes,
+            metadata=dict(record.metadata) if record.metadata else {},
+            is_active=record.is_active(),
+            program_duration_days=record.get_program_duration()
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
@@ -133,15 +152,22 @@ class ClientUpdateDTO:
 class ClientSearchResultDTO:
     """DTO for client search results with pagination"""
     
-    clients: List[ClientDTO]
-    total_count: int
+    clients: List[Union[ClientDTO, "ClientSummaryDTO"]]
+    total_count: Optional[int]
     limit: Optional[int]
     offset: int
+    next_cursor: Optional[str] = None
+    pagination_mode: str = "offset"
+    count_mode: str = "exact"
     
     @property
     def has_more(self) -> bool:
         """Check if there are more results available"""
-        if self.limit is None:
+        if self.next_cursor is not None:
+            return True
+        if self.pagination_mode == "cursor":
+            return False
+        if self.limit is None or self.total_count is None:
             return False
         return self.offset + len(self.clients) < self.total_count
     
@@ -153,8 +179,10 @@ class ClientSearchResultDTO:
         return (self.offset // self.limit) + 1
     
     @property
-    def total_pages(self) -> int:
-        """Calculate total number of pages"""
+    def total_pages(self) -> Optional[int]:
+        """Calculate total number of pages (None when no count was requested)"""
+        if self.total_count is None:
+            return None
         if self.limit is None or self.limit == 0:
             return 1
         return (self.total_count + self.limit - 1) // self.limit
@@ -169,21 +197,66 @@ class ClientSearchResultDTO:
                 "offset": self.offset,
                 "current_page": self.current_page,
                 "total_pages": self.total_pages,
-                "has_more": self.has_more
+                "has_more": self.has_more,
+                "next_cursor": self.next_cursor,
+                "mode": self.pagination_mode,
+                "count_mode": self.count_mode
             }
         }
 
 
+
+@dataclass
+class BulkCreateResultDTO:
+    """DTO for the outcome of a bulk client creation"""
+    
+    created: List[ClientDTO]
+    errors: List[Dict[str, Any]]
+    total_requested: int
+    
+    @property
+    def successful(self) -> int:
+        return len(self.created)
+    
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+    
+    @property
+    def success_rate(self) -> float:
+        """Percentage of requested clients that were created"""
+        if self.total_requested == 0:
+            return 0.0
+        return self.successful / self.total_requested * 100
+    
+    def summary(self) -> Dict[str, Any]:
+        """Counts for the batch"""
+        return {
+            "total_requested": self.total_requested,
+            "successful": self.successful,
+            "failed": self.failed,
+            "success_rate": self.success_rate
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "created_clients": [client.to_dict() for client in self.created],
+            "errors": self.errors,
+            "summary": self.summary()
+        }
+
 @dataclass
 class ClientSummaryDTO:
     """Lightweight DTO for client summaries"""
     
     id: str
     name: str
-    email: str
     program_type: str
     status: str
     is_active: bool
+    updated_at: Optional[str] = None
+    email: Optional[str] = None
     
     @classmethod
     def from_entity(cls, client: Client) -> "ClientSummaryDTO":
@@ -194,5 +267,32 @@ class ClientSummaryDTO:
             email=str(client.email),
             program_type=client.program_type.value,
             status=client.status.value,
-            is_active=client.is_active()
-        )
\ No newline at end of file
+            is_active=client.is_active(),
+            updated_at=client.updated_at.isoformat()
+        )
+    
+    @classmethod
+    def from_summary(cls, summary: ClientSummary) -> "ClientSummaryDTO":
+        """Create summary DTO from a projected read model"""
+        return cls(
+            id=summary.id,
+            name=summary.name,
+            program_type=summary.program_type.value,
+            status=summary.status.value,
+            is_active=summary.is_active(),
+            updated_at=summary.updated_at.isoformat()
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary, leaving out fields that were not loaded"""
+        data = {
+            "id": self.id,
+            "name": self.name,
+            "program_type": self.program_type,
+            "status": self.status,
+            "is_active": self.is_active,
+            "updated_at": self.updated_at
+        }
+        if self.email is not None:
+            data["email"] = self.email
+        return data
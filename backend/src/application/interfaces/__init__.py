@@ -6,7 +6,7 @@ used by the application layer use cases.
 """
 
 from .repositories import IClientRepository, IProgramRepository, IProgressRepository
-from .services import IEventPublisher, IEmailService, INotificationService
+from .services import IEventPublisher, IEmailService, INotificationService, IClientCache
 from .infrastructure import ILogger, IMetricsCollector, ICacheService
 from .external import ISupabaseService
 
@@ -20,6 +20,7 @@ __all__ = [
     "IEventPublisher",
     "IEmailService",
     "INotificationService",
+    "IClientCache",
     
     # Infrastructure Interfaces
     "ILogger",
@@ -5,6 +5,8 @@ Service interfaces for application layer
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 
+from ...domain.entities import Client
+
 
 class IEventPublisher(ABC):
     """Interface for publishing domain events"""
@@ -160,4 +162,84 @@ class INotificationService(ABC):
         Returns:
             True if notification was marked as read
         """
-        pass
\ No newline at end of file
+        pass
+
+
+class IClientCache(ABC):
+    """
+    Interface for an identity map of clients by ID and by email.
+    
+    Use cases read through it before the repository, put clients they have
+    just written (and IDs found missing), and invalidate clients they
+    delete. Implementations also drop entries on client domain events, so
+    writes made elsewhere are not served stale.
+    """
+    
+    @abstractmethod
+    def get_by_id(self, client_id: str) -> Optional[Client]:
+        """
+        Get a cached client by ID.
+        
+        Args:
+            client_id: Client identifier
+            
+        Returns:
+            A fresh copy of the cached client, or None if not cached
+        """
+        pass
+    
+    @abstractmethod
+    def get_by_email(self, email: str) -> Optional[Client]:
+        """
+        Get a cached client by email (compared case-insensitively).
+        
+        Args:
+            email: Client email
+            
+        Returns:
+            A fresh copy of the cached client, or None if not cached
+        """
+        pass
+    
+    @abstractmethod
+    def put(self, client: Client) -> None:
+        """
+        Cache a client as it is now stored.
+        
+        Args:
+            client: Client to cache
+        """
+        pass
+    
+    @abstractmethod
+    def is_missing(self, client_id: str) -> bool:
+        """
+        Check whether a recent lookup of this ID found no client.
+        
+        Args:
+            client_id: Client identifier
+            
+        Returns:
+            True if the client is known not to exist
+        """
+        pass
+    
+    @abstractmethod
+    def put_missing(self, client_id: str) -> None:
+        """
+        Remember, briefly, that no client has this ID.
+        
+        Args:
+            client_id: Client identifier
+        """
+        pass
+    
+    @abstractmethod
+    def invalidate(self, client_id: str) -> None:
+        """
+        Drop a client from the cache, under its ID and its email.
+        
+        Args:
+            client_id: Client identifier
+        """
+        pass
@@ -7,11 +7,13 @@ the flow of data to and from the entities.
 
 from .client import (
     CreateClientUseCase,
+    BulkCreateClientsUseCase,
     GetClientUseCase, 
     UpdateClientUseCase,
     DeleteClientUseCase,
     SearchClientsUseCase,
-    GetClientAnalyticsUseCase
+    GetClientAnalyticsUseCase,
+    ExportClientsUseCase
 )
 
 from .mcp import (
@@ -24,11 +26,13 @@ from .mcp import (
 __all__ = [
     # Client Use Cases
     "CreateClientUseCase",
+    "BulkCreateClientsUseCase",
     "GetClientUseCase",
     "UpdateClientUseCase", 
     "DeleteClientUseCase",
     "SearchClientsUseCase",
     "GetClientAnalyticsUseCase",
+    "ExportClientsUseCase",
     
     # MCP Use Cases
     "MCPSearchClientsUseCase",
@@ -2,14 +2,80 @@
 Client Use Cases - Application Business Logic
 """
 
-from typing import List, Optional, Dict, Any
+import asyncio
+import os
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence, Set, Tuple
 from datetime import datetime
 
-from ..dto import ClientDTO, ClientCreateDTO, ClientUpdateDTO, ClientSearchResultDTO
-from ..interfaces import IClientRepository, IEventPublisher, ILogger
-from ...domain.entities import Client, ClientId, ClientStatus, ProgramType
+from ..dto import (
+    ClientDTO,
+    ClientCreateDTO,
+    ClientUpdateDTO,
+    ClientSearchResultDTO,
+    ClientSummaryDTO,
+    BulkCreateResultDTO
+)
+from ..interfaces import IClientCache, IClientRepository, IEventPublisher, ILogger
+from ..deadline import DeadlineExceeded, check_deadline
+from ...domain.entities import Client, ClientId, ClientRecord, ClientStatus, ProgramType
 from ...domain.value_objects import Email, PhoneNumber
 from ...domain.exceptions import ClientNotFound, ClientAlreadyExists, DomainException
+from ...domain.repositories.pagination import (
+    DEFAULT_SORT_KEY,
+    DEFAULT_COUNT_MODE,
+    DEFAULT_SEARCH_MODE,
+)
+
+# Page size used by cursor pagination when the caller gives no limit
+DEFAULT_PAGE_SIZE = 20
+
+# Bulk creation: request cap, upsert chunk bounds and chunks in flight
+BULK_CREATE_MAX_ITEMS = int(os.getenv("CLIENT_BULK_CREATE_MAX_ITEMS", "5000"))
+BULK_CREATE_CHUNK_ROWS = int(os.getenv("CLIENT_BULK_CREATE_CHUNK_ROWS", "500"))
+BULK_CREATE_CHUNK_BYTES = int(os.getenv("CLIENT_BULK_CREATE_CHUNK_BYTES", "262144"))
+BULK_CREATE_CONCURRENCY = int(os.getenv("CLIENT_BULK_CREATE_CONCURRENCY", "4"))
+
+# Emails per uniqueness lookup; each one becomes part of the query string
+BULK_EMAIL_LOOKUP_CHUNK = 200
+
+# Rows per keyset page when streaming an export
+EXPORT_PAGE_SIZE = int(os.getenv("CLIENT_EXPORT_PAGE_SIZE", "1000"))
+
+# Fixed part of a serialized client row (ids, enums, timestamps, keys)
+_ROW_OVERHEAD_BYTES = 300
+
+
+def _estimated_row_bytes(client: Client) -> int:
+    """Rough JSON size of a client row, used to size upsert chunks"""
+    return (
+        _ROW_OVERHEAD_BYTES
+        + len(client.name)
+        + len(str(client.email))
+        + len(client.notes)
+        + (len(str(client.metadata)) if client.metadata else 0)
+    )
+
+
+async def _find_client(
+    repository: IClientRepository,
+    cache: Optional[IClientCache],
+    client_id: ClientId
+) -> Optional[Client]:
+    """Client from the identity cache, else from the repository (then cached)"""
+    if cache is not None:
+        client = cache.get_by_id(str(client_id))
+        if client is not None:
+            return client
+        if cache.is_missing(str(client_id)):
+            return None
+    
+    client = await repository.find_by_id(client_id)
+    if cache is not None:
+        if client is not None:
+            cache.put(client)
+        else:
+            cache.put_missing(str(client_id))
+    return client
 
 
 class CreateClientUseCase:
@@ -24,11 +90,13 @@ class CreateClientUseCase:
         self,
         client_repository: IClientRepository,
         event_publisher: IEventPublisher,
-        logger: ILogger
+        logger: ILogger,
+        client_cache: Optional[IClientCache] = None
     ):
         self._client_repository = client_repository
         self._event_publisher = event_publisher
         self._logger = logger
+        self._client_cache = client_cache
     
     async def execute(self, dto: ClientCreateDTO) -> ClientDTO:
         """
@@ -46,8 +114,11 @@ class CreateClientUseCase:
         """
         self._logger.info(f"Creating client with email: {dto.email}")
         
-        # Check if client already exists
+        # Check if client already exists; a cached client with the email
+        # settles it, but only the database can tell that none exists
         email = Email(dto.email)
+        if self._client_cache is not None and self._client_cache.get_by_email(str(email)):
+            raise ClientAlreadyExists(dto.email)
         if await self._client_repository.exists_by_email(email):
             raise ClientAlreadyExists(dto.email)
         
@@ -81,16 +152,232 @@ class CreateClientUseCase:
             "timestamp": datetime.utcnow().isoformat()
         })
         
+        # After publishing, so the event's invalidation does not drop it
+        if self._client_cache is not None:
+            self._client_cache.put(client)
+        
         self._logger.info(f"Client created successfully: {client.id}")
         
         return ClientDTO.from_entity(client)
 
 
+class BulkCreateClientsUseCase:
+    """
+    Use case for creating many clients at once.
+    
+    Validates every item up front, checks email uniqueness with a few
+    ``in`` queries instead of one lookup per client, upserts the valid
+    clients in size-bounded chunks (several in flight at a time) and
+    publishes all ClientCreated events in one batch. Items that fail are
+    reported individually; they do not fail the rest of the batch.
+    """
+    
+    def __init__(
+        self,
+        client_repository: IClientRepository,
+        event_publisher: IEventPublisher,
+        logger: ILogger,
+        max_items: int = BULK_CREATE_MAX_ITEMS,
+        chunk_rows: int = BULK_CREATE_CHUNK_ROWS,
+        chunk_bytes: int = BULK_CREATE_CHUNK_BYTES,
+        concurrency: int = BULK_CREATE_CONCURRENCY
+    ):
+        self._client_repository = client_repository
+        self._event_publisher = event_publisher
+        self._logger = logger
+        self._max_items = max_items
+        self._chunk_rows = max(1, chunk_rows)
+        self._chunk_bytes = chunk_bytes
+        self._concurrency = max(1, concurrency)
+    
+    async def execute(self, dtos: Sequence[ClientCreateDTO]) -> BulkCreateResultDTO:
+        """
+        Execute bulk client creation.
+        
+        Args:
+            dtos: Client creation data, one per client
+            
+        Returns:
+            Created clients (in request order) and per-item errors
+            
+        Raises:
+            DomainException: If the batch is larger than ``max_items``
+            DeadlineExceeded: If the request runs out of time; chunks
+                already upserted stay saved
+        """
+        if len(dtos) > self._max_items:
+            raise DomainException(
+                f"Batch size limited to {self._max_items} clients per request",
+                error_code="BATCH_TOO_LARGE",
+                details={"max_items": self._max_items, "requested": len(dtos)}
+            )
+        
+        self._logger.info(f"Creating {len(dtos)} clients in bulk")
+        
+        errors: List[Dict[str, Any]] = []
+        pending: Dict[str, Tuple[int, Client]] = {}
+        
+        # Validate everything before touching the database
+        for index, dto in enumerate(dtos):
+            try:
+                client = self._build_client(dto)
+            except DomainException as e:
+                errors.append(self._error(index, dto.email, e.message, e.error_code))
+                continue
+            except ValueError as e:
+                errors.append(self._error(index, dto.email, str(e), "VALIDATION_ERROR"))
+                continue
+            
+            email = str(client.email)
+            if email in pending:
+                errors.append(self._error(
+                    index, email,
+                    f"Email '{email}' appears more than once in the batch",
+                    "DUPLICATE_IN_BATCH"
+                ))
+                continue
+            pending[email] = (index, client)
+        
+        for email in await self._existing_emails(list(pending)):
+            index, _ = pending.pop(email)
+            error = ClientAlreadyExists(email)
+            errors.append(self._error(index, email, error.message, error.error_code))
+        
+        # Don't start writing if validation used up the request's time
+        check_deadline("bulk_create.save")
+        saved, save_errors = await self._save_in_chunks(list(pending.values()))
+        errors.extend(save_errors)
+        saved.sort(key=lambda item: item[0])
+        
+        if saved:
+            timestamp = datetime.utcnow().isoformat()
+            await self._event_publisher.publish_batch([
+                {
+                    "event_type": "ClientCreated",
+                    "client_id": str(client.id),
+                    "email": str(client.email),
+                    "program_type": client.program_type.value,
+                    "timestamp": timestamp
+                }
+                for _, client in saved
+            ])
+        
+        errors.sort(key=lambda error: error["index"])
+        self._logger.info(
+            f"Bulk create finished: {len(saved)} created, {len(errors)} failed"
+        )
+        
+        return BulkCreateResultDTO(
+            created=[ClientDTO.from_entity(client) for _, client in saved],
+            errors=errors,
+            total_requested=len(dtos)
+        )
+    
+    @staticmethod
+    def _build_client(dto: ClientCreateDTO) -> Client:
+        """Build the client entity, raising on invalid data"""
+        client = Client.create(
+            name=dto.name,
+            email=Email(dto.email),
+            program_type=ProgramType(dto.program_type),
+            phone=PhoneNumber(dto.phone) if dto.phone else None,
+            status=ClientStatus(dto.status) if dto.status else ClientStatus.TRIAL
+        )
+        if dto.notes:
+            client.add_note(dto.notes)
+        return client
+    
+    @staticmethod
+    def _error(index: int, email: Optional[str], message: str, error_code: Optional[str]) -> Dict[str, Any]:
+        return {"index": index, "email": email, "error": message, "error_code": error_code}
+    
+    async def _existing_emails(self, emails: List[str]) -> Set[str]:
+        """Emails already taken, looked up in chunks that keep the URL short"""
+        chunks = [
+            emails[start:start + BULK_EMAIL_LOOKUP_CHUNK]
+            for start in range(0, len(emails), BULK_EMAIL_LOOKUP_CHUNK)
+        ]
+        found = await asyncio.gather(
+            *(self._client_repository.find_existing_emails(chunk) for chunk in chunks)
+        )
+        return set().union(*found)
+    
+    def _chunks(self, items: List[Tuple[int, Client]]) -> List[List[Tuple[int, Client]]]:
+        """Split items into chunks bounded by row count and estimated payload size"""
+        chunks: List[List[Tuple[int, Client]]] = []
+        current: List[Tuple[int, Client]] = []
+        current_bytes = 0
+        
+        for item in items:
+            size = _estimated_row_bytes(item[1])
+            if current and (
+                len(current) >= self._chunk_rows or current_bytes + size > self._chunk_bytes
+            ):
+                chunks.append(current)
+                current, current_bytes = [], 0
+            current.append(item)
+            current_bytes += size
+        
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    async def _save_in_chunks(
+        self,
+        items: List[Tuple[int, Client]]
+    ) -> Tuple[List[Tuple[int, Client]], List[Dict[str, Any]]]:
+        """Upsert chunks with bounded parallelism; return saved items and errors"""
+        semaphore = asyncio.Semaphore(self._concurrency)
+        saved: List[Tuple[int, Client]] = []
+        errors: List[Dict[str, Any]] = []
+        
+        async def save_chunk(chunk: List[Tuple[int, Client]]) -> None:
+            async with semaphore:
+                await self._save_or_split(chunk, saved, errors)
+        
+        await asyncio.gather(*(save_chunk(chunk) for chunk in self._chunks(items)))
+        return saved, errors
+    
+    async def _save_or_split(
+        self,
+        chunk: List[Tuple[int, Client]],
+        saved: List[Tuple[int, Client]],
+        errors: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Upsert one chunk. A failed upsert writes nothing, so the chunk is
+        halved and retried until the offending rows are isolated.
+        """
+        try:
+            await self._client_repository.save_batch([client for _, client in chunk])
+            saved.extend(chunk)
+            return
+        except DeadlineExceeded:
+            # Out of time, not a bad row: splitting would only fail again
+            raise
+        except Exception as e:
+            if len(chunk) == 1:
+                index, client = chunk[0]
+                message = e.message if isinstance(e, DomainException) else str(e)
+                self._logger.warning(f"Bulk create of {client.email} failed: {message}")
+                errors.append(self._error(index, str(client.email), message, "SAVE_FAILED"))
+                return
+        
+        middle = len(chunk) // 2
+        await self._save_or_split(chunk[:middle], saved, errors)
+        await self._save_or_split(chunk[middle:], saved, errors)
+
+
 class GetClientUseCase:
     """Use case for retrieving a client by ID"""
     
-    def __init__(self, client_repository: IClientRepository):
+    def __init__(
+        self,
+        client_repository: IClientRepository,
+        client_cache: Optional[IClientCache] = None
+    ):
         self._client_repository = client_repository
+        self._client_cache = client_cache
     
     async def execute(self, client_id: str) -> ClientDTO:
         """
@@ -106,7 +393,7 @@ class GetClientUseCase:
             ClientNotFound: If client doesn't exist
         """
         client_id_obj = ClientId(client_id)
-        client = await self._client_repository.find_by_id(client_id_obj)
+        client = await _find_client(self._client_repository, self._client_cache, client_id_obj)
         
         if not client:
             raise ClientNotFound(client_id)
@@ -121,11 +408,13 @@ class UpdateClientUseCase:
         self,
         client_repository: IClientRepository,
         event_publisher: IEventPublisher,
-        logger: ILogger
+        logger: ILogger,
+        client_cache: Optional[IClientCache] = None
     ):
         self._client_repository = client_repository
         self._event_publisher = event_publisher
         self._logger = logger
+        self._client_cache = client_cache
     
     async def execute(self, client_id: str, dto: ClientUpdateDTO) -> ClientDTO:
         """
@@ -143,7 +432,7 @@ class UpdateClientUseCase:
         """
         # Get existing client
         client_id_obj = ClientId(client_id)
-        client = await self._client_repository.find_by_id(client_id_obj)
+        client = await _find_client(self._client_repository, self._client_cache, client_id_obj)
         
         if not client:
             raise ClientNotFound(client_id)
@@ -155,8 +444,13 @@ class UpdateClientUseCase:
         
         if dto.email is not None:
             new_email = Email(dto.email)
-            # Check if email is already taken by another client
-            existing_client = await self._client_repository.find_by_email(new_email)
+            # Check if email is already taken by another client; emails are
+            # unique, so a cached owner answers it without a query
+            existing_client = None
+            if self._client_cache is not None:
+                existing_client = self._client_cache.get_by_email(str(new_email))
+            if existing_client is None:
+                existing_client = await self._client_repository.find_by_email(new_email)
             if existing_client and existing_client.id != client.id:
                 raise ClientAlreadyExists(dto.email)
             client.update_contact_info(email=new_email)
@@ -194,6 +488,10 @@ class UpdateClientUseCase:
             "timestamp": datetime.utcnow().isoformat()
         })
         
+        # After publishing, so the event's invalidation does not drop it
+        if self._client_cache is not None:
+            self._client_cache.put(client)
+        
         self._logger.info(f"Client updated: {client.id}")
         
         return ClientDTO.from_entity(client)
@@ -211,59 +509,77 @@ class SearchClientsUseCase:
         status: Optional[str] = None,
         program_type: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        pagination: str = "offset",
+        summary: bool = False,
+        count_mode: str = DEFAULT_COUNT_MODE,
+        search_mode: str = DEFAULT_SEARCH_MODE
     ) -> ClientSearchResultDTO:
         """
         Search clients with filters.
         
+        Filters combine, results are newest first, and the page and its
+        total count are fetched in a single repository call.
+        
         Args:
             query: Search query for name/email
             status: Filter by status
             program_type: Filter by program type
             limit: Maximum results
-            offset: Results offset
+            offset: Results offset (offset pagination only)
+            cursor: Cursor from a previous page (implies cursor pagination)
+            sort_key: Keyset sort column (cursor pagination only)
+            pagination: "offset" (default, legacy) or "cursor"
+            summary: Return projected ClientSummaryDTOs instead of full clients
+            count_mode: "exact", "planned", "estimated" or "none" (no total)
+            search_mode: "contains" (substring) or "fulltext" (indexed words)
             
         Returns:
             Search results with metadata
         """
-        clients = []
-        total_count = 0
-        
-        if query:
-            # Text search
-            clients = await self._client_repository.search(query, limit, offset)
-            # For simplicity, using length as count - in real implementation,
-            # you'd have a separate count query
-            total_count = len(clients)
-        elif status:
-            # Filter by status
-            status_enum = ClientStatus(status)
-            clients = await self._client_repository.find_by_status(
-                status_enum, limit, offset
-            )
-            total_count = await self._client_repository.count_by_status(status_enum)
-        elif program_type:
-            # Filter by program type
-            program_type_enum = ProgramType(program_type)
-            clients = await self._client_repository.find_by_program_type(
-                program_type_enum, limit, offset
-            )
-            total_count = await self._client_repository.count_by_program_type(
-                program_type_enum
+        keyset = cursor is not None or pagination == "cursor"
+        status_enum = ClientStatus(status) if status else None
+        program_type_enum = ProgramType(program_type) if program_type else None
+        limit = limit or DEFAULT_PAGE_SIZE
+        offset = None if keyset else (offset or 0)
+        
+        if summary:
+            page = await self._client_repository.find_summary_page(
+                limit=limit,
+                cursor=cursor,
+                sort_key=sort_key,
+                query=query,
+                status=status_enum,
+                program_type=program_type_enum,
+                offset=offset,
+                count_mode=count_mode,
+                search_mode=search_mode
             )
+            client_dtos = [ClientSummaryDTO.from_summary(item) for item in page.items]
         else:
-            # Get all clients
-            clients = await self._client_repository.find_all(limit, offset)
-            total_count = await self._client_repository.count()
-        
-        # Convert to DTOs
-        client_dtos = [ClientDTO.from_entity(client) for client in clients]
+            page = await self._client_repository.find_page(
+                limit=limit,
+                cursor=cursor,
+                sort_key=sort_key,
+                query=query,
+                status=status_enum,
+                program_type=program_type_enum,
+                offset=offset,
+                count_mode=count_mode,
+                search_mode=search_mode
+            )
+            client_dtos = [ClientDTO.from_entity(client) for client in page.items]
         
         return ClientSearchResultDTO(
             clients=client_dtos,
-            total_count=total_count,
+            total_count=page.total_count,
             limit=limit,
-            offset=offset or 0
+            offset=offset or 0,
+            next_cursor=page.next_cursor,
+            pagination_mode="cursor" if keyset else "offset",
+            count_mode=count_mode
         )
 
 
@@ -282,6 +598,9 @@ class GetClientAnalyticsUseCase:
         """
         Get client analytics data.
         
+        Status and program type distributions are built from grouped
+        counts aggregated by the repository in the database.
+        
         Args:
             start_date: Start date filter
             end_date: End date filter  
@@ -320,11 +639,13 @@ class DeleteClientUseCase:
         self,
         client_repository: IClientRepository,
         event_publisher: IEventPublisher,
-        logger: ILogger
+        logger: ILogger,
+        client_cache: Optional[IClientCache] = None
     ):
         self._client_repository = client_repository
         self._event_publisher = event_publisher
         self._logger = logger
+        self._client_cache = client_cache
     
     async def execute(self, client_id: str) -> bool:
         """
@@ -347,6 +668,9 @@ class DeleteClientUseCase:
         deleted = await self._client_repository.delete(client_id_obj)
         
         if deleted:
+            if self._client_cache is not None:
+                self._client_cache.invalidate(client_id)
+            
             # Publish event
             await self._event_publisher.publish({
                 "event_type": "ClientDeleted",
@@ -356,4 +680,56 @@ class DeleteClientUseCase:
             
             self._logger.info(f"Client deleted: {client_id}")
         
-        return deleted
\ No newline at end of file
+        return deleted
+
+
+class ExportClientsUseCase:
+    """
+    Use case for exporting clients.
+    
+    Walks the table with keyset pagination and yields one page of
+    ClientRecord snapshots at a time, so an export of any size holds a
+    single page in memory.
+    """
+    
+    def __init__(
+        self,
+        client_repository: IClientRepository,
+        logger: ILogger,
+        page_size: int = EXPORT_PAGE_SIZE
+    ):
+        self._client_repository = client_repository
+        self._logger = logger
+        self._page_size = page_size
+    
+    async def pages(
+        self,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None
+    ) -> AsyncIterator[List[ClientRecord]]:
+        """
+        Yield every matching client, newest first, one page at a time.
+        
+        Args:
+            status: Optional status filter
+            program_type: Optional program type filter
+        """
+        cursor: Optional[str] = None
+        exported = 0
+        
+        while True:
+            page = await self._client_repository.find_record_page(
+                limit=self._page_size,
+                cursor=cursor,
+                status=status,
+                program_type=program_type,
+                count_mode="none"
+            )
+            if page.items:
+                exported += len(page.items)
+                yield page.items
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+        
+        self._logger.info(f"Exported {exported} clients")
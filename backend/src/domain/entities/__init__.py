@@ -5,7 +5,7 @@ This module contains the core business entities that represent the essential
 concepts in the NGX Performance & Longevity domain.
 """
 
-from .client import Client, ClientId, ClientStatus, ProgramType
+from .client import Client, ClientId, ClientStatus, ProgramType, ClientSummary, ClientRecord
 from .program import Program, ProgramId, Exercise, ExerciseType
 from .progress import Progress, ProgressId, Measurement, MeasurementType
 from .user import User, UserId, UserRole
@@ -16,6 +16,8 @@ __all__ = [
     "ClientId", 
     "ClientStatus",
     "ProgramType",
+    "ClientSummary",
+    "ClientRecord",
     
     # Program
     "Program",
@@ -6,6 +6,16 @@ without coupling to specific implementation details.
 """
 
 from .client_repository import IClientRepository
+from .pagination import (
+    Page,
+    PageCursor,
+    SORT_KEYS,
+    DEFAULT_SORT_KEY,
+    COUNT_MODES,
+    DEFAULT_COUNT_MODE,
+    SEARCH_MODES,
+    DEFAULT_SEARCH_MODE,
+)
 from .program_repository import IProgramRepository
 from .progress_repository import IProgressRepository
 from .user_repository import IUserRepository
@@ -15,4 +25,14 @@ __all__ = [
     "IProgramRepository", 
     "IProgressRepository",
     "IUserRepository",
+    
+    # Pagination
+    "Page",
+    "PageCursor",
+    "SORT_KEYS",
+    "DEFAULT_SORT_KEY",
+    "COUNT_MODES",
+    "DEFAULT_COUNT_MODE",
+    "SEARCH_MODES",
+    "DEFAULT_SEARCH_MODE",
 ]
\ No newline at end of file
@@ -3,11 +3,12 @@ Client Repository Interface
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime
 
-from ..entities import Client, ClientId, ClientStatus, ProgramType
+from ..entities import Client, ClientId, ClientStatus, ProgramType, ClientSummary, ClientRecord
 from ..value_objects import Email
+from .pagination import Page, DEFAULT_SORT_KEY, DEFAULT_SEARCH_MODE
 
 
 class IClientRepository(ABC):
@@ -57,6 +58,20 @@ class IClientRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def find_by_ids(self, client_ids: List[ClientId]) -> List[Client]:
+        """
+        Find several clients by ID with one ``in`` query.
+        
+        Args:
+            client_ids: The client identifiers
+            
+        Returns:
+            The clients found, in no particular order; missing IDs are
+            left out
+        """
+        pass
+    
     @abstractmethod
     async def find_all(
         self, 
@@ -120,7 +135,8 @@ class IClientRepository(ABC):
         self, 
         query: str,
         limit: Optional[int] = None, 
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        search_mode: str = DEFAULT_SEARCH_MODE
     ) -> List[Client]:
         """
         Search clients by name or email.
@@ -129,12 +145,122 @@ class IClientRepository(ABC):
             query: Search query string
             limit: Maximum number of clients to return
             offset: Number of clients to skip
+            search_mode: ``contains`` (substring) or ``fulltext`` (indexed
+                word search)
             
         Returns:
             List of client entities matching the search criteria
         """
         pass
     
+    @abstractmethod
+    async def find_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        query: Optional[str] = None,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None,
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Page[Client]:
+        """
+        Find one keyset page of clients, newest first.
+        
+        Unlike offset pagination, the cost of a page does not grow with
+        its depth and concurrent inserts never shift later pages.
+        
+        Args:
+            limit: Maximum number of clients to return
+            cursor: Opaque cursor from the previous page's ``next_cursor``
+            sort_key: Column to page by (``created_at`` or ``updated_at``)
+            query: Optional name/email search
+            status: Optional status filter
+            program_type: Optional program type filter
+            offset: Legacy offset; used instead of the cursor when given
+            count_mode: Total count strategy (see ``COUNT_MODES``), read
+                from the same request; ``none`` leaves ``total_count`` unset
+            search_mode: How ``query`` matches (see ``SEARCH_MODES``)
+            
+        Returns:
+            Page of client entities, the cursor of the next page and the
+            total count when requested
+            
+        Raises:
+            DomainException: If the cursor, sort key or count mode is invalid
+        """
+        pass
+    
+    @abstractmethod
+    async def find_summary_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        query: Optional[str] = None,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None,
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Page[ClientSummary]:
+        """
+        Find one page of client summaries for list views, newest first.
+        
+        Selects only ``ClientSummary.COLUMNS`` and skips full entity
+        hydration. Same filters and ordering as ``find_page``.
+        
+        Args:
+            limit: Maximum number of summaries to return
+            cursor: Opaque cursor from the previous page's ``next_cursor``
+            sort_key: Column to page by (``created_at`` or ``updated_at``)
+            query: Optional name/email search
+            status: Optional status filter
+            program_type: Optional program type filter
+            offset: Legacy offset; used instead of the cursor when given
+            count_mode: Total count strategy, as for ``find_page``
+            search_mode: How ``query`` matches, as for ``find_page``
+            
+        Returns:
+            Page of client summaries, the cursor of the next page and the
+            total count when requested
+            
+        Raises:
+            DomainException: If the cursor, sort key or count mode is invalid
+        """
+        pass
+    
+    @abstractmethod
+    async def find_record_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        query: Optional[str] = None,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None,
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Page[ClientRecord]:
+        """
+        Find one page of compact client snapshots, newest first.
+        
+        For bulk read paths (exports, analytics) that hold many clients
+        at once: same rows, filters and ordering as ``find_page``, but
+        hydrated into ``ClientRecord`` instead of full entities.
+        
+        Returns:
+            Page of client records, the cursor of the next page and the
+            total count when requested
+            
+        Raises:
+            DomainException: If the cursor, sort key or count mode is invalid
+        """
+        pass
+    
     @abstractmethod
     async def count(self) -> int:
         """
@@ -228,6 +354,59 @@ class IClientRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def find_existing_emails(self, emails: List[str]) -> Set[str]:
+        """
+        Find which of the given emails already belong to a client.
+        
+        Checks all emails with one ``in`` query instead of one
+        ``exists_by_email`` round trip each.
+        
+        Args:
+            emails: Normalized email addresses to check
+            
+        Returns:
+            The subset of ``emails`` that already exist
+        """
+        pass
+    
+    @abstractmethod
+    async def save_batch(self, clients: List[Client]) -> None:
+        """
+        Save several clients with a single upsert.
+        
+        Args:
+            clients: The client entities to save
+            
+        Raises:
+            DomainException: If the batch could not be saved; no partial
+                result is reported
+        """
+        pass
+    
+    @abstractmethod
+    async def count_by_status_and_program_type(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        program_type: Optional[ProgramType] = None
+    ) -> Dict[Tuple[str, str], int]:
+        """
+        Count clients grouped by status and program type.
+        
+        The aggregation runs in the database; implementations must not
+        load every matching client to count them.
+        
+        Args:
+            start_date: Optional start of the creation date range
+            end_date: Optional end of the creation date range
+            program_type: Optional program type filter
+            
+        Returns:
+            Mapping of (status, program_type) to client count
+        """
+        pass
+    
     @abstractmethod
     async def get_analytics_data(
         self,
@@ -0,0 +1,124 @@
+"""
+Keyset Pagination Types
+
+Opaque cursor tokens and result pages for repositories that page by a
+``(sort_key, id)`` position instead of an offset, and the count and
+search strategies a page can be fetched with.
+"""
+
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Generic, List, Optional, TypeVar
+
+from ..exceptions import DomainException
+
+T = TypeVar("T")
+
+# Columns a keyset page can be ordered by (always newest first, id as tiebreaker)
+SORT_KEYS = ("created_at", "updated_at")
+DEFAULT_SORT_KEY = "created_at"
+
+# How a page reports the total number of matching rows, in the same request:
+# exact (COUNT(*)), planned (planner estimate), estimated (exact up to a
+# threshold, planned beyond it) or none (no total; has_more only)
+COUNT_MODES = ("exact", "planned", "estimated", "none")
+DEFAULT_COUNT_MODE = "exact"
+
+# How a text query matches: contains (substring ilike on name/email, no index)
+# or fulltext (whole words against the indexed search_vector column)
+SEARCH_MODES = ("contains", "fulltext")
+DEFAULT_SEARCH_MODE = "contains"
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """
+    Position of the last row of a page.
+    
+    The next page starts strictly after ``(sort_value, id)`` in
+    ``sort_key DESC, id DESC`` order, so rows inserted while a client is
+    paging never shift or duplicate the rows it has not seen yet.
+    """
+    
+    sort_key: str
+    sort_value: str
+    id: str
+    
+    def encode(self) -> str:
+        """Encode as an opaque URL-safe token"""
+        payload = json.dumps([self.sort_key, self.sort_value, self.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+    
+    @classmethod
+    def decode(cls, token: str, sort_key: str = DEFAULT_SORT_KEY) -> "PageCursor":
+        """
+        Decode a token produced by ``encode``.
+        
+        Raises:
+            DomainException: If the token is malformed or was issued for
+                a different sort order
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            key, value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            cursor = cls(sort_key=str(key), sort_value=str(value), id=str(row_id))
+        except (ValueError, TypeError) as e:
+            raise DomainException(
+                "Invalid pagination cursor",
+                error_code="INVALID_CURSOR",
+                details={"reason": str(e)}
+            )
+        
+        if cursor.sort_key != sort_key:
+            raise DomainException(
+                f"Cursor was issued for sort '{cursor.sort_key}', not '{sort_key}'",
+                error_code="INVALID_CURSOR"
+            )
+        
+        return cursor
+
+
+def validate_sort_key(sort_key: str) -> str:
+    """Check that a keyset sort key is supported"""
+    if sort_key not in SORT_KEYS:
+        raise DomainException(
+            f"Sort must be one of: {list(SORT_KEYS)}",
+            error_code="INVALID_SORT_KEY"
+        )
+    return sort_key
+
+
+def validate_count_mode(count_mode: str) -> str:
+    """Check that a count strategy is supported"""
+    if count_mode not in COUNT_MODES:
+        raise DomainException(
+            f"Count mode must be one of: {list(COUNT_MODES)}",
+            error_code="INVALID_COUNT_MODE"
+        )
+    return count_mode
+
+
+def validate_search_mode(search_mode: str) -> str:
+    """Check that a search strategy is supported"""
+    if search_mode not in SEARCH_MODES:
+        raise DomainException(
+            f"Search mode must be one of: {list(SEARCH_MODES)}",
+            error_code="INVALID_SEARCH_MODE"
+        )
+    return search_mode
+
+
+@dataclass
+class Page(Generic[T]):
+    """One keyset page of results"""
+    
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    # Total matching rows, when the page was fetched with a count mode
+    total_count: Optional[int] = None
+    
+    @property
+    def has_more(self) -> bool:
+        """Whether another page follows this one"""
+        return self.next_cursor is not None
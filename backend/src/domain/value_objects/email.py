@@ -9,7 +9,7 @@ from typing import ClassVar
 from ..exceptions import DomainException
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Email:
     """
     Email value object that ensures email format validity
@@ -40,6 +40,18 @@ class Email:
         if len(self.value) > 254:  # RFC 5321 limit
             raise DomainException("Email too long (max 254 characters)")
     
+    @classmethod
+    def trusted(cls, value: str) -> "Email":
+        """
+        Wrap an email read back from storage without re-validating it.
+        
+        Stored emails were normalized and validated on write; use the
+        regular constructor for anything else.
+        """
+        email = object.__new__(cls)
+        object.__setattr__(email, 'value', value)
+        return email
+    
     @property
     def domain(self) -> str:
         """Get the domain part of the email"""
@@ -9,7 +9,7 @@ from typing import ClassVar, Optional
 from ..exceptions import DomainException
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhoneNumber:
     """
     Phone number value object that handles validation and formatting
@@ -39,6 +39,14 @@ class PhoneNumber:
         # Store normalized version
         object.__setattr__(self, 'value', cleaned)
     
+    @classmethod
+    def trusted(cls, value: str, country_code: Optional[str] = None) -> "PhoneNumber":
+        """Wrap a phone number read back from storage without re-validating it"""
+        phone = object.__new__(cls)
+        object.__setattr__(phone, 'value', value)
+        object.__setattr__(phone, 'country_code', country_code)
+        return phone
+    
     @property
     def digits_only(self) -> str:
         """Get phone number with digits only"""
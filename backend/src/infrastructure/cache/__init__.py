@@ -0,0 +1,59 @@
+"""
+Cache Infrastructure
+
+Caching shared by the repositories and API layer: one backend per process
+(in-memory, or in-memory in front of Redis when configured), namespaced
+per subsystem and decorated function.
+"""
+
+from .backend import DEFAULT_NAMESPACE, MISSING, CacheBackend, NamespaceStats
+from .conditional import (
+    ResourceVersions,
+    etag_matches,
+    hashed_json,
+    not_modified,
+    resource_versions,
+    strong_etag,
+    versioned,
+)
+from .dashboards import dashboard_cache, dashboard_cache_stats
+from .decorator import cached, cached_function_stats
+from .keys import Uncacheable, canonical, entity_tag, make_key, table_tag
+from .memory import MemoryCache
+from .negative import NegativeCache, negative_cache
+from .registry import close_cache, get_cache, memory_cache, set_cache
+from .sizing import estimate_size
+from .swr import CachedResult, StaleWhileRevalidate
+
+__all__ = [
+    "DEFAULT_NAMESPACE",
+    "MISSING",
+    "CacheBackend",
+    "CachedResult",
+    "MemoryCache",
+    "NamespaceStats",
+    "NegativeCache",
+    "ResourceVersions",
+    "StaleWhileRevalidate",
+    "Uncacheable",
+    "cached",
+    "cached_function_stats",
+    "close_cache",
+    "dashboard_cache",
+    "dashboard_cache_stats",
+    "canonical",
+    "entity_tag",
+    "estimate_size",
+    "etag_matches",
+    "get_cache",
+    "hashed_json",
+    "make_key",
+    "memory_cache",
+    "negative_cache",
+    "not_modified",
+    "resource_versions",
+    "set_cache",
+    "strong_etag",
+    "table_tag",
+    "versioned",
+]
@@ -0,0 +1,120 @@
+"""
+Cache Backend Interface
+
+What the ``cached`` decorator, QueryCache and the API layer need from a
+cache store. Entries live in a namespace (one per decorated function or
+subsystem, which is also the unit of hit/miss accounting) and may carry
+tags for grouped invalidation.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, Optional
+
+DEFAULT_NAMESPACE = "default"
+
+# Returned by ``get`` for a miss when the caller needs to tell it from a cached None
+MISSING: Any = object()
+
+
+@dataclass
+class NamespaceStats:
+    """Counters for one cache namespace"""
+
+    entries: int = 0
+    bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return round(self.hits / lookups * 100, 2) if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class CacheBackend(ABC):
+    """Key/value store with TTLs, namespaces and tags"""
+
+    @abstractmethod
+    def get(self, key: str, namespace: str = DEFAULT_NAMESPACE, default: Any = None) -> Any:
+        """Cached value, or ``default`` when missing or expired"""
+
+    async def aget(self, key: str, namespace: str = DEFAULT_NAMESPACE, default: Any = None) -> Any:
+        """
+        ``get`` for async callers.
+
+        Backends that go over the network override it to wait without
+        blocking the event loop.
+        """
+        return self.get(key, namespace, default)
+
+    @abstractmethod
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        namespace: str = DEFAULT_NAMESPACE,
+        size: Optional[int] = None
+    ) -> bool:
+        """Store ``value``; returns False if it was not stored"""
+
+    def setdefault(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        namespace: str = DEFAULT_NAMESPACE
+    ) -> Any:
+        """
+        Store ``value`` unless ``key`` is cached; returns the cached value.
+
+        Callers racing on one key all get the value of the first to
+        store. Backends override it to make the check and the store one
+        atomic step; this fallback only avoids overwriting.
+        """
+        current = self.get(key, namespace, MISSING)
+        if current is not MISSING:
+            return current
+        self.set(key, value, ttl=ttl, tags=tags, namespace=namespace)
+        return value
+
+    async def asetdefault(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        namespace: str = DEFAULT_NAMESPACE
+    ) -> Any:
+        """``setdefault`` for async callers"""
+        return self.setdefault(key, value, ttl=ttl, tags=tags, namespace=namespace)
+
+    @abstractmethod
+    def delete(self, key: str, namespace: str = DEFAULT_NAMESPACE) -> bool:
+        """Drop one entry; returns whether it was cached"""
+
+    @abstractmethod
+    def invalidate_tags(self, *tags: str) -> int:
+        """Drop every entry carrying any of ``tags``; returns how many were dropped"""
+
+    @abstractmethod
+    def clear(self, namespace: Optional[str] = None) -> int:
+        """Drop every entry, or every entry of one namespace; returns how many"""
+
+    @abstractmethod
+    def namespace_stats(self, namespace: str = DEFAULT_NAMESPACE) -> Dict[str, Any]:
+        """Counters for one namespace"""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Backend-wide statistics with per-namespace counters"""
@@ -0,0 +1,201 @@
+"""
+Cache Value Codec
+
+How values cross process boundaries (Redis). Values are reduced to JSON
+and dumped with orjson; what JSON cannot express is wrapped in a
+``{"__t": <type>, "v": <payload>}`` object: tuples, sets, datetimes,
+decimals, UUIDs, bytes, dicts with non-string keys, and instances of
+enums, dataclasses, NamedTuples and pydantic models.
+
+Unlike pickle, decoding never runs code chosen by the data: a class is
+only rebuilt, through its own constructor, if this process registered
+it, either explicitly with ``register_type`` or by encoding an instance
+of it. A value naming any other type fails to decode and is treated as
+a miss, so its reader computes and caches the value itself.
+"""
+
+import base64
+import dataclasses
+import json
+import threading
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Tuple, Type
+from uuid import UUID
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+TYPE_FIELD = "__t"
+VALUE_FIELD = "v"
+
+
+class CodecError(ValueError):
+    """A value cannot be encoded, or a payload cannot be decoded"""
+
+
+# Registered classes by name, with how to rebuild one from its decoded payload
+_types: Dict[str, Tuple[Type, Callable[[Type, Any], Any]]] = {}
+_types_lock = threading.Lock()
+
+
+def register_type(cls: Type) -> Type:
+    """
+    Allow instances of ``cls`` to be decoded in this process.
+
+    Works for enums, dataclasses, NamedTuples and pydantic models, and
+    can be used as a class decorator.
+    """
+    _register(cls)
+    return cls
+
+
+def encode(value: Any) -> bytes:
+    """JSON bytes for ``value``; raises CodecError for unsupported types"""
+    document = _to_json(value)
+    try:
+        if orjson is not None:
+            return orjson.dumps(document)
+        return json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    except (TypeError, ValueError) as e:
+        raise CodecError(f"Cannot encode cached value: {e}") from e
+
+
+def decode(payload: bytes) -> Any:
+    """The value encoded in ``payload``; raises CodecError if it cannot be rebuilt"""
+    try:
+        document = orjson.loads(payload) if orjson is not None else json.loads(payload)
+    except ValueError as e:
+        raise CodecError(f"Cached payload is not JSON: {e}") from e
+    try:
+        return _from_json(document)
+    except CodecError:
+        raise
+    except Exception as e:
+        raise CodecError(f"Cannot rebuild cached value: {e}") from e
+
+
+def _type_name(cls: Type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _register(cls: Type) -> str:
+    name = _type_name(cls)
+    if name in _types:
+        return name
+
+    if issubclass(cls, Enum):
+        rebuild = _rebuild_enum
+    elif issubclass(cls, BaseModel):
+        rebuild = _rebuild_model
+    elif issubclass(cls, tuple) and hasattr(cls, "_fields"):
+        rebuild = _rebuild_named_tuple
+    elif dataclasses.is_dataclass(cls):
+        rebuild = _rebuild_dataclass
+    else:
+        raise CodecError(f"Cannot cache values of type {cls.__name__}")
+
+    with _types_lock:
+        _types[name] = (cls, rebuild)
+    return name
+
+
+def _rebuild_enum(cls: Type, payload: Any) -> Any:
+    return cls(payload)
+
+
+def _rebuild_model(cls: Type, payload: Any) -> Any:
+    return cls.model_validate(payload)
+
+
+def _rebuild_named_tuple(cls: Type, payload: Any) -> Any:
+    return cls(*payload)
+
+
+def _rebuild_dataclass(cls: Type, payload: Any) -> Any:
+    return cls(**payload)
+
+
+def _tagged(kind: str, payload: Any) -> Dict[str, Any]:
+    return {TYPE_FIELD: kind, VALUE_FIELD: payload}
+
+
+def _to_json(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, Enum):
+        return _tagged(_register(type(value)), _to_json(value.value))
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value) and TYPE_FIELD not in value:
+            return {key: _to_json(item) for key, item in value.items()}
+        return _tagged("dict", [[_to_json(key), _to_json(item)] for key, item in value.items()])
+    if isinstance(value, list):
+        return [_to_json(item) for item in value]
+    if isinstance(value, tuple):
+        if hasattr(type(value), "_fields"):
+            return _tagged(_register(type(value)), [_to_json(item) for item in value])
+        return _tagged("tuple", [_to_json(item) for item in value])
+    if isinstance(value, (set, frozenset)):
+        return _tagged(type(value).__name__, [_to_json(item) for item in value])
+    if isinstance(value, datetime):
+        return _tagged("datetime", value.isoformat())
+    if isinstance(value, date):
+        return _tagged("date", value.isoformat())
+    if isinstance(value, time):
+        return _tagged("time", value.isoformat())
+    if isinstance(value, Decimal):
+        return _tagged("decimal", str(value))
+    if isinstance(value, UUID):
+        return _tagged("uuid", str(value))
+    if isinstance(value, bytes):
+        return _tagged("bytes", base64.b64encode(value).decode("ascii"))
+    if isinstance(value, BaseModel):
+        return _tagged(_register(type(value)), _to_json(value.model_dump()))
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        fields = {
+            field.name: _to_json(getattr(value, field.name))
+            for field in dataclasses.fields(value) if field.init
+        }
+        return _tagged(_register(type(value)), fields)
+    raise CodecError(f"Cannot cache values of type {type(value).__name__}")
+
+
+_BUILTINS: Dict[str, Callable[[Any], Any]] = {
+    "dict": lambda pairs: {_from_json(key): _from_json(item) for key, item in pairs},
+    "tuple": lambda items: tuple(_from_json(item) for item in items),
+    "set": lambda items: {_from_json(item) for item in items},
+    "frozenset": lambda items: frozenset(_from_json(item) for item in items),
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "time": time.fromisoformat,
+    "decimal": Decimal,
+    "uuid": UUID,
+    "bytes": base64.b64decode,
+}
+
+
+def _from_json(document: Any) -> Any:
+    if isinstance(document, list):
+        return [_from_json(item) for item in document]
+    if not isinstance(document, dict):
+        return document
+    if TYPE_FIELD not in document:
+        return {key: _from_json(item) for key, item in document.items()}
+
+    kind, payload = document[TYPE_FIELD], document.get(VALUE_FIELD)
+    builtin = _BUILTINS.get(kind)
+    if builtin is not None:
+        return builtin(payload)
+
+    registered = _types.get(kind)
+    if registered is None:
+        raise CodecError(f"Cached value has unregistered type {kind}")
+    cls, rebuild = registered
+    return rebuild(cls, _from_json(payload))
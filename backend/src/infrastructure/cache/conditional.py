@@ -0,0 +1,164 @@
+"""
+HTTP Conditional Requests
+
+Strong ETags for read endpoints, so pollers that already hold the
+current representation get ``304 Not Modified`` and no body.
+
+``versioned(resource)`` is a route dependency for data written through
+the API. Its ETag is derived from a version token of the resource, kept
+in the shared cache backend so every worker agrees, plus the request
+path and query. Writes call ``resource_versions.bump(resource)``. A
+matching ``If-None-Match`` is answered before the endpoint runs, so
+there is no query and no serialization. Tokens also expire after
+``ttl`` seconds, which bounds how long rows changed outside the API can
+be reported unchanged.
+
+Endpoints whose data has no version are hashed instead: ``strong_etag``
+of the rendered body (see ``interfaces.api.conditional``, or
+``hashed_json`` for routers outside that app). That saves the bytes,
+not the work.
+
+Only GET and HEAD are conditional: on other methods a matching
+``If-None-Match`` means 412 (RFC 9110), never 304.
+"""
+
+import hashlib
+import os
+import uuid
+from typing import Any, Callable, Optional
+
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from .backend import MISSING, CacheBackend
+from .registry import get_cache
+
+CONDITIONAL_METHODS = ("GET", "HEAD")
+
+# Cache-Control of read-mostly catalogs: browsers keep the copy but
+# revalidate it on every use, which versioned routes answer with a 304
+CATALOG_CACHE_CONTROL = os.getenv("CACHE_CONTROL_CATALOG", "private, no-cache")
+
+# Longest a version token lives, for data that can change outside the API
+ETAG_VERSION_TTL = float(os.getenv("ETAG_VERSION_TTL", "3600"))
+
+VERSIONS_NAMESPACE = "etag_versions"
+
+
+def strong_etag(content: bytes) -> str:
+    """Quoted strong ETag of a representation"""
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an ``If-None-Match`` header lists ``etag`` (weak comparison, as RFC 9110 asks)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str, cache_control: Optional[str] = None) -> Response:
+    """Bodiless 304 carrying the validator and caching policy"""
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return Response(status_code=304, headers=headers)
+
+
+def hashed_json(
+    request: Request,
+    content: Any,
+    cache_control: Optional[str] = CATALOG_CACHE_CONTROL
+) -> Response:
+    """
+    JSON response whose ETag hashes its body, or a 304 when the client
+    already holds that body.
+
+    For data that can change without a version bump; ``content`` must
+    already be JSON-compatible.
+    """
+    response = JSONResponse(content)
+    etag = strong_etag(response.body)
+    if request.method in CONDITIONAL_METHODS and etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag, cache_control)
+    response.headers["ETag"] = etag
+    if cache_control:
+        response.headers["Cache-Control"] = cache_control
+    return response
+
+
+class ResourceVersions:
+    """Version tokens per resource, shared by workers through the cache backend"""
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self._backend = backend
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend if self._backend is not None else get_cache()
+
+    def token(self, resource: str, ttl: float = ETAG_VERSION_TTL) -> str:
+        """Current token of ``resource``, minted if there is none"""
+        token = self.backend.get(resource, VERSIONS_NAMESPACE, MISSING)
+        if token is MISSING:
+            # Set-if-absent, so workers minting at once agree on the first token
+            token = self.backend.setdefault(resource, uuid.uuid4().hex, ttl=ttl, namespace=VERSIONS_NAMESPACE)
+        return token
+
+    async def atoken(self, resource: str, ttl: float = ETAG_VERSION_TTL) -> str:
+        """``token`` for async callers; asks the shared tier without blocking the loop"""
+        token = await self.backend.aget(resource, VERSIONS_NAMESPACE, MISSING)
+        if token is MISSING:
+            token = await self.backend.asetdefault(
+                resource, uuid.uuid4().hex, ttl=ttl, namespace=VERSIONS_NAMESPACE
+            )
+        return token
+
+    def bump(self, *resources: str) -> None:
+        """Mark resources changed; call after the write is committed"""
+        # The next read mints a new token; deleting also reaches other workers' L1
+        for resource in resources:
+            self.backend.delete(resource, VERSIONS_NAMESPACE)
+
+    async def etag(self, resource: str, request: Request, ttl: float = ETAG_VERSION_TTL) -> str:
+        """ETag of the representation at this path and query for the current version"""
+        token = await self.atoken(resource, ttl)
+        variant = f"{token}|{request.url.path}|{sorted(request.query_params.multi_items())}"
+        return strong_etag(variant.encode())
+
+
+resource_versions = ResourceVersions()
+
+
+def versioned(
+    resource: str,
+    cache_control: Optional[str] = CATALOG_CACHE_CONTROL,
+    ttl: float = ETAG_VERSION_TTL
+) -> Callable:
+    """
+    Route dependency answering ``If-None-Match`` from the version of ``resource``.
+
+    Raises a 304 before the endpoint runs when the client's copy is
+    current; otherwise tags the response with the ETag and
+    ``cache_control``.
+    """
+
+    async def check_version(request: Request, response: Response) -> None:
+        if request.method not in CONDITIONAL_METHODS:
+            return
+        etag = await resource_versions.etag(resource, request, ttl)
+        headers = {"ETag": etag}
+        if cache_control:
+            headers["Cache-Control"] = cache_control
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+    return check_version
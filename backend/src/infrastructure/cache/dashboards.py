@@ -0,0 +1,36 @@
+"""
+Dashboard Caching
+
+Dashboards and KPI views are served stale-while-revalidate: fresh for
+DASHBOARD_FRESH_SECONDS, then served stale while one background task
+recomputes them, and never older than DASHBOARD_MAX_AGE_SECONDS.
+Endpoints report how they were served with the result's ``X-Cache`` and
+``Age`` headers and a ``cache`` block in the body.
+"""
+
+import os
+from typing import Any, Dict
+
+from .swr import StaleWhileRevalidate
+
+DASHBOARD_FRESH_SECONDS = float(os.getenv("DASHBOARD_FRESH_SECONDS", "30"))
+DASHBOARD_MAX_AGE_SECONDS = float(os.getenv("DASHBOARD_MAX_AGE_SECONDS", "600"))
+
+_policies: Dict[str, StaleWhileRevalidate] = {}
+
+
+def dashboard_cache(name: str) -> StaleWhileRevalidate:
+    """The stale-while-revalidate policy for one dashboard"""
+    policy = _policies.get(name)
+    if policy is None:
+        policy = _policies[name] = StaleWhileRevalidate(
+            f"dashboard:{name}",
+            fresh_for=DASHBOARD_FRESH_SECONDS,
+            max_age=DASHBOARD_MAX_AGE_SECONDS
+        )
+    return policy
+
+
+def dashboard_cache_stats() -> Dict[str, Any]:
+    """Serving counters per dashboard"""
+    return {name: policy.stats() for name, policy in _policies.items()}
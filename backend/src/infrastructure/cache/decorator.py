@@ -0,0 +1,169 @@
+"""
+Cached Function Results
+
+``@cached`` memoises sync and async functions (FastAPI endpoints
+included) in the process-wide cache backend. Each decorated function gets
+its own namespace (its qualified name by default), so its hits and misses
+show up separately in ``cached_function_stats()`` and ``func.invalidate()``
+drops only its entries.
+
+Keys are built from the call's arguments bound to the function signature
+(so ``f(1)`` and ``f(x=1)`` share an entry and defaults are always
+included) and hashed canonically, pydantic models by their JSON fields.
+Framework objects (Request, Response, BackgroundTasks) and ``self``/``cls``
+are left out of the key; so are the parameters and model fields named in
+``exclude``. Calls with an argument that has no stable key (see
+``keys.canonical``) run uncached instead of being keyed by something that
+never repeats, and Response results are never cached.
+"""
+
+import functools
+import inspect
+import logging
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from starlette.background import BackgroundTasks
+from starlette.requests import HTTPConnection
+from starlette.responses import Response
+
+from .backend import MISSING, CacheBackend
+from .keys import Uncacheable, make_key
+from .registry import get_cache
+
+logger = logging.getLogger(__name__)
+
+# Injected by the framework, never part of what a call computes
+FRAMEWORK_TYPES = (HTTPConnection, Response, BackgroundTasks)
+
+_BOUND_NAMES = ("self", "cls")
+
+# namespace -> backend pinned by the decorator, or None for the process-wide one
+_functions: Dict[str, Optional[CacheBackend]] = {}
+
+
+def cached(
+    ttl: float = 300,
+    namespace: Optional[str] = None,
+    tags: Iterable[str] = (),
+    exclude: Iterable[str] = (),
+    backend: Optional[CacheBackend] = None
+) -> Callable[[Callable], Callable]:
+    """
+    Cache the decorated function's results for ``ttl`` seconds.
+
+    ``exclude`` names parameters (``"trace_id"``) or fields of a model
+    parameter (``"request.request_id"``) that do not change the result.
+    ``tags`` are attached to every entry so related writes can drop them
+    with ``invalidate_tags``; ``backend`` pins a store instead of the
+    configured one (mainly for tests).
+    """
+    tags = tuple(tags)
+    excluded_params, excluded_fields = _split_exclusions(exclude)
+
+    def decorator(func: Callable) -> Callable:
+        name = namespace or f"{func.__module__}.{func.__qualname__}"
+        signature = inspect.signature(func)
+        _functions[name] = backend
+
+        def store() -> CacheBackend:
+            return backend if backend is not None else get_cache()
+
+        def key_of(args: tuple, kwargs: dict) -> Optional[str]:
+            try:
+                arguments = _key_arguments(signature, args, kwargs, excluded_params, excluded_fields)
+                return make_key(name, (), arguments)
+            except Uncacheable as e:
+                logger.debug(f"Not caching {name}: {e}")
+                return None
+            except TypeError:
+                # Arguments do not fit the signature; let the call raise it
+                return None
+
+        def remember(key: Optional[str], result: Any) -> None:
+            if key is not None and not isinstance(result, Response):
+                store().set(key, result, ttl=ttl, tags=tags, namespace=name)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = key_of(args, kwargs)
+                value = MISSING if key is None else await store().aget(key, name, MISSING)
+                if value is not MISSING:
+                    return value
+                result = await func(*args, **kwargs)
+                remember(key, result)
+                return result
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = key_of(args, kwargs)
+                value = MISSING if key is None else store().get(key, name, MISSING)
+                if value is not MISSING:
+                    return value
+                result = func(*args, **kwargs)
+                remember(key, result)
+                return result
+
+        def invalidate() -> int:
+            """Drop every cached result of this function"""
+            return store().clear(name)
+
+        wrapper.cache_namespace = name
+        wrapper.invalidate = invalidate
+        wrapper.cache_stats = lambda: store().namespace_stats(name)
+        return wrapper
+
+    return decorator
+
+
+def cached_function_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit/miss counters of every ``@cached`` function, by namespace"""
+    return {
+        name: (backend if backend is not None else get_cache()).namespace_stats(name)
+        for name, backend in list(_functions.items())
+    }
+
+
+def _split_exclusions(exclude: Iterable[str]) -> Tuple[Set[str], Dict[str, Set[str]]]:
+    params: Set[str] = set()
+    fields: Dict[str, Set[str]] = {}
+    for item in exclude:
+        param, _, field = item.partition(".")
+        if field:
+            fields.setdefault(param, set()).add(field)
+        else:
+            params.add(param)
+    return params, fields
+
+
+def _key_arguments(
+    signature: inspect.Signature,
+    args: tuple,
+    kwargs: dict,
+    excluded_params: Set[str],
+    excluded_fields: Dict[str, Set[str]]
+) -> Dict[str, Any]:
+    """The call's arguments by parameter name, minus what does not affect the result"""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+
+    arguments = {}
+    for index, (param, value) in enumerate(bound.arguments.items()):
+        if param in excluded_params or isinstance(value, FRAMEWORK_TYPES):
+            continue
+        if index == 0 and param in _BOUND_NAMES:
+            continue
+        fields = excluded_fields.get(param)
+        if fields:
+            value = _without_fields(value, fields)
+        arguments[param] = value
+    return arguments
+
+
+def _without_fields(value: Any, fields: Set[str]) -> Any:
+    model_dump = getattr(value, "model_dump", None)
+    if callable(model_dump):
+        return {"__type__": type(value).__qualname__, **model_dump(mode="json", exclude=fields)}
+    if isinstance(value, dict):
+        return {key: item for key, item in value.items() if key not in fields}
+    return value
@@ -0,0 +1,80 @@
+"""
+Cache Key Derivation
+
+Deterministic keys for function results. Arguments are reduced to a
+canonical JSON form (pydantic models by their dumped fields, dicts and
+sets sorted) and hashed, so equal arguments give the same key in every
+process. Arguments with no stable value representation are refused
+rather than keyed by ``repr``, which embeds memory addresses.
+
+Also the tag conventions shared by everything caching rows, so one
+write can invalidate all of them.
+"""
+
+import dataclasses
+import hashlib
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Iterable
+from uuid import UUID
+
+
+class Uncacheable(TypeError):
+    """An argument has no stable value representation to key on"""
+
+
+def canonical(value: Any) -> Any:
+    """JSON-serialisable form of ``value`` that is equal for equal values"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return canonical(value.value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, bytes):
+        return value.hex()
+    if isinstance(value, dict):
+        return {str(key): canonical(item) for key, item in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [canonical(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((canonical(item) for item in value), key=_sort_key)
+
+    model_dump = getattr(value, "model_dump", None)
+    if callable(model_dump):
+        return {"__type__": type(value).__qualname__, **canonical(model_dump(mode="json"))}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__type__": type(value).__qualname__,
+            **{field.name: canonical(getattr(value, field.name)) for field in dataclasses.fields(value)},
+        }
+
+    raise Uncacheable(f"cannot derive a cache key from {type(value).__qualname__}")
+
+
+def make_key(name: str, args: Iterable[Any] = (), kwargs: Dict[str, Any] = None) -> str:
+    """Stable key for calling ``name`` with ``args`` and ``kwargs``"""
+    payload = json.dumps(
+        [name, canonical(list(args)), canonical(kwargs or {})],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def table_tag(table: str) -> str:
+    """Tag carried by every cached entry read from ``table``"""
+    return f"table:{table}"
+
+
+def entity_tag(table: str, entity_id: Any) -> str:
+    """Tag carried by every cached entry holding (or ruling out) the given row"""
+    return f"{table}:{entity_id}"
+
+
+def _sort_key(item: Any) -> str:
+    return json.dumps(item, sort_keys=True)
@@ -0,0 +1,223 @@
+"""
+In-Memory Cache
+
+Byte-bounded LRU cache with per-entry TTLs and tags. Every entry is sized
+once when stored, so the cache keeps an exact running byte total and
+evicts least-recently-used entries as soon as the total passes
+``max_bytes``. A tag -> keys index makes invalidating everything cached
+for a table or an entity proportional to the entries removed, not to the
+size of the cache. Hit, miss, eviction and invalidation counters are kept
+per namespace and updated as they happen, so ``stats()`` does no scanning.
+
+Safe to share between the event loop and threadpool (sync endpoint) code.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from .backend import DEFAULT_NAMESPACE, CacheBackend, NamespaceStats
+from .sizing import estimate_size
+
+# (namespace, key)
+EntryKey = Tuple[str, str]
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires_at", "tags")
+
+    def __init__(self, value: Any, size: int, expires_at: float, tags: frozenset):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.tags = tags
+
+
+class MemoryCache(CacheBackend):
+    """Byte-bounded, tag-indexed LRU cache with TTLs"""
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 300,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+
+        self._max_bytes = max_bytes
+        self._default_ttl = default_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[EntryKey, _Entry]" = OrderedDict()
+        self._tags: Dict[str, Set[EntryKey]] = {}
+        self._namespaces: Dict[str, NamespaceStats] = {}
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, namespace: str = DEFAULT_NAMESPACE, default: Any = None) -> Any:
+        """Cached value, or ``default`` when missing or expired"""
+        entry_key = (namespace, key)
+        with self._lock:
+            stats = self._stats(namespace)
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                stats.misses += 1
+                return default
+            if entry.expires_at <= self._clock():
+                self._remove(entry_key, entry)
+                stats.expirations += 1
+                stats.misses += 1
+                return default
+
+            self._entries.move_to_end(entry_key)
+            stats.hits += 1
+            return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        namespace: str = DEFAULT_NAMESPACE,
+        size: Optional[int] = None
+    ) -> bool:
+        """
+        Store ``value`` for ``ttl`` seconds under ``tags``.
+
+        ``size`` overrides the measured size in bytes. Returns False when
+        the value alone is larger than the whole cache and was not stored.
+        """
+        if size is None:
+            size = estimate_size(value) + sys.getsizeof(key)
+        entry_key = (namespace, key)
+        expires_at = self._clock() + (self._default_ttl if ttl is None else ttl)
+
+        with self._lock:
+            existing = self._entries.get(entry_key)
+            if existing is not None:
+                self._remove(entry_key, existing)
+            if size > self._max_bytes:
+                return False
+
+            entry = _Entry(value, size, expires_at, frozenset(tags))
+            self._entries[entry_key] = entry
+            self._bytes += size
+            stats = self._stats(namespace)
+            stats.entries += 1
+            stats.bytes += size
+            stats.sets += 1
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(entry_key)
+
+            # The new entry is the most recent, so it is never evicted here
+            while self._bytes > self._max_bytes:
+                oldest_key, oldest = next(iter(self._entries.items()))
+                self._remove(oldest_key, oldest)
+                self._stats(oldest_key[0]).evictions += 1
+
+        return True
+
+    def setdefault(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        namespace: str = DEFAULT_NAMESPACE
+    ) -> Any:
+        """Store ``value`` unless ``key`` is cached; returns the cached value"""
+        with self._lock:
+            return super().setdefault(key, value, ttl=ttl, tags=tags, namespace=namespace)
+
+    def delete(self, key: str, namespace: str = DEFAULT_NAMESPACE) -> bool:
+        """Drop one entry; returns whether it was cached"""
+        entry_key = (namespace, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                return False
+            self._remove(entry_key, entry)
+            self._stats(namespace).invalidations += 1
+            return True
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """Drop every entry carrying any of ``tags``; returns how many were dropped"""
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                for entry_key in list(self._tags.get(tag, ())):
+                    entry = self._entries.get(entry_key)
+                    if entry is not None:
+                        self._remove(entry_key, entry)
+                        self._stats(entry_key[0]).invalidations += 1
+                        removed += 1
+        return removed
+
+    def clear(self, namespace: Optional[str] = None) -> int:
+        """Drop every entry, or every entry of one namespace; returns how many"""
+        with self._lock:
+            if namespace is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._tags.clear()
+                self._bytes = 0
+                for stats in self._namespaces.values():
+                    stats.invalidations += stats.entries
+                    stats.entries = 0
+                    stats.bytes = 0
+                return removed
+
+            keys = [entry_key for entry_key in self._entries if entry_key[0] == namespace]
+            for entry_key in keys:
+                self._remove(entry_key, self._entries[entry_key])
+            self._stats(namespace).invalidations += len(keys)
+            return len(keys)
+
+    def namespace_stats(self, namespace: str = DEFAULT_NAMESPACE) -> Dict[str, Any]:
+        """Counters for one namespace"""
+        with self._lock:
+            return self._stats(namespace).to_dict()
+
+    def stats(self) -> Dict[str, Any]:
+        """Size, budget and per-namespace counters"""
+        with self._lock:
+            return {
+                "backend": "memory",
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "utilization": round(self._bytes / self._max_bytes * 100, 2),
+                "tags": len(self._tags),
+                "namespaces": {
+                    name: stats.to_dict() for name, stats in self._namespaces.items()
+                },
+            }
+
+    def _stats(self, namespace: str) -> NamespaceStats:
+        stats = self._namespaces.get(namespace)
+        if stats is None:
+            stats = self._namespaces[namespace] = NamespaceStats()
+        return stats
+
+    def _remove(self, entry_key: EntryKey, entry: _Entry) -> None:
+        del self._entries[entry_key]
+        self._bytes -= entry.size
+        stats = self._stats(entry_key[0])
+        stats.entries -= 1
+        stats.bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(entry_key)
+                if not keys:
+                    del self._tags[tag]
@@ -0,0 +1,87 @@
+"""
+Negative Result Cache
+
+Remembers, for a short while, lookups by id that found nothing, so bad
+ids retried by MCP calls or stale links stop costing a database round
+trip each. Entries are kept per kind (the table name) in their own
+namespace of the process-wide backend and carry the same table and
+entity tags as cached rows: whatever invalidates a row (a client event,
+QueryCache.invalidate_entity or invalidate_table) also forgets that it
+was missing. Code creating a row with a caller-chosen id should still
+call ``forget`` right after the insert.
+
+``NEGATIVE_CACHE_TTL`` is kept short because rows created outside the
+API (by other services, or directly in Supabase) cannot invalidate it.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from .backend import MISSING, CacheBackend
+from .keys import entity_tag, table_tag
+from .registry import get_cache
+
+NEGATIVE_CACHE_TTL = float(os.getenv("NEGATIVE_CACHE_TTL", "30"))
+
+NEGATIVE_NAMESPACE = "negative"
+
+
+class NegativeCache:
+    """Short-lived record of ids known not to exist, per table"""
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: float = NEGATIVE_CACHE_TTL):
+        self._backend = backend
+        self._ttl = ttl
+        self._metrics: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend if self._backend is not None else get_cache()
+
+    def is_missing(self, kind: str, entity_id: Any) -> bool:
+        """Whether a recent lookup of this id found nothing"""
+        missing = self.backend.get(_key(kind, entity_id), NEGATIVE_NAMESPACE, MISSING) is not MISSING
+        self._count(kind, "hits" if missing else "misses")
+        return missing
+
+    def remember_missing(self, kind: str, entity_id: Any) -> None:
+        """Record that a lookup of this id found nothing"""
+        self.backend.set(
+            _key(kind, entity_id), True, ttl=self._ttl,
+            tags=(table_tag(kind), entity_tag(kind, entity_id)), namespace=NEGATIVE_NAMESPACE
+        )
+        self._count(kind, "remembered")
+
+    def forget(self, kind: str, entity_id: Any) -> None:
+        """The id exists now (it was just created)"""
+        if self.backend.delete(_key(kind, entity_id), NEGATIVE_NAMESPACE):
+            self._count(kind, "forgotten")
+
+    def stats(self) -> Dict[str, Any]:
+        """Lookups answered (hits) and passed on (misses) per kind, plus entry counters"""
+        with self._lock:
+            kinds = {kind: dict(counters) for kind, counters in self._metrics.items()}
+        for counters in kinds.values():
+            lookups = counters["hits"] + counters["misses"]
+            counters["hit_rate"] = round(counters["hits"] / lookups * 100, 2) if lookups else 0.0
+        return {
+            "ttl": self._ttl,
+            "kinds": kinds,
+            "entries": self.backend.namespace_stats(NEGATIVE_NAMESPACE),
+        }
+
+    def _count(self, kind: str, field: str) -> None:
+        with self._lock:
+            counters = self._metrics.get(kind)
+            if counters is None:
+                counters = self._metrics[kind] = {"hits": 0, "misses": 0, "remembered": 0, "forgotten": 0}
+            counters[field] += 1
+
+
+negative_cache = NegativeCache()
+
+
+def _key(kind: str, entity_id: Any) -> str:
+    return f"{kind}:{entity_id}"
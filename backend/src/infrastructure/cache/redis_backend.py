@@ -0,0 +1,298 @@
+"""
+Redis Cache Backend
+
+Cache shared by every worker process. Values are stored as JSON (see
+``codec``; never pickled, since anything that can write to Redis could
+then run code in every worker) under ``<prefix>:k:<namespace>:<key>``
+with a server-side TTL; each tag is a set
+of entry keys under ``<prefix>:t:<tag>`` so tag invalidation deletes just
+the tagged entries. Redis errors are logged and treated as misses (or as
+skipped writes), and after an error Redis is skipped for ``retry_after``
+seconds, so an unreachable Redis neither fails requests nor makes each
+one wait for a socket timeout. Hit/miss counters are kept per process.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from .backend import DEFAULT_NAMESPACE, CacheBackend, NamespaceStats
+from .codec import CodecError, decode, encode
+
+try:
+    import redis
+    from redis.exceptions import RedisError
+except ImportError:  # pragma: no cover - exercised only without redis
+    redis = None
+    RedisError = OSError
+
+logger = logging.getLogger(__name__)
+
+# Tag sets outlive their entries by at most this long
+TAG_TTL_SECONDS = 86400
+
+
+class RedisCache(CacheBackend):
+    """Cache backend storing entries in Redis"""
+
+    def __init__(
+        self,
+        client: Any,
+        prefix: str = "nexus:cache",
+        default_ttl: float = 300,
+        max_entry_bytes: int = 1024 * 1024,
+        retry_after: float = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._client = client
+        self._prefix = prefix
+        self._default_ttl = default_ttl
+        self._max_entry_bytes = max_entry_bytes
+        self._retry_after = retry_after
+        self._clock = clock
+        self._unavailable_until = 0.0
+        self._namespaces: Dict[str, NamespaceStats] = {}
+        self._errors = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "RedisCache":
+        if redis is None:
+            raise RuntimeError("the redis package is not installed")
+        return cls(redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5), **kwargs)
+
+    @property
+    def client(self) -> Any:
+        return self._client
+
+    @property
+    def prefix(self) -> str:
+        return self._prefix
+
+    @property
+    def default_ttl(self) -> float:
+        return self._default_ttl
+
+    @property
+    def available(self) -> bool:
+        """False for ``retry_after`` seconds after a Redis error"""
+        return self._clock() >= self._unavailable_until
+
+    def ping(self) -> bool:
+        return bool(self._client.ping())
+
+    def get(self, key: str, namespace: str = DEFAULT_NAMESPACE, default: Any = None) -> Any:
+        """Cached value, or ``default`` when missing, expired or unreachable"""
+        payload = None
+        if self.available:
+            try:
+                payload = self._client.get(self._entry_key(namespace, key))
+            except RedisError as e:
+                self._error("get", e)
+
+        value = default
+        if payload is not None:
+            try:
+                value = decode(payload)
+            except CodecError as e:
+                # Written by a worker knowing a type this one has not used yet
+                logger.debug(f"Treating undecodable cache entry {namespace}:{key} as a miss: {e}")
+                payload = None
+
+        with self._lock:
+            stats = self._stats(namespace)
+            if payload is None:
+                stats.misses += 1
+            else:
+                stats.hits += 1
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        namespace: str = DEFAULT_NAMESPACE,
+        size: Optional[int] = None
+    ) -> bool:
+        """Store ``value`` for ``ttl`` seconds; False when too large, unencodable or Redis failed"""
+        if not self.available:
+            return False
+        payload = self.encode(value)
+        if payload is None:
+            return False
+        return self.store(key, payload, ttl=ttl, tags=tags, namespace=namespace)
+
+    def setdefault(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        namespace: str = DEFAULT_NAMESPACE
+    ) -> Any:
+        """
+        Store ``value`` with SET NX unless ``key`` is cached; returns the
+        cached value, or ``value`` itself when Redis cannot be used
+        """
+        payload = self.encode(value)
+        if payload is None or self.store(key, payload, ttl=ttl, tags=tags, namespace=namespace, only_if_absent=True):
+            return value
+        # Another worker got there first
+        return self.get(key, namespace, value)
+
+    def encode(self, value: Any) -> Optional[bytes]:
+        """The payload ``set`` would store, or None when it cannot be cached here"""
+        try:
+            payload = encode(value)
+        except CodecError as e:
+            logger.debug(f"Not caching value in Redis: {e}")
+            return None
+        return payload if len(payload) <= self._max_entry_bytes else None
+
+    def store(
+        self,
+        key: str,
+        payload: bytes,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        namespace: str = DEFAULT_NAMESPACE,
+        only_if_absent: bool = False
+    ) -> bool:
+        """
+        Store an already encoded payload for ``ttl`` seconds.
+
+        With ``only_if_absent`` an existing entry is kept and False is
+        returned.
+        """
+        if not self.available:
+            return False
+        entry_key = self._entry_key(namespace, key)
+        ttl_ms = max(1, int((self._default_ttl if ttl is None else ttl) * 1000))
+        try:
+            pipe = self._client.pipeline()
+            pipe.set(entry_key, payload, px=ttl_ms, nx=only_if_absent)
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.sadd(tag_key, entry_key)
+                pipe.expire(tag_key, max(TAG_TTL_SECONDS, ttl_ms // 1000 + 1))
+            if not pipe.execute()[0]:
+                return False
+        except RedisError as e:
+            self._error("set", e)
+            return False
+
+        with self._lock:
+            self._stats(namespace).sets += 1
+        return True
+
+    def delete(self, key: str, namespace: str = DEFAULT_NAMESPACE) -> bool:
+        """Drop one entry; returns whether it was cached"""
+        if not self.available:
+            return False
+        try:
+            removed = self._client.delete(self._entry_key(namespace, key))
+        except RedisError as e:
+            self._error("delete", e)
+            return False
+        self._count_invalidations(namespace, removed)
+        return bool(removed)
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """Drop every entry carrying any of ``tags``; returns how many were dropped"""
+        removed = 0
+        if not tags or not self.available:
+            return removed
+        try:
+            # Read and drop the tag sets in one MULTI/EXEC, so an entry
+            # tagged meanwhile lands in a new set instead of being lost
+            pipe = self._client.pipeline()
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.smembers(tag_key)
+                pipe.delete(tag_key)
+            results = pipe.execute()
+            entry_keys = list(set().union(*results[::2]))
+            if not entry_keys:
+                return removed
+
+            # Then every tagged entry in a second round trip
+            pipe = self._client.pipeline(transaction=False)
+            for entry_key in entry_keys:
+                pipe.delete(entry_key)
+            for entry_key, deleted in zip(entry_keys, pipe.execute()):
+                if deleted:
+                    self._count_invalidations(self._namespace_of(entry_key), 1)
+                    removed += 1
+        except RedisError as e:
+            self._error("invalidate_tags", e)
+        return removed
+
+    def clear(self, namespace: Optional[str] = None) -> int:
+        """Drop every entry, or every entry of one namespace; returns how many"""
+        pattern = f"{self._prefix}:*" if namespace is None else f"{self._prefix}:k:{namespace}:*"
+        removed = 0
+        if not self.available:
+            return removed
+        try:
+            batch = []
+            for entry_key in self._client.scan_iter(match=pattern, count=500):
+                batch.append(entry_key)
+                if len(batch) >= 500:
+                    removed += self._client.delete(*batch)
+                    batch = []
+            if batch:
+                removed += self._client.delete(*batch)
+        except RedisError as e:
+            self._error("clear", e)
+        if namespace is not None:
+            self._count_invalidations(namespace, removed)
+        return removed
+
+    def namespace_stats(self, namespace: str = DEFAULT_NAMESPACE) -> Dict[str, Any]:
+        """Counters for one namespace, as seen by this process"""
+        with self._lock:
+            return self._stats(namespace).to_dict()
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-process counters; entry counts live in Redis"""
+        with self._lock:
+            return {
+                "backend": "redis",
+                "prefix": self._prefix,
+                "available": self.available,
+                "errors": self._errors,
+                "namespaces": {
+                    name: stats.to_dict() for name, stats in self._namespaces.items()
+                },
+            }
+
+    def _entry_key(self, namespace: str, key: str) -> str:
+        return f"{self._prefix}:k:{namespace}:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._prefix}:t:{tag}"
+
+    def _namespace_of(self, entry_key: Any) -> str:
+        if isinstance(entry_key, bytes):
+            entry_key = entry_key.decode()
+        return entry_key[len(self._prefix) + 3:].split(":", 1)[0]
+
+    def _stats(self, namespace: str) -> NamespaceStats:
+        stats = self._namespaces.get(namespace)
+        if stats is None:
+            stats = self._namespaces[namespace] = NamespaceStats()
+        return stats
+
+    def _count_invalidations(self, namespace: str, count: int) -> None:
+        if count:
+            with self._lock:
+                self._stats(namespace).invalidations += count
+
+    def _error(self, operation: str, error: Exception) -> None:
+        with self._lock:
+            self._errors += 1
+            self._unavailable_until = self._clock() + self._retry_after
+        logger.warning(f"Redis cache {operation} failed, skipping Redis for {self._retry_after}s: {error}")
@@ -0,0 +1,85 @@
+"""
+Cache Registry
+
+The process-wide cache backend. ``CACHE_BACKEND=redis`` with ``REDIS_URL``
+puts the in-process cache in front of Redis (see ``tiered``) so workers
+share results and invalidations; anything else, or a Redis package that
+is not installed, uses the in-process cache alone. A Redis that is down
+at startup is retried in the background rather than given up on.
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+from .backend import CacheBackend
+from .memory import MemoryCache
+
+logger = logging.getLogger(__name__)
+
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Longest a worker keeps its own copy of a shared (Redis) entry
+CACHE_L1_TTL = float(os.getenv("CACHE_L1_TTL", "60"))
+
+_lock = threading.RLock()
+_memory: Optional[MemoryCache] = None
+_backend: Optional[CacheBackend] = None
+
+
+def memory_cache() -> MemoryCache:
+    """The shared in-process cache"""
+    global _memory
+    if _memory is None:
+        with _lock:
+            if _memory is None:
+                _memory = MemoryCache(max_bytes=CACHE_MAX_BYTES)
+    return _memory
+
+
+def get_cache() -> CacheBackend:
+    """The configured cache backend, created on first use"""
+    global _backend
+    if _backend is None:
+        with _lock:
+            if _backend is None:
+                _backend = _create_backend()
+    return _backend
+
+
+def set_cache(backend: Optional[CacheBackend]) -> None:
+    """Replace the process-wide backend; None re-reads the configuration"""
+    global _backend
+    with _lock:
+        _backend = backend
+
+
+def close_cache() -> None:
+    """Stop background work of the process-wide backend (the invalidation listener)"""
+    backend = _backend
+    close = getattr(backend, "close", None)
+    if close is not None:
+        close()
+
+
+def _create_backend() -> CacheBackend:
+    kind = os.getenv("CACHE_BACKEND", "memory").lower()
+    if kind != "redis":
+        return memory_cache()
+
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        logger.warning("CACHE_BACKEND=redis without REDIS_URL, using the in-process cache")
+        return memory_cache()
+
+    try:
+        from .redis_backend import RedisCache
+        from .tiered import TieredCache
+        l2 = RedisCache.from_url(redis_url)
+    except Exception as e:
+        logger.warning(f"Redis cache unavailable ({e}), using the in-process cache")
+        return memory_cache()
+
+    backend = TieredCache(memory_cache(), l2, l1_ttl=CACHE_L1_TTL)
+    backend.start()
+    return backend
@@ -0,0 +1,58 @@
+"""
+Cache Entry Sizing
+
+Deep size estimate of a cached value, computed once when it is stored so
+the cache can keep an exact running byte total instead of measuring
+itself on every stats call.
+"""
+
+import sys
+from enum import Enum
+from typing import Any, Set
+
+# Interned/shared objects that do not belong to any one entry
+_SHARED_TYPES = (type(None), bool, Enum, type)
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate bytes held by ``value`` and everything it references.
+
+    Walks containers, instance ``__dict__`` and ``__slots__``; each object
+    is counted once. Enum members, classes and singletons are shared and
+    count as zero.
+    """
+    seen: Set[int] = set()
+    total = 0
+    stack = [value]
+
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, _SHARED_TYPES) or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, (str, bytes, bytearray, int, float, complex)):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+            continue
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+            continue
+
+        instance_dict = getattr(obj, "__dict__", None)
+        if isinstance(instance_dict, dict):
+            stack.append(instance_dict)
+        for cls in type(obj).__mro__:
+            slots = getattr(cls, "__slots__", ())
+            for slot in (slots,) if isinstance(slots, str) else slots:
+                if slot in ("__dict__", "__weakref__"):
+                    continue
+                attribute = getattr(obj, slot, None)
+                if attribute is not None:
+                    stack.append(attribute)
+
+    return total
@@ -0,0 +1,176 @@
+"""
+Stale-While-Revalidate
+
+Cache policy for expensive aggregates such as dashboards. A value is
+fresh for ``fresh_for`` seconds and served as is (HIT). After that, and
+until ``max_age`` (the hard cap), it is served immediately as STALE and
+one background task per key recomputes it. Past ``max_age`` the entry is
+gone and the caller waits for the recomputation (MISS); concurrent
+callers for the same key share that single computation. Computations run
+detached from the request that started them: a caller that runs out of
+its deadline gets DeadlineExceeded, and the computation still finishes
+and fills the cache for the next one.
+
+Values are stamped with wall-clock time, so ages agree between workers
+sharing a Redis-backed cache.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, NamedTuple, Optional, Set
+
+from ...application.deadline import deadline_guard
+from .backend import MISSING, CacheBackend
+from .codec import register_type
+from .registry import get_cache
+
+logger = logging.getLogger(__name__)
+
+HIT = "HIT"
+STALE = "STALE"
+MISS = "MISS"
+
+
+@register_type
+class _Stamped(NamedTuple):
+    value: Any
+    computed_at: float
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """A value with how it was served and how old it is"""
+
+    value: Any
+    status: str
+    age: float
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """``X-Cache`` and ``Age`` response headers"""
+        return {"X-Cache": self.status, "Age": str(int(self.age))}
+
+    def metadata(self) -> Dict[str, Any]:
+        """Cache status and age for a response body"""
+        return {"status": self.status, "age_seconds": round(self.age, 3)}
+
+
+class StaleWhileRevalidate:
+    """Serve cached values past freshness while one task refreshes them"""
+
+    def __init__(
+        self,
+        namespace: str,
+        fresh_for: float,
+        max_age: float,
+        backend: Optional[CacheBackend] = None,
+        tags: Iterable[str] = (),
+        clock: Callable[[], float] = time.time
+    ):
+        if max_age < fresh_for:
+            raise ValueError("max_age must be at least fresh_for")
+
+        self._namespace = namespace
+        self._fresh_for = fresh_for
+        self._max_age = max_age
+        self._backend = backend
+        self._tags = tuple(tags)
+        self._clock = clock
+        self._computing: Dict[str, asyncio.Task] = {}
+        # Background refreshes, referenced until done so they are not collected
+        self._refreshes: Set[asyncio.Task] = set()
+        self._metrics = {"hits": 0, "stale": 0, "misses": 0, "refreshes": 0, "refresh_failures": 0}
+
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend if self._backend is not None else get_cache()
+
+    async def get(self, key: str, compute: Callable[[], Awaitable[Any]]) -> CachedResult:
+        """The cached value for ``key``, computed with ``compute`` when needed"""
+        stamped = await self.backend.aget(key, self._namespace, MISSING)
+        if stamped is not MISSING:
+            age = max(self._clock() - stamped.computed_at, 0.0)
+            if age < self._fresh_for:
+                self._metrics["hits"] += 1
+                return CachedResult(stamped.value, HIT, age)
+            if age < self._max_age:
+                self._metrics["stale"] += 1
+                self._refresh(key, compute)
+                return CachedResult(stamped.value, STALE, age)
+
+        self._metrics["misses"] += 1
+        async with deadline_guard(f"{self._namespace}.compute"):
+            stamped = await asyncio.shield(self._computation(key, compute))
+        return CachedResult(stamped.value, MISS, max(self._clock() - stamped.computed_at, 0.0))
+
+    def invalidate(self, key: Optional[str] = None) -> int:
+        """Drop one key, or every key of this namespace"""
+        if key is None:
+            return self.backend.clear(self._namespace)
+        return int(self.backend.delete(key, self._namespace))
+
+    def stats(self) -> Dict[str, Any]:
+        """Serving counters and refreshes in flight"""
+        served = self._metrics["hits"] + self._metrics["stale"] + self._metrics["misses"]
+        return {
+            **self._metrics,
+            "fresh_for": self._fresh_for,
+            "max_age": self._max_age,
+            "refreshing": len(self._refreshes),
+            "served_from_cache": round(
+                (self._metrics["hits"] + self._metrics["stale"]) / served * 100, 2
+            ) if served else 0.0,
+        }
+
+    def _computation(self, key: str, compute: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """The task computing ``key``, started if none is running"""
+        task = self._computing.get(key)
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return task
+
+        # A fresh context: the computation must not inherit the deadline
+        # (or other request state) of whichever request happened to start it
+        task = asyncio.get_running_loop().create_task(
+            self._compute_and_store(key, compute), context=contextvars.Context()
+        )
+        self._computing[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return task
+
+    def _refresh(self, key: str, compute: Callable[[], Awaitable[Any]]) -> None:
+        task = self._computing.get(key)
+        if task is not None and not task.done():
+            return
+        task = self._computation(key, compute)
+        self._metrics["refreshes"] += 1
+        self._refreshes.add(task)
+        task.add_done_callback(self._refresh_done)
+
+    async def _compute_and_store(self, key: str, compute: Callable[[], Awaitable[Any]]) -> _Stamped:
+        value = await compute()
+        stamped = _Stamped(value, self._clock())
+        self.backend.set(key, stamped, ttl=self._max_age, tags=self._tags, namespace=self._namespace)
+        return stamped
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._computing.get(key) is task:
+            del self._computing[key]
+        # Mark the exception as retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        self._refreshes.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._metrics["refresh_failures"] += 1
+            logger.warning(f"Background refresh of {self._namespace} failed, serving stale: {error}")
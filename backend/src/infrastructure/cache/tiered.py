@@ -0,0 +1,460 @@
+"""
+Two-Tier Cache
+
+L1 is this process's MemoryCache, L2 is Redis shared by every worker.
+Reads try L1, then L2 (refilling L1); writes go to both. L1 copies live
+at most ``l1_ttl`` seconds, which bounds how stale a worker can be if it
+misses an invalidation.
+
+The redis client is synchronous, so no L2 call is made on the event
+loop. L2 calls run in order on one background thread: writes and
+invalidations are applied to L1 at once and queued for L2. ``aget``
+awaits its L2 read there. A plain ``get`` from the event loop answers
+from L1 alone and refills L1 from L2 in the background for the next
+reader. A ``get`` from any other thread (sync routes run in a
+threadpool) waits for its L2 read.
+
+Invalidations (delete, tags, clear) are applied to L2 and published on a
+Redis channel; every worker runs a listener thread that applies the
+messages of the other workers to its own L1. While Redis is unreachable
+the cache runs on L1 alone; when the listener resubscribes it drops L1,
+since invalidations sent in the meantime were lost.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Set, Tuple, TypeVar
+
+from .backend import DEFAULT_NAMESPACE, MISSING, CacheBackend
+from .codec import register_type
+from .memory import MemoryCache
+from .redis_backend import RedisCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_CHANNEL = "nexus:cache:invalidate"
+MAX_RESUBSCRIBE_DELAY = 30.0
+
+
+@register_type
+class _Shared(NamedTuple):
+    """What L2 holds: the value plus what L1 needs to hold a copy"""
+    value: Any
+    tags: Tuple[str, ...]
+    expires_at: float
+
+
+@dataclass
+class _TierCounters:
+    l1_hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.l1_hits + self.l2_hits + self.misses
+        l2_lookups = self.l2_hits + self.misses
+        return {
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "l1_hit_rate": _rate(self.l1_hits, lookups),
+            "l2_hit_rate": _rate(self.l2_hits, l2_lookups),
+            "hit_rate": _rate(self.l1_hits + self.l2_hits, lookups),
+        }
+
+
+def _rate(hits: int, lookups: int) -> float:
+    return round(hits / lookups * 100, 2) if lookups else 0.0
+
+
+class TieredCache(CacheBackend):
+    """In-process L1 in front of a shared Redis L2, kept coherent over pub/sub"""
+
+    def __init__(
+        self,
+        l1: MemoryCache,
+        l2: RedisCache,
+        channel: str = DEFAULT_CHANNEL,
+        l1_ttl: float = 60,
+        resubscribe_delay: float = 1.0
+    ):
+        self._l1 = l1
+        self._l2 = l2
+        self._channel = channel
+        self._l1_ttl = l1_ttl
+        self._resubscribe_delay = resubscribe_delay
+        self._origin = uuid.uuid4().hex
+        self._counters: Dict[str, _TierCounters] = {}
+        self._published = 0
+        self._received = 0
+        self._subscribed = threading.Event()
+        self._stopping = threading.Event()
+        self._listener: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        # One thread, so L2 sees writes and invalidations in the order made
+        self._l2_io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-l2")
+        self._filling: Set[Tuple[str, str]] = set()
+        self._fills = 0
+        # Bumped by every L1 change; an L2 read started before a bump may
+        # return what was just invalidated, so it is not copied into L1
+        self._generation = 0
+
+    @property
+    def l1(self) -> MemoryCache:
+        return self._l1
+
+    @property
+    def l2(self) -> RedisCache:
+        return self._l2
+
+    @property
+    def max_bytes(self) -> int:
+        return self._l1.max_bytes
+
+    @property
+    def subscribed(self) -> bool:
+        return self._subscribed.is_set()
+
+    def start(self) -> None:
+        """Start listening for other workers' invalidations"""
+        if self._listener is not None and self._listener.is_alive():
+            return
+        self._stopping.clear()
+        self._listener = threading.Thread(
+            target=self._listen, name="cache-invalidation-listener", daemon=True
+        )
+        self._listener.start()
+
+    def close(self) -> None:
+        """Stop the listener thread, after the queued L2 writes are sent"""
+        self._stopping.set()
+        if self._listener is not None:
+            self._listener.join(timeout=5)
+            self._listener = None
+        self.flush()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> None:
+        """Wait until the L2 calls queued so far have been made"""
+        self._l2_io.submit(lambda: None).result(timeout)
+
+    def get(self, key: str, namespace: str = DEFAULT_NAMESPACE, default: Any = None) -> Any:
+        """
+        L1 value, else ``default`` on the event loop (L1 is refilled from
+        L2 in the background) and the L2 value on any other thread
+        """
+        value = self._l1.get(key, namespace, MISSING)
+        if value is not MISSING:
+            self._count(namespace, "l1_hits")
+            return value
+
+        if _on_event_loop():
+            self._fill_l1(key, namespace)
+            self._count(namespace, "misses")
+            return default
+        generation = self._generation
+        shared = self._in_l2_thread(self._l2.get, key, namespace, MISSING).result()
+        return self._from_l2(key, namespace, shared, default, generation)
+
+    async def aget(self, key: str, namespace: str = DEFAULT_NAMESPACE, default: Any = None) -> Any:
+        """L1 value, else the L2 value (copied into L1), else ``default``"""
+        value = self._l1.get(key, namespace, MISSING)
+        if value is not MISSING:
+            self._count(namespace, "l1_hits")
+            return value
+
+        generation = self._generation
+        shared = await asyncio.wrap_future(self._in_l2_thread(self._l2.get, key, namespace, MISSING))
+        return self._from_l2(key, namespace, shared, default, generation)
+
+    def _from_l2(self, key: str, namespace: str, shared: Any, default: Any, generation: int) -> Any:
+        if shared is MISSING:
+            self._count(namespace, "misses")
+            return default
+        self._count(namespace, "l2_hits")
+        self._copy_to_l1(key, namespace, shared, generation)
+        return shared.value
+
+    def _copy_to_l1(self, key: str, namespace: str, shared: "_Shared", generation: int) -> bool:
+        """Copy an L2 entry into L1 unless L1 changed since the read was queued"""
+        remaining = shared.expires_at - time.time()
+        if remaining <= 0:
+            return False
+        with self._lock:
+            if self._generation != generation:
+                return False
+            return self._l1.set(
+                key, shared.value, ttl=min(self._l1_ttl, remaining), tags=shared.tags, namespace=namespace
+            )
+
+    def _change_l1(self, change: Callable[[], T]) -> T:
+        """Apply a change to L1, making L2 reads already under way stale"""
+        with self._lock:
+            self._generation += 1
+            return change()
+
+    def _fill_l1(self, key: str, namespace: str) -> None:
+        """Copy the L2 entry, if any, into L1 without waiting for it"""
+        with self._lock:
+            if (namespace, key) in self._filling:
+                return
+            self._filling.add((namespace, key))
+            generation = self._generation
+        self._in_l2_thread(self._fill, key, namespace, generation)
+
+    def _fill(self, key: str, namespace: str, generation: int) -> None:
+        try:
+            shared = self._l2.get(key, namespace, MISSING)
+            if shared is not MISSING and self._copy_to_l1(key, namespace, shared, generation):
+                with self._lock:
+                    self._fills += 1
+        finally:
+            with self._lock:
+                self._filling.discard((namespace, key))
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        namespace: str = DEFAULT_NAMESPACE,
+        size: Optional[int] = None
+    ) -> bool:
+        """Store in L1 and queue the L2 write; returns whether L1 kept it"""
+        tags = tuple(tags)
+        ttl = self._l2.default_ttl if ttl is None else ttl
+        if self._l2.available:
+            # Encoded now: the caller may mutate ``value`` once we return
+            payload = self._l2.encode(_Shared(value, tags, time.time() + ttl))
+            if payload is not None:
+                self._in_l2_thread(self._l2.store, key, payload, ttl=ttl, tags=tags, namespace=namespace)
+        # Also newer than any L2 copy being read
+        return self._change_l1(lambda: self._l1.set(
+            key, value, ttl=min(self._l1_ttl, ttl), tags=tags, namespace=namespace, size=size
+        ))
+
+    def setdefault(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        namespace: str = DEFAULT_NAMESPACE
+    ) -> Any:
+        """
+        Store ``value`` unless either tier holds ``key``; returns the
+        cached value. Waits for Redis, so async callers use ``asetdefault``.
+        """
+        tags = tuple(tags)
+        current = self._l1.get(key, namespace, MISSING)
+        if current is not MISSING:
+            return current
+        if not self._l2.available:
+            return self._setdefault_in_l1(key, value, ttl, tags, namespace)
+        generation = self._generation
+        shared = self._claim_in_l2(key, value, ttl, tags, namespace).result()
+        return self._claimed(key, value, ttl, tags, namespace, shared, generation)
+
+    async def asetdefault(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        namespace: str = DEFAULT_NAMESPACE
+    ) -> Any:
+        """``setdefault`` without blocking the event loop"""
+        tags = tuple(tags)
+        current = self._l1.get(key, namespace, MISSING)
+        if current is not MISSING:
+            return current
+        if not self._l2.available:
+            return self._setdefault_in_l1(key, value, ttl, tags, namespace)
+        generation = self._generation
+        shared = await asyncio.wrap_future(self._claim_in_l2(key, value, ttl, tags, namespace))
+        return self._claimed(key, value, ttl, tags, namespace, shared, generation)
+
+    def _claim_in_l2(
+        self, key: str, value: Any, ttl: Optional[float], tags: Tuple[str, ...], namespace: str
+    ) -> Future:
+        """Queue a SET NX of ``value``; resolves to the entry L2 then holds"""
+        ttl = self._l2.default_ttl if ttl is None else ttl
+        return self._in_l2_thread(
+            self._l2.setdefault, key, _Shared(value, tags, time.time() + ttl),
+            ttl=ttl, tags=tags, namespace=namespace
+        )
+
+    def _claimed(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float],
+        tags: Tuple[str, ...],
+        namespace: str,
+        shared: Any,
+        generation: int
+    ) -> Any:
+        if shared is MISSING or not self._l2.available:
+            # Redis failed: agree with this worker only
+            return self._setdefault_in_l1(key, value, ttl, tags, namespace)
+        self._copy_to_l1(key, namespace, shared, generation)
+        return shared.value
+
+    def _setdefault_in_l1(
+        self, key: str, value: Any, ttl: Optional[float], tags: Tuple[str, ...], namespace: str
+    ) -> Any:
+        ttl = min(self._l1_ttl, self._l2.default_ttl if ttl is None else ttl)
+        return self._change_l1(lambda: self._l1.setdefault(key, value, ttl=ttl, tags=tags, namespace=namespace))
+
+    def delete(self, key: str, namespace: str = DEFAULT_NAMESPACE) -> bool:
+        """Drop one entry everywhere; returns whether L1 held it"""
+        self._in_l2_thread(self._l2.delete, key, namespace)
+        self._in_l2_thread(self._publish, {"op": "delete", "namespace": namespace, "key": key})
+        return self._change_l1(lambda: self._l1.delete(key, namespace))
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """Drop tagged entries everywhere; returns how many L1 held"""
+        self._in_l2_thread(self._l2.invalidate_tags, *tags)
+        self._in_l2_thread(self._publish, {"op": "tags", "tags": list(tags)})
+        return self._change_l1(lambda: self._l1.invalidate_tags(*tags))
+
+    def clear(self, namespace: Optional[str] = None) -> int:
+        """Drop every entry, or one namespace, everywhere; returns how many L1 held"""
+        self._in_l2_thread(self._l2.clear, namespace)
+        self._in_l2_thread(self._publish, {"op": "clear", "namespace": namespace})
+        return self._change_l1(lambda: self._l1.clear(namespace))
+
+    def namespace_stats(self, namespace: str = DEFAULT_NAMESPACE) -> Dict[str, Any]:
+        """L1 entry counters with hits and hit rates per tier"""
+        with self._lock:
+            counters = self._counters.get(namespace, _TierCounters())
+            tiers = counters.to_dict()
+        return {**self._l1.namespace_stats(namespace), **tiers, "hits": tiers["l1_hits"] + tiers["l2_hits"]}
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-tier hit ratios, pub/sub state and both tiers' own stats"""
+        with self._lock:
+            total = _TierCounters()
+            for counters in self._counters.values():
+                total.l1_hits += counters.l1_hits
+                total.l2_hits += counters.l2_hits
+                total.misses += counters.misses
+            namespaces = {name: counters.to_dict() for name, counters in self._counters.items()}
+            published, received, fills = self._published, self._received, self._fills
+
+        return {
+            "backend": "tiered",
+            "tiers": total.to_dict(),
+            "l2_available": self._l2.available,
+            "subscribed": self.subscribed,
+            "invalidations_published": published,
+            "invalidations_received": received,
+            "l1_refills": fills,
+            "namespaces": namespaces,
+            "l1": self._l1.stats(),
+            "l2": self._l2.stats(),
+        }
+
+    def apply(self, payload: Any) -> None:
+        """Apply another worker's invalidation message to L1"""
+        if isinstance(payload, bytes):
+            payload = payload.decode()
+        message = json.loads(payload)
+        if message.get("origin") == self._origin:
+            return
+
+        op = message.get("op")
+        if op == "delete":
+            self._change_l1(lambda: self._l1.delete(message["key"], message["namespace"]))
+        elif op == "tags":
+            self._change_l1(lambda: self._l1.invalidate_tags(*message["tags"]))
+        elif op == "clear":
+            self._change_l1(lambda: self._l1.clear(message.get("namespace")))
+        else:
+            logger.warning(f"Ignoring unknown cache invalidation message: {message}")
+            return
+        with self._lock:
+            self._received += 1
+
+    def _count(self, namespace: str, field: str) -> None:
+        with self._lock:
+            counters = self._counters.get(namespace)
+            if counters is None:
+                counters = self._counters[namespace] = _TierCounters()
+            setattr(counters, field, getattr(counters, field) + 1)
+
+    def _in_l2_thread(self, call: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Queue an L2 call behind the ones already queued"""
+        return self._l2_io.submit(_logged, call, *args, **kwargs)
+
+    def _publish(self, message: Dict[str, Any]) -> None:
+        if not self._l2.available:
+            return
+        try:
+            self._l2.client.publish(self._channel, json.dumps({**message, "origin": self._origin}))
+        except Exception as e:
+            logger.warning(f"Could not publish cache invalidation: {e}")
+            return
+        with self._lock:
+            self._published += 1
+
+    def _listen(self) -> None:
+        missed_messages = False
+        delay = self._resubscribe_delay
+        while not self._stopping.is_set():
+            pubsub = None
+            try:
+                pubsub = self._l2.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self._channel)
+                if missed_messages:
+                    # Invalidations published while we were away are gone
+                    self._change_l1(self._l1.clear)
+                    logger.info("Cache invalidation listener resubscribed, dropped L1")
+                    missed_messages = False
+                delay = self._resubscribe_delay
+                self._subscribed.set()
+                while not self._stopping.is_set():
+                    message = pubsub.get_message(timeout=0.5)
+                    if message and message.get("type") == "message":
+                        self.apply(message["data"])
+            except Exception as e:
+                if delay == self._resubscribe_delay:
+                    logger.warning(f"Cache invalidation listener lost Redis, running on L1 only: {e}")
+                self._subscribed.clear()
+                missed_messages = True
+                self._stopping.wait(delay)
+                delay = min(delay * 2, MAX_RESUBSCRIBE_DELAY)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+        self._subscribed.clear()
+
+
+def _on_event_loop() -> bool:
+    """Whether this thread is running an event loop, which must not block"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _logged(call: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a queued L2 call; nobody may be waiting to see it fail"""
+    try:
+        return call(*args, **kwargs)
+    except Exception as e:
+        logger.warning(f"Cache L2 call {getattr(call, '__name__', call)} failed: {e}")
+        return MISSING
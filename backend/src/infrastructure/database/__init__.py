@@ -6,10 +6,15 @@ database technologies.
 """
 
 from .supabase import SupabaseClientRepository, SupabaseConnection
+from .postgrest import AsyncPostgrestClientRepository, AsyncPostgrestConnection
+from .batch_loader import BatchLoader
 from .migrations import DatabaseMigrator
 
 __all__ = [
     "SupabaseClientRepository",
     "SupabaseConnection",
+    "AsyncPostgrestClientRepository",
+    "AsyncPostgrestConnection",
+    "BatchLoader",
     "DatabaseMigrator",
 ]
\ No newline at end of file
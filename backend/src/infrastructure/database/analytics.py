@@ -0,0 +1,124 @@
+"""
+Client Analytics Aggregation
+
+Client analytics only need row counts per (status, program_type). The
+repositories get them from the ``get_client_analytics_counts`` RPC (see
+DATABASE_OPTIMIZATIONS) and, where the function is not installed, fall
+back to streaming a projection of the table one keyset page at a time.
+Either way only the grouped counts are held in memory.
+"""
+
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ...domain.entities import ProgramType
+from ...domain.repositories.pagination import PageCursor
+
+ANALYTICS_COUNTS_RPC = "get_client_analytics_counts"
+
+# PostgREST's "function not found in the schema cache" error
+MISSING_FUNCTION_CODE = "PGRST202"
+
+# Columns the paged fallback needs: the keyset position plus the group keys
+ANALYTICS_COLUMNS = "id,created_at,status,program_type"
+ANALYTICS_PAGE_SIZE = int(os.getenv("CLIENT_ANALYTICS_PAGE_SIZE", "1000"))
+
+GroupCounts = Dict[Tuple[str, str], int]
+
+
+def analytics_rpc_params(
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    program_type: Optional[ProgramType]
+) -> Dict[str, Any]:
+    """Arguments for the grouped-count RPC (NULL disables a filter)"""
+    return {
+        "start_date": start_date.isoformat() if start_date else None,
+        "end_date": end_date.isoformat() if end_date else None,
+        "program_type_filter": program_type.value if program_type else None,
+    }
+
+
+def rpc_is_missing(error: Exception) -> bool:
+    """
+    Whether an RPC failed because the function is not installed.
+
+    Only then is paging through the table the right fallback; timeouts,
+    5xx answers or an open circuit mean the database is struggling, and
+    a full scan is the last thing it needs.
+    """
+    details = getattr(error, "details", None)
+    if isinstance(details, dict):
+        if details.get("code") == MISSING_FUNCTION_CODE or details.get("status_code") == 404:
+            return True
+    # supabase-py raises postgrest.APIError, which carries the code itself
+    return getattr(error, "code", None) == MISSING_FUNCTION_CODE
+
+
+def counts_from_rpc(rows: Iterable[Dict[str, Any]]) -> GroupCounts:
+    """Read the RPC result rows into grouped counts"""
+    counts: GroupCounts = {}
+    for row in rows:
+        key = (row["status"], row["program_type"])
+        counts[key] = counts.get(key, 0) + int(row["client_count"])
+    return counts
+
+
+def tally_rows(counts: GroupCounts, rows: Iterable[Dict[str, Any]]) -> GroupCounts:
+    """Add one page of projected rows to the running counts"""
+    for row in rows:
+        key = (row["status"], row["program_type"])
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def last_row_cursor(rows: List[Dict[str, Any]], page_size: int) -> Optional[PageCursor]:
+    """
+    Keyset position after one fallback page, or None on the last page.
+
+    Pages are fetched with ``page_size + 1`` rows like the list queries;
+    the extra row is counted with the next page.
+    """
+    if len(rows) <= page_size:
+        return None
+
+    last = rows[page_size - 1]
+    return PageCursor(sort_key="created_at", sort_value=str(last["created_at"]), id=str(last["id"]))
+
+
+def build_analytics(
+    counts: GroupCounts,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    program_type: Optional[ProgramType] = None,
+    source: str = "rpc"
+) -> Dict[str, Any]:
+    """Derive the analytics payload from grouped counts"""
+    status_counts: Dict[str, int] = {}
+    program_type_counts: Dict[str, int] = {}
+    group_counts: List[Dict[str, Any]] = []
+
+    for (status, ptype), count in sorted(counts.items()):
+        status_counts[status] = status_counts.get(status, 0) + count
+        program_type_counts[ptype] = program_type_counts.get(ptype, 0) + count
+        group_counts.append({"status": status, "program_type": ptype, "count": count})
+
+    total_clients = sum(counts.values())
+    active_clients = status_counts.get("active", 0)
+    active_rate = (active_clients / total_clients * 100) if total_clients > 0 else 0
+
+    return {
+        "total_clients": total_clients,
+        "active_clients": active_clients,
+        "active_rate": round(active_rate, 2),
+        "status_distribution": status_counts,
+        "program_type_distribution": program_type_counts,
+        "group_counts": group_counts,
+        "aggregation": source,
+        "period_summary": {
+            "start_date": start_date.isoformat() if start_date else None,
+            "end_date": end_date.isoformat() if end_date else None,
+            "program_type_filter": program_type.value if program_type else None
+        }
+    }
@@ -0,0 +1,145 @@
+"""
+Batch Loader for Repository Lookups
+
+DataLoader-style batching: concurrent ``load(key)`` calls made within one
+event loop tick (or a small configurable window) are collected and
+resolved with a single batch query.
+"""
+
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, TypeVar
+from weakref import WeakKeyDictionary, WeakValueDictionary
+import logging
+
+from .performance import Histogram, copy_result
+from ...application.deadline import without_deadline
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Wait this long (seconds) for more keys before dispatching; 0 = one tick
+BATCH_WINDOW = float(os.getenv("CLIENT_BATCH_WINDOW_MS", "0")) / 1000
+BATCH_MAX_SIZE = int(os.getenv("CLIENT_BATCH_MAX_SIZE", "100"))
+
+# Live loaders by name, for reporting
+_batch_loaders: "WeakValueDictionary[str, BatchLoader]" = WeakValueDictionary()
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesces concurrent single-key lookups into batch lookups.
+
+    ``batch_fn`` receives the distinct keys of one batch and returns a
+    mapping of the keys it found; every caller gets the value for its own
+    key, or None when the key is missing. When several callers wait on
+    one key, all but the first get it through ``copy`` (by default Client
+    results are copied), so none of them can see another's changes to
+    the entity. Pending keys are tracked per
+    event loop, so one loader can be shared by repositories that outlive
+    a loop (e.g. across tests).
+    """
+
+    SIZE_BUCKETS = [1, 2, 5, 10, 25, 50, 100, 250]
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        window: float = BATCH_WINDOW,
+        max_batch_size: int = BATCH_MAX_SIZE,
+        name: str = "batch_loader",
+        copy: Callable[[V], V] = copy_result
+    ):
+        self._batch_fn = batch_fn
+        self._copy = copy
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._name = name
+        # event loop -> key -> futures waiting on that key
+        self._pending: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[K, List[asyncio.Future]]]" = (
+            WeakKeyDictionary()
+        )
+        self._batch_size = Histogram(self.SIZE_BUCKETS)
+        self._metrics = {
+            "loads": 0,
+            "batches": 0,
+            "keys_loaded": 0,
+            "round_trips_saved": 0,
+            "batch_errors": 0,
+        }
+        self._logger = logging.getLogger(__name__)
+        _batch_loaders[name] = self
+
+    async def load(self, key: K) -> Optional[V]:
+        """Load one key, batched with other keys requested in the same tick"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._metrics["loads"] += 1
+
+        pending = self._pending.get(loop)
+        if pending is None:
+            pending = self._pending[loop] = {}
+            if self._window > 0:
+                loop.call_later(self._window, self._dispatch, loop)
+            else:
+                loop.call_soon(self._dispatch, loop)
+
+        pending.setdefault(key, []).append(future)
+        return await future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Send everything collected for this loop as one or more batches"""
+        pending = self._pending.pop(loop, None)
+        if not pending:
+            return
+
+        keys = list(pending.keys())
+        for start in range(0, len(keys), self._max_batch_size):
+            chunk = {key: pending[key] for key in keys[start:start + self._max_batch_size]}
+            # The batch serves every caller in it, so it runs without the
+            # deadline of the request whose load scheduled the dispatch
+            loop.create_task(self._run_batch(chunk), context=without_deadline())
+
+    async def _run_batch(self, batch: Dict[K, List[asyncio.Future]]) -> None:
+        """Resolve the futures of one batch"""
+        keys = list(batch.keys())
+        waiters = sum(len(futures) for futures in batch.values())
+
+        self._metrics["batches"] += 1
+        self._metrics["keys_loaded"] += len(keys)
+        self._metrics["round_trips_saved"] += waiters - 1
+        self._batch_size.observe(len(keys))
+
+        try:
+            results = await self._batch_fn(keys)
+        except Exception as e:
+            self._metrics["batch_errors"] += 1
+            self._logger.warning(f"Batch load '{self._name}' of {len(keys)} keys failed: {e}")
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for key, futures in batch.items():
+            value = results.get(key)
+            for index, future in enumerate(futures):
+                if not future.done():
+                    future.set_result(value if index == 0 else self._copy(value))
+
+    def stats(self) -> Dict[str, Any]:
+        """Get loader statistics"""
+        batches = self._metrics["batches"]
+        return {
+            "name": self._name,
+            "window_ms": self._window * 1000,
+            "max_batch_size": self._max_batch_size,
+            **self._metrics,
+            "average_batch_size": round(self._metrics["keys_loaded"] / batches, 2) if batches else 0,
+            "batch_size": self._batch_size.snapshot()
+        }
+
+
+def get_batch_loader_stats() -> Dict[str, Dict[str, Any]]:
+    """Get statistics for every live batch loader, keyed by loader name"""
+    return {name: loader.stats() for name, loader in list(_batch_loaders.items())}
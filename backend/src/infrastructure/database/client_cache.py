@@ -0,0 +1,118 @@
+"""
+Client Identity Cache
+
+Clients by id and by normalized email, kept in the ``clients`` namespace
+of the process-wide cache backend. Entries are immutable ClientRecord
+snapshots and every read returns a fresh Client, so callers can mutate
+what they get without touching the cache.
+
+Use cases put clients after writing them; ``handle_event``, subscribed
+to the client domain events, drops them when any writer changes them.
+Both entries of a client carry its entity tag, the one QueryCache uses,
+so one tag invalidation drops the id entry, the email entry (under the
+old email too) and any cached query result holding that client. With
+the tiered Redis backend the invalidation reaches every worker over the
+cache's pub/sub channel. ``CLIENT_CACHE_TTL`` bounds how long an entry
+can survive a missed invalidation.
+
+Ids found missing go to the negative cache under the same entity tag,
+so the ClientCreated event (or a put) forgets them at once.
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+from ...application.interfaces import IClientCache
+from ...domain.entities import Client, ClientRecord
+from ..cache import MISSING, CacheBackend, NegativeCache, entity_tag, get_cache, negative_cache
+
+CLIENT_CACHE_NAMESPACE = "clients"
+CLIENT_TABLE = "clients"
+CLIENT_CACHE_TTL = float(os.getenv("CLIENT_CACHE_TTL", "300"))
+
+# Event types after which cached copies of the client may be stale
+CLIENT_EVENTS = ("ClientCreated", "ClientUpdated", "ClientDeleted")
+
+
+def normalize_email(email: Any) -> str:
+    """Emails are matched case-insensitively, as the Email value object stores them"""
+    return str(email).strip().lower()
+
+
+class ClientIdentityCache(IClientCache):
+    """Identity map of clients by id and email, invalidated by client events"""
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: float = CLIENT_CACHE_TTL,
+        negative: Optional[NegativeCache] = None
+    ):
+        self._backend = backend
+        self._ttl = ttl
+        self._negative = negative if negative is not None else negative_cache
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend if self._backend is not None else get_cache()
+
+    def get_by_id(self, client_id: str) -> Optional[Client]:
+        """A fresh copy of the cached client, or None"""
+        record = self.backend.get(_id_key(client_id), CLIENT_CACHE_NAMESPACE, MISSING)
+        return record.to_entity() if record is not MISSING else None
+
+    def get_by_email(self, email: str) -> Optional[Client]:
+        """A fresh copy of the cached client with this email, or None"""
+        email = normalize_email(email)
+        client_id = self.backend.get(_email_key(email), CLIENT_CACHE_NAMESPACE, MISSING)
+        if client_id is MISSING:
+            return None
+        record = self.backend.get(_id_key(client_id), CLIENT_CACHE_NAMESPACE, MISSING)
+        # The id entry may have been evicted or rewritten with another email
+        if record is MISSING or normalize_email(record.email) != email:
+            return None
+        return record.to_entity()
+
+    def put(self, client: Client) -> None:
+        """Cache a snapshot of the client under its id and email"""
+        record = ClientRecord.from_entity(client)
+        self._negative.forget(CLIENT_TABLE, record.id)
+        tags = (entity_tag(CLIENT_TABLE, record.id),)
+        self.backend.set(
+            _id_key(record.id), record, ttl=self._ttl, tags=tags, namespace=CLIENT_CACHE_NAMESPACE
+        )
+        self.backend.set(
+            _email_key(normalize_email(record.email)), record.id,
+            ttl=self._ttl, tags=tags, namespace=CLIENT_CACHE_NAMESPACE
+        )
+
+    def is_missing(self, client_id: str) -> bool:
+        """Whether a recent lookup of this id found no client"""
+        return self._negative.is_missing(CLIENT_TABLE, client_id)
+
+    def put_missing(self, client_id: str) -> None:
+        """Remember for a short while that no client has this id"""
+        self._negative.remember_missing(CLIENT_TABLE, client_id)
+
+    def invalidate(self, client_id: str) -> None:
+        """Drop the client everywhere it is cached, including as missing"""
+        self.backend.invalidate_tags(entity_tag(CLIENT_TABLE, client_id))
+        self._negative.forget(CLIENT_TABLE, client_id)
+
+    async def handle_event(self, event: Dict[str, Any]) -> None:
+        """Apply a ClientCreated/ClientUpdated/ClientDeleted event"""
+        client_id = event.get("client_id")
+        if event.get("event_type") in CLIENT_EVENTS and client_id:
+            self.invalidate(str(client_id))
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the clients namespace"""
+        return self.backend.namespace_stats(CLIENT_CACHE_NAMESPACE)
+
+
+def _id_key(client_id: Any) -> str:
+    return f"id:{client_id}"
+
+
+def _email_key(email: str) -> str:
+    return f"email:{email}"
@@ -2,18 +2,54 @@
 Performance-optimized repository implementations
 """
 
-from typing import List, Optional, Dict, Any
+from contextvars import ContextVar
+from functools import wraps
+from typing import List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime
 
+from supabase import Client as SupabaseClient
+
 from .supabase import SupabaseClientRepository, SupabaseConnection
 from .performance import (
     with_performance_monitoring, 
     OptimizedSupabaseConnection,
+    ConnectionPool,
     connection_pool
 )
-from ...domain.entities import Client, ClientId, ClientStatus, ProgramType
+from .batch_loader import BatchLoader
+from ...domain.entities import Client, ClientId, ClientStatus, ProgramType, ClientSummary, ClientRecord
 from ...domain.value_objects import Email
 from ...domain.exceptions import DomainException
+from ...domain.repositories.pagination import (
+    Page,
+    DEFAULT_SORT_KEY,
+    DEFAULT_COUNT_MODE,
+    DEFAULT_SEARCH_MODE,
+)
+
+
+# Connection checked out from the pool by the current task, if any
+_pooled_connection: ContextVar[Optional[SupabaseConnection]] = ContextVar(
+    "pooled_supabase_connection", default=None
+)
+
+
+def pooled(func):
+    """Run a repository method on a connection checked out from the pool"""
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        # Nested repository calls reuse the connection already held by this task
+        if _pooled_connection.get() is not None:
+            return await func(self, *args, **kwargs)
+        
+        async with self._pool.get_connection() as connection:
+            token = _pooled_connection.set(connection)
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                _pooled_connection.reset(token)
+    
+    return wrapper
 
 
 class OptimizedClientRepository(SupabaseClientRepository):
@@ -26,27 +62,52 @@ class OptimizedClientRepository(SupabaseClientRepository):
     - Retry logic
     """
     
-    def __init__(self, connection: OptimizedSupabaseConnection = None):
+    def __init__(
+        self,
+        connection: OptimizedSupabaseConnection = None,
+        pool: ConnectionPool = None
+    ):
         if connection is None:
             connection = OptimizedSupabaseConnection()
         super().__init__(connection)
+        self._pool = pool or connection_pool
+        self._id_loader = BatchLoader(self._load_by_ids, name="clients.find_by_id")
+        self._email_loader = BatchLoader(self._load_by_emails, name="clients.find_by_email")
+    
+    @property
+    def _client(self) -> SupabaseClient:
+        """Client of the pooled connection held by this task, else the default one"""
+        connection = _pooled_connection.get() or self._connection
+        return connection.client
     
     @with_performance_monitoring("clients", "save")
+    @pooled
     async def save(self, client: Client) -> None:
         """Save client with performance monitoring"""
         return await super().save(client)
     
     @with_performance_monitoring("clients", "find_by_id")
     async def find_by_id(self, client_id: ClientId) -> Optional[Client]:
-        """Find client by ID with caching"""
-        return await super().find_by_id(client_id)
+        """Find client by ID, batched with concurrent lookups into one find_by_ids"""
+        return await self._id_loader.load(str(client_id))
     
     @with_performance_monitoring("clients", "find_by_email")
     async def find_by_email(self, email: Email) -> Optional[Client]:
-        """Find client by email with caching"""
-        return await super().find_by_email(email)
+        """Find client by email, batched with concurrent lookups into one find_by_emails"""
+        return await self._email_loader.load(str(email))
+    
+    async def _load_by_ids(self, ids: List[str]) -> Dict[str, Client]:
+        """Batch function behind find_by_id"""
+        clients = await self.find_by_ids([ClientId(client_id) for client_id in ids])
+        return {str(client.id): client for client in clients}
+    
+    async def _load_by_emails(self, emails: List[str]) -> Dict[str, Client]:
+        """Batch function behind find_by_email"""
+        clients = await self.find_by_emails(emails)
+        return {str(client.email): client for client in clients}
     
     @with_performance_monitoring("clients", "find_all")
+    @pooled
     async def find_all(
         self, 
         limit: Optional[int] = None, 
@@ -56,6 +117,7 @@ class OptimizedClientRepository(SupabaseClientRepository):
         return await super().find_all(limit, offset)
     
     @with_performance_monitoring("clients", "find_by_status")
+    @pooled
     async def find_by_status(
         self, 
         status: ClientStatus,
@@ -66,6 +128,7 @@ class OptimizedClientRepository(SupabaseClientRepository):
         return await super().find_by_status(status, limit, offset)
     
     @with_performance_monitoring("clients", "find_by_program_type")
+    @pooled
     async def find_by_program_type(
         self, 
         program_type: ProgramType,
@@ -76,65 +139,137 @@ class OptimizedClientRepository(SupabaseClientRepository):
         return await super().find_by_program_type(program_type, limit, offset)
     
     @with_performance_monitoring("clients", "search")
+    @pooled
     async def search(
         self, 
         query: str,
         limit: Optional[int] = None, 
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        search_mode: str = DEFAULT_SEARCH_MODE
     ) -> List[Client]:
         """Search clients with caching"""
-        return await super().search(query, limit, offset)
+        return await super().search(query, limit, offset, search_mode)
+    
+    @with_performance_monitoring("clients", "find_page")
+    @pooled
+    async def find_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        query: Optional[str] = None,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None,
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Page[Client]:
+        """Find one keyset page of clients with performance monitoring"""
+        return await super().find_page(
+            limit, cursor, sort_key, query, status, program_type, offset, count_mode,
+            search_mode
+        )
+    
+    @with_performance_monitoring("clients", "find_summary_page")
+    @pooled
+    async def find_summary_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        query: Optional[str] = None,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None,
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Page[ClientSummary]:
+        """Find one page of projected client summaries with performance monitoring"""
+        return await super().find_summary_page(
+            limit, cursor, sort_key, query, status, program_type, offset, count_mode,
+            search_mode
+        )
+    
+    @with_performance_monitoring("clients", "find_record_page")
+    @pooled
+    async def find_record_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        query: Optional[str] = None,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None,
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Page[ClientRecord]:
+        """Find one page of client snapshots with performance monitoring"""
+        return await super().find_record_page(
+            limit, cursor, sort_key, query, status, program_type, offset, count_mode,
+            search_mode
+        )
     
     @with_performance_monitoring("clients", "count")
+    @pooled
     async def count(self) -> int:
         """Count total clients with caching"""
         return await super().count()
     
     @with_performance_monitoring("clients", "count_by_status")
+    @pooled
     async def count_by_status(self, status: ClientStatus) -> int:
         """Count clients by status with caching"""
         return await super().count_by_status(status)
     
     @with_performance_monitoring("clients", "count_by_program_type")
+    @pooled
     async def count_by_program_type(self, program_type: ProgramType) -> int:
         """Count clients by program type with caching"""
         return await super().count_by_program_type(program_type)
     
     @with_performance_monitoring("clients", "delete")
+    @pooled
     async def delete(self, client_id: ClientId) -> bool:
         """Delete client with performance monitoring"""
         return await super().delete(client_id)
     
     @with_performance_monitoring("clients", "analytics")
+    @pooled
     async def get_analytics_data(
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         program_type: Optional[ProgramType] = None
     ) -> Dict[str, Any]:
-        """Get analytics data with caching"""
+        """Get analytics data from grouped counts"""
         return await super().get_analytics_data(start_date, end_date, program_type)
     
+    @with_performance_monitoring("clients", "group_counts")
+    @pooled
+    async def count_by_status_and_program_type(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        program_type: Optional[ProgramType] = None
+    ) -> Dict[Tuple[str, str], int]:
+        """Count clients per (status, program_type) with performance monitoring"""
+        return await super().count_by_status_and_program_type(start_date, end_date, program_type)
+    
     # Enhanced methods with batch operations
+    @with_performance_monitoring("clients", "save")
+    @pooled
     async def save_batch(self, clients: List[Client]) -> None:
-        """Save multiple clients in batch"""
-        if not clients:
-            return
-        
-        async with connection_pool.get_connection() as conn:
-            try:
-                # Prepare batch data
-                batch_data = [self._entity_to_dict(client) for client in clients]
-                
-                # Execute batch upsert
-                response = self._client.table(self._table_name).upsert(batch_data).execute()
-                
-                if not response.data or len(response.data) != len(clients):
-                    raise DomainException("Batch save operation failed")
-                    
-            except Exception as e:
-                raise DomainException(f"Database error during batch save: {e}")
+        """Save multiple clients in a single upsert"""
+        await super().save_batch(clients)
     
+    @with_performance_monitoring("clients", "existing_emails")
+    @pooled
+    async def find_existing_emails(self, emails: List[str]) -> Set[str]:
+        """Find which emails already exist with performance monitoring"""
+        return await super().find_existing_emails(emails)
+    
+    @pooled
     async def find_by_ids(self, client_ids: List[ClientId]) -> List[Client]:
         """Find multiple clients by IDs efficiently"""
         if not client_ids:
@@ -144,15 +279,34 @@ class OptimizedClientRepository(SupabaseClientRepository):
             id_strings = [str(client_id) for client_id in client_ids]
             
             response = self._client.table(self._table_name)\
-                .select("*")\
+                .select(self.COLUMNS)\
                 .in_("id", id_strings)\
                 .execute()
             
-            return [self._dict_to_entity(data) for data in response.data]
+            return self._rows_to_entities(response.data)
             
         except Exception as e:
             raise DomainException(f"Database error while finding clients by IDs: {e}")
     
+    @pooled
+    async def find_by_emails(self, emails: List[str]) -> List[Client]:
+        """Find multiple clients by email efficiently"""
+        if not emails:
+            return []
+        
+        try:
+            response = self._client.table(self._table_name)\
+                .select(self.COLUMNS)\
+                .in_("email", emails)\
+                .execute()
+            
+            return self._rows_to_entities(response.data)
+            
+        except Exception as e:
+            raise DomainException(f"Database error while finding clients by emails: {e}")
+    
+    @with_performance_monitoring("clients", "dashboard")
+    @pooled
     async def get_dashboard_metrics(self) -> Dict[str, Any]:
         """Get optimized dashboard metrics with single query"""
         try:
@@ -182,6 +336,8 @@ class OptimizedClientRepository(SupabaseClientRepository):
         except Exception as e:
             raise DomainException(f"Database error while getting dashboard metrics: {e}")
     
+    @with_performance_monitoring("clients", "recent_activity")
+    @pooled
     async def get_recent_activity(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent client activity efficiently"""
         try:
@@ -208,60 +364,71 @@ class OptimizedClientRepository(SupabaseClientRepository):
         except Exception as e:
             raise DomainException(f"Database error while getting recent activity: {e}")
     
+    @pooled
     async def search_with_filters(
         self, 
         query: str = None,
         status: ClientStatus = None,
         program_type: ProgramType = None,
         limit: int = 50,
-        offset: int = 0
+        offset: Optional[int] = 0,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        summary: bool = False,
+        count_mode: str = DEFAULT_COUNT_MODE,
+        search_mode: str = DEFAULT_SEARCH_MODE
     ) -> Dict[str, Any]:
-        """Advanced search with multiple filters"""
+        """
+        Advanced search with multiple filters.
+        
+        Pages by keyset when a cursor is given or offset is None, otherwise
+        by offset for backwards compatibility. With ``summary`` the clients
+        are projected ClientSummary rows instead of full entities. Rows and
+        total count come back in one request; ``total_count`` is None when
+        ``count_mode`` is ``none``, and ``has_more`` always comes from
+        fetching one row past the page.
+        """
+        keyset = cursor is not None or offset is None
+        page_offset = None if keyset else offset
+        
         try:
-            # Build dynamic query
-            db_query = self._client.table(self._table_name).select("*")
-            
-            # Apply filters
-            if query:
-                db_query = db_query.or_(f"name.ilike.%{query}%,email.ilike.%{query}%")
-            
-            if status:
-                db_query = db_query.eq("status", status.value)
-            
-            if program_type:
-                db_query = db_query.eq("program_type", program_type.value)
-            
-            # Add pagination
-            if offset:
-                db_query = db_query.range(offset, offset + limit - 1)
+            if summary:
+                page = await self.find_summary_page(
+                    limit=limit,
+                    cursor=cursor,
+                    sort_key=sort_key,
+                    query=query,
+                    status=status,
+                    program_type=program_type,
+                    offset=page_offset,
+                    count_mode=count_mode,
+                    search_mode=search_mode
+                )
             else:
-                db_query = db_query.limit(limit)
-            
-            # Execute query
-            response = db_query.execute()
-            clients = [self._dict_to_entity(data) for data in response.data]
-            
-            # Get total count for pagination
-            count_query = self._client.table(self._table_name).select("id", count="exact")
-            
-            if query:
-                count_query = count_query.or_(f"name.ilike.%{query}%,email.ilike.%{query}%")
-            if status:
-                count_query = count_query.eq("status", status.value)
-            if program_type:
-                count_query = count_query.eq("program_type", program_type.value)
-            
-            count_response = count_query.execute()
-            total_count = count_response.count
+                page = await self.find_page(
+                    limit=limit,
+                    cursor=cursor,
+                    sort_key=sort_key,
+                    query=query,
+                    status=status,
+                    program_type=program_type,
+                    offset=page_offset,
+                    count_mode=count_mode,
+                    search_mode=search_mode
+                )
             
             return {
-                "clients": clients,
-                "total_count": total_count,
+                "clients": page.items,
+                "total_count": page.total_count,
+                "count_mode": count_mode,
                 "page_size": limit,
-                "offset": offset,
-                "has_more": offset + len(clients) < total_count
+                "offset": page_offset,
+                "next_cursor": page.next_cursor,
+                "has_more": page.has_more
             }
             
+        except DomainException:
+            raise
         except Exception as e:
             raise DomainException(f"Database error during advanced search: {e}")
 
@@ -279,8 +446,18 @@ CREATE INDEX IF NOT EXISTS idx_clients_updated_at ON clients(updated_at);
 CREATE INDEX IF NOT EXISTS idx_clients_status_program_type ON clients(status, program_type);
 CREATE INDEX IF NOT EXISTS idx_clients_status_created_at ON clients(status, created_at);
 
--- Full-text search index for name and email
-CREATE INDEX IF NOT EXISTS idx_clients_search ON clients USING gin(to_tsvector('english', name || ' ' || email));
+-- Keyset pagination indexes: (sort_key DESC, id DESC), optionally behind a filter
+CREATE INDEX IF NOT EXISTS idx_clients_created_at_id ON clients(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_clients_updated_at_id ON clients(updated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_clients_status_created_at_id ON clients(status, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_clients_program_type_created_at_id ON clients(program_type, created_at DESC, id DESC);
+
+-- Full-text search on name and email. PostgREST can only filter on columns,
+-- so the tsvector is a generated column (the old expression index was unusable)
+ALTER TABLE clients ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(email, ''))) STORED;
+DROP INDEX IF EXISTS idx_clients_search;
+CREATE INDEX IF NOT EXISTS idx_clients_search_vector ON clients USING gin(search_vector);
 
 -- RPC function for dashboard metrics
 CREATE OR REPLACE FUNCTION get_client_dashboard_metrics()
@@ -306,6 +483,28 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- RPC function for client analytics: counts per (status, program_type)
+CREATE OR REPLACE FUNCTION get_client_analytics_counts(
+    start_date timestamptz DEFAULT NULL,
+    end_date timestamptz DEFAULT NULL,
+    program_type_filter text DEFAULT NULL
+)
+RETURNS TABLE(
+    status text,
+    program_type text,
+    client_count bigint
+) AS $$
+    SELECT
+        c.status::text,
+        c.program_type::text,
+        COUNT(*) as client_count
+    FROM clients c
+    WHERE (start_date IS NULL OR c.created_at >= start_date)
+      AND (end_date IS NULL OR c.created_at <= end_date)
+      AND (program_type_filter IS NULL OR c.program_type = program_type_filter)
+    GROUP BY c.status, c.program_type;
+$$ LANGUAGE sql STABLE;
+
 -- Analyze tables for query optimization
 ANALYZE clients;
 """
@@ -3,15 +3,25 @@ Database Performance Optimization Layer
 """
 
 import asyncio
+import hashlib
+import os
 import time
-from typing import Any, Dict, List, Optional, Callable, TypeVar, Generic
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Awaitable, Deque, Dict, List, NamedTuple, Optional, Callable, Tuple, TypeVar, Generic
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import wraps
 from contextlib import asynccontextmanager
+from weakref import WeakKeyDictionary, WeakValueDictionary
 import logging
 
 from .supabase import SupabaseConnection
+from ..cache import CacheBackend, entity_tag, get_cache, table_tag
+from ..cache.codec import register_type
+from ...application.deadline import deadline_guard, without_deadline
+from ...domain.entities import Client, ClientRecord, ClientStatus, ProgramType
+from ...domain.exceptions import DomainException
 
 T = TypeVar('T')
 
@@ -24,6 +34,7 @@ class QueryMetrics:
     row_count: Optional[int]
     cache_hit: bool
     timestamp: datetime
+    coalesced: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -32,128 +43,332 @@ class QueryMetrics:
             "execution_time": self.execution_time,
             "row_count": self.row_count,
             "cache_hit": self.cache_hit,
+            "coalesced": self.coalesced,
             "timestamp": self.timestamp.isoformat()
         }
 
 
+@register_type
+class _ClientSnapshot(NamedTuple):
+    """Cached form of a Client result, or of a list of them"""
+    records: Tuple[ClientRecord, ...]
+    many: bool
+
+
+# Decodable from Redis before this worker has cached one itself
+register_type(ClientRecord)
+register_type(ClientStatus)
+register_type(ProgramType)
+
+
+def _to_cached(result: Any) -> Any:
+    """
+    Store Client results as immutable ClientRecords: they take about half
+    the memory, and callers mutating a returned entity cannot change what
+    later cache hits see.
+    """
+    if isinstance(result, Client):
+        return _ClientSnapshot((ClientRecord.from_entity(result),), False)
+    if isinstance(result, list) and result and all(isinstance(item, Client) for item in result):
+        return _ClientSnapshot(tuple(ClientRecord.from_entity(item) for item in result), True)
+    return result
+
+
+def _from_cached(cached: Any) -> Any:
+    """Rebuild fresh entities from a cached snapshot"""
+    if isinstance(cached, _ClientSnapshot):
+        clients = [record.to_entity() for record in cached.records]
+        return clients if cached.many else clients[0]
+    return cached
+
+
+def copy_result(result: Any) -> Any:
+    """
+    A copy of a Client result (or list of them) that one caller can
+    mutate without the others seeing it; other results are returned as is.
+    """
+    return _from_cached(_to_cached(result))
+
+
+# Query result default lifetime; the byte budget is the shared cache's CACHE_MAX_BYTES
+QUERY_CACHE_DEFAULT_TTL = int(os.getenv("QUERY_CACHE_DEFAULT_TTL", "300"))
+
+
 class QueryCache:
-    """In-memory cache for database queries with TTL"""
+    """
+    Query result cache with TTL, kept in its own namespace of the
+    process-wide cache backend (so with Redis configured, writes in one
+    worker invalidate the cached reads of all of them).
     
-    def __init__(self, default_ttl: int = 300):  # 5 minutes default
-        self._cache: Dict[str, Dict[str, Any]] = {}
+    Every entry is tagged with its table, and client results also with
+    each client's id, so invalidating a table or an entity only touches
+    the entries concerned.
+    """
+    
+    NAMESPACE = "query"
+    
+    def __init__(
+        self,
+        default_ttl: int = QUERY_CACHE_DEFAULT_TTL,
+        store: Optional[CacheBackend] = None
+    ):
+        self._store = store
         self._default_ttl = default_ttl
         self._logger = logging.getLogger(__name__)
     
+    @property
+    def store(self) -> CacheBackend:
+        # Resolved on first use, not at import, so configuration is read once the app starts
+        return self._store if self._store is not None else get_cache()
+    
     def _generate_key(self, table: str, query: str, params: Dict[str, Any]) -> str:
         """Generate cache key from query parameters"""
-        import hashlib
-        query_string = f"{table}:{query}:{str(sorted(params.items()))}"
-        return hashlib.md5(query_string.encode()).hexdigest()
+        digest = hashlib.blake2b(repr(sorted(params.items())).encode(), digest_size=16).hexdigest()
+        return f"{table}:{query}:{digest}"
     
     def get(self, table: str, query: str, params: Dict[str, Any]) -> Optional[Any]:
         """Get cached result if not expired"""
-        key = self._generate_key(table, query, params)
-        
-        if key in self._cache:
-            cached_item = self._cache[key]
-            if datetime.now() < cached_item['expires_at']:
-                self._logger.debug(f"Cache hit for key: {key[:8]}...")
-                return cached_item['data']
-            else:
-                # Remove expired item
-                del self._cache[key]
-                self._logger.debug(f"Cache expired for key: {key[:8]}...")
-        
-        return None
+        return self.store.get(self._generate_key(table, query, params), self.NAMESPACE)
     
-    def set(self, table: str, query: str, params: Dict[str, Any], data: Any, ttl: Optional[int] = None) -> None:
+    async def aget(self, table: str, query: str, params: Dict[str, Any]) -> Optional[Any]:
+        """Get cached result if not expired, without blocking the event loop"""
+        return await self.store.aget(self._generate_key(table, query, params), self.NAMESPACE)
+    
+    def set(
+        self,
+        table: str,
+        query: str,
+        params: Dict[str, Any],
+        data: Any,
+        ttl: Optional[int] = None,
+        tags: Tuple[str, ...] = ()
+    ) -> None:
         """Cache query result with TTL"""
-        key = self._generate_key(table, query, params)
-        expires_at = datetime.now() + timedelta(seconds=ttl or self._default_ttl)
-        
-        self._cache[key] = {
-            'data': data,
-            'expires_at': expires_at,
-            'created_at': datetime.now()
-        }
+        all_tags = {table_tag(table), *tags}
+        if isinstance(data, _ClientSnapshot):
+            all_tags.update(entity_tag(table, record.id) for record in data.records)
         
-        self._logger.debug(f"Cached result for key: {key[:8]}...")
+        self.store.set(
+            self._generate_key(table, query, params),
+            data,
+            ttl=ttl or self._default_ttl,
+            tags=all_tags,
+            namespace=self.NAMESPACE
+        )
     
-    def invalidate_table(self, table: str) -> None:
+    def invalidate_table(self, table: str) -> int:
         """Invalidate all cache entries for a table"""
-        keys_to_remove = []
-        for key, item in self._cache.items():
-            if key.startswith(f"{table}:"):
-                keys_to_remove.append(key)
-        
-        for key in keys_to_remove:
-            del self._cache[key]
-        
-        self._logger.info(f"Invalidated {len(keys_to_remove)} cache entries for table: {table}")
+        removed = self.store.invalidate_tags(table_tag(table))
+        self._logger.debug(f"Invalidated {removed} cache entries for table: {table}")
+        return removed
+    
+    def invalidate_entity(self, table: str, entity_id: Any) -> int:
+        """Invalidate the cache entries holding one row"""
+        return self.store.invalidate_tags(entity_tag(table, entity_id))
     
     def clear(self) -> None:
         """Clear all cache entries"""
-        count = len(self._cache)
-        self._cache.clear()
+        count = self.store.clear(self.NAMESPACE)
         self._logger.info(f"Cleared {count} cache entries")
     
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        now = datetime.now()
-        active_entries = sum(1 for item in self._cache.values() if now < item['expires_at'])
-        
+        store = self.store
+        counters = store.namespace_stats(self.NAMESPACE)
+        stats = {
+            "total_entries": counters["entries"],
+            "cache_size_mb": round(counters["bytes"] / (1024 * 1024), 3),
+            "max_size_mb": round(store.max_bytes / (1024 * 1024), 3),
+            "hits": counters["hits"],
+            "misses": counters["misses"],
+            "hit_rate": counters["hit_rate"],
+            "evictions": counters["evictions"],
+            "expirations": counters["expirations"],
+            "invalidations": counters["invalidations"]
+        }
+        # Two-tier backend: how much of the hit rate each tier contributes
+        for field in ("l1_hit_rate", "l2_hit_rate"):
+            if field in counters:
+                stats[field] = counters[field]
+        return stats
+
+
+class Histogram:
+    """
+    Latency/size histogram with fixed buckets plus a rolling sample window.
+
+    Bucket counts are cumulative for the life of the process; percentiles
+    are computed from the most recent ``window`` observations.
+    """
+    
+    def __init__(self, buckets: List[float], window: int = 2048):
+        self._buckets = sorted(buckets)
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._total = 0
+        self._sum = 0.0
+    
+    def observe(self, value: float) -> None:
+        """Record one observation"""
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self._samples.append(value)
+        self._total += 1
+        self._sum += value
+    
+    @property
+    def samples(self) -> int:
+        """Number of observations in the recent window"""
+        return len(self._samples)
+    
+    def percentile(self, p: float) -> float:
+        """Return the p-th percentile (0-100) of the recent window"""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered))) - 1))
+        return ordered[index]
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Get histogram state"""
+        labels = [f"le_{bound:g}" for bound in self._buckets] + ["le_inf"]
         return {
-            "total_entries": len(self._cache),
-            "active_entries": active_entries,
-            "expired_entries": len(self._cache) - active_entries,
-            "cache_size_mb": len(str(self._cache)) / (1024 * 1024)
+            "count": self._total,
+            "sum": round(self._sum, 6),
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "buckets": dict(zip(labels, self._counts))
         }
 
 
+# Live pools by name, for reporting
+_connection_pools: "WeakValueDictionary[str, ConnectionPool]" = WeakValueDictionary()
+
+
 class ConnectionPool:
-    """Connection pool for Supabase connections"""
+    """
+    Bounded connection pool with FIFO waiters.
+    
+    At most ``max_connections`` connections are handed out at once. When the
+    pool is exhausted callers queue in arrival order and a released
+    connection is passed directly to the oldest waiter, so nobody can jump
+    the queue. Callers that wait longer than ``acquire_timeout`` seconds get
+    a DomainException instead of hanging.
+    """
+    
+    # Acquire wait buckets in seconds, queue depth buckets in waiters
+    WAIT_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+    DEPTH_BUCKETS = [0, 1, 2, 5, 10, 25, 50, 100]
     
-    def __init__(self, max_connections: int = 10, connection_timeout: int = 30):
+    def __init__(
+        self,
+        max_connections: int = 10,
+        connection_timeout: int = 30,
+        connection_factory: Callable[[], Any] = None,
+        name: str = "supabase"
+    ):
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        
         self._max_connections = max_connections
         self._connection_timeout = connection_timeout
-        self._pool: List[SupabaseConnection] = []
+        self._connection_factory = connection_factory or SupabaseConnection
+        self._name = name
+        self._idle: Deque[Any] = deque()
+        self._waiters: Deque[asyncio.Future] = deque()
         self._active_connections: int = 0
-        self._lock = asyncio.Lock()
+        self._created_connections: int = 0
+        self._timeouts: int = 0
+        self._wait_time = Histogram(self.WAIT_BUCKETS)
+        self._queue_depth = Histogram(self.DEPTH_BUCKETS)
         self._logger = logging.getLogger(__name__)
+        _connection_pools[name] = self
+    
+    @property
+    def name(self) -> str:
+        return self._name
     
-    async def acquire(self) -> SupabaseConnection:
-        """Acquire connection from pool"""
-        async with self._lock:
-            if self._pool:
-                connection = self._pool.pop()
-                self._active_connections += 1
-                self._logger.debug(f"Acquired connection from pool. Active: {self._active_connections}")
-                return connection
+    def _checkout(self) -> Any:
+        """Take an idle connection or create one. Caller already holds a slot."""
+        if self._idle:
+            return self._idle.pop()
+        
+        connection = self._connection_factory()
+        self._created_connections += 1
+        self._logger.debug(f"Created new connection for pool '{self._name}'")
+        return connection
+    
+    def _hand_off(self) -> bool:
+        """Pass a freed slot to the oldest live waiter, if any"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return True
+        return False
+    
+    async def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Acquire connection from pool.
+        
+        Raises:
+            DomainException: If no connection frees up within the timeout
+        """
+        start_time = time.monotonic()
+        
+        if not self._waiters and self._active_connections < self._max_connections:
+            self._active_connections += 1
+            self._wait_time.observe(0.0)
+            self._queue_depth.observe(0)
+            return self._checkout()
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._queue_depth.observe(len(self._waiters))
+        
+        try:
+            await asyncio.wait_for(waiter, timeout or self._connection_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed to us just as we gave up: pass it on
+                if not self._hand_off():
+                    self._active_connections -= 1
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
             
-            if self._active_connections < self._max_connections:
-                connection = SupabaseConnection()
-                self._active_connections += 1
-                self._logger.debug(f"Created new connection. Active: {self._active_connections}")
-                return connection
+            if isinstance(e, asyncio.CancelledError):
+                raise
             
-            # Wait for connection to become available
-            self._logger.warning("Connection pool exhausted, waiting...")
-            await asyncio.sleep(0.1)
-            return await self.acquire()
+            self._timeouts += 1
+            waited = time.monotonic() - start_time
+            self._wait_time.observe(waited)
+            self._logger.warning(
+                f"Connection pool '{self._name}' exhausted: gave up after {waited:.2f}s "
+                f"with {len(self._waiters)} waiters"
+            )
+            raise DomainException(
+                f"Timed out after {waited:.2f}s waiting for a database connection",
+                error_code="CONNECTION_POOL_TIMEOUT",
+                details={"pool": self._name, "max_connections": self._max_connections}
+            )
+        
+        self._wait_time.observe(time.monotonic() - start_time)
+        return self._checkout()
     
-    async def release(self, connection: SupabaseConnection) -> None:
+    async def release(self, connection: Any) -> None:
         """Release connection back to pool"""
-        async with self._lock:
-            if len(self._pool) < self._max_connections:
-                self._pool.append(connection)
-            
+        self._idle.append(connection)
+        
+        # The slot moves straight to the next waiter instead of being freed
+        if not self._hand_off():
             self._active_connections -= 1
-            self._logger.debug(f"Released connection to pool. Active: {self._active_connections}")
     
     @asynccontextmanager
-    async def get_connection(self):
+    async def get_connection(self, timeout: Optional[float] = None):
         """Context manager for connection handling"""
-        connection = await self.acquire()
+        connection = await self.acquire(timeout)
         try:
             yield connection
         finally:
@@ -162,19 +377,102 @@ class ConnectionPool:
     def stats(self) -> Dict[str, Any]:
         """Get pool statistics"""
         return {
+            "name": self._name,
             "max_connections": self._max_connections,
             "active_connections": self._active_connections,
-            "available_connections": len(self._pool),
-            "pool_utilization": (self._active_connections / self._max_connections) * 100
+            "available_connections": len(self._idle),
+            "created_connections": self._created_connections,
+            "waiting": len(self._waiters),
+            "acquire_timeouts": self._timeouts,
+            "pool_utilization": (self._active_connections / self._max_connections) * 100,
+            "acquire_wait_p50_ms": round(self._wait_time.percentile(50) * 1000, 3),
+            "acquire_wait_p99_ms": round(self._wait_time.percentile(99) * 1000, 3),
+            "acquire_wait_seconds": self._wait_time.snapshot(),
+            "queue_depth": self._queue_depth.snapshot()
         }
 
 
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls.
+    
+    The first caller for a key starts the call as a task; callers arriving
+    while it is in flight await that same task instead of starting their
+    own. Results and exceptions reach every caller; callers that joined
+    get the result through ``copy``, so use cases that mutate the entity
+    they loaded (UpdateClientUseCase) never share one. A caller that is
+    cancelled does not cancel the shared call for the others; once every
+    caller has been cancelled (or timed out) the call itself is cancelled.
+    """
+    
+    def __init__(self, copy: Callable[[Any], Any] = copy_result):
+        self._copy = copy
+        # event loop -> key -> in-flight task
+        self._calls: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = (
+            WeakKeyDictionary()
+        )
+        # in-flight task -> callers still awaiting it
+        self._waiting: Dict[asyncio.Task, int] = {}
+        self._metrics = {"calls": 0, "coalesced": 0}
+    
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """Run ``fn`` or join the identical call in flight. Returns (result, coalesced)."""
+        loop = asyncio.get_running_loop()
+        calls = self._calls.setdefault(loop, {})
+        self._metrics["calls"] += 1
+        
+        task = calls.get(key)
+        coalesced = task is not None
+        if coalesced:
+            self._metrics["coalesced"] += 1
+        else:
+            # Shared by every caller: it must not run under the deadline of
+            # whichever request started it, but keeps the pooled connection
+            # a composite repository method may already hold
+            task = loop.create_task(fn(), context=without_deadline())
+            calls[key] = task
+            task.add_done_callback(lambda done: self._forget(calls, key, done))
+        
+        self._waiting[task] = self._waiting.get(task, 0) + 1
+        try:
+            result = await asyncio.shield(task)
+            return (self._copy(result) if coalesced else result), coalesced
+        finally:
+            waiting = self._waiting.pop(task) - 1
+            if waiting:
+                self._waiting[task] = waiting
+            elif not task.done():
+                # Nobody is left to use the result
+                task.cancel()
+    
+    @staticmethod
+    def _forget(calls: Dict[str, asyncio.Task], key: str, task: asyncio.Task) -> None:
+        if calls.get(key) is task:
+            del calls[key]
+        # Mark the exception as retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+    
+    def in_flight(self) -> int:
+        """Number of calls currently in flight across loops"""
+        return sum(len(calls) for calls in list(self._calls.values()))
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics"""
+        return {**self._metrics, "in_flight": self.in_flight()}
+
+
 class PerformanceMonitor:
     """Performance monitoring for database operations"""
     
     def __init__(self, max_metrics: int = 1000):
         self._metrics: List[QueryMetrics] = []
         self._max_metrics = max_metrics
+        # circuit name -> event -> count, and circuit name -> current state
+        self._resilience_events: Dict[str, Dict[str, int]] = {}
+        self._circuit_states: Dict[str, str] = {}
+        # route -> requests served under a deadline / requests that ran out of time
+        self._deadlines: Dict[str, Dict[str, int]] = {}
         self._logger = logging.getLogger(__name__)
     
     def record_query(self, metrics: QueryMetrics) -> None:
@@ -192,6 +490,42 @@ class PerformanceMonitor:
                 f"took {metrics.execution_time:.2f}s"
             )
     
+    def record_resilience_event(self, circuit: str, event: str) -> None:
+        """Count a retry, hedge, rejection or breaker transition"""
+        events = self._resilience_events.setdefault(circuit, {})
+        events[event] = events.get(event, 0) + 1
+    
+    def record_circuit_state(self, circuit: str, state: str) -> None:
+        """Record a circuit breaker's new state"""
+        self._circuit_states[circuit] = state
+    
+    def resilience_stats(self) -> Dict[str, Any]:
+        """Circuit states and resilience event counts since startup"""
+        return {
+            "circuits": dict(self._circuit_states),
+            "open_circuits": sorted(
+                name for name, state in self._circuit_states.items() if state == "open"
+            ),
+            "events": {name: dict(events) for name, events in self._resilience_events.items()}
+        }
+    
+    def record_deadline(self, route: str, exceeded: bool) -> None:
+        """Count a request served under a deadline, and whether it ran out of time"""
+        counts = self._deadlines.setdefault(route, {"requests": 0, "exceeded": 0})
+        counts["requests"] += 1
+        if exceeded:
+            counts["exceeded"] += 1
+    
+    def deadline_stats(self) -> Dict[str, Any]:
+        """Deadline-exceeded requests per route since startup"""
+        return {
+            route: {
+                **counts,
+                "exceeded_rate": round(counts["exceeded"] / counts["requests"] * 100, 2)
+            }
+            for route, counts in self._deadlines.items()
+        }
+    
     def get_stats(self, minutes: int = 60) -> Dict[str, Any]:
         """Get performance statistics for the last N minutes"""
         cutoff_time = datetime.now() - timedelta(minutes=minutes)
@@ -206,6 +540,7 @@ class PerformanceMonitor:
         avg_time = total_time / total_queries
         cache_hits = sum(1 for m in recent_metrics if m.cache_hit)
         cache_hit_rate = (cache_hits / total_queries) * 100
+        coalesced_calls = sum(1 for m in recent_metrics if m.coalesced)
         
         # Query type distribution
         query_types = {}
@@ -226,6 +561,8 @@ class PerformanceMonitor:
             "total_execution_time": round(total_time, 2),
             "average_execution_time": round(avg_time, 3),
             "cache_hit_rate": round(cache_hit_rate, 2),
+            "coalesced_calls": coalesced_calls,
+            "coalesced_rate": round(coalesced_calls / total_queries * 100, 2),
             "query_type_distribution": query_types,
             "table_access_distribution": table_access,
             "slowest_queries": [
@@ -242,28 +579,52 @@ class PerformanceMonitor:
 
 # Global instances
 query_cache = QueryCache()
-connection_pool = ConnectionPool()
+connection_pool = ConnectionPool(
+    max_connections=int(os.getenv("DB_POOL_MAX_CONNECTIONS", "10")),
+    connection_timeout=int(os.getenv("DB_POOL_ACQUIRE_TIMEOUT", "30"))
+)
 performance_monitor = PerformanceMonitor()
+single_flight = SingleFlight()
+
+# Results of these query types are cached; writes invalidate the table
+CACHEABLE_QUERY_TYPES = ('select', 'find', 'search', 'count')
+WRITE_QUERY_TYPES = ('insert', 'update', 'delete', 'save', 'upsert')
+
+
+def get_connection_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Get statistics for every live connection pool, keyed by pool name"""
+    return {name: pool.stats() for name, pool in list(_connection_pools.items())}
 
 
 def with_performance_monitoring(table_name: str, query_type: str):
-    """Decorator to add performance monitoring to database methods"""
+    """
+    Decorator to add performance monitoring to database methods.
+    
+    Read calls are cached (for the cacheable query types) and coalesced:
+    identical reads already in flight are awaited instead of re-issued.
+    Calls made while serving a request are bounded by its deadline.
+    """
+    is_read = query_type not in WRITE_QUERY_TYPES
+    is_cacheable = query_type in CACHEABLE_QUERY_TYPES
+    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs):
             start_time = time.time()
             cache_hit = False
+            coalesced = False
+            cache_key_params = {
+                'args': str(args[1:]),  # Skip self
+                'kwargs': str(kwargs)
+            }
             
             try:
                 # Check cache for read operations
-                if query_type in ['select', 'find', 'search', 'count']:
-                    cache_key_params = {
-                        'args': str(args[1:]),  # Skip self
-                        'kwargs': str(kwargs)
-                    }
-                    cached_result = query_cache.get(table_name, query_type, cache_key_params)
+                if is_cacheable:
+                    cached_result = await query_cache.aget(table_name, query_type, cache_key_params)
                     
                     if cached_result is not None:
+                        cached_result = _from_cached(cached_result)
                         cache_hit = True
                         execution_time = time.time() - start_time
                         
@@ -279,22 +640,26 @@ def with_performance_monitoring(table_name: str, query_type: str):
                         
                         return cached_result
                 
-                # Execute the actual function
-                result = await func(*args, **kwargs)
+                # Execute the actual function, sharing identical in-flight reads,
+                # within whatever is left of the request's deadline
+                async with deadline_guard(f"{table_name}.{query_type}"):
+                    if is_read:
+                        flight_key = f"{table_name}:{query_type}:{sorted(cache_key_params.items())}"
+                        result, coalesced = await single_flight.do(
+                            flight_key, lambda: func(*args, **kwargs)
+                        )
+                    else:
+                        result = await func(*args, **kwargs)
                 execution_time = time.time() - start_time
                 
-                # Cache the result for read operations
-                if query_type in ['select', 'find', 'search', 'count'] and result is not None:
-                    cache_key_params = {
-                        'args': str(args[1:]),
-                        'kwargs': str(kwargs)
-                    }
+                # Cache the result for read operations (only the call that ran the query)
+                if is_cacheable and not coalesced and result is not None:
                     # Use shorter TTL for frequently changing data
                     ttl = 60 if query_type == 'count' else 300
-                    query_cache.set(table_name, query_type, cache_key_params, result, ttl)
+                    query_cache.set(table_name, query_type, cache_key_params, _to_cached(result), ttl)
                 
                 # Invalidate cache for write operations
-                if query_type in ['insert', 'update', 'delete', 'save', 'upsert']:
+                if not is_read:
                     query_cache.invalidate_table(table_name)
                 
                 # Record metrics
@@ -310,7 +675,8 @@ def with_performance_monitoring(table_name: str, query_type: str):
                     execution_time=execution_time,
                     row_count=row_count,
                     cache_hit=cache_hit,
-                    timestamp=datetime.now()
+                    timestamp=datetime.now(),
+                    coalesced=coalesced
                 )
                 performance_monitor.record_query(metrics)
                 
@@ -326,7 +692,8 @@ def with_performance_monitoring(table_name: str, query_type: str):
                     execution_time=execution_time,
                     row_count=0,
                     cache_hit=cache_hit,
-                    timestamp=datetime.now()
+                    timestamp=datetime.now(),
+                    coalesced=coalesced
                 )
                 performance_monitor.record_query(metrics)
                 
@@ -354,22 +721,18 @@ class OptimizedSupabaseConnection(SupabaseConnection):
         max_retries: int = 3, 
         delay: float = 1.0
     ) -> Any:
-        """Execute database operation with retry logic"""
-        last_exception = None
+        """Execute database operation with jittered exponential backoff"""
+        from .resilience import RetryPolicy
         
-        for attempt in range(max_retries):
-            try:
-                return await operation()
-            except Exception as e:
-                last_exception = e
-                self._logger.warning(
-                    f"Database operation failed (attempt {attempt + 1}/{max_retries}): {e}"
-                )
-                
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(delay * (2 ** attempt))  # Exponential backoff
+        def on_retry(attempt: int, error: Exception, wait: float) -> None:
+            performance_monitor.record_resilience_event("supabase", "retried")
+            self._logger.warning(
+                f"Database operation failed (attempt {attempt + 1}/{max_retries}), "
+                f"retrying in {wait:.2f}s: {error}"
+            )
         
-        raise last_exception
+        policy = RetryPolicy(max_attempts=max_retries, base_delay=delay, max_delay=delay * 2 ** max_retries)
+        return await policy.run(operation, lambda error: True, on_retry)
     
     async def batch_operation(self, operations: List[Callable]) -> List[Any]:
         """Execute multiple operations in batch"""
@@ -405,8 +768,19 @@ async def analyze_query_performance(table_name: str = None, minutes: int = 60) -
     
     # Connection pool stats
     pool_stats = connection_pool.stats()
-    if pool_stats["pool_utilization"] > 80:
-        recommendations.append("Consider increasing connection pool size")
+    all_pool_stats = get_connection_pool_stats()
+    for name, stats_for_pool in all_pool_stats.items():
+        if stats_for_pool["pool_utilization"] > 80:
+            recommendations.append(f"Consider increasing connection pool size ({name})")
+        if stats_for_pool["acquire_wait_p99_ms"] > 100:
+            recommendations.append(
+                f"Requests are queueing for connections ({name} p99 wait "
+                f"{stats_for_pool['acquire_wait_p99_ms']:.0f}ms)"
+            )
+    
+    resilience = performance_monitor.resilience_stats()
+    for circuit in resilience["open_circuits"]:
+        recommendations.append(f"Circuit '{circuit}' is open: the backend is failing")
     
     # Cache stats
     cache_stats = query_cache.stats()
@@ -415,6 +789,8 @@ async def analyze_query_performance(table_name: str = None, minutes: int = 60) -
         **stats,
         "cache_statistics": cache_stats,
         "connection_pool_statistics": pool_stats,
+        "connection_pools": all_pool_stats,
+        "resilience": resilience,
         "optimization_recommendations": recommendations
     }
 
@@ -440,6 +816,8 @@ async def get_database_health() -> Dict[str, Any]:
                 "cache_hit_rate": performance_stats.get("cache_hit_rate", 0)
             },
             "connection_pool": connection_pool.stats(),
+            "connection_pools": get_connection_pool_stats(),
+            "resilience": performance_monitor.resilience_stats(),
             "cache_status": query_cache.stats()
         }
         
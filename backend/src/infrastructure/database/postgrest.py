@@ -0,0 +1,863 @@
+"""
+Async PostgREST Database Implementation
+
+Talks to the Supabase REST endpoint (PostgREST) over a shared async HTTP
+client so repository calls never block the event loop.
+"""
+
+import os
+from typing import List, Optional, Dict, Any, Set, Tuple
+from datetime import datetime
+
+import httpx
+
+from .supabase import ClientRowMapper
+from .query_filters import (
+    quote_filter_value,
+    search_term,
+    keyset_condition,
+    combine_conditions,
+    keyset_order,
+    next_page_cursor,
+)
+from .analytics import (
+    ANALYTICS_COUNTS_RPC,
+    ANALYTICS_COLUMNS,
+    ANALYTICS_PAGE_SIZE,
+    GroupCounts,
+    analytics_rpc_params,
+    counts_from_rpc,
+    rpc_is_missing,
+    tally_rows,
+    last_row_cursor,
+    build_analytics,
+)
+from .performance import ConnectionPool, with_performance_monitoring
+from .resilience import ResiliencePolicy
+from .batch_loader import BatchLoader
+from .hydration import hydrate_records
+from ...domain.repositories import IClientRepository
+from ...domain.repositories.pagination import (
+    Page,
+    PageCursor,
+    DEFAULT_SORT_KEY,
+    DEFAULT_COUNT_MODE,
+    DEFAULT_SEARCH_MODE,
+    validate_sort_key,
+    validate_count_mode,
+)
+from ...domain.entities import Client, ClientId, ClientStatus, ProgramType, ClientSummary, ClientRecord
+from ...domain.value_objects import Email
+from ...domain.exceptions import DomainException
+
+
+QueryParams = List[Tuple[str, str]]
+
+# Safe to retry and hedge; RPCs go over POST and get the breaker only
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+
+def parse_content_range(header: Optional[str]) -> Optional[int]:
+    """
+    Extract the total row count from a PostgREST ``Content-Range`` header.
+
+    The header looks like ``0-24/3573`` or ``*/3573``; the total is ``*``
+    when no count was requested.
+    """
+    if not header or "/" not in header:
+        return None
+
+    total = header.rsplit("/", 1)[1]
+    return int(total) if total.isdigit() else None
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Whether a request failure means PostgREST is down or overloaded.
+
+    Network errors, timeouts, 5xx and 429 count against the circuit
+    breaker and are retried; other errors mean the server answered.
+    """
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, DomainException):
+        status_code = error.details.get("status_code")
+        return status_code is not None and (status_code >= 500 or status_code == 429)
+    return False
+
+
+class AsyncPostgrestConnection:
+    """
+    Async connection manager for the Supabase PostgREST endpoint.
+
+    Owns a single ``httpx.AsyncClient`` per process so every repository
+    call reuses warm keep-alive connections instead of paying a new TLS
+    handshake. In-flight requests are bounded by a ConnectionPool sized
+    like the HTTP pool, so queueing is fair and shows up in pool stats.
+    Requests run under a per-table ResiliencePolicy: reads are retried
+    and hedged, and a failing table's circuit opens so callers fail fast
+    instead of waiting out the HTTP timeout.
+    """
+
+    def __init__(
+        self,
+        url: str = None,
+        key: str = None,
+        max_connections: int = None,
+        max_keepalive_connections: int = None,
+        keepalive_expiry: float = 30.0,
+        timeout: float = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        acquire_timeout: float = None,
+        resilience: Optional[ResiliencePolicy] = None
+    ):
+        self.url = url or os.getenv("SUPABASE_URL")
+        self.key = key or os.getenv("SUPABASE_SERVICE_KEY")
+
+        if not self.url or not self.key:
+            raise ValueError("Supabase URL and Service Key are required")
+
+        self._limits = httpx.Limits(
+            max_connections=max_connections or int(os.getenv("POSTGREST_MAX_CONNECTIONS", "20")),
+            max_keepalive_connections=(
+                max_keepalive_connections
+                or int(os.getenv("POSTGREST_MAX_KEEPALIVE_CONNECTIONS", "10"))
+            ),
+            keepalive_expiry=keepalive_expiry
+        )
+        self._timeout = httpx.Timeout(timeout or float(os.getenv("POSTGREST_TIMEOUT", "10")))
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._pool = ConnectionPool(
+            max_connections=self._limits.max_connections,
+            connection_timeout=acquire_timeout or float(os.getenv("POSTGREST_ACQUIRE_TIMEOUT", "10")),
+            # Slots share the one HTTP client, which may be recreated after aclose()
+            connection_factory=lambda: self,
+            name="postgrest"
+        )
+        self._resilience = resilience or ResiliencePolicy.from_env(
+            "postgrest", "POSTGREST", is_transient_error
+        )
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the REST endpoint"""
+        return f"{self.url.rstrip('/')}/rest/v1"
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """Pool bounding in-flight requests"""
+        return self._pool
+
+    @property
+    def resilience(self) -> ResiliencePolicy:
+        """Breakers, retries and hedging applied to requests"""
+        return self._resilience
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get or create the shared async HTTP client"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={
+                    "apikey": self.key,
+                    "Authorization": f"Bearer {self.key}",
+                    "Accept": "application/json",
+                },
+                limits=self._limits,
+                timeout=self._timeout,
+                transport=self._transport
+            )
+        return self._client
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[QueryParams] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        Send a request to PostgREST.
+
+        GET and HEAD requests are retried on transient errors and hedged
+        when slow; every request is refused while its table's circuit is
+        open.
+
+        Raises:
+            DomainException: If PostgREST answers with an error status or
+                no pool slot frees up within the acquire timeout
+            CircuitOpenError: If the table's circuit is open
+        """
+        async def send() -> httpx.Response:
+            return await self._send(method, path, params, json, headers)
+
+        table = path.strip("/")
+        if method in IDEMPOTENT_METHODS:
+            return await self._resilience.read(table, send)
+        return await self._resilience.call(table, send)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[QueryParams],
+        json: Any,
+        headers: Optional[Dict[str, str]]
+    ) -> httpx.Response:
+        async with self._pool.get_connection():
+            response = await self.client.request(
+                method, path, params=params, json=json, headers=headers
+            )
+
+        if response.status_code >= 400:
+            try:
+                body = response.json()
+            except ValueError:
+                body = None
+            if not isinstance(body, dict):
+                body = {}
+            raise DomainException(
+                f"PostgREST error {response.status_code}: {body.get('message', response.text)}",
+                error_code="POSTGREST_ERROR",
+                details={"status_code": response.status_code, "path": path, "code": body.get("code")}
+            )
+
+        return response
+
+    async def health_check(self) -> bool:
+        """Check database connectivity"""
+        try:
+            await self.request("GET", "/clients", params=[("select", "id"), ("limit", "1")])
+            return True
+        except Exception:
+            return False
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class AsyncPostgrestClientRepository(ClientRowMapper, IClientRepository):
+    """
+    Async PostgREST implementation of client repository.
+
+    Drop-in replacement for SupabaseClientRepository and
+    OptimizedClientRepository: same behaviour and extended methods, but
+    every query is awaited on the shared HTTP pool so concurrent requests
+    on one worker overlap their database I/O. Concurrent find_by_id and
+    find_by_email calls are batched into single ``in.(...)`` queries.
+    """
+
+    def __init__(self, connection: AsyncPostgrestConnection):
+        self._connection = connection
+        self._table_name = "clients"
+        self._id_loader = BatchLoader(self._load_by_ids, name="clients.find_by_id")
+        self._email_loader = BatchLoader(self._load_by_emails, name="clients.find_by_email")
+
+    @property
+    def _path(self) -> str:
+        return f"/{self._table_name}"
+
+    @staticmethod
+    def _paginate(
+        params: QueryParams,
+        limit: Optional[int],
+        offset: Optional[int]
+    ) -> QueryParams:
+        """Apply the same limit/offset semantics as the Supabase repository"""
+        if offset:
+            params.append(("offset", str(offset)))
+            params.append(("limit", str(limit or 1000)))
+        elif limit:
+            params.append(("limit", str(limit)))
+        return params
+
+    @staticmethod
+    def _search_filter(query: str, search_mode: str = DEFAULT_SEARCH_MODE) -> Tuple[str, str]:
+        """Build the name/email search filter"""
+        if search_mode == "contains":
+            pattern = quote_filter_value(f"*{query}*")
+            return ("or", f"(name.ilike.{pattern},email.ilike.{pattern})")
+        return ("or", f"({search_term(query, search_mode)})")
+
+    async def _select(self, params: QueryParams) -> List[Dict[str, Any]]:
+        """Run a select and return the raw rows"""
+        response = await self._connection.request("GET", self._path, params=params)
+        return response.json()
+
+    async def _select_with_count(
+        self,
+        params: QueryParams,
+        count_mode: str
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Run a select and read the total from the same response's Content-Range"""
+        if count_mode == "none":
+            return await self._select(params), None
+
+        response = await self._connection.request(
+            "GET",
+            self._path,
+            params=params,
+            headers={"Prefer": f"count={count_mode}"}
+        )
+        return response.json(), parse_content_range(response.headers.get("content-range"))
+
+    async def _count(self, filters: QueryParams) -> int:
+        """Count rows matching the filters without transferring them"""
+        response = await self._connection.request(
+            "HEAD",
+            self._path,
+            params=[("select", "id"), *filters],
+            headers={"Prefer": "count=exact"}
+        )
+        return parse_content_range(response.headers.get("content-range")) or 0
+
+    async def _find(self, params: QueryParams) -> List[Client]:
+        rows = await self._select(params)
+        return self._rows_to_entities(rows)
+
+    @with_performance_monitoring("clients", "save")
+    async def save(self, client: Client) -> None:
+        """Save client to database"""
+        try:
+            data = self._entity_to_dict(client)
+
+            # Upsert to handle both create and update
+            response = await self._connection.request(
+                "POST",
+                self._path,
+                params=[("select", "id")],
+                json=data,
+                headers={"Prefer": "resolution=merge-duplicates,return=representation"}
+            )
+
+            if not response.json():
+                raise DomainException(f"Failed to save client: {client.id}")
+
+        except Exception as e:
+            raise DomainException(f"Database error while saving client: {e}")
+
+    @with_performance_monitoring("clients", "find_by_id")
+    async def find_by_id(self, client_id: ClientId) -> Optional[Client]:
+        """Find client by ID (batched with concurrent lookups)"""
+        return await self._id_loader.load(str(client_id))
+
+    @with_performance_monitoring("clients", "find_by_email")
+    async def find_by_email(self, email: Email) -> Optional[Client]:
+        """Find client by email (batched with concurrent lookups)"""
+        return await self._email_loader.load(str(email))
+
+    async def _load_by_ids(self, ids: List[str]) -> Dict[str, Client]:
+        """Batch function behind find_by_id"""
+        clients = await self.find_by_ids([ClientId(client_id) for client_id in ids])
+        return {str(client.id): client for client in clients}
+
+    async def _load_by_emails(self, emails: List[str]) -> Dict[str, Client]:
+        """Batch function behind find_by_email"""
+        clients = await self.find_by_emails(emails)
+        return {str(client.email): client for client in clients}
+
+    @with_performance_monitoring("clients", "find_all")
+    async def find_all(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Client]:
+        """Find all clients with pagination"""
+        try:
+            return await self._find(self._paginate([("select", self.COLUMNS)], limit, offset))
+        except Exception as e:
+            raise DomainException(f"Database error while finding all clients: {e}")
+
+    @with_performance_monitoring("clients", "find_by_status")
+    async def find_by_status(
+        self,
+        status: ClientStatus,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Client]:
+        """Find clients by status"""
+        try:
+            params = [("select", self.COLUMNS), ("status", f"eq.{status.value}")]
+            return await self._find(self._paginate(params, limit, offset))
+        except Exception as e:
+            raise DomainException(f"Database error while finding clients by status: {e}")
+
+    @with_performance_monitoring("clients", "find_by_program_type")
+    async def find_by_program_type(
+        self,
+        program_type: ProgramType,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Client]:
+        """Find clients by program type"""
+        try:
+            params = [("select", self.COLUMNS), ("program_type", f"eq.{program_type.value}")]
+            return await self._find(self._paginate(params, limit, offset))
+        except Exception as e:
+            raise DomainException(f"Database error while finding clients by program type: {e}")
+
+    @with_performance_monitoring("clients", "search")
+    async def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> List[Client]:
+        """Search clients by name or email (substring or full-text)"""
+        try:
+            params = [("select", self.COLUMNS), self._search_filter(query, search_mode)]
+            return await self._find(self._paginate(params, limit, offset))
+        except Exception as e:
+            raise DomainException(f"Database error while searching clients: {e}")
+
+    async def _select_page_rows(
+        self,
+        columns: str,
+        limit: int,
+        cursor: Optional[str],
+        sort_key: str,
+        query: Optional[str],
+        status: Optional[ClientStatus],
+        program_type: Optional[ProgramType],
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[int]]:
+        """Fetch the raw rows of one page (newest first), the next cursor and the total"""
+        validate_sort_key(sort_key)
+        validate_count_mode(count_mode)
+        page_cursor = PageCursor.decode(cursor, sort_key) if cursor else None
+
+        params: QueryParams = [("select", columns)]
+        if status:
+            params.append(("status", f"eq.{status.value}"))
+        if program_type:
+            params.append(("program_type", f"eq.{program_type.value}"))
+
+        conditions = []
+        if query:
+            conditions.append(search_term(query, search_mode))
+        if page_cursor:
+            conditions.append(keyset_condition(page_cursor))
+        if conditions:
+            params.append(("or", f"({combine_conditions(conditions)})"))
+
+        # One extra row tells us whether another page exists
+        params.append(("order", keyset_order(sort_key)))
+        params.append(("limit", str(limit + 1)))
+        if offset and not page_cursor:
+            params.append(("offset", str(offset)))
+
+        try:
+            rows, total_count = await self._select_with_count(params, count_mode)
+        except Exception as e:
+            raise DomainException(f"Database error while paging clients: {e}")
+
+        return rows[:limit], next_page_cursor(rows, limit, sort_key), total_count
+
+    @with_performance_monitoring("clients", "find_page")
+    async def find_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        query: Optional[str] = None,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None,
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Page[Client]:
+        """Find one keyset page of clients, newest first"""
+        rows, next_cursor, total_count = await self._select_page_rows(
+            self.COLUMNS, limit, cursor, sort_key, query, status, program_type, offset, count_mode,
+            search_mode
+        )
+        return Page(
+            items=self._rows_to_entities(rows),
+            next_cursor=next_cursor,
+            total_count=total_count
+        )
+
+    @with_performance_monitoring("clients", "find_summary_page")
+    async def find_summary_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        query: Optional[str] = None,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None,
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Page[ClientSummary]:
+        """Find one page of projected client summaries, newest first"""
+        rows, next_cursor, total_count = await self._select_page_rows(
+            ClientSummary.COLUMNS, limit, cursor, sort_key, query, status, program_type,
+            offset, count_mode, search_mode
+        )
+        try:
+            items = [ClientSummary.from_row(data) for data in rows]
+        except Exception as e:
+            raise DomainException(f"Failed to convert database record to summary: {e}")
+        return Page(items=items, next_cursor=next_cursor, total_count=total_count)
+
+    @with_performance_monitoring("clients", "find_record_page")
+    async def find_record_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        query: Optional[str] = None,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None,
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Page[ClientRecord]:
+        """Find one keyset page of client snapshots, newest first"""
+        rows, next_cursor, total_count = await self._select_page_rows(
+            self.COLUMNS, limit, cursor, sort_key, query, status, program_type, offset, count_mode,
+            search_mode
+        )
+        return Page(items=hydrate_records(rows), next_cursor=next_cursor, total_count=total_count)
+
+    @with_performance_monitoring("clients", "count")
+    async def count(self) -> int:
+        """Count total clients"""
+        try:
+            return await self._count([])
+        except Exception as e:
+            raise DomainException(f"Database error while counting clients: {e}")
+
+    @with_performance_monitoring("clients", "count_by_status")
+    async def count_by_status(self, status: ClientStatus) -> int:
+        """Count clients by status"""
+        try:
+            return await self._count([("status", f"eq.{status.value}")])
+        except Exception as e:
+            raise DomainException(f"Database error while counting clients by status: {e}")
+
+    @with_performance_monitoring("clients", "count_by_program_type")
+    async def count_by_program_type(self, program_type: ProgramType) -> int:
+        """Count clients by program type"""
+        try:
+            return await self._count([("program_type", f"eq.{program_type.value}")])
+        except Exception as e:
+            raise DomainException(f"Database error while counting clients by program type: {e}")
+
+    async def find_created_between(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Client]:
+        """Find clients created within date range"""
+        try:
+            return await self._find([
+                ("select", self.COLUMNS),
+                ("created_at", f"gte.{start_date.isoformat()}"),
+                ("created_at", f"lte.{end_date.isoformat()}"),
+            ])
+        except Exception as e:
+            raise DomainException(f"Database error while finding clients by date range: {e}")
+
+    @with_performance_monitoring("clients", "delete")
+    async def delete(self, client_id: ClientId) -> bool:
+        """Delete client"""
+        try:
+            response = await self._connection.request(
+                "DELETE",
+                self._path,
+                params=[("select", "id"), ("id", f"eq.{client_id}")],
+                headers={"Prefer": "return=representation"}
+            )
+            return len(response.json()) > 0
+        except Exception as e:
+            raise DomainException(f"Database error while deleting client: {e}")
+
+    async def exists(self, client_id: ClientId) -> bool:
+        """Check if client exists"""
+        try:
+            rows = await self._select([("select", "id"), ("id", f"eq.{client_id}"), ("limit", "1")])
+            return len(rows) > 0
+        except Exception as e:
+            raise DomainException(f"Database error while checking client existence: {e}")
+
+    async def exists_by_email(self, email: Email) -> bool:
+        """Check if client with email exists"""
+        try:
+            rows = await self._select([("select", "id"), ("email", f"eq.{email}"), ("limit", "1")])
+            return len(rows) > 0
+        except Exception as e:
+            raise DomainException(f"Database error while checking email existence: {e}")
+
+    @with_performance_monitoring("clients", "group_counts")
+    async def count_by_status_and_program_type(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        program_type: Optional[ProgramType] = None
+    ) -> Dict[Tuple[str, str], int]:
+        """Count clients per (status, program_type) in the database"""
+        counts, _ = await self._grouped_counts(start_date, end_date, program_type)
+        return counts
+
+    async def _grouped_counts(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        program_type: Optional[ProgramType]
+    ) -> Tuple[GroupCounts, str]:
+        """Grouped counts from the RPC, or from paged rows if it is not installed"""
+        try:
+            response = await self._connection.request(
+                "POST",
+                f"/rpc/{ANALYTICS_COUNTS_RPC}",
+                json=analytics_rpc_params(start_date, end_date, program_type)
+            )
+            return counts_from_rpc(response.json() or []), "rpc"
+        except Exception as e:
+            if not rpc_is_missing(e):
+                raise
+
+        try:
+            return await self._tally_pages(start_date, end_date, program_type), "paged"
+        except Exception as e:
+            raise DomainException(f"Database error while counting clients: {e}")
+
+    async def _tally_pages(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        program_type: Optional[ProgramType],
+        page_size: int = ANALYTICS_PAGE_SIZE
+    ) -> GroupCounts:
+        """Count projected rows one keyset page at a time"""
+        filters: QueryParams = []
+        if start_date:
+            filters.append(("created_at", f"gte.{start_date.isoformat()}"))
+        if end_date:
+            filters.append(("created_at", f"lte.{end_date.isoformat()}"))
+        if program_type:
+            filters.append(("program_type", f"eq.{program_type.value}"))
+
+        counts: GroupCounts = {}
+        cursor: Optional[PageCursor] = None
+
+        while True:
+            params: QueryParams = [("select", ANALYTICS_COLUMNS), *filters]
+            if cursor:
+                params.append(("or", f"({keyset_condition(cursor)})"))
+            params.append(("order", keyset_order("created_at")))
+            params.append(("limit", str(page_size + 1)))
+
+            rows = await self._select(params)
+            tally_rows(counts, rows[:page_size])
+            cursor = last_row_cursor(rows, page_size)
+            if cursor is None:
+                return counts
+
+    @with_performance_monitoring("clients", "analytics")
+    async def get_analytics_data(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        program_type: Optional[ProgramType] = None
+    ) -> Dict[str, Any]:
+        """Get analytics data for clients from grouped counts"""
+        try:
+            counts, source = await self._grouped_counts(start_date, end_date, program_type)
+            return build_analytics(counts, start_date, end_date, program_type, source)
+
+        except Exception as e:
+            raise DomainException(f"Database error while getting analytics data: {e}")
+
+    # Extended methods (parity with OptimizedClientRepository)
+
+    @with_performance_monitoring("clients", "save")
+    async def save_batch(self, clients: List[Client]) -> None:
+        """Save multiple clients in a single upsert"""
+        if not clients:
+            return
+
+        try:
+            response = await self._connection.request(
+                "POST",
+                self._path,
+                params=[("select", "id")],
+                json=[self._entity_to_dict(client) for client in clients],
+                headers={"Prefer": "resolution=merge-duplicates,return=representation"}
+            )
+
+            if len(response.json()) != len(clients):
+                raise DomainException("Batch save operation failed")
+
+        except Exception as e:
+            raise DomainException(f"Database error during batch save: {e}")
+
+    @with_performance_monitoring("clients", "existing_emails")
+    async def find_existing_emails(self, emails: List[str]) -> Set[str]:
+        """Find which emails already exist with one in.(...) query"""
+        if not emails:
+            return set()
+
+        try:
+            email_list = ",".join(quote_filter_value(email) for email in emails)
+            rows = await self._select([("select", "email"), ("email", f"in.({email_list})")])
+            return {row["email"] for row in rows}
+        except Exception as e:
+            raise DomainException(f"Database error while checking email existence: {e}")
+
+    async def find_by_ids(self, client_ids: List[ClientId]) -> List[Client]:
+        """Find multiple clients by IDs in one round trip"""
+        if not client_ids:
+            return []
+
+        try:
+            id_list = ",".join(str(client_id) for client_id in client_ids)
+            return await self._find([("select", self.COLUMNS), ("id", f"in.({id_list})")])
+        except Exception as e:
+            raise DomainException(f"Database error while finding clients by IDs: {e}")
+
+    async def find_by_emails(self, emails: List[str]) -> List[Client]:
+        """Find multiple clients by email in one round trip"""
+        if not emails:
+            return []
+
+        try:
+            email_list = ",".join(quote_filter_value(email) for email in emails)
+            return await self._find([("select", self.COLUMNS), ("email", f"in.({email_list})")])
+        except Exception as e:
+            raise DomainException(f"Database error while finding clients by emails: {e}")
+
+    @with_performance_monitoring("clients", "dashboard")
+    async def get_dashboard_metrics(self) -> Dict[str, Any]:
+        """Get dashboard metrics through the aggregate RPC"""
+        try:
+            response = await self._connection.request(
+                "POST", "/rpc/get_client_dashboard_metrics", json={}
+            )
+            data = response.json()
+
+            if data:
+                return data[0]
+
+            # Fallback to count queries if the RPC returned nothing
+            total_clients = await self.count()
+            active_clients = await self.count_by_status(ClientStatus.ACTIVE)
+            prime_clients = await self.count_by_program_type(ProgramType.PRIME)
+            longevity_clients = await self.count_by_program_type(ProgramType.LONGEVITY)
+
+            active_rate = (active_clients / total_clients * 100) if total_clients > 0 else 0
+
+            return {
+                "total_clients": total_clients,
+                "active_clients": active_clients,
+                "prime_clients": prime_clients,
+                "longevity_clients": longevity_clients,
+                "active_rate": round(active_rate, 2),
+                "generated_at": datetime.now().isoformat()
+            }
+
+        except Exception as e:
+            raise DomainException(f"Database error while getting dashboard metrics: {e}")
+
+    @with_performance_monitoring("clients", "recent_activity")
+    async def get_recent_activity(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get recently updated clients"""
+        try:
+            rows = await self._select([
+                ("select", "id,name,status,updated_at,program_type"),
+                ("order", "updated_at.desc"),
+                ("limit", str(limit)),
+            ])
+
+            return [
+                {
+                    "client_id": row["id"],
+                    "client_name": row["name"],
+                    "activity_type": "profile_updated",
+                    "program_type": row["program_type"],
+                    "status": row["status"],
+                    "timestamp": row["updated_at"]
+                }
+                for row in rows
+            ]
+
+        except Exception as e:
+            raise DomainException(f"Database error while getting recent activity: {e}")
+
+    async def search_with_filters(
+        self,
+        query: str = None,
+        status: ClientStatus = None,
+        program_type: ProgramType = None,
+        limit: int = 50,
+        offset: Optional[int] = 0,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        summary: bool = False,
+        count_mode: str = DEFAULT_COUNT_MODE,
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Dict[str, Any]:
+        """
+        Advanced search with multiple filters.
+
+        Pages by keyset when a cursor is given or offset is None, otherwise
+        by offset for backwards compatibility. With ``summary`` the clients
+        are projected ClientSummary rows instead of full entities. Rows and
+        total count come back in one request; ``total_count`` is None when
+        ``count_mode`` is ``none``, and ``has_more`` always comes from
+        fetching one row past the page.
+        """
+        keyset = cursor is not None or offset is None
+        page_offset = None if keyset else offset
+
+        try:
+            if summary:
+                page = await self.find_summary_page(
+                    limit=limit,
+                    cursor=cursor,
+                    sort_key=sort_key,
+                    query=query,
+                    status=status,
+                    program_type=program_type,
+                    offset=page_offset,
+                    count_mode=count_mode,
+                    search_mode=search_mode
+                )
+            else:
+                page = await self.find_page(
+                    limit=limit,
+                    cursor=cursor,
+                    sort_key=sort_key,
+                    query=query,
+                    status=status,
+                    program_type=program_type,
+                    offset=page_offset,
+                    count_mode=count_mode,
+                    search_mode=search_mode
+                )
+
+            return {
+                "clients": page.items,
+                "total_count": page.total_count,
+                "count_mode": count_mode,
+                "page_size": limit,
+                "offset": page_offset,
+                "next_cursor": page.next_cursor,
+                "has_more": page.has_more
+            }
+
+        except DomainException:
+            raise
+        except Exception as e:
+            raise DomainException(f"Database error during advanced search: {e}")
@@ -0,0 +1,90 @@
+"""
+PostgREST Filter Builders
+
+Shared by the supabase-py and async PostgREST repositories so both send
+the same logical filters for search and keyset pagination.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from ...domain.repositories.pagination import PageCursor, validate_search_mode
+
+# Generated tsvector over name and email (see DATABASE_OPTIMIZATIONS)
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_VECTOR_CONFIG = "simple"
+
+
+def quote_filter_value(value: str) -> str:
+    """
+    Quote a value for use inside a PostgREST logical filter (``or=(...)``).
+
+    Commas, parentheses and dots are reserved inside logical filters, so
+    user input is always wrapped in double quotes with quotes/backslashes
+    escaped.
+    """
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def search_condition(query: str) -> str:
+    """Name/email case-insensitive search as a logical term"""
+    pattern = quote_filter_value(f"*{query}*")
+    return f"or(name.ilike.{pattern},email.ilike.{pattern})"
+
+
+def fulltext_condition(query: str) -> str:
+    """
+    Word search on the GIN-indexed search vector as a logical term.
+
+    Uses ``websearch_to_tsquery`` so quoted phrases, ``or`` and ``-word``
+    behave like a search box; the ``simple`` configuration does not stem,
+    which suits names and email addresses.
+    """
+    return f"{SEARCH_VECTOR_COLUMN}.wfts({SEARCH_VECTOR_CONFIG}).{quote_filter_value(query)}"
+
+
+def search_term(query: str, search_mode: str = "contains") -> str:
+    """Logical term for a text query in the given search mode"""
+    validate_search_mode(search_mode)
+    if search_mode == "fulltext":
+        return fulltext_condition(query)
+    return search_condition(query)
+
+
+def keyset_condition(cursor: PageCursor) -> str:
+    """Rows strictly after the cursor in ``sort_key DESC, id DESC`` order"""
+    key = cursor.sort_key
+    value = quote_filter_value(cursor.sort_value)
+    row_id = quote_filter_value(cursor.id)
+    return f"or({key}.lt.{value},and({key}.eq.{value},id.lt.{row_id}))"
+
+
+def combine_conditions(conditions: List[str]) -> str:
+    """
+    AND logical terms into the body of a single ``or=(...)`` filter.
+
+    PostgREST accepts one ``or`` parameter per request, so several terms
+    are nested as ``or=(and(term1,term2))``.
+    """
+    if len(conditions) == 1:
+        return conditions[0]
+    return f"and({','.join(conditions)})"
+
+
+def keyset_order(sort_key: str) -> str:
+    """PostgREST ``order`` value matching keyset_condition"""
+    return f"{sort_key}.desc,id.desc"
+
+
+def next_page_cursor(rows: List[Dict[str, Any]], limit: int, sort_key: str) -> Optional[str]:
+    """
+    Cursor for the page after ``rows``.
+
+    Queries fetch ``limit + 1`` rows; the extra row only signals that
+    another page exists and is never returned.
+    """
+    if len(rows) <= limit:
+        return None
+
+    last = rows[limit - 1]
+    return PageCursor(sort_key=sort_key, sort_value=str(last[sort_key]), id=str(last["id"])).encode()
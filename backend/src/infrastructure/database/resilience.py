@@ -0,0 +1,359 @@
+"""
+Read Resilience Policies
+
+Circuit breaking, jittered retries and hedged requests for database
+calls. A ResiliencePolicy keeps one circuit breaker and one latency
+histogram per key (the PostgREST table or RPC being called):
+
+- every call passes through the key's breaker, which fails fast with
+  CircuitOpenError once the backend keeps failing, and lets one probe
+  through after the reset timeout;
+- idempotent reads are retried on transient errors with full-jitter
+  exponential backoff;
+- idempotent reads still running after the key's p95 latency get a
+  second, identical request; the first success wins and the other is
+  cancelled. Hedges are capped at a fraction of reads so a slow backend
+  is not hit with double the load.
+
+Breaker transitions, retries and hedges are reported to PerformanceMonitor.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from .performance import Histogram, performance_monitor
+from ...domain.exceptions import DomainException
+
+T = TypeVar("T")
+Operation = Callable[[], Awaitable[T]]
+TransientCheck = Callable[[Exception], bool]
+
+
+class CircuitOpenError(DomainException):
+    """Raised instead of calling a backend whose circuit is open"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(
+            f"{name} is unavailable, retry in {retry_after:.1f}s",
+            error_code="CIRCUIT_OPEN",
+            details={"circuit": name, "retry_after": round(retry_after, 3)}
+        )
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Closed: calls go through; ``failure_threshold`` transient failures in
+    a row open the circuit. Open: calls fail fast for ``reset_timeout``
+    seconds. Half-open: a single probe call is admitted; its success
+    closes the circuit, its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def state(self) -> str:
+        """Current state; an open circuit turns half-open once the timeout passes"""
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self._reset_timeout:
+            return self.HALF_OPEN
+        return self._state
+
+    def before_call(self) -> bool:
+        """
+        Admit a call. Returns True when the call is the half-open probe.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with
+                the probe still in flight
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return False
+        if state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+
+        performance_monitor.record_resilience_event(self._name, "rejected")
+        retry_after = max(self._opened_at + self._reset_timeout - self._clock(), 0.0)
+        raise CircuitOpenError(self._name, retry_after)
+
+    def record_success(self) -> None:
+        """The backend answered"""
+        self._failures = 0
+        self._probing = False
+        if self._state != self.CLOSED:
+            self._transition(self.CLOSED)
+
+    def record_failure(self) -> None:
+        """The backend failed or timed out"""
+        self._failures += 1
+        if self._probing or self._state == self.OPEN or self._failures >= self._failure_threshold:
+            self._probing = False
+            self._opened_at = self._clock()
+            if self._state != self.OPEN:
+                self._transition(self.OPEN)
+
+    def release_probe(self) -> None:
+        """The probe was cancelled before it could tell either way"""
+        self._probing = False
+
+    def _transition(self, state: str) -> None:
+        self._state = state
+        performance_monitor.record_circuit_state(self._name, state)
+        performance_monitor.record_resilience_event(self._name, state)
+        log = self._logger.warning if state == self.OPEN else self._logger.info
+        log(f"Circuit '{self._name}' {state} after {self._failures} consecutive failures")
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "failure_threshold": self._failure_threshold,
+            "reset_timeout": self._reset_timeout,
+        }
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter: attempt n waits U(0, min(max, base * 2**n))"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.05, max_delay: float = 1.0):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        """Backoff before retry number ``attempt`` (0-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    async def run(
+        self,
+        operation: Operation[T],
+        is_transient: TransientCheck,
+        on_retry: Optional[Callable[[int, Exception, float], None]] = None
+    ) -> T:
+        """Run ``operation``, retrying transient errors until attempts run out"""
+        attempt = 0
+        while True:
+            try:
+                return await operation()
+            except Exception as e:
+                if attempt + 1 >= self.max_attempts or not is_transient(e):
+                    raise
+                delay = self.delay(attempt)
+                if on_retry is not None:
+                    on_retry(attempt, e, delay)
+                attempt += 1
+                await asyncio.sleep(delay)
+
+
+class ResiliencePolicy:
+    """
+    Breakers, retries and hedging for one backend, keyed by table.
+
+    ``is_transient`` decides which errors count against the breaker and
+    are retried; anything else (a 4xx, a validation error) means the
+    backend is up and is raised straight away.
+    """
+
+    # Per-key latency buckets in seconds
+    LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+    def __init__(
+        self,
+        name: str,
+        is_transient: TransientCheck,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        retry: Optional[RetryPolicy] = None,
+        hedging: bool = True,
+        hedge_percentile: float = 95.0,
+        hedge_min_samples: int = 20,
+        hedge_max_ratio: float = 0.1,
+        hedge_min_delay: float = 0.005
+    ):
+        self._name = name
+        self._is_transient = is_transient
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._retry = retry or RetryPolicy()
+        self._hedging = hedging
+        self._hedge_percentile = hedge_percentile
+        self._hedge_min_samples = hedge_min_samples
+        self._hedge_max_ratio = hedge_max_ratio
+        self._hedge_min_delay = hedge_min_delay
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._latency: Dict[str, Histogram] = {}
+        self._reads = 0
+        self._hedges = 0
+        self._logger = logging.getLogger(__name__)
+
+    @classmethod
+    def from_env(cls, name: str, prefix: str, is_transient: TransientCheck) -> "ResiliencePolicy":
+        """Policy configured from ``<prefix>_BREAKER_*``, ``_READ_*`` and ``_HEDGE_*`` variables"""
+        def env(key: str, default: str) -> str:
+            return os.getenv(f"{prefix}_{key}", default)
+
+        return cls(
+            name,
+            is_transient,
+            failure_threshold=int(env("BREAKER_FAILURES", "5")),
+            reset_timeout=float(env("BREAKER_RESET_SECONDS", "30")),
+            retry=RetryPolicy(
+                max_attempts=int(env("READ_ATTEMPTS", "3")),
+                base_delay=float(env("RETRY_BASE_DELAY", "0.05")),
+                max_delay=float(env("RETRY_MAX_DELAY", "1.0"))
+            ),
+            hedging=env("HEDGE_READS", "true").lower() == "true",
+            hedge_percentile=float(env("HEDGE_PERCENTILE", "95")),
+            hedge_min_samples=int(env("HEDGE_MIN_SAMPLES", "20")),
+            hedge_max_ratio=float(env("HEDGE_MAX_RATIO", "0.1"))
+        )
+
+    def breaker(self, key: str) -> CircuitBreaker:
+        """Circuit breaker for a key"""
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                f"{self._name}:{key}", self._failure_threshold, self._reset_timeout
+            )
+            self._breakers[key] = breaker
+        return breaker
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """Seconds to wait before hedging a read, or None until enough latency samples exist"""
+        histogram = self._latency.get(key)
+        if not self._hedging or histogram is None or histogram.samples < self._hedge_min_samples:
+            return None
+        return max(histogram.percentile(self._hedge_percentile), self._hedge_min_delay)
+
+    async def call(self, key: str, operation: Operation[T]) -> T:
+        """Run a non-idempotent call behind the key's breaker, without retries or hedging"""
+        return await self._attempt(key, operation)
+
+    async def read(self, key: str, operation: Operation[T]) -> T:
+        """Run an idempotent read with breaker, retries and hedging"""
+        def on_retry(attempt: int, error: Exception, delay: float) -> None:
+            performance_monitor.record_resilience_event(self.breaker(key).name, "retried")
+            self._logger.warning(
+                f"Read on '{key}' failed (attempt {attempt + 1}/{self._retry.max_attempts}), "
+                f"retrying in {delay * 1000:.0f}ms: {error}"
+            )
+
+        return await self._retry.run(
+            lambda: self._hedged(key, operation), self._retryable, on_retry
+        )
+
+    def _retryable(self, error: Exception) -> bool:
+        return not isinstance(error, CircuitOpenError) and self._is_transient(error)
+
+    async def _attempt(self, key: str, operation: Operation[T]) -> T:
+        breaker = self.breaker(key)
+        probe = breaker.before_call()
+        started = time.monotonic()
+        try:
+            result = await operation()
+        except asyncio.CancelledError:
+            if probe:
+                breaker.release_probe()
+            raise
+        except Exception as e:
+            if self._is_transient(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+
+        breaker.record_success()
+        latency = self._latency.get(key)
+        if latency is None:
+            latency = self._latency[key] = Histogram(self.LATENCY_BUCKETS)
+        latency.observe(time.monotonic() - started)
+        return result
+
+    async def _hedged(self, key: str, operation: Operation[T]) -> T:
+        self._reads += 1
+        delay = self.hedge_delay(key)
+        if delay is None:
+            return await self._attempt(key, operation)
+
+        primary = asyncio.ensure_future(self._attempt(key, operation))
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done or self._hedges >= self._hedge_max_ratio * self._reads:
+                return await primary
+
+            self._hedges += 1
+            name = self.breaker(key).name
+            performance_monitor.record_resilience_event(name, "hedged")
+            hedge = asyncio.ensure_future(self._attempt(key, operation))
+            pending = {primary, hedge}
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            performance_monitor.record_resilience_event(name, "hedge_won")
+                        return task.result()
+
+            # Both failed: report the original request's error
+            raise primary.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(_consume_result)
+
+    def stats(self) -> Dict[str, object]:
+        """Breaker states and hedging activity"""
+        return {
+            "reads": self._reads,
+            "hedges": self._hedges,
+            "hedge_delay_ms": {
+                key: round(delay * 1000, 3)
+                for key in list(self._latency)
+                if (delay := self.hedge_delay(key)) is not None
+            },
+            "circuits": {breaker.name: breaker.stats() for breaker in self._breakers.values()},
+        }
+
+
+def _consume_result(task: asyncio.Task) -> None:
+    """Mark a discarded hedge's exception as retrieved"""
+    if not task.cancelled():
+        task.exception()
@@ -3,14 +3,41 @@ Supabase Database Implementation
 """
 
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime
 from supabase import create_client, Client as SupabaseClient
 
 from ...domain.repositories import IClientRepository
-from ...domain.entities import Client, ClientId, ClientStatus, ProgramType
+from ...domain.repositories.pagination import (
+    Page,
+    PageCursor,
+    DEFAULT_SORT_KEY,
+    DEFAULT_SEARCH_MODE,
+    validate_sort_key,
+    validate_count_mode,
+)
+from ...domain.entities import Client, ClientId, ClientStatus, ProgramType, ClientSummary, ClientRecord
 from ...domain.value_objects import Email, PhoneNumber
 from ...domain.exceptions import ClientNotFound, DomainException
+from .query_filters import (
+    search_term,
+    keyset_condition,
+    combine_conditions,
+    next_page_cursor,
+)
+from .hydration import hydrate_clients, hydrate_records
+from .analytics import (
+    ANALYTICS_COUNTS_RPC,
+    ANALYTICS_COLUMNS,
+    ANALYTICS_PAGE_SIZE,
+    GroupCounts,
+    analytics_rpc_params,
+    counts_from_rpc,
+    rpc_is_missing,
+    tally_rows,
+    last_row_cursor,
+    build_analytics,
+)
 
 
 class SupabaseConnection:
@@ -42,21 +69,17 @@ class SupabaseConnection:
             return False
 
 
-class SupabaseClientRepository(IClientRepository):
+class ClientRowMapper:
     """
-    Supabase implementation of client repository.
+    Maps Client entities to and from rows of the ``clients`` table.
     
-    Handles persistence of Client entities using Supabase/PostgreSQL.
+    Shared by every repository implementation that talks to the
+    Supabase/PostgREST schema, regardless of the transport used.
     """
     
-    def __init__(self, connection: SupabaseConnection):
-        self._connection = connection
-        self._table_name = "clients"
-    
-    @property
-    def _client(self) -> SupabaseClient:
-        """Get Supabase client"""
-        return self._connection.client
+    # Columns a Client is built from; never "*", which would also send
+    # derived columns such as the search_vector tsvector
+    COLUMNS = "id,name,email,phone,program_type,status,created_at,updated_at,notes,metadata"
     
     def _entity_to_dict(self, client: Client) -> Dict[str, Any]:
         """Convert Client entity to database dictionary"""
@@ -101,6 +124,27 @@ class SupabaseClientRepository(IClientRepository):
         except Exception as e:
             raise DomainException(f"Failed to convert database record to entity: {e}")
     
+    def _rows_to_entities(self, rows: List[Dict[str, Any]]) -> List[Client]:
+        """Convert a list of trusted database rows to Client entities in bulk"""
+        return hydrate_clients(rows)
+
+
+class SupabaseClientRepository(ClientRowMapper, IClientRepository):
+    """
+    Supabase implementation of client repository.
+    
+    Handles persistence of Client entities using Supabase/PostgreSQL.
+    """
+    
+    def __init__(self, connection: SupabaseConnection):
+        self._connection = connection
+        self._table_name = "clients"
+    
+    @property
+    def _client(self) -> SupabaseClient:
+        """Get Supabase client"""
+        return self._connection.client
+    
     async def save(self, client: Client) -> None:
         """Save client to database"""
         try:
@@ -119,7 +163,7 @@ class SupabaseClientRepository(IClientRepository):
         """Find client by ID"""
         try:
             response = self._client.table(self._table_name)\
-                .select("*")\
+                .select(self.COLUMNS)\
                 .eq("id", str(client_id))\
                 .execute()
             
@@ -131,11 +175,27 @@ class SupabaseClientRepository(IClientRepository):
         except Exception as e:
             raise DomainException(f"Database error while finding client by ID: {e}")
     
+    async def find_by_ids(self, client_ids: List[ClientId]) -> List[Client]:
+        """Find multiple clients by IDs with one in_ query"""
+        if not client_ids:
+            return []
+        
+        try:
+            response = self._client.table(self._table_name)\
+                .select(self.COLUMNS)\
+                .in_("id", [str(client_id) for client_id in client_ids])\
+                .execute()
+            
+            return self._rows_to_entities(response.data)
+            
+        except Exception as e:
+            raise DomainException(f"Database error while finding clients by IDs: {e}")
+    
     async def find_by_email(self, email: Email) -> Optional[Client]:
         """Find client by email"""
         try:
             response = self._client.table(self._table_name)\
-                .select("*")\
+                .select(self.COLUMNS)\
                 .eq("email", str(email))\
                 .execute()
             
@@ -154,7 +214,7 @@ class SupabaseClientRepository(IClientRepository):
     ) -> List[Client]:
         """Find all clients with pagination"""
         try:
-            query = self._client.table(self._table_name).select("*")
+            query = self._client.table(self._table_name).select(self.COLUMNS)
             
             if offset:
                 query = query.range(offset, offset + (limit or 1000) - 1)
@@ -163,7 +223,7 @@ class SupabaseClientRepository(IClientRepository):
             
             response = query.execute()
             
-            return [self._dict_to_entity(data) for data in response.data]
+            return self._rows_to_entities(response.data)
             
         except Exception as e:
             raise DomainException(f"Database error while finding all clients: {e}")
@@ -177,7 +237,7 @@ class SupabaseClientRepository(IClientRepository):
         """Find clients by status"""
         try:
             query = self._client.table(self._table_name)\
-                .select("*")\
+                .select(self.COLUMNS)\
                 .eq("status", status.value)
             
             if offset:
@@ -187,7 +247,7 @@ class SupabaseClientRepository(IClientRepository):
             
             response = query.execute()
             
-            return [self._dict_to_entity(data) for data in response.data]
+            return self._rows_to_entities(response.data)
             
         except Exception as e:
             raise DomainException(f"Database error while finding clients by status: {e}")
@@ -201,7 +261,7 @@ class SupabaseClientRepository(IClientRepository):
         """Find clients by program type"""
         try:
             query = self._client.table(self._table_name)\
-                .select("*")\
+                .select(self.COLUMNS)\
                 .eq("program_type", program_type.value)
             
             if offset:
@@ -211,7 +271,7 @@ class SupabaseClientRepository(IClientRepository):
             
             response = query.execute()
             
-            return [self._dict_to_entity(data) for data in response.data]
+            return self._rows_to_entities(response.data)
             
         except Exception as e:
             raise DomainException(f"Database error while finding clients by program type: {e}")
@@ -220,14 +280,15 @@ class SupabaseClientRepository(IClientRepository):
         self, 
         query: str,
         limit: Optional[int] = None, 
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        search_mode: str = DEFAULT_SEARCH_MODE
     ) -> List[Client]:
-        """Search clients by name or email"""
+        """Search clients by name or email (substring or full-text)"""
         try:
-            # Use Supabase text search
+            # User input is quoted inside the filter, never interpolated raw
             search_query = self._client.table(self._table_name)\
-                .select("*")\
-                .or_(f"name.ilike.%{query}%,email.ilike.%{query}%")
+                .select(self.COLUMNS)\
+                .or_(search_term(query, search_mode))
             
             if offset:
                 search_query = search_query.range(offset, offset + (limit or 1000) - 1)
@@ -236,11 +297,131 @@ class SupabaseClientRepository(IClientRepository):
             
             response = search_query.execute()
             
-            return [self._dict_to_entity(data) for data in response.data]
+            return self._rows_to_entities(response.data)
             
         except Exception as e:
             raise DomainException(f"Database error while searching clients: {e}")
     
+    def _select_page_rows(
+        self,
+        columns: str,
+        limit: int,
+        cursor: Optional[str],
+        sort_key: str,
+        query: Optional[str],
+        status: Optional[ClientStatus],
+        program_type: Optional[ProgramType],
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[int]]:
+        """Fetch the raw rows of one page (newest first), the next cursor and the total"""
+        validate_sort_key(sort_key)
+        validate_count_mode(count_mode)
+        page_cursor = PageCursor.decode(cursor, sort_key) if cursor else None
+        
+        try:
+            # The total comes back with the rows (Content-Range), not as a second query
+            db_query = self._client.table(self._table_name).select(
+                columns, count=None if count_mode == "none" else count_mode
+            )
+            
+            if status:
+                db_query = db_query.eq("status", status.value)
+            if program_type:
+                db_query = db_query.eq("program_type", program_type.value)
+            
+            conditions = []
+            if query:
+                conditions.append(search_term(query, search_mode))
+            if page_cursor:
+                conditions.append(keyset_condition(page_cursor))
+            if conditions:
+                db_query = db_query.or_(combine_conditions(conditions))
+            
+            db_query = db_query\
+                .order(sort_key, desc=True)\
+                .order("id", desc=True)
+            
+            # One extra row tells us whether another page exists
+            if offset and not page_cursor:
+                db_query = db_query.range(offset, offset + limit)
+            else:
+                db_query = db_query.limit(limit + 1)
+            
+            response = db_query.execute()
+            rows = response.data
+            
+        except Exception as e:
+            raise DomainException(f"Database error while paging clients: {e}")
+        
+        return rows[:limit], next_page_cursor(rows, limit, sort_key), response.count
+    
+    async def find_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        query: Optional[str] = None,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None,
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Page[Client]:
+        """Find one keyset page of clients, newest first"""
+        rows, next_cursor, total_count = self._select_page_rows(
+            self.COLUMNS, limit, cursor, sort_key, query, status, program_type, offset, count_mode,
+            search_mode
+        )
+        return Page(
+            items=self._rows_to_entities(rows),
+            next_cursor=next_cursor,
+            total_count=total_count
+        )
+    
+    async def find_summary_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        query: Optional[str] = None,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None,
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Page[ClientSummary]:
+        """Find one page of projected client summaries, newest first"""
+        rows, next_cursor, total_count = self._select_page_rows(
+            ClientSummary.COLUMNS, limit, cursor, sort_key, query, status, program_type,
+            offset, count_mode, search_mode
+        )
+        try:
+            items = [ClientSummary.from_row(data) for data in rows]
+        except Exception as e:
+            raise DomainException(f"Failed to convert database record to summary: {e}")
+        return Page(items=items, next_cursor=next_cursor, total_count=total_count)
+    
+    async def find_record_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_key: str = DEFAULT_SORT_KEY,
+        query: Optional[str] = None,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None,
+        offset: Optional[int] = None,
+        count_mode: str = "none",
+        search_mode: str = DEFAULT_SEARCH_MODE
+    ) -> Page[ClientRecord]:
+        """Find one keyset page of client snapshots, newest first"""
+        rows, next_cursor, total_count = self._select_page_rows(
+            self.COLUMNS, limit, cursor, sort_key, query, status, program_type, offset, count_mode,
+            search_mode
+        )
+        return Page(items=hydrate_records(rows), next_cursor=next_cursor, total_count=total_count)
+    
     async def count(self) -> int:
         """Count total clients"""
         try:
@@ -287,12 +468,12 @@ class SupabaseClientRepository(IClientRepository):
         """Find clients created within date range"""
         try:
             response = self._client.table(self._table_name)\
-                .select("*")\
+                .select(self.COLUMNS)\
                 .gte("created_at", start_date.isoformat())\
                 .lte("created_at", end_date.isoformat())\
                 .execute()
             
-            return [self._dict_to_entity(data) for data in response.data]
+            return self._rows_to_entities(response.data)
             
         except Exception as e:
             raise DomainException(f"Database error while finding clients by date range: {e}")
@@ -336,59 +517,116 @@ class SupabaseClientRepository(IClientRepository):
         except Exception as e:
             raise DomainException(f"Database error while checking email existence: {e}")
     
-    async def get_analytics_data(
+    async def find_existing_emails(self, emails: List[str]) -> Set[str]:
+        """Find which emails already exist with one in_ query"""
+        if not emails:
+            return set()
+        
+        try:
+            response = self._client.table(self._table_name)\
+                .select("email")\
+                .in_("email", emails)\
+                .execute()
+            
+            return {row["email"] for row in response.data}
+            
+        except Exception as e:
+            raise DomainException(f"Database error while checking email existence: {e}")
+    
+    async def save_batch(self, clients: List[Client]) -> None:
+        """Save multiple clients in batch"""
+        if not clients:
+            return
+        
+        try:
+            # Prepare batch data
+            batch_data = [self._entity_to_dict(client) for client in clients]
+            
+            # Execute batch upsert
+            response = self._client.table(self._table_name).upsert(batch_data).execute()
+            
+            if not response.data or len(response.data) != len(clients):
+                raise DomainException("Batch save operation failed")
+                
+        except Exception as e:
+            raise DomainException(f"Database error during batch save: {e}")
+    
+    async def count_by_status_and_program_type(
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         program_type: Optional[ProgramType] = None
-    ) -> Dict[str, Any]:
-        """Get analytics data for clients"""
+    ) -> Dict[Tuple[str, str], int]:
+        """Count clients per (status, program_type) in the database"""
+        counts, _ = await self._grouped_counts(start_date, end_date, program_type)
+        return counts
+    
+    async def _grouped_counts(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        program_type: Optional[ProgramType]
+    ) -> Tuple[GroupCounts, str]:
+        """Grouped counts from the RPC, or from paged rows if it is not installed"""
         try:
-            # Build base query
-            query = self._client.table(self._table_name).select("*")
+            response = self._client.rpc(
+                ANALYTICS_COUNTS_RPC,
+                analytics_rpc_params(start_date, end_date, program_type)
+            ).execute()
+            return counts_from_rpc(response.data or []), "rpc"
+        except Exception as e:
+            if not rpc_is_missing(e):
+                raise
+        
+        try:
+            return self._tally_pages(start_date, end_date, program_type), "paged"
+        except Exception as e:
+            raise DomainException(f"Database error while counting clients: {e}")
+    
+    def _tally_pages(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        program_type: Optional[ProgramType],
+        page_size: int = ANALYTICS_PAGE_SIZE
+    ) -> GroupCounts:
+        """Count projected rows one keyset page at a time"""
+        counts: GroupCounts = {}
+        cursor: Optional[PageCursor] = None
+        
+        while True:
+            db_query = self._client.table(self._table_name).select(ANALYTICS_COLUMNS)
             
-            # Apply filters
             if start_date:
-                query = query.gte("created_at", start_date.isoformat())
+                db_query = db_query.gte("created_at", start_date.isoformat())
             if end_date:
-                query = query.lte("created_at", end_date.isoformat())
+                db_query = db_query.lte("created_at", end_date.isoformat())
             if program_type:
-                query = query.eq("program_type", program_type.value)
-            
-            response = query.execute()
-            clients_data = response.data
-            
-            # Calculate analytics
-            total_clients = len(clients_data)
-            
-            # Group by status
-            status_counts = {}
-            for client in clients_data:
-                status = client["status"]
-                status_counts[status] = status_counts.get(status, 0) + 1
-            
-            # Group by program type  
-            program_type_counts = {}
-            for client in clients_data:
-                ptype = client["program_type"]
-                program_type_counts[ptype] = program_type_counts.get(ptype, 0) + 1
-            
-            # Calculate active rate
-            active_clients = status_counts.get("active", 0)
-            active_rate = (active_clients / total_clients * 100) if total_clients > 0 else 0
-            
-            return {
-                "total_clients": total_clients,
-                "active_clients": active_clients,
-                "active_rate": round(active_rate, 2),
-                "status_distribution": status_counts,
-                "program_type_distribution": program_type_counts,
-                "period_summary": {
-                    "start_date": start_date.isoformat() if start_date else None,
-                    "end_date": end_date.isoformat() if end_date else None,
-                    "program_type_filter": program_type.value if program_type else None
-                }
-            }
+                db_query = db_query.eq("program_type", program_type.value)
+            if cursor:
+                db_query = db_query.or_(keyset_condition(cursor))
+            
+            rows = db_query\
+                .order("created_at", desc=True)\
+                .order("id", desc=True)\
+                .limit(page_size + 1)\
+                .execute().data
+            
+            tally_rows(counts, rows[:page_size])
+            cursor = last_row_cursor(rows, page_size)
+            if cursor is None:
+                return counts
+    
+    async def get_analytics_data(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        program_type: Optional[ProgramType] = None
+    ) -> Dict[str, Any]:
+        """Get analytics data for clients from grouped counts"""
+        try:
+            counts, source = await self._grouped_counts(start_date, end_date, program_type)
+            return build_analytics(counts, start_date, end_date, program_type, source)
             
         except Exception as e:
             raise DomainException(f"Database error while getting analytics data: {e}")
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""
+Search Infrastructure
+
+In-process search structures that complement the database search.
+"""
+
+from .prefix_index import ClientPrefixIndex, fold
+
+__all__ = [
+    "ClientPrefixIndex",
+    "fold",
+]
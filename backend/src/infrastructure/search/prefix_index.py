@@ -0,0 +1,320 @@
+"""
+Client Prefix Index
+
+In-process autocomplete over client names and emails. Tokens are folded
+to lowercase without accents and kept in one sorted array, so a prefix
+lookup is a binary search plus a scan of the matching run, with no
+database round trip per keystroke. The index is built lazily from the
+repository and kept current by client domain events; once built, it
+is rebuilt in the background when older than ``max_age``.
+"""
+
+import asyncio
+import contextvars
+import os
+import re
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+import logging
+
+from ...domain.entities import Client, ClientId, ClientStatus, ProgramType, ClientSummary
+from ...domain.repositories import IClientRepository
+
+# Rebuild from the database at most this often (seconds), to pick up
+# changes made by other workers; local changes arrive through events
+PREFIX_INDEX_MAX_AGE = float(os.getenv("CLIENT_PREFIX_INDEX_MAX_AGE", "600"))
+PREFIX_INDEX_PAGE_SIZE = 500
+
+# Event types that change what the index holds
+INDEXED_EVENTS = ("ClientCreated", "ClientUpdated", "ClientDeleted")
+
+_WORD_SPLIT = re.compile(r"\W+")
+
+
+def fold(text: str) -> str:
+    """Lowercase and strip accents so "José" and "jose" index alike"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split folded text into searchable words"""
+    return [token for token in _WORD_SPLIT.split(fold(text)) if token]
+
+
+def query_terms(query: str) -> List[str]:
+    """Words of a query; anything with an @ is matched as one email prefix"""
+    folded = fold(query).strip()
+    if "@" in folded:
+        return [folded]
+    return tokenize(folded)
+
+
+class IndexedClient(NamedTuple):
+    """One client as held by the index"""
+
+    summary: ClientSummary
+    email: str
+    folded_name: str
+    tokens: Tuple[str, ...]
+
+
+def _client_tokens(name: str, email: str) -> Tuple[str, ...]:
+    """Name words, the whole email and the words of its local part"""
+    folded_email = fold(email)
+    local_part = folded_email.split("@", 1)[0]
+    return tuple(sorted({*tokenize(name), folded_email, *tokenize(local_part)}))
+
+
+class ClientPrefixIndex:
+    """
+    Accent-insensitive prefix index over client names and emails.
+
+    Every query word must be a prefix of some word of the client's name
+    or email, so "jos gar" finds "José García". Holds one entry per
+    client; subscribe ``handle_event`` to the event publisher to keep it
+    current between rebuilds. Clients named by events are reloaded with
+    one ``find_by_ids`` per ``page_size`` of them, so a bulk create costs
+    a few queries rather than one per client.
+    """
+
+    def __init__(
+        self,
+        repository: IClientRepository,
+        max_age: float = PREFIX_INDEX_MAX_AGE,
+        page_size: int = PREFIX_INDEX_PAGE_SIZE
+    ):
+        self._repository = repository
+        self._max_age = max_age
+        self._page_size = page_size
+
+        # Sorted (token, client_id) pairs and the entries they point to
+        self._keys: List[Tuple[str, str]] = []
+        self._entries: Dict[str, IndexedClient] = {}
+        self._built_at: Optional[float] = None
+
+        # In-flight build, and clients changed while it was running
+        self._build: Optional[asyncio.Task] = None
+        self._changed_during_build: Set[str] = set()
+
+        # Clients to reload, drained in find_by_ids batches by one task
+        self._pending: Set[str] = set()
+        self._flush: Optional[asyncio.Task] = None
+        self._deleted_during_reload: Set[str] = set()
+
+        self._metrics = {
+            "lookups": 0,
+            "builds": 0,
+            "build_failures": 0,
+            "upserts": 0,
+            "removals": 0,
+            "reload_batches": 0,
+        }
+        self._logger = logging.getLogger(__name__)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # Maintenance
+
+    def upsert(self, client: Client) -> None:
+        """Add a client or replace its previous tokens"""
+        self._remove_keys(str(client.id))
+        entry = self._entry(client)
+        self._entries[entry.summary.id] = entry
+        for token in entry.tokens:
+            insort(self._keys, (token, entry.summary.id))
+        self._metrics["upserts"] += 1
+
+    def remove(self, client_id: str) -> None:
+        """Drop a client from the index"""
+        if self._remove_keys(client_id):
+            self._metrics["removals"] += 1
+
+    @staticmethod
+    def _entry(client: Client) -> IndexedClient:
+        email = str(client.email)
+        return IndexedClient(
+            summary=ClientSummary.from_entity(client),
+            email=email,
+            folded_name=fold(client.name),
+            tokens=_client_tokens(client.name, email)
+        )
+
+    def _remove_keys(self, client_id: str) -> bool:
+        entry = self._entries.pop(client_id, None)
+        if entry is None:
+            return False
+
+        for token in entry.tokens:
+            position = bisect_left(self._keys, (token, client_id))
+            if position < len(self._keys) and self._keys[position] == (token, client_id):
+                del self._keys[position]
+        return True
+
+    async def handle_event(self, event: Dict[str, Any]) -> None:
+        """Apply a ClientCreated/ClientUpdated/ClientDeleted event"""
+        client_id = event.get("client_id")
+        if event.get("event_type") not in INDEXED_EVENTS or not client_id:
+            return
+
+        if self._build is not None and not self._build.done():
+            # The build may have read the old row; reload it once it finishes
+            self._changed_during_build.add(client_id)
+        if self._built_at is None:
+            # Not built yet: the first build reads the current state
+            return
+
+        # The index being served is updated right away, rebuilding or not
+        if event["event_type"] == "ClientDeleted":
+            self.remove(client_id)
+            self._pending.discard(client_id)
+            # A reload in flight may have read the row before the delete
+            self._deleted_during_reload.add(client_id)
+        else:
+            self._reload(client_id)
+
+    def _reload(self, *client_ids: str) -> None:
+        """Queue clients to be read again, batched with the other queued ones"""
+        self._pending.update(client_ids)
+        loop = asyncio.get_running_loop()
+        if self._flush is None or self._flush.done() or self._flush.get_loop() is not loop:
+            self._flush = loop.create_task(self._flush_pending(), context=contextvars.Context())
+
+    async def _flush_pending(self) -> None:
+        """Reload queued clients with one find_by_ids per page_size of them"""
+        while self._pending:
+            batch = [self._pending.pop() for _ in range(min(self._page_size, len(self._pending)))]
+            self._deleted_during_reload = set()
+            try:
+                clients = await self._repository.find_by_ids([ClientId(client_id) for client_id in batch])
+            except Exception as e:
+                self._logger.warning(f"Prefix index reload of {len(batch)} clients failed: {e}")
+                continue
+
+            self._metrics["reload_batches"] += 1
+            found = {str(client.id): client for client in clients}
+            for client_id in batch:
+                if client_id in found and client_id not in self._deleted_during_reload:
+                    self.upsert(found[client_id])
+                else:
+                    self.remove(client_id)
+
+    # Building
+
+    async def ensure_fresh(self) -> None:
+        """
+        Build the index if it is missing or older than ``max_age``.
+
+        Only the first build is waited for; a stale index keeps answering
+        while its replacement is read in the background.
+        """
+        if self._built_at is not None and time.monotonic() - self._built_at < self._max_age:
+            return
+
+        loop = asyncio.get_running_loop()
+        if self._build is None or self._build.done() or self._build.get_loop() is not loop:
+            # Searches share the build; it must not inherit the deadline of
+            # the request that started it
+            self._build = loop.create_task(self._rebuild(), context=contextvars.Context())
+            self._build.add_done_callback(self._build_finished)
+        if self._built_at is None:
+            await asyncio.shield(self._build)
+
+    def _build_finished(self, build: asyncio.Task) -> None:
+        if not build.cancelled() and build.exception() is not None:
+            self._metrics["build_failures"] += 1
+            self._logger.warning(f"Prefix index build failed: {build.exception()}")
+
+    async def _rebuild(self) -> None:
+        """Read every client page by page into fresh structures, then swap"""
+        keys: List[Tuple[str, str]] = []
+        entries: Dict[str, IndexedClient] = {}
+        cursor: Optional[str] = None
+
+        while True:
+            page = await self._repository.find_page(
+                limit=self._page_size, cursor=cursor, count_mode="none"
+            )
+            for client in page.items:
+                entry = self._entry(client)
+                entries[entry.summary.id] = entry
+                keys.extend((token, entry.summary.id) for token in entry.tokens)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        keys.sort()
+        self._keys, self._entries = keys, entries
+        self._built_at = time.monotonic()
+        self._metrics["builds"] += 1
+
+        changed, self._changed_during_build = self._changed_during_build, set()
+        if changed:
+            self._reload(*changed)
+
+    # Lookup
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        status: Optional[ClientStatus] = None,
+        program_type: Optional[ProgramType] = None
+    ) -> List[ClientSummary]:
+        """
+        Clients whose name/email words start with every word of ``query``.
+
+        Clients whose full name starts with the query rank first, then
+        results are alphabetical.
+        """
+        await self.ensure_fresh()
+        flush = self._flush
+        if flush is not None and not flush.done() and flush.get_loop() is asyncio.get_running_loop():
+            # Answer with the writes already announced by events
+            await asyncio.shield(flush)
+        self._metrics["lookups"] += 1
+
+        terms = query_terms(query)
+        if not terms:
+            return []
+
+        # Scan the run of the longest (most selective) term, check the rest per entry
+        anchor = max(terms, key=len)
+        others = [term for term in terms if term != anchor]
+
+        matches: Dict[str, IndexedClient] = {}
+        position = bisect_left(self._keys, (anchor, ""))
+        while position < len(self._keys) and self._keys[position][0].startswith(anchor):
+            client_id = self._keys[position][1]
+            position += 1
+            if client_id in matches:
+                continue
+
+            entry = self._entries[client_id]
+            if status and entry.summary.status != status:
+                continue
+            if program_type and entry.summary.program_type != program_type:
+                continue
+            if all(any(token.startswith(term) for token in entry.tokens) for term in others):
+                matches[client_id] = entry
+
+        folded_query = fold(query).strip()
+        ranked = sorted(
+            matches.values(),
+            key=lambda entry: (not entry.folded_name.startswith(folded_query), entry.folded_name)
+        )
+        return [entry.summary for entry in ranked[:limit]]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get index statistics"""
+        return {
+            "clients": len(self._entries),
+            "tokens": len(self._keys),
+            "age_seconds": round(time.monotonic() - self._built_at, 1) if self._built_at else None,
+            "max_age_seconds": self._max_age,
+            "pending_reloads": len(self._pending),
+            **self._metrics
+        }
@@ -4,8 +4,8 @@ Client Management API Controller
 REST endpoints for client management operations.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
 
 from ...application.use_cases.client import (
     CreateClientUseCase,
@@ -20,6 +20,7 @@ from ...application.dto.client_dto import (
     ClientDTO
 )
 from ...domain.exceptions import DomainException, ClientNotFound
+from .responses import json_response
 from ..dependencies import (
     get_create_client_use_case,
     get_get_client_use_case,
@@ -29,6 +30,49 @@ from ..dependencies import (
 
 router = APIRouter()
 
+@router.get("/")
+async def list_clients(
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    offset: Optional[int] = Query(None, ge=0, description="Legacy offset pagination"),
+    sort: str = Query("created_at", pattern="^(created_at|updated_at)$"),
+    query: Optional[str] = Query(None, description="Search term for name/email"),
+    status: Optional[str] = None,
+    program_type: Optional[str] = None,
+    fields: str = Query("summary", pattern="^(summary|full)$", description="summary projects list columns only"),
+    count_mode: str = Query(
+        "exact",
+        pattern="^(exact|planned|estimated|none)$",
+        description="How total_count is computed; none skips it"
+    ),
+    search_mode: str = Query(
+        "contains",
+        pattern="^(contains|fulltext)$",
+        description="contains matches substrings; fulltext matches whole words via the search index"
+    ),
+    use_case: SearchClientsUseCase = Depends(get_search_clients_use_case)
+):
+    """List clients, newest first. Pages by cursor unless an offset is given."""
+    try:
+        result = await use_case.execute(
+            query=query,
+            status=status,
+            program_type=program_type,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            sort_key=sort,
+            pagination="offset" if offset is not None and cursor is None else "cursor",
+            summary=fields == "summary",
+            count_mode=count_mode,
+            search_mode=search_mode
+        )
+        return json_response(result.to_dict())
+    except DomainException as e:
+        raise HTTPException(status_code=400, detail=e.message)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/", response_model=ClientDTO)
 async def create_client(
     client_data: ClientCreateDTO,
@@ -0,0 +1,73 @@
+"""
+Conditional GET Middleware
+
+Gives GET/HEAD responses of the routes listed in ROUTE_CACHE_CONTROL a
+strong ETag and their Cache-Control policy, and answers a matching
+``If-None-Match`` with a bodiless 304. Routes that set their own ETag
+(``infrastructure.cache.versioned``) already answered before running;
+for the others the rendered body is hashed here, which saves the
+transfer but not the work.
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+from fastapi import Request
+from starlette.responses import Response
+
+from ...infrastructure.cache import etag_matches, not_modified, strong_etag
+from ...infrastructure.cache.conditional import CONDITIONAL_METHODS
+
+# Path prefix -> Cache-Control, first match wins; None leaves the route alone
+ROUTE_CACHE_CONTROL: List[Tuple[str, Optional[str]]] = [
+    # Client reads: never reused without asking, but revalidated cheaply
+    ("/api/v1/clients", os.getenv("CACHE_CONTROL_CLIENTS", "private, no-cache")),
+]
+
+# Larger bodies are passed through unhashed rather than buffered
+ETAG_MAX_BODY_BYTES = int(os.getenv("ETAG_MAX_BODY_BYTES", str(1024 * 1024)))
+
+
+def route_cache_control(path: str) -> Optional[str]:
+    """Cache-Control policy of ``path``, or None when it is not conditional"""
+    for prefix, cache_control in ROUTE_CACHE_CONTROL:
+        if path.startswith(prefix):
+            return cache_control
+    return None
+
+
+async def conditional_get(request: Request, call_next) -> Response:
+    """HTTP middleware adding ETags and answering If-None-Match with 304"""
+    cache_control = route_cache_control(request.url.path)
+    if request.method not in CONDITIONAL_METHODS or cache_control is None:
+        return await call_next(request)
+
+    response = await call_next(request)
+    if response.status_code != 200:
+        return response
+
+    etag = response.headers.get("etag")
+    if etag is None:
+        length = response.headers.get("content-length")
+        # No length means a real stream (exports); leave it alone
+        if length is None or int(length) > ETAG_MAX_BODY_BYTES:
+            return response
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = strong_etag(body)
+        response = _buffered(response, body)
+
+    cache_control = response.headers.get("cache-control", cache_control)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag, cache_control)
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    return response
+
+
+def _buffered(response: Response, body: bytes) -> Response:
+    """The same response with its already-read body"""
+    buffered = Response(content=body, status_code=response.status_code)
+    # Keep every header as sent, repeated ones (Set-Cookie) included
+    buffered.raw_headers = list(response.raw_headers)
+    return buffered
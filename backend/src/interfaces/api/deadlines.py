@@ -0,0 +1,83 @@
+"""
+Request Deadline Middleware
+
+Gives every request a time budget: the route's default, shortened by an
+``X-Request-Timeout`` header (seconds) when the caller will give up
+sooner. Repository calls made while serving the request stop once the
+budget is spent (see ``application.deadline``); the request then answers
+504 with a report of the calls that did complete, whatever the endpoint
+did with the error. Requests served and deadlines exceeded are counted
+per route in PerformanceMonitor.
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+from fastapi import Request
+from starlette.responses import Response
+
+from ...application.deadline import deadline_scope
+from ...infrastructure.database.performance import performance_monitor
+from .responses import FastJSONResponse
+
+DEADLINE_HEADER = "X-Request-Timeout"
+
+DEFAULT_REQUEST_DEADLINE = float(os.getenv("REQUEST_DEADLINE_SECONDS", "30"))
+
+# Path prefix -> budget in seconds, first match wins; None disables the deadline
+ROUTE_DEADLINES: List[Tuple[str, Optional[float]]] = [
+    # Streams for as long as the export takes
+    ("/api/v1/optimized/bulk-export", None),
+    # Claude Desktop gives up long before the default
+    ("/api/v1/mcp", float(os.getenv("REQUEST_DEADLINE_MCP_SECONDS", "15"))),
+]
+
+
+def request_budget(path: str, requested: Optional[str]) -> Optional[float]:
+    """Budget for a request to ``path``; the header can only shorten it"""
+    budget: Optional[float] = DEFAULT_REQUEST_DEADLINE
+    for prefix, route_budget in ROUTE_DEADLINES:
+        if path.startswith(prefix):
+            budget = route_budget
+            break
+
+    if budget is None or not requested:
+        return budget
+
+    try:
+        seconds = float(requested)
+    except ValueError:
+        return budget
+    return min(budget, seconds) if seconds > 0 else budget
+
+
+def route_template(request: Request) -> str:
+    """Matched route path (``/api/v1/clients/{client_id}``), so ids don't split the metrics"""
+    route = request.scope.get("route")
+    return getattr(route, "path", request.url.path)
+
+
+async def enforce_request_deadline(request: Request, call_next) -> Response:
+    """HTTP middleware running each request under its deadline"""
+    budget = request_budget(request.url.path, request.headers.get(DEADLINE_HEADER))
+    if budget is None:
+        return await call_next(request)
+
+    with deadline_scope(budget, route=request.url.path) as deadline:
+        response = await call_next(request)
+
+    route = route_template(request)
+    performance_monitor.record_deadline(route, deadline.exceeded)
+    if not deadline.exceeded:
+        return response
+
+    deadline.route = route
+    return FastJSONResponse(
+        status_code=504,
+        content={
+            "error": "Gateway Timeout",
+            "message": f"Request did not complete within {budget:g}s",
+            "error_code": "DEADLINE_EXCEEDED",
+            "details": deadline.report()
+        }
+    )
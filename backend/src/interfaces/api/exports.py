@@ -0,0 +1,142 @@
+"""
+Streaming Export Encoders
+
+Turn an async iterator of ClientRecord pages into CSV, NDJSON or JSON
+byte chunks, optionally gzip-compressed on the fly. Each page is encoded
+and handed to the response as soon as it arrives, so memory stays at
+one page however large the export is.
+"""
+
+import csv
+import io
+import zlib
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List
+
+from ...domain.entities import ClientRecord
+from .responses import dumps
+
+EXPORT_FORMATS = ("csv", "ndjson", "json")
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+CSV_HEADER = [
+    "ID", "Name", "Email", "Phone", "Program Type",
+    "Status", "Created At", "Updated At", "Notes"
+]
+
+Pages = AsyncIterator[List[ClientRecord]]
+
+
+def export_row(record: ClientRecord) -> Dict[str, Any]:
+    """JSON form of one exported client"""
+    return {
+        "id": record.id,
+        "name": record.name,
+        "email": record.email,
+        "phone": record.phone,
+        "program_type": record.program_type.value,
+        "status": record.status.value,
+        "created_at": record.created_at.isoformat(),
+        "updated_at": record.updated_at.isoformat(),
+        "notes": record.notes,
+        "metadata": record.metadata or {},
+    }
+
+
+async def csv_chunks(pages: Pages, stats: Dict[str, int]) -> AsyncIterator[bytes]:
+    """Header, then one CSV chunk per page"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+
+    async for records in pages:
+        writer.writerows(
+            (
+                record.id,
+                record.name,
+                record.email,
+                record.phone or "",
+                record.program_type.value,
+                record.status.value,
+                record.created_at.isoformat(),
+                record.updated_at.isoformat(),
+                record.notes or "",
+            )
+            for record in records
+        )
+        stats["records"] += len(records)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        # Header of an empty export
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def ndjson_chunks(pages: Pages, stats: Dict[str, int]) -> AsyncIterator[bytes]:
+    """One JSON object per line"""
+    async for records in pages:
+        stats["records"] += len(records)
+        yield b"".join(dumps(export_row(record)) + b"\n" for record in records)
+
+
+async def json_chunks(pages: Pages, stats: Dict[str, int]) -> AsyncIterator[bytes]:
+    """
+    The ``{"status": ..., "data": {"clients": [...]}}`` envelope of the
+    previous buffered export, with the client array streamed and the
+    totals written after it.
+    """
+    yield b'{"status":"success","data":{"format":"json","clients":['
+    separator = b""
+    async for records in pages:
+        stats["records"] += len(records)
+        yield separator + b",".join(dumps(export_row(record)) for record in records)
+        separator = b","
+    yield (
+        b'],"total_records":' + dumps(stats["records"])
+        + b',"generated_at":' + dumps(datetime.now().isoformat()) + b"}}"
+    )
+
+
+ENCODERS: Dict[str, Callable[[Pages, Dict[str, int]], AsyncIterator[bytes]]] = {
+    "csv": csv_chunks,
+    "ndjson": ndjson_chunks,
+    "json": json_chunks,
+}
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """Compress a byte stream into a single gzip member as it is produced"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+async def prefetched(pages: Pages) -> Pages:
+    """
+    Fetch the first page before the response starts.
+
+    Errors on the first query then surface as a normal error response
+    instead of a stream that breaks after the 200 status was sent.
+    """
+    try:
+        first = await pages.__anext__()
+    except StopAsyncIteration:
+        first = None
+
+    async def chained() -> Pages:
+        if first is not None:
+            yield first
+        async for records in pages:
+            yield records
+
+    return chained()
@@ -20,11 +20,15 @@ from ...application.use_cases.client import (
 from ...application.dto.client_dto import (
     ClientCreateDTO,
     ClientUpdateDTO,
-    ClientSearchFiltersDTO,
-    ClientDTO
+    ClientDTO,
+    ClientSummaryDTO,
+    ClientSearchResultDTO
 )
+from ...domain.entities import ClientStatus, ProgramType
 from ...domain.exceptions import DomainException, ClientNotFound
+from ...infrastructure.search import ClientPrefixIndex
 from ..dependencies import (
+    get_client_prefix_index,
     get_create_client_use_case,
     get_get_client_use_case,
     get_search_clients_use_case,
@@ -76,6 +80,10 @@ class McpClientSearchRequest(McpBaseModel):
         False,
         description="Include adherence and progress metrics"
     )
+    autocomplete: bool = Field(
+        False,
+        description="Treat the query as a typed prefix of name/email words (search-as-you-type)"
+    )
 
 class McpClientDetailsRequest(McpBaseModel):
     """MCP request for detailed client information"""
@@ -122,7 +130,8 @@ class McpResponse(BaseModel):
 @router.post("/clients/search", response_model=McpResponse)
 async def mcp_search_clients(
     request: McpClientSearchRequest,
-    use_case: SearchClientsUseCase = Depends(get_search_clients_use_case)
+    use_case: SearchClientsUseCase = Depends(get_search_clients_use_case),
+    prefix_index: ClientPrefixIndex = Depends(get_client_prefix_index)
 ) -> McpResponse:
     """
     Search for clients with natural language support for Claude Desktop.
@@ -131,20 +140,38 @@ async def mcp_search_clients(
     - "busca todos los clientes PRIME activos"
     - "clientes pausados este mes"
     - "sarah johnson"
+    
+    With ``autocomplete`` the query is matched as word prefixes against
+    the in-memory index ("jos gar" finds "José García") instead of
+    querying the database.
     """
     
     try:
-        # Convert MCP request to domain DTO
-        search_filters = ClientSearchFiltersDTO(
-            query=request.query,
-            program_type=request.program_type,
-            status=request.status,
-            limit=request.limit,
-            page=1
-        )
+        status = request.status.lower() if request.status else None
         
-        # Execute search
-        result = await use_case.execute(search_filters)
+        if request.autocomplete and request.query:
+            summaries = await prefix_index.search(
+                request.query,
+                limit=request.limit,
+                status=ClientStatus(status) if status else None,
+                program_type=ProgramType(request.program_type) if request.program_type else None
+            )
+            result = ClientSearchResultDTO(
+                clients=[ClientSummaryDTO.from_summary(summary) for summary in summaries],
+                total_count=len(summaries),
+                limit=request.limit,
+                offset=0
+            )
+        else:
+            # Execute search on the lightweight read model (list columns only)
+            result = await use_case.execute(
+                query=request.query,
+                program_type=request.program_type,
+                status=status,
+                limit=request.limit,
+                offset=0,
+                summary=True
+            )
         
         # Format response for Claude Desktop
         clients_data = []
@@ -152,11 +179,9 @@ async def mcp_search_clients(
             client_data = {
                 "id": client_dto.id,
                 "name": client_dto.name,
-                "email": client_dto.email,
                 "program_type": client_dto.program_type,
                 "status": client_dto.status,
-                "created_at": client_dto.created_at,
-                "last_activity": client_dto.last_activity
+                "last_activity": client_dto.updated_at
             }
             clients_data.append(client_data)
         
@@ -170,7 +195,7 @@ async def mcp_search_clients(
             ]
         else:
             count = len(clients_data)
-            total = result.pagination.total
+            total = result.total_count
             program_filter = f" {request.program_type}" if request.program_type else ""
             status_filter = f" {request.status.lower()}" if request.status else ""
             
@@ -188,10 +213,11 @@ async def mcp_search_clients(
             data={
                 "clients": clients_data,
                 "pagination": {
-                    "total": result.pagination.total,
-                    "page": result.pagination.page,
-                    "limit": result.pagination.limit,
-                    "pages": result.pagination.total_pages
+                    "total": result.total_count,
+                    "page": result.current_page,
+                    "limit": result.limit,
+                    "pages": result.total_pages,
+                    "next_cursor": result.next_cursor
                 }
             },
             context={
@@ -4,6 +4,7 @@ Optimized client API endpoints with performance enhancements
 
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, Query, HTTPException, BackgroundTasks
+from fastapi.responses import Response, StreamingResponse
 from datetime import datetime, timedelta
 
 from ...application.use_cases.client import (
@@ -13,49 +14,83 @@ from ...application.use_cases.client import (
     SearchClientsUseCase,
     GetClientAnalyticsUseCase
 )
-from ...application.dto.client_dto import ClientCreateRequest, ClientUpdateRequest, ClientResponse
+from ...application.dto.client_dto import (
+    ClientCreateRequest,
+    ClientUpdateRequest,
+    ClientResponse,
+    ClientSummaryDTO
+)
 from ...domain.entities import ClientStatus, ProgramType
 from ...domain.value_objects import Email
-from ...infrastructure.database.optimized_repository import create_optimized_client_repository
+from ...domain.exceptions import DomainException
+from ...infrastructure.cache import dashboard_cache
 from ..dependencies import get_container
+from .exports import ENCODERS, MEDIA_TYPES, gzip_chunks, prefetched
+from .responses import dump_list, json_response
 
 router = APIRouter(prefix="/clients", tags=["clients-optimized"])
 
 
 @router.get("/dashboard")
-async def get_clients_dashboard():
-    """Get optimized client dashboard data"""
+async def get_clients_dashboard(response: Response):
+    """Get optimized client dashboard data (stale-while-revalidate)"""
     try:
-        repo = create_optimized_client_repository()
-        
-        # Get dashboard metrics efficiently in single query
-        metrics = await repo.get_dashboard_metrics()
-        recent_activity = await repo.get_recent_activity(limit=15)
+        result = await dashboard_cache("clients").get("clients", _build_clients_dashboard)
+        response.headers.update(result.headers)
         
         return {
             "status": "success", 
-            "data": {
-                "metrics": metrics,
-                "recent_activity": recent_activity,
-                "last_updated": datetime.now().isoformat()
-            }
+            "data": result.value,
+            "cache": result.metadata()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get dashboard: {e}")
 
 
+async def _build_clients_dashboard() -> Dict[str, Any]:
+    repo = get_container().client_repository()
+    
+    # Get dashboard metrics efficiently in single query
+    metrics = await repo.get_dashboard_metrics()
+    recent_activity = await repo.get_recent_activity(limit=15)
+    
+    return {
+        "metrics": metrics,
+        "recent_activity": recent_activity,
+        "last_updated": datetime.now().isoformat()
+    }
+
+
 @router.get("/search/advanced")
 async def advanced_client_search(
     query: Optional[str] = Query(None, description="Search term for name/email"),
     status: Optional[ClientStatus] = Query(None, description="Filter by status"),
     program_type: Optional[ProgramType] = Query(None, description="Filter by program type"),
     limit: int = Query(20, ge=1, le=100, description="Number of results"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
+    offset: Optional[int] = Query(None, ge=0, description="Legacy offset pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    sort: str = Query("created_at", pattern="^(created_at|updated_at)$"),
+    fields: str = Query("full", pattern="^(summary|full)$", description="summary projects list columns only"),
+    count_mode: str = Query(
+        "exact",
+        pattern="^(exact|planned|estimated|none)$",
+        description="How total_count is computed; none skips it"
+    ),
+    search_mode: str = Query(
+        "contains",
+        pattern="^(contains|fulltext)$",
+        description="contains matches substrings; fulltext matches whole words via the search index"
+    ),
     background_tasks: BackgroundTasks = BackgroundTasks()
 ):
-    """Advanced client search with multiple filters and caching"""
+    """
+    Advanced client search with multiple filters and caching.
+    
+    Pages by cursor (newest first) unless an offset is given. Rows and
+    total count are fetched in one query.
+    """
     try:
-        repo = create_optimized_client_repository()
+        repo = get_container().client_repository()
         
         # Execute optimized search
         search_results = await repo.search_with_filters(
@@ -63,14 +98,25 @@ async def advanced_client_search(
             status=status,
             program_type=program_type,
             limit=limit,
-            offset=offset
+            offset=offset if cursor is None else None,
+            cursor=cursor,
+            sort_key=sort,
+            summary=fields == "summary",
+            count_mode=count_mode,
+            search_mode=search_mode
         )
         
-        # Convert entities to DTOs
-        client_responses = [
-            ClientResponse.from_entity(client) 
-            for client in search_results["clients"]
-        ]
+        # Convert entities (or projected summaries) to DTOs
+        if fields == "summary":
+            client_responses = [
+                ClientSummaryDTO.from_summary(summary).to_dict()
+                for summary in search_results["clients"]
+            ]
+        else:
+            client_responses = dump_list(ClientResponse, [
+                ClientResponse.from_entity(client)
+                for client in search_results["clients"]
+            ])
         
         # Log search for analytics (background task)
         background_tasks.add_task(
@@ -80,17 +126,21 @@ async def advanced_client_search(
             result_count=len(client_responses)
         )
         
-        return {
+        total_count = search_results["total_count"]
+        
+        return json_response({
             "status": "success",
             "data": {
                 "clients": client_responses,
                 "pagination": {
-                    "total_count": search_results["total_count"],
+                    "total_count": total_count,
+                    "count_mode": count_mode,
                     "limit": limit,
-                    "offset": offset,
+                    "offset": search_results["offset"],
                     "has_more": search_results["has_more"],
-                    "current_page": offset // limit + 1,
-                    "total_pages": (search_results["total_count"] + limit - 1) // limit
+                    "next_cursor": search_results["next_cursor"],
+                    "current_page": (search_results["offset"] or 0) // limit + 1,
+                    "total_pages": (total_count + limit - 1) // limit if total_count is not None else None
                 },
                 "filters_applied": {
                     "query": query,
@@ -98,7 +148,13 @@ async def advanced_client_search(
                     "program_type": program_type.value if program_type else None
                 }
             }
-        }
+        })
+    except DomainException as e:
+        if e.error_code in (
+            "INVALID_CURSOR", "INVALID_SORT_KEY", "INVALID_COUNT_MODE", "INVALID_SEARCH_MODE"
+        ):
+            raise HTTPException(status_code=400, detail=e.message)
+        raise HTTPException(status_code=500, detail=f"Search failed: {e}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {e}")
 
@@ -111,55 +167,35 @@ async def create_clients_batch(
 ):
     """Create multiple clients in batch for better performance"""
     try:
-        if len(clients_data) > 50:
-            raise HTTPException(
-                status_code=400, 
-                detail="Batch size limited to 50 clients per request"
-            )
-        
-        create_use_case = container.create_client_use_case()
-        created_clients = []
-        errors = []
+        bulk_use_case = container.bulk_create_clients_use_case()
+        result = await bulk_use_case.execute(clients_data)
         
-        # Process in smaller batches for better performance
-        batch_size = 10
-        for i in range(0, len(clients_data), batch_size):
-            batch = clients_data[i:i + batch_size]
-            
-            for client_data in batch:
-                try:
-                    client = await create_use_case.execute(client_data)
-                    created_clients.append(ClientResponse.from_entity(client))
-                except Exception as e:
-                    errors.append({
-                        "client_data": client_data.model_dump(),
-                        "error": str(e)
-                    })
+        errors = [
+            {**error, "client_data": clients_data[error["index"]].model_dump()}
+            for error in result.errors
+        ]
         
         # Log batch operation (background task)
         background_tasks.add_task(
             _log_batch_operation,
             operation="create",
             total_items=len(clients_data),
-            successful=len(created_clients),
-            failed=len(errors)
+            successful=result.successful,
+            failed=result.failed
         )
         
         return {
             "status": "success",
             "data": {
-                "created_clients": created_clients,
+                "created_clients": [ClientResponse.from_entity(client) for client in result.created],
                 "errors": errors,
-                "summary": {
-                    "total_requested": len(clients_data),
-                    "successful": len(created_clients),
-                    "failed": len(errors),
-                    "success_rate": (len(created_clients) / len(clients_data)) * 100
-                }
+                "summary": result.summary()
             }
         }
-    except HTTPException:
-        raise
+    except DomainException as e:
+        if e.error_code == "BATCH_TOO_LARGE":
+            raise HTTPException(status_code=400, detail=e.message)
+        raise HTTPException(status_code=500, detail=f"Batch creation failed: {e}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Batch creation failed: {e}")
 
@@ -171,13 +207,13 @@ async def get_client_analytics_performance(
 ):
     """Get client analytics with performance optimization"""
     try:
-        repo = create_optimized_client_repository()
+        repo = get_container().client_repository()
         
         # Calculate date range
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
-        # Get analytics data efficiently
+        # Grouped counts come from the database, not from client rows
         analytics_data = await repo.get_analytics_data(
             start_date=start_date,
             end_date=end_date,
@@ -205,69 +241,47 @@ async def get_client_analytics_performance(
 
 @router.get("/bulk-export")
 async def export_clients_bulk(
-    format: str = Query("json", regex="^(json|csv)$", description="Export format"),
+    format: str = Query("json", pattern="^(json|csv|ndjson)$", description="Export format"),
+    compress: bool = Query(False, alias="gzip", description="gzip-compress the stream"),
     status: Optional[ClientStatus] = Query(None, description="Filter by status"),
     program_type: Optional[ProgramType] = Query(None, description="Filter by program type"),
+    container = Depends(get_container),
     background_tasks: BackgroundTasks = BackgroundTasks()
 ):
-    """Bulk export clients with streaming for large datasets"""
+    """
+    Stream every matching client as CSV, NDJSON or JSON.
+    
+    Pages through the table by cursor and writes each page as soon as it
+    is read, so exports have no row cap and use constant memory.
+    """
     try:
-        repo = create_optimized_client_repository()
-        
-        # Use search with filters for consistent filtering logic
-        all_clients_data = await repo.search_with_filters(
-            status=status,
-            program_type=program_type,
-            limit=10000  # Large limit for export
-        )
-        
-        clients = all_clients_data["clients"]
-        
-        if format == "csv":
-            # Generate CSV content
-            csv_content = _generate_csv_export(clients)
-            
-            # Log export (background task)
-            background_tasks.add_task(
-                _log_export_operation,
-                format="csv",
-                count=len(clients),
-                filters={"status": status, "program_type": program_type}
-            )
-            
-            return {
-                "status": "success",
-                "data": {
-                    "format": "csv",
-                    "content": csv_content,
-                    "total_records": len(clients),
-                    "generated_at": datetime.now().isoformat()
-                }
-            }
-        else:
-            # JSON format
-            client_responses = [ClientResponse.from_entity(client) for client in clients]
-            
-            # Log export (background task)
-            background_tasks.add_task(
-                _log_export_operation,
-                format="json",
-                count=len(clients),
-                filters={"status": status, "program_type": program_type}
-            )
-            
-            return {
-                "status": "success",
-                "data": {
-                    "format": "json",
-                    "clients": client_responses,
-                    "total_records": len(clients),
-                    "generated_at": datetime.now().isoformat()
-                }
-            }
-            
+        export_use_case = container.export_clients_use_case()
+        pages = await prefetched(export_use_case.pages(status=status, program_type=program_type))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Export failed: {e}")
+    
+    stats = {"records": 0}
+    body = ENCODERS[format](pages, stats)
+    filename = f"clients-export.{format}"
+    media_type = MEDIA_TYPES[format]
+    if compress:
+        body = gzip_chunks(body)
+        filename += ".gz"
+        media_type = "application/gzip"
+    
+    # Runs once the stream has been sent, when the count is known
+    background_tasks.add_task(
+        _log_export_operation,
+        format=format,
+        stats=stats,
+        filters={"status": status, "program_type": program_type}
+    )
+    
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
 
 
 @router.get("/by-ids")
@@ -286,27 +300,27 @@ async def get_clients_by_ids(
                 detail="Maximum 100 IDs allowed per request"
             )
         
-        repo = create_optimized_client_repository()
+        repo = get_container().client_repository()
         
         # Use batch find for better performance
         from ...domain.entities import ClientId
         client_id_objects = [ClientId(id) for id in client_ids]
         
         clients = await repo.find_by_ids(client_id_objects)
-        client_responses = [ClientResponse.from_entity(client) for client in clients]
+        client_responses = dump_list(
+            ClientResponse, [ClientResponse.from_entity(client) for client in clients]
+        )
+        found_ids = {str(client.id) for client in clients}
         
-        return {
+        return json_response({
             "status": "success",
             "data": {
                 "clients": client_responses,
                 "requested_count": len(client_ids),
                 "found_count": len(clients),
-                "missing_ids": [
-                    id for id in client_ids 
-                    if id not in [str(client.id) for client in clients]
-                ]
+                "missing_ids": [id for id in client_ids if id not in found_ids]
             }
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -325,24 +339,24 @@ async def _log_batch_operation(operation: str, total_items: int, successful: int
     print(f"Batch {operation}: total={total_items}, success={successful}, failed={failed}")
 
 
-async def _log_export_operation(format: str, count: int, filters: Dict):
+async def _log_export_operation(format: str, stats: Dict[str, int], filters: Dict):
     """Log export operation metrics"""
-    print(f"Export {format}: {count} records, filters={filters}")
+    print(f"Export {format}: {stats['records']} records, filters={filters}")
 
 
 async def _calculate_growth_metrics(repo, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
     """Calculate client growth metrics"""
     try:
-        # Get clients created in this period
-        new_clients = await repo.find_created_between(start_date, end_date)
+        # Count clients created in this period (aggregated in the database)
+        current_counts = await repo.count_by_status_and_program_type(start_date, end_date)
         
         # Calculate previous period for comparison
         period_days = (end_date - start_date).days
         prev_start = start_date - timedelta(days=period_days)
-        prev_clients = await repo.find_created_between(prev_start, start_date)
+        previous_counts = await repo.count_by_status_and_program_type(prev_start, start_date)
         
-        current_count = len(new_clients)
-        previous_count = len(prev_clients)
+        current_count = sum(current_counts.values())
+        previous_count = sum(previous_counts.values())
         
         growth_rate = 0
         if previous_count > 0:
@@ -361,34 +375,3 @@ async def _calculate_growth_metrics(repo, start_date: datetime, end_date: dateti
             "growth_rate_percentage": 0,
             "trend": "unknown"
         }
-
-
-def _generate_csv_export(clients) -> str:
-    """Generate CSV content from clients list"""
-    import csv
-    import io
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Header
-    writer.writerow([
-        "ID", "Name", "Email", "Phone", "Program Type", 
-        "Status", "Created At", "Updated At", "Notes"
-    ])
-    
-    # Data rows
-    for client in clients:
-        writer.writerow([
-            str(client.id),
-            client.name,
-            str(client.email),
-            str(client.phone) if client.phone else "",
-            client.program_type.value,
-            client.status.value,
-            client.created_at.isoformat(),
-            client.updated_at.isoformat(),
-            client.notes or ""
-        ])
-    
-    return output.getvalue()
\ No newline at end of file
@@ -2,8 +2,8 @@
 Performance monitoring API endpoints
 """
 
-from typing import Optional, Dict, Any
-from fastapi import APIRouter, Depends, Query, HTTPException
+from typing import Optional, Dict, Any, List
+from fastapi import APIRouter, Depends, Query, HTTPException, Response
 from datetime import datetime, timedelta
 
 from ...infrastructure.database.performance import (
@@ -11,10 +11,13 @@ from ...infrastructure.database.performance import (
     get_database_health,
     performance_monitor,
     query_cache,
-    connection_pool
+    connection_pool,
+    single_flight,
+    get_connection_pool_stats
 )
-from ...infrastructure.database.optimized_repository import create_optimized_client_repository
-from ..dependencies import get_current_user
+from ...infrastructure.cache import cached_function_stats, dashboard_cache, dashboard_cache_stats, negative_cache
+from ...infrastructure.database.batch_loader import get_batch_loader_stats
+from ..dependencies import get_container, get_current_user
 
 router = APIRouter(prefix="/performance", tags=["performance"])
 
@@ -66,6 +69,11 @@ async def get_performance_metrics(
                 "query_performance": stats,
                 "cache_statistics": cache_stats,
                 "connection_pool": pool_stats,
+                "connection_pools": get_connection_pool_stats(),
+                "batch_loaders": get_batch_loader_stats(),
+                "single_flight": single_flight.stats(),
+                "deadlines": performance_monitor.deadline_stats(),
+                "dashboards": dashboard_cache_stats(),
                 "period_minutes": minutes
             },
             "timestamp": datetime.now().isoformat()
@@ -145,6 +153,8 @@ async def get_cache_statistics():
             "status": "success",
             "data": {
                 "cache_statistics": stats,
+                "cached_functions": cached_function_stats(),
+                "negative_lookups": negative_cache.stats(),
                 "recommendations": _get_cache_recommendations(stats)
             },
             "timestamp": datetime.now().isoformat()
@@ -154,35 +164,43 @@ async def get_cache_statistics():
 
 
 @router.get("/database/dashboard")
-async def get_database_dashboard():
-    """Get optimized database dashboard metrics"""
+async def get_database_dashboard(response: Response):
+    """Get optimized database dashboard metrics (stale-while-revalidate)"""
     try:
-        repo = create_optimized_client_repository()
-        
-        # Get dashboard metrics efficiently
-        metrics = await repo.get_dashboard_metrics()
-        recent_activity = await repo.get_recent_activity(limit=10)
-        
-        # Get performance summary
-        perf_stats = performance_monitor.get_stats(minutes=60)
+        result = await dashboard_cache("database").get("database", _build_database_dashboard)
+        response.headers.update(result.headers)
         
         return {
             "status": "success",
-            "data": {
-                "client_metrics": metrics,
-                "recent_activity": recent_activity,
-                "performance_summary": {
-                    "total_queries_last_hour": perf_stats.get("total_queries", 0),
-                    "average_response_time": perf_stats.get("average_execution_time", 0),
-                    "cache_hit_rate": perf_stats.get("cache_hit_rate", 0)
-                }
-            },
+            "data": result.value,
+            "cache": result.metadata(),
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get dashboard data: {e}")
 
 
+async def _build_database_dashboard() -> Dict[str, Any]:
+    repo = get_container().client_repository()
+    
+    # Get dashboard metrics efficiently
+    metrics = await repo.get_dashboard_metrics()
+    recent_activity = await repo.get_recent_activity(limit=10)
+    
+    # Get performance summary
+    perf_stats = performance_monitor.get_stats(minutes=60)
+    
+    return {
+        "client_metrics": metrics,
+        "recent_activity": recent_activity,
+        "performance_summary": {
+            "total_queries_last_hour": perf_stats.get("total_queries", 0),
+            "average_response_time": perf_stats.get("average_execution_time", 0),
+            "cache_hit_rate": perf_stats.get("cache_hit_rate", 0)
+        }
+    }
+
+
 @router.get("/optimization/recommendations")
 async def get_optimization_recommendations():
     """Get performance optimization recommendations"""
@@ -225,14 +243,18 @@ async def get_optimization_recommendations():
             })
         
         # Memory recommendations
-        cache_size_mb = cache_stats.get("cache_size_mb", 0)
-        if cache_size_mb > 100:
+        evictions = cache_stats.get("evictions", 0)
+        if evictions > 0:
             recommendations.append({
                 "category": "memory",
                 "priority": "low",
-                "title": "Monitor Cache Memory Usage",
-                "description": f"Cache is using {cache_size_mb:.1f}MB. Consider implementing LRU eviction.",
-                "impact": "Low - Prevents memory bloat"
+                "title": "Cache Size Budget Reached",
+                "description": (
+                    f"Cache is at {cache_stats.get('cache_size_mb', 0):.1f}MB of "
+                    f"{cache_stats.get('max_size_mb', 0):.1f}MB and has evicted {evictions} entries. "
+                    "Consider raising CACHE_MAX_BYTES."
+                ),
+                "impact": "Low - Fewer repeated queries for evicted results"
             })
         
         return {
@@ -251,7 +273,7 @@ async def get_optimization_recommendations():
 async def run_performance_benchmark():
     """Run a performance benchmark test"""
     try:
-        repo = create_optimized_client_repository()
+        repo = get_container().client_repository()
         
         # Benchmark different operations
         start_time = datetime.now()
@@ -305,13 +327,13 @@ def _get_cache_recommendations(cache_stats: Dict[str, Any]) -> List[str]:
     """Generate cache optimization recommendations"""
     recommendations = []
     
-    active_ratio = cache_stats.get("active_entries", 0) / max(cache_stats.get("total_entries", 1), 1)
-    
-    if active_ratio < 0.5:
+    if cache_stats.get("expirations", 0) > cache_stats.get("hits", 0):
         recommendations.append("High cache expiration rate - consider increasing TTL")
     
-    if cache_stats.get("cache_size_mb", 0) > 50:
-        recommendations.append("Large cache size - consider implementing LRU eviction")
+    if cache_stats.get("evictions", 0) > 0:
+        recommendations.append(
+            "Cache is evicting live entries - consider raising CACHE_MAX_BYTES"
+        )
     
     if cache_stats.get("total_entries", 0) > 10000:
         recommendations.append("High entry count - consider cache partitioning")
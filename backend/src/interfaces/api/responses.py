@@ -0,0 +1,96 @@
+"""
+JSON Response Layer
+
+App-wide response class backed by orjson, plus helpers for hot list
+endpoints. FastAPI runs every returned value through ``jsonable_encoder``
+(a recursive pure-Python walk) before the response class renders it;
+endpoints that return ``json_response(...)`` skip that walk and are
+serialized in one orjson call. Lists of pydantic models are dumped with
+a cached ``TypeAdapter`` in a single pydantic-core pass.
+
+Falls back to the standard library encoder when orjson is not installed.
+"""
+
+import json
+from dataclasses import asdict, is_dataclass
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode the types orjson does not handle natively"""
+    if isinstance(value, BaseModel):
+        # mode="json" applies the model's own json_encoders
+        # (ExecutiveResponse: Decimal -> float, Alert: datetime -> isoformat)
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if orjson is None:
+        # The stdlib encoder also lacks these
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        if isinstance(value, Enum):
+            return value.value
+        if is_dataclass(value) and not isinstance(value, type):
+            return asdict(value)
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+if orjson is not None:
+    # Dict keys may be enums, UUIDs or datetimes (e.g. counts keyed by status)
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(content: Any) -> bytes:
+        """Serialize content to JSON bytes"""
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+else:  # pragma: no cover
+    def dumps(content: Any) -> bytes:
+        """Serialize content to JSON bytes"""
+        return json.dumps(
+            content, default=_default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+
+    Handles datetime/date (ISO 8601), UUID, enums and dataclasses
+    natively, and Decimal, sets and pydantic models through ``_default``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def json_response(
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None
+) -> FastJSONResponse:
+    """Return content as-is, skipping FastAPI's jsonable_encoder pass"""
+    return FastJSONResponse(content=content, status_code=status_code, headers=headers)
+
+
+@lru_cache(maxsize=128)
+def list_adapter(item_type: Type[Any]) -> TypeAdapter:
+    """Cached TypeAdapter for ``List[item_type]``; building one is expensive"""
+    return TypeAdapter(List[item_type])
+
+
+def dump_list(item_type: Type[Any], items: Sequence[Any]) -> List[Any]:
+    """JSON-ready form of a list of pydantic models/dataclasses in one pass"""
+    return list_adapter(item_type).dump_python(list(items), mode="json")
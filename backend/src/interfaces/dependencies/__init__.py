@@ -7,6 +7,7 @@ Handles the wiring of all dependencies throughout the application layers.
 from .container import Container, get_container
 from .providers import (
     get_client_repository,
+    get_client_prefix_index,
     get_create_client_use_case,
     get_get_client_use_case,
     get_update_client_use_case,
@@ -19,6 +20,7 @@ __all__ = [
     "Container",
     "get_container",
     "get_client_repository",
+    "get_client_prefix_index",
     "get_create_client_use_case",
     "get_get_client_use_case", 
     "get_update_client_use_case",
@@ -6,16 +6,30 @@ import os
 from typing import Dict, Any
 from functools import lru_cache
 
-from ...infrastructure.database import SupabaseConnection, SupabaseClientRepository
+from ...infrastructure.database import (
+    SupabaseConnection,
+    SupabaseClientRepository,
+    AsyncPostgrestConnection,
+    AsyncPostgrestClientRepository
+)
+from ...infrastructure.cache import close_cache
+from ...infrastructure.database.client_cache import CLIENT_EVENTS, ClientIdentityCache
+from ...infrastructure.database.optimized_repository import OptimizedClientRepository
+from ...infrastructure.database.performance import OptimizedSupabaseConnection
 from ...infrastructure.monitoring import Logger, ConsoleLogger
 from ...infrastructure.messaging import EventPublisher, InMemoryEventPublisher
+from ...infrastructure.search import ClientPrefixIndex
+from ...infrastructure.search.prefix_index import INDEXED_EVENTS
 
+from ...application.interfaces import IClientRepository
 from ...application.use_cases import (
     CreateClientUseCase,
+    BulkCreateClientsUseCase,
     GetClientUseCase,
     UpdateClientUseCase,
     SearchClientsUseCase,
-    GetClientAnalyticsUseCase
+    GetClientAnalyticsUseCase,
+    ExportClientsUseCase
 )
 
 
@@ -38,6 +52,10 @@ class Container:
                 "url": os.getenv("SUPABASE_URL"),
                 "service_key": os.getenv("SUPABASE_SERVICE_KEY")
             },
+            "database": {
+                # postgrest (async HTTP), optimized or supabase (sync supabase-py)
+                "client_repository": os.getenv("CLIENT_REPOSITORY_BACKEND", "postgrest")
+            },
             "logging": {
                 "level": os.getenv("LOG_LEVEL", "INFO"),
                 "format": os.getenv("LOG_FORMAT", "json")
@@ -63,6 +81,16 @@ class Container:
             )
         )
     
+    def postgrest_connection(self) -> AsyncPostgrestConnection:
+        """Get shared async PostgREST connection"""
+        return self._get_or_create(
+            "postgrest_connection",
+            lambda: AsyncPostgrestConnection(
+                url=self._config["supabase"]["url"],
+                key=self._config["supabase"]["service_key"]
+            )
+        )
+    
     def logger(self) -> Logger:
         """Get logger instance"""
         return self._get_or_create(
@@ -82,12 +110,57 @@ class Container:
     
     # Repository Layer
     
-    def client_repository(self) -> SupabaseClientRepository:
+    def client_repository(self) -> IClientRepository:
         """Get client repository instance"""
-        return self._get_or_create(
-            "client_repository",
-            lambda: SupabaseClientRepository(connection=self.supabase_connection())
-        )
+        return self._get_or_create("client_repository", self._create_client_repository)
+    
+    def _create_client_repository(self) -> IClientRepository:
+        """Build the client repository for the configured backend"""
+        backend = self._config["database"]["client_repository"]
+        
+        if backend == "supabase":
+            return SupabaseClientRepository(connection=self.supabase_connection())
+        if backend == "optimized":
+            return OptimizedClientRepository(
+                connection=OptimizedSupabaseConnection(
+                    url=self._config["supabase"]["url"],
+                    key=self._config["supabase"]["service_key"]
+                )
+            )
+        if backend == "postgrest":
+            return AsyncPostgrestClientRepository(connection=self.postgrest_connection())
+        
+        raise ValueError(f"Unknown client repository backend: {backend}")
+    
+    def client_prefix_index(self) -> ClientPrefixIndex:
+        """Get the in-process client autocomplete index"""
+        return self._get_or_create("client_prefix_index", self._create_client_prefix_index)
+    
+    def _create_client_prefix_index(self) -> ClientPrefixIndex:
+        """Build the prefix index and subscribe it to client events"""
+        index = ClientPrefixIndex(repository=self.client_repository())
+        
+        publisher = self.event_publisher()
+        if hasattr(publisher, "register_handler"):
+            for event_type in INDEXED_EVENTS:
+                publisher.register_handler(event_type, index.handle_event)
+        
+        return index
+    
+    def client_cache(self) -> ClientIdentityCache:
+        """Get the client identity cache"""
+        return self._get_or_create("client_cache", self._create_client_cache)
+    
+    def _create_client_cache(self) -> ClientIdentityCache:
+        """Build the client cache and subscribe it to client events"""
+        cache = ClientIdentityCache()
+        
+        publisher = self.event_publisher()
+        if hasattr(publisher, "register_handler"):
+            for event_type in CLIENT_EVENTS:
+                publisher.register_handler(event_type, cache.handle_event)
+        
+        return cache
     
     # Use Case Layer
     
@@ -96,18 +169,41 @@ class Container:
         return self._get_or_create(
             "create_client_use_case",
             lambda: CreateClientUseCase(
+                client_repository=self.client_repository(),
+                event_publisher=self.event_publisher(),
+                logger=self.logger(),
+                client_cache=self.client_cache()
+            )
+        )
+    
+    def bulk_create_clients_use_case(self) -> BulkCreateClientsUseCase:
+        """Get bulk create clients use case"""
+        return self._get_or_create(
+            "bulk_create_clients_use_case",
+            lambda: BulkCreateClientsUseCase(
                 client_repository=self.client_repository(),
                 event_publisher=self.event_publisher(),
                 logger=self.logger()
             )
         )
     
+    def export_clients_use_case(self) -> ExportClientsUseCase:
+        """Get export clients use case"""
+        return self._get_or_create(
+            "export_clients_use_case",
+            lambda: ExportClientsUseCase(
+                client_repository=self.client_repository(),
+                logger=self.logger()
+            )
+        )
+    
     def get_client_use_case(self) -> GetClientUseCase:
         """Get client use case"""
         return self._get_or_create(
             "get_client_use_case",
             lambda: GetClientUseCase(
-                client_repository=self.client_repository()
+                client_repository=self.client_repository(),
+                client_cache=self.client_cache()
             )
         )
     
@@ -118,7 +214,8 @@ class Container:
             lambda: UpdateClientUseCase(
                 client_repository=self.client_repository(),
                 event_publisher=self.event_publisher(),
-                logger=self.logger()
+                logger=self.logger(),
+                client_cache=self.client_cache()
             )
         )
     
@@ -140,6 +237,13 @@ class Container:
             )
         )
     
+    async def shutdown(self) -> None:
+        """Release pooled resources held by infrastructure services"""
+        connection = self._instances.get("postgrest_connection")
+        if connection is not None:
+            await connection.aclose()
+        close_cache()
+    
     def reset(self):
         """Reset all instances (useful for testing)"""
         self._instances.clear()
@@ -9,9 +9,10 @@ from fastapi import Depends
 from typing import Annotated
 
 from .container import get_container, Container
-from ...infrastructure.database import SupabaseClientRepository
+from ...application.interfaces import IClientRepository
 from ...infrastructure.monitoring import Logger
 from ...infrastructure.messaging import EventPublisher
+from ...infrastructure.search import ClientPrefixIndex
 from ...application.use_cases import (
     CreateClientUseCase,
     GetClientUseCase,
@@ -30,11 +31,18 @@ def get_container_dependency() -> Container:
 
 def get_client_repository(
     container: Annotated[Container, Depends(get_container_dependency)]
-) -> SupabaseClientRepository:
+) -> IClientRepository:
     """Get client repository dependency"""
     return container.client_repository()
 
 
+def get_client_prefix_index(
+    container: Annotated[Container, Depends(get_container_dependency)]
+) -> ClientPrefixIndex:
+    """Get client autocomplete index dependency"""
+    return container.client_prefix_index()
+
+
 def get_logger(
     container: Annotated[Container, Depends(get_container_dependency)]
 ) -> Logger:
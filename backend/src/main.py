@@ -9,13 +9,17 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+import math
 import time
 import os
 
 from .interfaces.api import clients, health, mcp, performance, optimized_clients
+from .interfaces.api.conditional import conditional_get
+from .interfaces.api.deadlines import enforce_request_deadline
+from .interfaces.api.responses import FastJSONResponse
 from .interfaces.dependencies import get_container
 from .domain.exceptions import DomainException
+from .infrastructure.database.resilience import CircuitOpenError
 
 
 @asynccontextmanager
@@ -39,6 +43,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 NEXUS-CORE shutting down...")
+    await container.shutdown()
 
 
 def create_app() -> FastAPI:
@@ -56,6 +61,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=FastJSONResponse,
         lifespan=lifespan
     )
     
@@ -91,6 +97,12 @@ def setup_middleware(app: FastAPI) -> None:
             allowed_hosts=["api.ngxperformance.com", "*.ngxperformance.com"]
         )
     
+    # Per-request time budget; registered first so timing and logging see the 504
+    app.middleware("http")(enforce_request_deadline)
+    
+    # ETags and 304s for read endpoints (see ROUTE_CACHE_CONTROL)
+    app.middleware("http")(conditional_get)
+    
     # Request timing middleware
     @app.middleware("http")
     async def add_process_time_header(request: Request, call_next):
@@ -148,7 +160,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
             path=request.url.path
         )
         
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=400,
             content={
                 "error": "Domain Error",
@@ -158,6 +170,25 @@ def setup_exception_handlers(app: FastAPI) -> None:
             }
         )
     
+    @app.exception_handler(CircuitOpenError)
+    async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+        """Fail fast while the database circuit is open"""
+        container = get_container()
+        logger = container.logger()
+        
+        logger.warning(f"Circuit open: {exc.message}", details=exc.details, path=request.url.path)
+        
+        return FastJSONResponse(
+            status_code=503,
+            headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+            content={
+                "error": "Service Unavailable",
+                "message": exc.message,
+                "error_code": exc.error_code,
+                "details": exc.details
+            }
+        )
+    
     @app.exception_handler(ValueError)
     async def value_error_handler(request: Request, exc: ValueError):
         """Handle value errors"""
@@ -166,7 +197,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
         
         logger.warning(f"Validation error: {str(exc)}", path=request.url.path)
         
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=400,
             content={
                 "error": "Validation Error",
@@ -177,7 +208,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
         """Handle HTTP exceptions"""
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": "HTTP Error",
@@ -198,7 +229,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
             exc_info=True
         )
         
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={
                 "error": "Internal Server Error",
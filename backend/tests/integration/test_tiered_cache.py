@@ -0,0 +1,184 @@
+"""
+Integration tests for the two-tier cache, with two workers sharing one
+in-process fake Redis server
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.cache import MemoryCache, ResourceVersions
+from src.infrastructure.cache.redis_backend import RedisCache
+from src.infrastructure.cache.tiered import TieredCache
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class GatedRedis:
+    """Redis client whose reads block while the gate is closed"""
+
+    def __init__(self, client):
+        self._client = client
+        self.gate = threading.Event()
+        self.gate.set()
+        self.reading = threading.Event()
+
+    def get(self, *args, **kwargs):
+        self.reading.set()
+        self.gate.wait(timeout=5)
+        return self._client.get(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def wait_for(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def workers(server):
+    caches = [
+        TieredCache(MemoryCache(), RedisCache(fakeredis.FakeRedis(server=server)), resubscribe_delay=0.05)
+        for _ in range(2)
+    ]
+    for cache in caches:
+        cache.start()
+    assert wait_for(lambda: all(cache.subscribed for cache in caches))
+    yield caches
+    for cache in caches:
+        cache.close()
+
+
+@pytest.mark.integration
+class TestTieredCache:
+    """Test TieredCache"""
+
+    def test_second_worker_is_served_from_l2_then_l1(self, workers):
+        first, second = workers
+        first.set("k", {"rows": [1]}, ttl=60, tags=["table:clients"], namespace="query")
+        first.flush()
+
+        assert second.get("k", "query") == {"rows": [1]}
+        assert second.get("k", "query") == {"rows": [1]}
+
+        stats = second.namespace_stats("query")
+        assert (stats["l1_hits"], stats["l2_hits"], stats["misses"]) == (1, 1, 0)
+        assert stats["hit_rate"] == 100.0
+        assert second.stats()["tiers"]["l1_hit_rate"] == 50.0
+
+    def test_invalidation_reaches_the_other_workers_l1(self, workers):
+        first, second = workers
+        first.set("k", "v", ttl=60, tags=["table:clients"], namespace="query")
+        first.flush()
+        second.get("k", "query")
+        assert second.l1.get("k", "query") == "v"
+
+        first.invalidate_tags("table:clients")
+
+        assert wait_for(lambda: second.l1.get("k", "query") is None)
+        assert second.get("k", "query") is None
+        assert second.stats()["invalidations_received"] == 1
+
+    def test_set_if_absent_keeps_the_first_workers_value(self, workers):
+        first, second = workers
+
+        assert first.setdefault("k", "mine", ttl=60) == "mine"
+        assert second.setdefault("k", "theirs", ttl=60) == "mine"
+        assert second.l1.get("k") == "mine"
+
+    def test_falls_back_to_l1_when_redis_is_down(self, server):
+        cache = TieredCache(MemoryCache(), RedisCache(fakeredis.FakeRedis(server=server)))
+        server.connected = False
+
+        cache.set("k", "v", ttl=60)
+        cache.flush()
+
+        assert cache.get("k") == "v"
+        assert cache.invalidate_tags("anything") == 0
+        assert cache.stats()["l2_available"] is False
+
+
+@pytest.mark.integration
+def test_redis_tag_invalidation_drops_every_tagged_entry(server):
+    client = fakeredis.FakeRedis(server=server)
+    cache = RedisCache(client)
+    for n in range(5):
+        cache.set(f"k{n}", n, ttl=60, tags=["entity:clients:1"], namespace="query" if n % 2 else "clients")
+    cache.set("other", "kept", ttl=60, tags=["entity:clients:2"])
+
+    assert cache.invalidate_tags("entity:clients:1", "entity:clients:3") == 5
+
+    assert [cache.get(f"k{n}", "query" if n % 2 else "clients") for n in range(5)] == [None] * 5
+    assert cache.get("other") == "kept"
+    assert not client.exists("nexus:cache:t:entity:clients:1")
+    assert cache.namespace_stats("query")["invalidations"] == 2
+
+
+@pytest.mark.integration
+class TestTieredCacheOnTheEventLoop:
+    """Test that TieredCache never waits for Redis on the event loop"""
+
+    @pytest.mark.asyncio
+    async def test_aget_reads_l2_off_the_loop(self, workers):
+        first, second = workers
+        first.set("k", "v", ttl=60)
+        first.flush()
+
+        assert await second.aget("k") == "v"
+        assert second.namespace_stats()["l2_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_on_the_loop_misses_then_refills_l1(self, workers):
+        first, second = workers
+        first.set("k", "v", ttl=60)
+        first.flush()
+
+        assert second.get("k") is None
+        second.flush()
+        assert second.get("k") == "v"
+        assert second.namespace_stats()["l1_hits"] == 1
+        assert second.stats()["l1_refills"] == 1
+
+    @pytest.mark.asyncio
+    async def test_read_queued_before_an_invalidation_does_not_refill_l1(self, server):
+        redis = GatedRedis(fakeredis.FakeRedis(server=server))
+        cache = TieredCache(MemoryCache(), RedisCache(redis))
+        cache.set("k", "old", ttl=60, tags=["table:clients"])
+        cache.flush()
+        cache.l1.clear()
+
+        redis.gate.clear()
+        redis.reading.clear()
+        read = asyncio.ensure_future(cache.aget("k"))
+        assert await asyncio.to_thread(redis.reading.wait, 3)
+        cache.invalidate_tags("table:clients")
+        redis.gate.set()
+
+        assert await read == "old"
+        cache.flush()
+        assert cache.l2.get("k") is None
+        assert cache.l1.get("k") is None
+        assert cache.get("k") is None
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_workers_mint_one_version_token(self, workers):
+        first, second = (ResourceVersions(backend=cache) for cache in workers)
+
+        tokens = await asyncio.gather(first.atoken("catalog"), second.atoken("catalog"))
+
+        assert tokens[0] == tokens[1]
+        assert await second.atoken("catalog") == tokens[0]
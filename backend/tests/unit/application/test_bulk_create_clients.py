@@ -0,0 +1,111 @@
+"""
+Unit tests for BulkCreateClientsUseCase
+"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from src.application.use_cases.client import BulkCreateClientsUseCase
+from src.application.dto.client_dto import ClientCreateDTO
+from src.domain.exceptions import DomainException
+
+
+def make_dto(name, email, program_type="PRIME"):
+    """Valid create DTO"""
+    return ClientCreateDTO(name=name, email=email, program_type=program_type)
+
+
+@pytest.fixture
+def mock_repository():
+    """Repository where nothing exists yet and every upsert succeeds"""
+    repository = Mock()
+    repository.find_existing_emails = AsyncMock(return_value=set())
+    repository.save_batch = AsyncMock()
+    return repository
+
+
+@pytest.fixture
+def mock_event_publisher():
+    publisher = Mock()
+    publisher.publish_batch = AsyncMock()
+    return publisher
+
+
+def make_use_case(repository, publisher, **kwargs):
+    return BulkCreateClientsUseCase(repository, publisher, Mock(), **kwargs)
+
+
+class TestBulkCreateClientsUseCase:
+    """Test BulkCreateClientsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_saves_in_chunks_and_publishes_once(self, mock_repository, mock_event_publisher):
+        use_case = make_use_case(mock_repository, mock_event_publisher, chunk_rows=2)
+        dtos = [make_dto(f"Client {i}", f"client{i}@example.com") for i in range(5)]
+
+        result = await use_case.execute(dtos)
+
+        assert [client.email for client in result.created] == [dto.email for dto in dtos]
+        assert result.errors == []
+        assert mock_repository.find_existing_emails.await_count == 1
+        assert [len(call.args[0]) for call in mock_repository.save_batch.await_args_list] == [2, 2, 1]
+        events = mock_event_publisher.publish_batch.await_args.args[0]
+        assert [event["event_type"] for event in events] == ["ClientCreated"] * 5
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_bounded_by_payload_size(self, mock_repository, mock_event_publisher):
+        use_case = make_use_case(mock_repository, mock_event_publisher, chunk_bytes=1000)
+        dtos = [make_dto(f"Client {i}", f"client{i}@example.com") for i in range(6)]
+
+        await use_case.execute(dtos)
+
+        assert mock_repository.save_batch.await_count > 1
+
+    @pytest.mark.asyncio
+    async def test_reports_invalid_duplicate_and_existing_items(self, mock_repository, mock_event_publisher):
+        mock_repository.find_existing_emails = AsyncMock(return_value={"taken@example.com"})
+        use_case = make_use_case(mock_repository, mock_event_publisher)
+        dtos = [
+            make_dto("Ana Ruiz", "ana@example.com"),
+            make_dto("Bad Email", "not-an-email"),
+            make_dto("Ana Again", "ANA@example.com"),
+            make_dto("Taken", "taken@example.com"),
+            make_dto("Wrong Program", "wrong@example.com", program_type="YOGA"),
+        ]
+
+        result = await use_case.execute(dtos)
+
+        assert [client.email for client in result.created] == ["ana@example.com"]
+        assert [(error["index"], error["error_code"]) for error in result.errors] == [
+            (1, "DomainException"),
+            (2, "DUPLICATE_IN_BATCH"),
+            (3, "CLIENT_ALREADY_EXISTS"),
+            (4, "VALIDATION_ERROR"),
+        ]
+        assert result.summary()["success_rate"] == 20.0
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_is_split_to_isolate_bad_rows(self, mock_repository, mock_event_publisher):
+        async def save_batch(clients):
+            if any(str(client.email) == "conflict@example.com" for client in clients):
+                raise DomainException("duplicate key value violates unique constraint")
+
+        mock_repository.save_batch = AsyncMock(side_effect=save_batch)
+        use_case = make_use_case(mock_repository, mock_event_publisher)
+        dtos = [make_dto(f"Client {i}", f"client{i}@example.com") for i in range(4)]
+        dtos.insert(2, make_dto("Conflict", "conflict@example.com"))
+
+        result = await use_case.execute(dtos)
+
+        assert len(result.created) == 4
+        assert [(error["index"], error["error_code"]) for error in result.errors] == [(2, "SAVE_FAILED")]
+
+    @pytest.mark.asyncio
+    async def test_rejects_batches_over_the_limit(self, mock_repository, mock_event_publisher):
+        use_case = make_use_case(mock_repository, mock_event_publisher, max_items=2)
+
+        with pytest.raises(DomainException) as exc_info:
+            await use_case.execute([make_dto(f"Client {i}", f"c{i}@example.com") for i in range(3)])
+
+        assert exc_info.value.error_code == "BATCH_TOO_LARGE"
+        mock_repository.save_batch.assert_not_called()
@@ -0,0 +1,70 @@
+"""
+Unit tests for request deadlines
+"""
+
+import asyncio
+
+import pytest
+
+from src.application.deadline import (
+    DeadlineExceeded,
+    check_deadline,
+    current_deadline,
+    deadline_guard,
+    deadline_scope,
+)
+
+
+class TestDeadline:
+    """Test deadline propagation and enforcement"""
+
+    @pytest.mark.asyncio
+    async def test_guard_is_a_no_op_outside_a_request(self):
+        assert current_deadline() is None
+
+        async with deadline_guard("clients.find"):
+            await asyncio.sleep(0)
+        check_deadline("clients.find")
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_cancelled_and_reported(self):
+        cancelled = asyncio.Event()
+
+        async def slow_query():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with deadline_scope(0.05, route="/api/v1/mcp/clients/search") as deadline:
+            async with deadline_guard("clients.count"):
+                pass
+
+            with pytest.raises(DeadlineExceeded) as exc_info:
+                async with deadline_guard("clients.search"):
+                    await slow_query()
+
+        assert cancelled.is_set()
+        assert exc_info.value.error_code == "DEADLINE_EXCEEDED"
+        report = exc_info.value.details
+        assert report["exceeded_at"] == "clients.search"
+        assert report["completed_calls"] == 1
+        assert report["last_completed"][0].startswith("clients.count")
+        assert deadline.exceeded
+
+    @pytest.mark.asyncio
+    async def test_spent_budget_refuses_new_calls_in_spawned_tasks(self):
+        calls = []
+
+        async def query():
+            async with deadline_guard("clients.find"):
+                calls.append("ran")
+
+        with deadline_scope(0.01):
+            await asyncio.sleep(0.02)
+            with pytest.raises(DeadlineExceeded):
+                await asyncio.gather(asyncio.create_task(query()))
+
+        assert calls == []
+        assert current_deadline() is None
@@ -6,7 +6,7 @@ import pytest
 from datetime import datetime
 from unittest.mock import Mock
 
-from src.domain.entities.client import Client, ClientId, ClientStatus, ProgramType
+from src.domain.entities.client import Client, ClientId, ClientRecord, ClientStatus, ProgramType
 from src.domain.value_objects import Email, PhoneNumber
 from src.domain.exceptions import DomainException
 
@@ -157,4 +157,45 @@ class TestClientEntity:
         assert client.notes == "Initial notes"
         
         client.add_note("Additional note")
-        assert "Additional note" in client.notes
\ No newline at end of file
+        assert "Additional note" in client.notes
+
+
+class TestClientRecord:
+    """Test the compact ClientRecord snapshot"""
+    
+    @pytest.fixture
+    def client(self):
+        client = Client.create(
+            name="Jane Roe",
+            email=Email("jane@example.com"),
+            program_type=ProgramType.HYBRID,
+            phone=PhoneNumber("+1234567890")
+        )
+        client.update_metadata("source", "referral")
+        return client
+    
+    def test_round_trip_preserves_entity(self, client):
+        """Test converting to a record and back"""
+        record = ClientRecord.from_entity(client)
+        
+        assert record.to_entity().to_dict() == client.to_dict()
+        assert record.email == "jane@example.com"
+        assert record.phone == "+1234567890"
+    
+    def test_record_is_slotted_and_immutable(self, client):
+        """Test records carry no __dict__ and reject changes"""
+        record = ClientRecord.from_entity(client)
+        
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.name = "Changed"
+    
+    def test_snapshot_is_isolated_from_entity_changes(self, client):
+        """Test later entity mutations do not leak into the record"""
+        record = ClientRecord.from_entity(client)
+        
+        client.update_metadata("source", "ads")
+        restored = record.to_entity()
+        restored.update_metadata("tier", "gold")
+        
+        assert record.metadata == {"source": "referral"}
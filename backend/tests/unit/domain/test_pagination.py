@@ -0,0 +1,37 @@
+"""
+Unit tests for keyset pagination cursors
+"""
+
+import pytest
+
+from src.domain.repositories.pagination import Page, PageCursor
+from src.domain.exceptions import DomainException
+
+
+class TestPageCursor:
+    """Test PageCursor encoding"""
+    
+    def test_round_trip(self):
+        cursor = PageCursor("created_at", "2025-01-01T12:00:00+00:00", "abc")
+        
+        token = cursor.encode()
+        
+        assert "=" not in token
+        assert PageCursor.decode(token) == cursor
+    
+    def test_malformed_token_is_rejected(self):
+        with pytest.raises(DomainException) as exc_info:
+            PageCursor.decode("not-a-cursor")
+        
+        assert exc_info.value.error_code == "INVALID_CURSOR"
+    
+    def test_cursor_for_other_sort_is_rejected(self):
+        token = PageCursor("updated_at", "2025-01-01T12:00:00", "abc").encode()
+        
+        with pytest.raises(DomainException):
+            PageCursor.decode(token, "created_at")
+
+
+def test_page_has_more_follows_next_cursor():
+    assert Page(items=[1], next_cursor="x").has_more
+    assert not Page(items=[1]).has_more
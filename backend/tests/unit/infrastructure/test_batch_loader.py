@@ -0,0 +1,117 @@
+"""
+Unit tests for the DataLoader-style batch loader
+"""
+
+import asyncio
+
+import pytest
+
+from src.application.deadline import current_deadline, deadline_scope
+from src.domain.entities.client import Client, ProgramType
+from src.domain.value_objects import Email
+from src.infrastructure.database.batch_loader import BatchLoader
+
+
+class RecordingBatch:
+    """Batch function that records the keys of every call"""
+
+    def __init__(self, known=None, error=None):
+        self.calls = []
+        self.known = known
+        self.error = error
+
+    async def __call__(self, keys):
+        self.calls.append(keys)
+        if self.error:
+            raise self.error
+        return {key: f"value-{key}" for key in keys if self.known is None or key in self.known}
+
+
+class TestBatchLoader:
+    """Test BatchLoader"""
+
+    @pytest.mark.asyncio
+    async def test_same_tick_loads_are_one_batch(self):
+        batch = RecordingBatch(known={"a", "b"})
+        loader = BatchLoader(batch, name="test")
+
+        results = await asyncio.gather(*[loader.load(key) for key in ["a", "b", "c", "a"]])
+
+        assert results == ["value-a", "value-b", None, "value-a"]
+        assert batch.calls == [["a", "b", "c"]]
+        stats = loader.stats()
+        assert stats["loads"] == 4
+        assert stats["batches"] == 1
+        assert stats["keys_loaded"] == 3
+        assert stats["round_trips_saved"] == 3
+
+    @pytest.mark.asyncio
+    async def test_sequential_loads_are_separate_batches(self):
+        batch = RecordingBatch()
+        loader = BatchLoader(batch, name="test")
+
+        await loader.load("a")
+        await loader.load("b")
+
+        assert batch.calls == [["a"], ["b"]]
+
+    @pytest.mark.asyncio
+    async def test_batches_are_split_at_max_size(self):
+        batch = RecordingBatch()
+        loader = BatchLoader(batch, max_batch_size=2, name="test")
+
+        await asyncio.gather(*[loader.load(key) for key in "abcde"])
+
+        assert batch.calls == [["a", "b"], ["c", "d"], ["e"]]
+
+    @pytest.mark.asyncio
+    async def test_window_collects_staggered_loads(self):
+        batch = RecordingBatch()
+        loader = BatchLoader(batch, window=0.02, name="test")
+
+        async def delayed(key):
+            await asyncio.sleep(0.005)
+            return await loader.load(key)
+
+        await asyncio.gather(loader.load("a"), delayed("b"))
+
+        assert batch.calls == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_batch_error_reaches_every_caller(self):
+        loader = BatchLoader(RecordingBatch(error=RuntimeError("down")), name="test")
+
+        results = await asyncio.gather(
+            loader.load("a"), loader.load("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert loader.stats()["batch_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_callers_of_one_key_get_their_own_client(self):
+        client = Client.create(name="Ana", email=Email("ana@example.com"), program_type=ProgramType.PRIME)
+
+        async def load(keys):
+            return {key: client for key in keys}
+
+        loader = BatchLoader(load, name="test")
+        first, second = await asyncio.gather(loader.load("a"), loader.load("a"))
+
+        assert first is not second
+        first.name = "Changed"
+        assert second.name == "Ana"
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_outside_the_callers_deadline(self):
+        seen = []
+
+        async def load(keys):
+            seen.append(current_deadline())
+            return {}
+
+        loader = BatchLoader(load, name="test")
+        with deadline_scope(5.0):
+            await loader.load("a")
+
+        assert seen == [None]
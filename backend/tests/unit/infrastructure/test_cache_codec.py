@@ -0,0 +1,58 @@
+"""
+Unit tests for the JSON codec of values cached in Redis
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import NamedTuple
+
+import pytest
+from pydantic import BaseModel
+
+from src.domain.entities.client import Client, ClientStatus, ProgramType
+from src.domain.value_objects import Email
+from src.infrastructure.cache.codec import CodecError, decode, encode
+from src.infrastructure.database.performance import _from_cached, _to_cached
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+class Summary(BaseModel):
+    status: ClientStatus
+    total: Decimal
+    at: datetime
+
+
+def test_round_trips_what_json_cannot_express():
+    value = {
+        "when": datetime(2025, 1, 1, 12, 30),
+        "amount": Decimal("10.50"),
+        "pair": (1, "a"),
+        "ids": {3, 4},
+        "by_status": {ClientStatus.ACTIVE: 2},
+        "point": Point(1, 2),
+        "__t": "not a type tag",
+    }
+
+    assert decode(encode(value)) == value
+
+
+def test_round_trips_client_snapshots_and_models():
+    client = Client.create(name="Ana", email=Email("ana@example.com"), program_type=ProgramType.PRIME)
+    summary = Summary(status=ClientStatus.ACTIVE, total=Decimal("3"), at=datetime(2025, 1, 1))
+
+    snapshot = decode(encode(_to_cached([client])))
+    assert _from_cached(snapshot)[0].email == client.email
+    assert decode(encode(summary)) == summary
+
+
+def test_refuses_types_it_cannot_rebuild_safely():
+    with pytest.raises(CodecError):
+        encode(object())
+    with pytest.raises(CodecError):
+        decode(b'{"__t": "os.system", "v": "echo pwned"}')
+    with pytest.raises(CodecError):
+        decode(b"\x80\x04pickled")
@@ -0,0 +1,197 @@
+"""
+Unit tests for the cached decorator, key derivation and Redis backend
+"""
+
+from datetime import date
+
+import pytest
+from fastapi import BackgroundTasks, FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.infrastructure.cache import (
+    MemoryCache,
+    Uncacheable,
+    cached,
+    cached_function_stats,
+    canonical,
+    make_key,
+)
+
+
+class Filters(BaseModel):
+    program: str
+    since: date
+
+
+class TestKeys:
+    """Test cache key derivation"""
+
+    def test_equal_arguments_give_equal_keys(self):
+        first = make_key("f", (Filters(program="PRIME", since=date(2025, 1, 1)),), {"tags": {"b", "a"}})
+        second = make_key("f", (Filters(program="PRIME", since=date(2025, 1, 1)),), {"tags": {"a", "b"}})
+
+        assert first == second
+        assert first != make_key("g", (Filters(program="PRIME", since=date(2025, 1, 1)),), {"tags": {"a", "b"}})
+
+    def test_objects_without_a_value_form_are_uncacheable(self):
+        with pytest.raises(Uncacheable):
+            canonical(object())
+
+
+class TestCachedDecorator:
+    """Test the cached decorator"""
+
+    def test_sync_results_are_cached_per_arguments(self):
+        calls = []
+
+        @cached(ttl=60, backend=MemoryCache())
+        def load(program):
+            calls.append(program)
+            return [program]
+
+        assert load("PRIME") == ["PRIME"]
+        assert load("PRIME") == ["PRIME"]
+        assert load("LONGEVITY") == ["LONGEVITY"]
+        assert calls == ["PRIME", "LONGEVITY"]
+
+    @pytest.mark.asyncio
+    async def test_async_results_are_cached_and_invalidated(self):
+        calls = []
+        store = MemoryCache()
+
+        @cached(ttl=60, backend=store)
+        async def load(filters: Filters):
+            calls.append(filters.program)
+            return None
+
+        filters = Filters(program="PRIME", since=date(2025, 1, 1))
+        assert await load(filters) is None
+        assert await load(filters) is None
+        assert len(calls) == 1
+        assert store.namespace_stats(load.cache_namespace)["hits"] == 1
+
+        assert load.invalidate() == 1
+        await load(filters)
+        assert len(calls) == 2
+
+    def test_uncacheable_arguments_run_uncached(self):
+        calls = []
+
+        @cached(backend=MemoryCache())
+        def describe(session):
+            calls.append(session)
+            return "ok"
+
+        session = object()
+        describe(session)
+        describe(session)
+
+        assert len(calls) == 2
+
+    def test_tagged_results_are_dropped_by_tag(self):
+        store = MemoryCache()
+        calls = []
+
+        @cached(tags=["exercises"], backend=store)
+        def categories():
+            calls.append(1)
+            return ["strength"]
+
+        categories()
+        store.invalidate_tags("exercises")
+        categories()
+
+        assert len(calls) == 2
+
+
+    def test_positional_keyword_and_default_arguments_share_an_entry(self):
+        calls = []
+
+        @cached(backend=MemoryCache())
+        def load(program, limit=10):
+            calls.append(program)
+            return program
+
+        load("PRIME")
+        load("PRIME", 10)
+        load(program="PRIME", limit=10)
+
+        assert len(calls) == 1
+
+    def test_excluded_parameters_and_model_fields_do_not_change_the_key(self):
+        class Query(BaseModel):
+            program: str
+            request_id: str
+
+        calls = []
+
+        @cached(exclude=["trace_id", "query.request_id"], backend=MemoryCache())
+        def search(query: Query, trace_id: str):
+            calls.append(query.request_id)
+            return query.program
+
+        search(Query(program="PRIME", request_id="a"), trace_id="1")
+        search(Query(program="PRIME", request_id="b"), trace_id="2")
+        search(Query(program="LONGEVITY", request_id="c"), trace_id="3")
+
+        assert calls == ["a", "c"]
+
+    def test_endpoint_is_cached_ignoring_request_and_background_tasks(self):
+        calls = []
+        app = FastAPI()
+
+        @app.post("/metrics")
+        @cached(ttl=60, backend=MemoryCache())
+        async def metrics(filters: Filters, request: Request, background_tasks: BackgroundTasks):
+            calls.append(filters.program)
+            return {"program": filters.program}
+
+        client = TestClient(app)
+        body = {"program": "PRIME", "since": "2025-01-01"}
+        responses = [client.post("/metrics", json=body) for _ in range(3)]
+
+        assert [response.json() for response in responses] == [{"program": "PRIME"}] * 3
+        assert calls == ["PRIME"]
+        stats = cached_function_stats()[metrics.cache_namespace]
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+
+
+class TestRedisCache:
+    """Test RedisCache against an in-process fake Redis"""
+
+    @pytest.fixture
+    def cache(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        from src.infrastructure.cache.redis_backend import RedisCache
+
+        return RedisCache(fakeredis.FakeRedis())
+
+    def test_round_trip_tags_and_namespaces(self, cache):
+        cache.set("a", {"rows": [1]}, tags=["table:clients"], namespace="query")
+        cache.set("b", [2], namespace="query")
+        cache.set("a", "other", namespace="logs")
+
+        assert cache.get("a", "query") == {"rows": [1]}
+        assert cache.invalidate_tags("table:clients") == 1
+        assert cache.get("a", "query") is None
+        assert cache.clear("query") == 1
+        assert cache.get("a", "logs") == "other"
+        assert cache.namespace_stats("query")["invalidations"] == 2
+
+    def test_redis_errors_degrade_to_misses_and_back_off(self, cache):
+        from redis.exceptions import ConnectionError
+
+        class Broken:
+            def __getattr__(self, name):
+                def fail(*args, **kwargs):
+                    raise ConnectionError("down")
+                return fail
+
+        cache._client = Broken()
+
+        assert cache.get("a", default="fallback") == "fallback"
+        assert cache.set("a", 1) is False
+        # The failed get marks Redis unavailable, so the set does not try it
+        assert cache.stats()["errors"] == 1
+        assert cache.available is False
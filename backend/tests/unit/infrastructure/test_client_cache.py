@@ -0,0 +1,145 @@
+"""
+Unit tests for the client identity cache
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.dto.client_dto import ClientCreateDTO, ClientUpdateDTO
+from src.application.use_cases.client import (
+    CreateClientUseCase,
+    DeleteClientUseCase,
+    GetClientUseCase,
+    UpdateClientUseCase
+)
+from src.domain.entities.client import Client, ProgramType
+from src.domain.exceptions import ClientAlreadyExists, ClientNotFound
+from src.domain.value_objects import Email
+from src.infrastructure.cache import MemoryCache, NegativeCache
+from src.infrastructure.database.client_cache import CLIENT_EVENTS, ClientIdentityCache
+from src.infrastructure.messaging import InMemoryEventPublisher
+
+
+class CountingRepository:
+    """Repository over a dict that counts the reads reaching it"""
+
+    def __init__(self):
+        self.clients = {}
+        self.reads = 0
+
+    async def find_by_id(self, client_id):
+        self.reads += 1
+        return self.clients.get(str(client_id))
+
+    async def find_by_email(self, email):
+        self.reads += 1
+        return next((c for c in self.clients.values() if c.email == email), None)
+
+    async def exists_by_email(self, email):
+        return await self.find_by_email(email) is not None
+
+    async def save(self, client):
+        self.clients[str(client.id)] = client
+        return client
+
+    async def delete(self, client_id):
+        return self.clients.pop(str(client_id), None) is not None
+
+
+@pytest.fixture
+def cache():
+    backend = MemoryCache()
+    return ClientIdentityCache(backend=backend, negative=NegativeCache(backend=backend))
+
+
+@pytest.fixture
+def repository():
+    return CountingRepository()
+
+
+@pytest.fixture
+def publisher(cache):
+    publisher = InMemoryEventPublisher(logger=Mock())
+    for event_type in CLIENT_EVENTS:
+        publisher.register_handler(event_type, cache.handle_event)
+    return publisher
+
+
+def test_lookups_by_id_and_normalized_email_return_copies(cache):
+    client = Client.create(name="Ana", email=Email("ana@example.com"), program_type=ProgramType.PRIME)
+    cache.put(client)
+
+    by_id = cache.get_by_id(str(client.id))
+    by_email = cache.get_by_email("  ANA@Example.com ")
+    assert by_id.name == by_email.name == "Ana"
+    assert by_id is not by_email
+
+    by_id.name = "Changed"
+    assert cache.get_by_id(str(client.id)).name == "Ana"
+
+    cache.invalidate(str(client.id))
+    assert cache.get_by_id(str(client.id)) is None
+    assert cache.get_by_email("ana@example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_writes_populate_and_reads_skip_the_repository(cache, repository, publisher):
+    created = await CreateClientUseCase(repository, publisher, Mock(), client_cache=cache).execute(
+        ClientCreateDTO(name="Ana", email="ana@example.com", program_type="PRIME")
+    )
+    reads = repository.reads
+
+    get_client = GetClientUseCase(repository, client_cache=cache)
+    assert (await get_client.execute(created.id)).email == "ana@example.com"
+    assert repository.reads == reads
+
+    # A cached client with the email settles the duplicate check
+    with pytest.raises(ClientAlreadyExists):
+        await CreateClientUseCase(repository, publisher, Mock(), client_cache=cache).execute(
+            ClientCreateDTO(name="Other", email="ANA@example.com", program_type="LONGEVITY")
+        )
+    assert repository.reads == reads
+
+    await UpdateClientUseCase(repository, publisher, Mock(), client_cache=cache).execute(
+        created.id, ClientUpdateDTO(email="ana.new@example.com")
+    )
+    assert cache.get_by_email("ana@example.com") is None
+    assert cache.get_by_email("ana.new@example.com").id.value == created.id
+
+    await DeleteClientUseCase(repository, publisher, Mock(), client_cache=cache).execute(created.id)
+    assert cache.get_by_id(created.id) is None
+
+
+@pytest.mark.asyncio
+async def test_events_from_other_writers_invalidate(cache, repository, publisher):
+    client = Client.create(name="Ana", email=Email("ana@example.com"), program_type=ProgramType.PRIME)
+    await repository.save(client)
+    get_client = GetClientUseCase(repository, client_cache=cache)
+    await get_client.execute(str(client.id))
+
+    # Another use case (or worker) changes the row and publishes the event
+    client.name = "Ana María"
+    await publisher.publish({"event_type": "ClientUpdated", "client_id": str(client.id)})
+
+    assert (await get_client.execute(str(client.id))).name == "Ana María"
+    assert repository.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_ids_are_remembered_until_created(cache, repository, publisher):
+    get_client = GetClientUseCase(repository, client_cache=cache)
+    client = Client.create(name="Ana", email=Email("ana@example.com"), program_type=ProgramType.PRIME)
+    client_id = str(client.id)
+
+    for _ in range(3):
+        with pytest.raises(ClientNotFound):
+            await get_client.execute(client_id)
+    assert repository.reads == 1
+
+    # Created by another writer: its event forgets the negative entry
+    await repository.save(client)
+    await publisher.publish({"event_type": "ClientCreated", "client_id": client_id})
+
+    assert (await get_client.execute(client_id)).name == "Ana"
+    assert repository.reads == 2
@@ -0,0 +1,121 @@
+"""
+Unit tests for the bounded connection pool
+"""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.database.performance import ConnectionPool, Histogram
+from src.domain.exceptions import DomainException
+
+
+def make_pool(max_connections=2, timeout=1):
+    return ConnectionPool(
+        max_connections=max_connections,
+        connection_timeout=timeout,
+        connection_factory=object,
+        name="test"
+    )
+
+
+class TestHistogram:
+    """Test Histogram"""
+
+    def test_percentiles_and_buckets(self):
+        histogram = Histogram([0.01, 0.1, 1.0])
+        for value in [0.005] * 98 + [0.5, 2.0]:
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 100
+        assert snapshot["p50"] == 0.005
+        assert snapshot["p99"] == 0.5
+        assert snapshot["buckets"] == {"le_0.01": 98, "le_0.1": 0, "le_1": 1, "le_inf": 1}
+
+
+class TestConnectionPool:
+    """Test ConnectionPool"""
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self):
+        pool = make_pool()
+
+        first = await pool.acquire()
+        await pool.release(first)
+        second = await pool.acquire()
+
+        assert first is second
+        assert pool.stats()["created_connections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_never_exceeds_max_connections(self):
+        pool = make_pool(max_connections=3)
+        in_use = 0
+        max_in_use = 0
+
+        async def worker():
+            nonlocal in_use, max_in_use
+            async with pool.get_connection():
+                in_use += 1
+                max_in_use = max(max_in_use, in_use)
+                await asyncio.sleep(0.01)
+                in_use -= 1
+
+        await asyncio.gather(*[worker() for _ in range(20)])
+
+        stats = pool.stats()
+        assert max_in_use == 3
+        assert stats["active_connections"] == 0
+        assert stats["created_connections"] == 3
+        assert stats["acquire_wait_seconds"]["count"] == 20
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_in_fifo_order(self):
+        pool = make_pool(max_connections=1)
+        held = await pool.acquire()
+        order = []
+
+        async def waiter(index):
+            async with pool.get_connection():
+                order.append(index)
+
+        tasks = [asyncio.create_task(waiter(i)) for i in range(5)]
+        await asyncio.sleep(0)
+        assert pool.stats()["waiting"] == 5
+
+        await pool.release(held)
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_acquire_times_out(self):
+        pool = make_pool(max_connections=1)
+        held = await pool.acquire()
+
+        with pytest.raises(DomainException) as exc_info:
+            await pool.acquire(timeout=0.05)
+
+        assert exc_info.value.error_code == "CONNECTION_POOL_TIMEOUT"
+        stats = pool.stats()
+        assert stats["acquire_timeouts"] == 1
+        assert stats["waiting"] == 0
+
+        # The slot is still usable after a waiter gave up
+        await pool.release(held)
+        assert await pool.acquire(timeout=0.05) is held
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        pool = make_pool(max_connections=1)
+        held = await pool.acquire()
+
+        task = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await pool.release(held)
+        assert pool.stats()["active_connections"] == 0
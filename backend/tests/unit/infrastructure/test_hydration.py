@@ -0,0 +1,64 @@
+"""
+Unit tests for bulk client row hydration
+"""
+
+import pytest
+
+from src.domain.entities.client import ClientStatus, ProgramType
+from src.domain.exceptions import DomainException
+from src.infrastructure.database.hydration import hydrate_clients, hydrate_records
+from src.infrastructure.database.supabase import ClientRowMapper
+
+
+def make_row(index, **overrides):
+    """A clients row as PostgREST returns it"""
+    row = {
+        "id": f"00000000-0000-0000-0000-{index:012d}",
+        "name": f"Client {index}",
+        "email": f"client{index}@example.com",
+        "phone": "+34 600 123 456" if index % 2 else None,
+        "program_type": "LONGEVITY",
+        "status": "active",
+        "created_at": "2024-05-01T10:00:00.123456+00:00",
+        "updated_at": "2024-05-01T10:00:00.123456+00:00",
+        "notes": "",
+        "metadata": {"source": "import"},
+    }
+    row.update(overrides)
+    return row
+
+
+class TestHydrateClients:
+    """Test hydrate_clients"""
+
+    def test_matches_the_validating_mapper(self):
+        rows = [make_row(1), make_row(2, updated_at="2024-06-02T08:30:00+00:00", status="paused")]
+
+        clients = hydrate_clients(rows)
+
+        assert clients == [ClientRowMapper()._dict_to_entity(row) for row in rows]
+        assert clients[1].status is ClientStatus.PAUSED
+        assert clients[1].program_type is ProgramType.LONGEVITY
+        assert clients[0].updated_at is clients[0].created_at
+        assert str(clients[0].phone) == "+34 600 123 456"
+
+    def test_hydrated_clients_stay_mutable(self):
+        client = hydrate_clients([make_row(1)])[0]
+
+        client.activate()
+        client.add_note("called back")
+
+        assert "called back" in client.notes
+
+    def test_unknown_enum_value_raises_domain_exception(self):
+        with pytest.raises(DomainException):
+            hydrate_clients([make_row(1, program_type="YOGA")])
+
+    def test_records_match_entities(self):
+        rows = [make_row(1), make_row(2, metadata={}, notes=None)]
+
+        records = hydrate_records(rows)
+
+        assert [record.to_entity() for record in records][0] == hydrate_clients(rows)[0]
+        assert records[1].metadata is None
+        assert records[1].notes == ""
@@ -0,0 +1,133 @@
+"""
+Unit tests for the byte-bounded, tag-indexed cache
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities import ClientRecord, ClientStatus, ProgramType
+from src.infrastructure.cache import MemoryCache, estimate_size
+from src.infrastructure.database.performance import QueryCache, _to_cached, with_performance_monitoring
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_record(client_id="c1"):
+    now = datetime(2025, 1, 1)
+    return ClientRecord(
+        client_id, "Ana Ruiz", "ana@example.com", ProgramType.PRIME, ClientStatus.ACTIVE, now, now
+    )
+
+
+class TestMemoryCache:
+    """Test MemoryCache"""
+
+    def test_evicts_least_recently_used_entries_over_the_byte_budget(self):
+        cache = MemoryCache(max_bytes=300)
+        cache.set("a", "x", size=100)
+        cache.set("b", "x", size=100)
+        cache.set("c", "x", size=100)
+        cache.get("a")
+
+        cache.set("d", "x", size=100)
+
+        assert cache.get("b") is None
+        assert [cache.get(key) for key in ("a", "c", "d")] == ["x", "x", "x"]
+        assert cache.stats()["bytes"] == 300
+        assert cache.namespace_stats()["evictions"] == 1
+
+    def test_value_larger_than_the_budget_is_not_stored(self):
+        cache = MemoryCache(max_bytes=100)
+        cache.set("a", "old", size=10)
+
+        assert cache.set("a", "new", size=101) is False
+        assert cache.get("a") is None
+        assert cache.stats()["bytes"] == 0
+
+    def test_entries_expire_after_their_ttl(self):
+        clock = FakeClock()
+        cache = MemoryCache(default_ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=60)
+
+        clock.now = 11
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.namespace_stats()["expirations"] == 1
+
+    def test_tag_invalidation_only_touches_tagged_entries(self):
+        cache = MemoryCache()
+        cache.set("list", [1, 2], tags=["table:clients", "clients:1", "clients:2"], namespace="query")
+        cache.set("one", 1, tags=["table:clients", "clients:1"], namespace="query")
+        cache.set("other", 3, tags=["table:programs"], namespace="query")
+
+        assert cache.invalidate_tags("clients:2") == 1
+        assert cache.get("one", "query") == 1
+        assert cache.invalidate_tags("table:clients") == 1
+        assert cache.get("other", "query") == 3
+        stats = cache.stats()
+        assert stats["tags"] == 1
+        assert stats["namespaces"]["query"]["invalidations"] == 2
+        assert stats["namespaces"]["query"]["entries"] == 1
+
+    def test_namespaces_keep_separate_keys_and_counters(self):
+        cache = MemoryCache()
+        cache.set("k", "query", namespace="query")
+        cache.set("k", "http", namespace="http")
+
+        assert cache.get("k", "query") == "query"
+        assert cache.get("k", "http") == "http"
+        assert cache.get("missing", "http") is None
+        assert cache.clear("http") == 1
+        assert cache.get("k", "query") == "query"
+        assert cache.namespace_stats("http")["misses"] == 1
+        assert cache.namespace_stats("query")["hit_rate"] == 100.0
+
+    def test_estimate_size_counts_nested_values(self):
+        record = make_record()
+
+        assert estimate_size([record, record]) < 2 * estimate_size(record)
+        assert estimate_size({"rows": [record]}) > estimate_size(record)
+
+
+class TestQueryCache:
+    """Test QueryCache invalidation"""
+
+    def test_invalidate_table_and_entity(self):
+        cache = QueryCache(store=MemoryCache())
+        cache.set("clients", "find", {"args": "('c1',)"}, _to_cached(make_record("c1").to_entity()))
+        cache.set("clients", "search", {"args": "()"}, _to_cached([make_record("c2").to_entity()]))
+        cache.set("programs", "find", {"args": "()"}, ["p"])
+
+        assert cache.invalidate_entity("clients", "c2") == 1
+        assert cache.get("clients", "find", {"args": "('c1',)"}) is not None
+        assert cache.invalidate_table("clients") == 1
+        assert cache.get("programs", "find", {"args": "()"}) == ["p"]
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cached_reads(self):
+        class Repository:
+            def __init__(self):
+                self.rows = ["a"]
+
+            @with_performance_monitoring("qc_test", "find")
+            async def find_all(self):
+                return list(self.rows)
+
+            @with_performance_monitoring("qc_test", "save")
+            async def save(self, row):
+                self.rows.append(row)
+
+        repository = Repository()
+        assert await repository.find_all() == ["a"]
+        await repository.save("b")
+
+        assert await repository.find_all() == ["a", "b"]
@@ -0,0 +1,42 @@
+"""
+Unit tests for the negative result cache
+"""
+
+from src.infrastructure.cache import MemoryCache, NegativeCache, entity_tag, table_tag
+
+
+def test_missing_ids_expire_and_count_per_kind():
+    clock = [0.0]
+    backend = MemoryCache(clock=lambda: clock[0])
+    negative = NegativeCache(backend=backend, ttl=30)
+
+    assert not negative.is_missing("exercises_library", "e1")
+    negative.remember_missing("exercises_library", "e1")
+    assert negative.is_missing("exercises_library", "e1")
+    assert not negative.is_missing("training_programs", "e1")
+
+    clock[0] = 31
+    assert not negative.is_missing("exercises_library", "e1")
+
+    stats = negative.stats()["kinds"]
+    assert stats["exercises_library"] == {
+        "hits": 1, "misses": 2, "remembered": 1, "forgotten": 0, "hit_rate": 33.33
+    }
+    assert stats["training_programs"]["misses"] == 1
+
+
+def test_creating_or_invalidating_the_row_forgets_it():
+    backend = MemoryCache()
+    negative = NegativeCache(backend=backend)
+    for entity_id in ("p1", "p2", "p3"):
+        negative.remember_missing("training_programs", entity_id)
+
+    negative.forget("training_programs", "p1")
+    backend.invalidate_tags(entity_tag("training_programs", "p2"))
+    assert not negative.is_missing("training_programs", "p1")
+    assert not negative.is_missing("training_programs", "p2")
+    assert negative.is_missing("training_programs", "p3")
+
+    backend.invalidate_tags(table_tag("training_programs"))
+    assert not negative.is_missing("training_programs", "p3")
+    assert negative.stats()["kinds"]["training_programs"]["forgotten"] == 1
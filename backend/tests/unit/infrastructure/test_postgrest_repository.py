@@ -0,0 +1,383 @@
+"""
+Unit tests for the async PostgREST client repository
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+import httpx
+import pytest
+
+from src.infrastructure.database.postgrest import (
+    AsyncPostgrestConnection,
+    AsyncPostgrestClientRepository,
+    parse_content_range,
+    quote_filter_value,
+)
+from src.domain.entities.client import Client, ClientId, ClientStatus, ProgramType, ClientSummary
+from src.domain.value_objects import Email
+from src.domain.exceptions import DomainException
+from src.domain.repositories.pagination import PageCursor
+
+
+def make_row(
+    name="John Doe",
+    email="john@example.com",
+    status="active",
+    id="6f1c1b4e-6f7a-4a53-9a55-0a2a3c1c0e01"
+):
+    """Build a raw clients table row"""
+    now = datetime(2025, 1, 1, 12, 0, 0).isoformat()
+    return {
+        "id": id,
+        "name": name,
+        "email": email,
+        "phone": None,
+        "program_type": "PRIME",
+        "status": status,
+        "created_at": now,
+        "updated_at": now,
+        "notes": "",
+        "metadata": {},
+    }
+
+
+def make_repository(handler):
+    """Create a repository backed by an in-process fake PostgREST"""
+    connection = AsyncPostgrestConnection(
+        url="https://test.supabase.co",
+        key="test_key",
+        transport=httpx.MockTransport(handler),
+    )
+    return AsyncPostgrestClientRepository(connection)
+
+
+class TestHelpers:
+    """Test PostgREST helper functions"""
+
+    def test_parse_content_range(self):
+        assert parse_content_range("0-24/3573") == 3573
+        assert parse_content_range("*/12") == 12
+        assert parse_content_range("0-24/*") is None
+        assert parse_content_range(None) is None
+
+    def test_quote_filter_value_escapes_reserved_characters(self):
+        assert quote_filter_value('a,b"(c)') == '"a,b\\"(c)"'
+
+
+class TestAsyncPostgrestClientRepository:
+    """Test AsyncPostgrestClientRepository against a fake PostgREST"""
+
+    @pytest.mark.asyncio
+    async def test_find_by_id_sends_filter_and_maps_entity(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=[make_row()])
+
+        repository = make_repository(handler)
+        client = await repository.find_by_id(ClientId("6f1c1b4e-6f7a-4a53-9a55-0a2a3c1c0e01"))
+
+        assert client.name == "John Doe"
+        assert client.status == ClientStatus.ACTIVE
+        assert requests[0].url.path == "/rest/v1/clients"
+        assert requests[0].url.params["id"] == "in.(6f1c1b4e-6f7a-4a53-9a55-0a2a3c1c0e01)"
+        assert requests[0].headers["apikey"] == "test_key"
+        # Explicit columns keep derived ones (search_vector) off the wire
+        assert requests[0].url.params["select"] == ",".join(make_row())
+
+    @pytest.mark.asyncio
+    async def test_concurrent_find_by_id_is_one_round_trip(self):
+        requests = []
+        ids = [f"6f1c1b4e-6f7a-4a53-9a55-0a2a3c1c0e0{i}" for i in range(3)]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=[make_row(id=ids[0]), make_row(id=ids[1])])
+
+        repository = make_repository(handler)
+        found = await asyncio.gather(*[
+            repository.find_by_id(ClientId(client_id)) for client_id in ids
+        ])
+
+        assert len(requests) == 1
+        assert requests[0].url.params["id"] == f"in.({','.join(ids)})"
+        assert [str(client.id) if client else None for client in found] == [ids[0], ids[1], None]
+
+    @pytest.mark.asyncio
+    async def test_find_by_email_returns_none_when_missing(self):
+        repository = make_repository(lambda request: httpx.Response(200, json=[]))
+
+        assert await repository.find_by_email(Email("nobody@example.com")) is None
+
+    @pytest.mark.asyncio
+    async def test_count_reads_content_range(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.method == "HEAD"
+            assert request.headers["prefer"] == "count=exact"
+            return httpx.Response(200, headers={"content-range": "*/42"})
+
+        repository = make_repository(handler)
+
+        assert await repository.count_by_status(ClientStatus.PAUSED) == 42
+
+    @pytest.mark.asyncio
+    async def test_save_upserts_entity(self):
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            assert "resolution=merge-duplicates" in request.headers["prefer"]
+            return httpx.Response(201, json=[bodies[-1]])
+
+        repository = make_repository(handler)
+        client = Client.create(
+            name="Jane Doe",
+            email=Email("jane@example.com"),
+            program_type=ProgramType.LONGEVITY,
+        )
+
+        await repository.save(client)
+
+        assert bodies[0]["email"] == "jane@example.com"
+        assert bodies[0]["program_type"] == "LONGEVITY"
+
+    @pytest.mark.asyncio
+    async def test_find_page_fetches_one_extra_row_for_next_cursor(self):
+        requests = []
+        rows = [
+            make_row(id=f"6f1c1b4e-6f7a-4a53-9a55-0a2a3c1c0e0{i}") for i in range(3)
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=rows)
+
+        repository = make_repository(handler)
+        page = await repository.find_page(limit=2, status=ClientStatus.ACTIVE)
+
+        params = requests[0].url.params
+        assert params["limit"] == "3"
+        assert params["order"] == "created_at.desc,id.desc"
+        assert params["status"] == "eq.active"
+        assert "or" not in params
+        assert len(page.items) == 2
+        cursor = PageCursor.decode(page.next_cursor)
+        assert cursor.id == rows[1]["id"]
+        assert cursor.sort_value == rows[1]["created_at"]
+
+    @pytest.mark.asyncio
+    async def test_find_page_with_cursor_filters_after_position(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=[make_row()])
+
+        repository = make_repository(handler)
+        token = PageCursor("created_at", "2025-01-01T12:00:00", "abc").encode()
+        page = await repository.find_page(limit=2, cursor=token, query="jo")
+
+        assert requests[0].url.params["or"] == (
+            '(and(or(name.ilike."*jo*",email.ilike."*jo*"),'
+            'or(created_at.lt."2025-01-01T12:00:00",'
+            'and(created_at.eq."2025-01-01T12:00:00",id.lt."abc"))))'
+        )
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_find_summary_page_projects_list_columns(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            row = make_row()
+            return httpx.Response(200, json=[{
+                column: row[column] for column in ClientSummary.COLUMNS.split(",")
+            }])
+
+        repository = make_repository(handler)
+        page = await repository.find_summary_page(limit=5, offset=10)
+
+        params = requests[0].url.params
+        assert params["select"] == ClientSummary.COLUMNS
+        assert params["offset"] == "10"
+        assert page.items[0] == ClientSummary(
+            id="6f1c1b4e-6f7a-4a53-9a55-0a2a3c1c0e01",
+            name="John Doe",
+            status=ClientStatus.ACTIVE,
+            program_type=ProgramType.PRIME,
+            created_at=datetime(2025, 1, 1, 12, 0, 0),
+            updated_at=datetime(2025, 1, 1, 12, 0, 0)
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_page_rejects_invalid_cursor(self):
+        repository = make_repository(lambda request: httpx.Response(200, json=[]))
+
+        with pytest.raises(DomainException) as exc_info:
+            await repository.find_page(cursor="garbage")
+
+        assert exc_info.value.error_code == "INVALID_CURSOR"
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises_domain_exception(self):
+        repository = make_repository(
+            lambda request: httpx.Response(500, json={"message": "boom"})
+        )
+
+        with pytest.raises(DomainException):
+            await repository.find_all(limit=10)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_overlap(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return httpx.Response(200, json=[make_row()])
+
+        repository = make_repository(handler)
+
+        # Distinct queries (identical ones would be coalesced into one)
+        await asyncio.gather(*[
+            repository.find_by_status(ClientStatus.ACTIVE, limit=limit) for limit in range(1, 6)
+        ])
+
+        assert max_in_flight == 5
+
+    @pytest.mark.asyncio
+    async def test_analytics_uses_grouped_count_rpc(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=[
+                {"status": "active", "program_type": "PRIME", "client_count": 3},
+                {"status": "paused", "program_type": "LONGEVITY", "client_count": 1},
+            ])
+
+        repository = make_repository(handler)
+        analytics = await repository.get_analytics_data(program_type=ProgramType.PRIME)
+
+        assert len(requests) == 1
+        assert requests[0].url.path == "/rest/v1/rpc/get_client_analytics_counts"
+        assert json.loads(requests[0].content)["program_type_filter"] == "PRIME"
+        assert analytics["total_clients"] == 4
+        assert analytics["active_rate"] == 75.0
+        assert analytics["status_distribution"] == {"active": 3, "paused": 1}
+        assert analytics["aggregation"] == "rpc"
+
+    @pytest.mark.asyncio
+    async def test_analytics_falls_back_to_projected_pages(self):
+        requests = []
+        rows = [
+            make_row(id=f"6f1c1b4e-6f7a-4a53-9a55-0a2a3c1c0e0{i}", status=status)
+            for i, status in enumerate(["active", "active", "inactive"])
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path.endswith("/rpc/get_client_analytics_counts"):
+                return httpx.Response(404, json={"message": "function not found"})
+            start = 2 if "or" in request.url.params else 0
+            return httpx.Response(200, json=rows[start:start + int(request.url.params["limit"])])
+
+        repository = make_repository(handler)
+        counts = await repository._tally_pages(None, None, None, page_size=2)
+
+        assert len(requests) == 2
+        assert requests[0].url.params["select"] == "id,created_at,status,program_type"
+        assert requests[0].url.params["limit"] == "3"
+        assert 'id.lt."6f1c1b4e-6f7a-4a53-9a55-0a2a3c1c0e01"' in requests[1].url.params["or"]
+        assert counts == {("active", "PRIME"): 2, ("inactive", "PRIME"): 1}
+
+        analytics = await repository.get_analytics_data()
+        assert analytics["aggregation"] == "paged"
+        assert analytics["total_clients"] == 3
+
+    @pytest.mark.asyncio
+    async def test_analytics_does_not_scan_when_the_rpc_fails(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(503, json={"message": "upstream unavailable"})
+
+        repository = make_repository(handler)
+        with pytest.raises(DomainException, match="503"):
+            await repository.get_analytics_data()
+
+        assert [request.url.path for request in requests] == ["/rest/v1/rpc/get_client_analytics_counts"]
+
+    @pytest.mark.asyncio
+    async def test_search_reads_rows_and_count_in_one_request(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200, json=[make_row()], headers={"content-range": "0-0/57"}
+            )
+
+        repository = make_repository(handler)
+        result = await repository.search_with_filters(
+            query="jo", limit=10, offset=0, count_mode="planned"
+        )
+
+        assert len(requests) == 1
+        assert requests[0].method == "GET"
+        assert requests[0].headers["prefer"] == "count=planned"
+        assert result["total_count"] == 57
+        assert result["has_more"] is False
+
+    @pytest.mark.asyncio
+    async def test_search_without_count_uses_extra_row_for_has_more(self):
+        requests = []
+        rows = [
+            make_row(id=f"6f1c1b4e-6f7a-4a53-9a55-0a2a3c1c0e0{i}") for i in range(3)
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=rows)
+
+        repository = make_repository(handler)
+        result = await repository.search_with_filters(limit=2, offset=4, count_mode="none")
+
+        assert len(requests) == 1
+        assert "prefer" not in requests[0].headers
+        assert requests[0].url.params["limit"] == "3"
+        assert requests[0].url.params["offset"] == "4"
+        assert result["total_count"] is None
+        assert result["has_more"] is True
+        assert len(result["clients"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_search_rejects_unknown_count_mode(self):
+        repository = make_repository(lambda request: httpx.Response(200, json=[]))
+
+        with pytest.raises(DomainException) as exc_info:
+            await repository.search_with_filters(count_mode="approximate")
+
+        assert exc_info.value.error_code == "INVALID_COUNT_MODE"
+
+    @pytest.mark.asyncio
+    async def test_fulltext_search_uses_search_vector(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=[make_row()])
+
+        repository = make_repository(handler)
+        await repository.find_page(limit=5, query='john "doe', search_mode="fulltext")
+
+        assert requests[0].url.params["or"] == '(search_vector.wfts(simple)."john \\"doe")'
@@ -0,0 +1,152 @@
+"""
+Unit tests for the in-process client prefix index
+"""
+
+import asyncio
+
+import pytest
+
+from src.domain.entities.client import Client, ProgramType
+from src.domain.repositories.pagination import Page
+from src.domain.value_objects import Email
+from src.infrastructure.search.prefix_index import ClientPrefixIndex, fold
+
+
+def make_client(name, email, program_type=ProgramType.PRIME):
+    """Create a client entity"""
+    return Client.create(name=name, email=Email(email), program_type=program_type)
+
+
+class FakeRepository:
+    """Repository serving find_page/find_by_ids from a dict"""
+
+    def __init__(self, clients, page_size=2):
+        self.clients = {str(client.id): client for client in clients}
+        self.page_size = page_size
+        self.page_calls = 0
+        self.id_calls = 0
+        self.paused = None
+
+    async def find_page(self, limit=20, cursor=None, count_mode="none", **kwargs):
+        self.page_calls += 1
+        if self.paused is not None:
+            await self.paused.wait()
+        items = list(self.clients.values())
+        start = int(cursor or 0)
+        end = start + min(limit, self.page_size)
+        return Page(items=items[start:end], next_cursor=str(end) if end < len(items) else None)
+
+    async def find_by_ids(self, client_ids):
+        self.id_calls += 1
+        return [self.clients[str(i)] for i in client_ids if str(i) in self.clients]
+
+
+@pytest.fixture
+def clients():
+    return [
+        make_client("José García", "jose.garcia@example.com"),
+        make_client("Josefina Ruiz", "fina@example.com", ProgramType.LONGEVITY),
+        make_client("Ana Joseph", "ana@example.com"),
+    ]
+
+
+class TestFold:
+    """Test accent and case folding"""
+
+    def test_fold_strips_accents_and_case(self):
+        assert fold("JOSÉ Muñoz") == "jose munoz"
+
+
+class TestClientPrefixIndex:
+    """Test ClientPrefixIndex lookups and maintenance"""
+
+    @pytest.mark.asyncio
+    async def test_builds_lazily_across_pages(self, clients):
+        repository = FakeRepository(clients)
+        index = ClientPrefixIndex(repository)
+
+        assert len(index) == 0
+        await index.search("jo")
+
+        assert len(index) == 3
+        assert repository.page_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_prefix_match_is_accent_insensitive(self, clients):
+        index = ClientPrefixIndex(FakeRepository(clients))
+
+        names = [summary.name for summary in await index.search("jose")]
+
+        # Full-name prefix matches rank before later-word matches
+        assert names == ["José García", "Josefina Ruiz", "Ana Joseph"]
+
+    @pytest.mark.asyncio
+    async def test_every_query_word_must_match(self, clients):
+        index = ClientPrefixIndex(FakeRepository(clients))
+
+        names = [summary.name for summary in await index.search("jos gar")]
+
+        assert names == ["José García"]
+
+    @pytest.mark.asyncio
+    async def test_matches_email_prefix_and_filters(self, clients):
+        index = ClientPrefixIndex(FakeRepository(clients))
+
+        assert [s.name for s in await index.search("fina@ex")] == ["Josefina Ruiz"]
+        assert [s.name for s in await index.search("garcia")] == ["José García"]
+        longevity = await index.search("jos", program_type=ProgramType.LONGEVITY)
+        assert [s.name for s in longevity] == ["Josefina Ruiz"]
+
+    @pytest.mark.asyncio
+    async def test_events_update_index_incrementally(self, clients):
+        repository = FakeRepository(clients)
+        index = ClientPrefixIndex(repository)
+        await index.search("x")
+
+        renamed = clients[0]
+        renamed.name = "Pedro García"
+        created = make_client("Zoë Adams", "zoe@example.com")
+        repository.clients[str(created.id)] = created
+
+        await index.handle_event({"event_type": "ClientUpdated", "client_id": str(renamed.id)})
+        await index.handle_event({"event_type": "ClientCreated", "client_id": str(created.id)})
+        await index.handle_event({"event_type": "ClientDeleted", "client_id": str(clients[2].id)})
+
+        # The renamed client still matches through its email
+        assert [s.name for s in await index.search("jose")] == ["Josefina Ruiz", "Pedro García"]
+        assert [s.name for s in await index.search("ped")] == ["Pedro García"]
+        assert [s.name for s in await index.search("zoe")] == ["Zoë Adams"]
+        assert repository.page_calls == 2
+        assert index.stats()["clients"] == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_events_reload_in_batches(self, clients):
+        repository = FakeRepository(clients)
+        index = ClientPrefixIndex(repository, page_size=4)
+        await index.search("x")
+
+        created = [make_client(f"Bulk {n}", f"bulk{n}@example.com") for n in range(10)]
+        repository.clients.update((str(client.id), client) for client in created)
+        for client in created:
+            await index.handle_event({"event_type": "ClientCreated", "client_id": str(client.id)})
+
+        assert len(await index.search("bulk", limit=20)) == 10
+        assert repository.id_calls == 3
+
+    @pytest.mark.asyncio
+    async def test_stale_index_answers_while_rebuilding(self, clients):
+        repository = FakeRepository(clients)
+        index = ClientPrefixIndex(repository, max_age=0)
+        await index.search("x")
+
+        repository.clients.pop(str(clients[0].id))
+        repository.paused = asyncio.Event()
+
+        # Served from the old index; the rebuild waits on the repository
+        assert [s.name for s in await index.search("jose")][0] == "José García"
+        await asyncio.sleep(0)
+        assert repository.page_calls == 3 and not index._build.done()
+
+        repository.paused.set()
+        await index._build
+        assert "José García" not in [s.name for s in await index.search("jose")]
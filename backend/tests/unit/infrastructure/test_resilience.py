@@ -0,0 +1,161 @@
+"""
+Unit tests for hedged reads, retries and circuit breaking
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.infrastructure.database.postgrest import AsyncPostgrestConnection, is_transient_error
+from src.infrastructure.database.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResiliencePolicy,
+    RetryPolicy,
+)
+from src.domain.exceptions import DomainException
+
+
+def make_connection(handler, **policy_options):
+    """Connection to an in-process fake PostgREST; async handlers can inject latency"""
+    options = {"retry": RetryPolicy(max_attempts=1), "hedging": False, **policy_options}
+    return AsyncPostgrestConnection(
+        url="https://test.supabase.co",
+        key="test_key",
+        transport=httpx.MockTransport(handler),
+        resilience=ResiliencePolicy("postgrest", is_transient_error, **options),
+    )
+
+
+async def read(connection):
+    return await connection.request("GET", "/clients", params=[("select", "id")])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state transitions"""
+
+    def test_opens_after_consecutive_failures_and_probes_once(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=10, clock=clock)
+
+        breaker.before_call()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.retry_after == 10
+
+        clock.now = 10
+        assert breaker.before_call() is True
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_failure()
+        clock.now = 15
+        assert breaker.state == CircuitBreaker.OPEN
+
+        clock.now = 20
+        breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+class TestResiliencePolicy:
+    """Test the policy against a fake PostgREST"""
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast_without_a_request(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(503, json={"message": "unavailable"})
+
+        connection = make_connection(handler, failure_threshold=2, reset_timeout=0.05)
+
+        for _ in range(2):
+            with pytest.raises(DomainException):
+                await read(connection)
+        with pytest.raises(CircuitOpenError):
+            await read(connection)
+        assert len(requests) == 2
+
+        # After the reset timeout one probe reaches the server; it fails again
+        await asyncio.sleep(0.06)
+        with pytest.raises(DomainException) as exc_info:
+            await read(connection)
+        assert exc_info.value.error_code == "POSTGREST_ERROR"
+        assert connection.resilience.breaker("clients").state == CircuitBreaker.OPEN
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_the_circuit(self):
+        connection = make_connection(
+            lambda request: httpx.Response(400, json={"message": "bad filter"}),
+            failure_threshold=1,
+            retry=RetryPolicy(max_attempts=3, base_delay=0)
+        )
+
+        for _ in range(3):
+            with pytest.raises(DomainException):
+                await read(connection)
+
+        assert connection.resilience.breaker("clients").state == CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_transient_reads_are_retried_but_writes_are_not(self):
+        calls = {"GET": 0, "POST": 0}
+
+        def handler(request):
+            calls[request.method] += 1
+            if calls[request.method] == 1:
+                return httpx.Response(503, json={"message": "unavailable"})
+            return httpx.Response(200, json=[])
+
+        connection = make_connection(handler, retry=RetryPolicy(max_attempts=3, base_delay=0))
+
+        response = await read(connection)
+        with pytest.raises(DomainException):
+            await connection.request("POST", "/clients", json={})
+
+        assert response.status_code == 200
+        assert calls == {"GET": 2, "POST": 1}
+
+    @pytest.mark.asyncio
+    async def test_slow_read_is_hedged_after_p95(self):
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            # The 6th request stalls; everything else answers in ~5ms
+            await asyncio.sleep(2.0 if len(requests) == 6 else 0.005)
+            return httpx.Response(200, json=[{"id": len(requests)}])
+
+        connection = make_connection(
+            handler, hedging=True, hedge_min_samples=5, hedge_max_ratio=1.0
+        )
+        for _ in range(5):
+            await read(connection)
+        assert connection.resilience.hedge_delay("clients") is not None
+
+        started = time.monotonic()
+        response = await read(connection)
+
+        assert time.monotonic() - started < 1.0
+        assert response.json() == [{"id": 7}]
+        assert len(requests) == 7
+        assert connection.resilience.stats()["hedges"] == 1
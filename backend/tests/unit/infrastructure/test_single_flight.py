@@ -0,0 +1,194 @@
+"""
+Unit tests for single-flight coalescing of in-flight reads
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.deadline import current_deadline, deadline_scope
+from src.domain.entities.client import Client, ProgramType
+from src.domain.value_objects import Email
+from src.infrastructure.database.optimized_repository import OptimizedClientRepository
+from src.infrastructure.database.performance import (
+    ConnectionPool,
+    SingleFlight,
+    performance_monitor,
+    with_performance_monitoring,
+)
+
+
+class FakeRepository:
+    """Repository whose reads block until released"""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.error = None
+
+    @with_performance_monitoring("sf_test", "dashboard")
+    async def get_dashboard_metrics(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return {"total_clients": 3}
+
+    @with_performance_monitoring("sf_test", "save")
+    async def save(self, value):
+        self.calls += 1
+        await self.release.wait()
+
+
+class FakeQuery:
+    """Supabase query builder answering every query with no rows"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        return SimpleNamespace(data=[], count=0)
+
+
+class TestSingleFlight:
+    """Test SingleFlight"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*[flight.do("key", work) for _ in range(5)])
+
+        assert calls == 1
+        assert [result for result, _ in results] == ["result"] * 5
+        assert [coalesced for _, coalesced in results] == [False, True, True, True, True]
+        assert flight.stats() == {"calls": 5, "coalesced": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_joined_callers_get_their_own_client(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            return Client.create(name="Ana", email=Email("ana@example.com"), program_type=ProgramType.PRIME)
+
+        (first, _), (second, _) = await asyncio.gather(flight.do("key", work), flight.do("key", work))
+
+        assert first is not second
+        first.name = "Changed"
+        assert second.name == "Ana"
+
+    @pytest.mark.asyncio
+    async def test_shared_call_runs_outside_the_leaders_deadline(self):
+        flight = SingleFlight()
+
+        async def work():
+            return current_deadline()
+
+        with deadline_scope(5.0):
+            result, _ = await flight.do("key", work)
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_shared_call_keeps_the_pooled_connection_it_was_started_with(self):
+        connection = SimpleNamespace(client=SimpleNamespace(table=lambda name: FakeQuery()))
+        pool = ConnectionPool(
+            max_connections=1, connection_timeout=0.2, connection_factory=lambda: connection, name="sf_test"
+        )
+        repository = OptimizedClientRepository(connection=connection, pool=pool)
+
+        # Holds the only connection, then pages through single-flight
+        result = await repository.search_with_filters(query="ana", offset=None)
+
+        assert result["clients"] == []
+        assert pool.stats()["active_connections"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_fail_followers(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "result"
+
+        leader = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == ("result", True)
+
+    @pytest.mark.asyncio
+    async def test_call_is_cancelled_when_every_caller_is_gone(self):
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.create_task(flight.do("key", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        callers[0].cancel()
+        await asyncio.sleep(0)
+        assert not cancelled.is_set()
+
+        callers[1].cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        await asyncio.sleep(0)
+        assert flight.in_flight() == 0
+
+
+class TestWithPerformanceMonitoringCoalescing:
+    """Test coalescing through the monitoring decorator"""
+
+    @pytest.mark.asyncio
+    async def test_stampede_runs_query_once(self):
+        repository = FakeRepository()
+
+        tasks = [asyncio.create_task(repository.get_dashboard_metrics()) for _ in range(10)]
+        await asyncio.sleep(0)
+        repository.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert repository.calls == 1
+        assert results == [{"total_clients": 3}] * 10
+        recent = [m for m in performance_monitor._metrics if m.table_name == "sf_test"][-10:]
+        assert sum(1 for m in recent if m.coalesced) == 9
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        repository = FakeRepository()
+        repository.error = RuntimeError("db down")
+
+        tasks = [asyncio.create_task(repository.get_dashboard_metrics()) for _ in range(3)]
+        await asyncio.sleep(0)
+        repository.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert repository.calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_writes_are_not_coalesced(self):
+        repository = FakeRepository()
+
+        tasks = [asyncio.create_task(repository.save("x")) for _ in range(3)]
+        await asyncio.sleep(0)
+        repository.release.set()
+        await asyncio.gather(*tasks)
+
+        assert repository.calls == 3
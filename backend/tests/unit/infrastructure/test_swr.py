@@ -0,0 +1,92 @@
+"""
+Unit tests for stale-while-revalidate serving
+"""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.cache import MemoryCache, StaleWhileRevalidate
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Counter:
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("backend down")
+        return {"version": self.calls}
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def policy(clock):
+    return StaleWhileRevalidate("dash", fresh_for=30, max_age=600, backend=MemoryCache(clock=clock), clock=clock)
+
+
+class TestStaleWhileRevalidate:
+    """Test StaleWhileRevalidate"""
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit_then_stale_with_one_refresh(self, policy, clock):
+        compute = Counter()
+
+        first = await policy.get("k", compute)
+        clock.now += 10
+        second = await policy.get("k", compute)
+
+        assert (first.status, second.status) == ("MISS", "HIT")
+        assert second.age == 10
+        assert second.headers == {"X-Cache": "HIT", "Age": "10"}
+
+        clock.now += 60
+        stale = await asyncio.gather(policy.get("k", compute), policy.get("k", compute))
+        assert [result.status for result in stale] == ["STALE", "STALE"]
+        assert stale[0].value == {"version": 1}
+
+        await asyncio.sleep(0.01)
+        refreshed = await policy.get("k", compute)
+        assert compute.calls == 2
+        assert (refreshed.status, refreshed.value) == ("HIT", {"version": 2})
+        assert policy.stats()["refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_values_past_max_age_are_recomputed_while_the_caller_waits(self, policy, clock):
+        compute = Counter()
+        await policy.get("k", compute)
+        clock.now += 601
+
+        results = await asyncio.gather(policy.get("k", compute), policy.get("k", compute))
+
+        assert [result.status for result in results] == ["MISS", "MISS"]
+        assert compute.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_serving_stale(self, policy, clock):
+        await policy.get("k", Counter())
+        clock.now += 60
+
+        failing = Counter(fail=True)
+        assert (await policy.get("k", failing)).status == "STALE"
+        await asyncio.sleep(0.01)
+
+        result = await policy.get("k", failing)
+        await asyncio.sleep(0.01)
+        assert (result.status, result.value) == ("STALE", {"version": 1})
+        assert policy.stats()["refresh_failures"] == 2
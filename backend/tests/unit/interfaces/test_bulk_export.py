@@ -0,0 +1,121 @@
+"""
+Unit tests for the streaming bulk export endpoint
+"""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.application.use_cases.client import ExportClientsUseCase
+from src.domain.entities import ClientRecord, ClientStatus, ProgramType
+from src.domain.repositories.pagination import Page
+from src.interfaces.api import optimized_clients
+from src.interfaces.dependencies import get_container
+
+
+def make_record(index):
+    created_at = datetime(2024, 1, 1) + timedelta(minutes=index)
+    return ClientRecord(
+        id=f"client-{index}",
+        name=f"Client {index}",
+        email=f"client{index}@example.com",
+        program_type=ProgramType.PRIME,
+        status=ClientStatus.ACTIVE if index % 2 else ClientStatus.TRIAL,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+class FakeRepository:
+    """Serves find_record_page from a list, recording each page request"""
+
+    def __init__(self, records):
+        self.records = records
+        self.limits = []
+
+    async def find_record_page(self, limit=20, cursor=None, status=None, **kwargs):
+        self.limits.append(limit)
+        items = [r for r in self.records if status is None or r.status == status]
+        start = int(cursor or 0)
+        end = start + limit
+        return Page(items=items[start:end], next_cursor=str(end) if end < len(items) else None)
+
+
+class FakeLogger:
+    def info(self, message, **kwargs):
+        pass
+
+
+class FakeContainer:
+    def __init__(self, repository):
+        self.repository = repository
+
+    def export_clients_use_case(self):
+        return ExportClientsUseCase(self.repository, FakeLogger(), page_size=2)
+
+
+@pytest.fixture
+def repository():
+    return FakeRepository([make_record(i) for i in range(5)])
+
+
+@pytest.fixture
+def client(repository):
+    app = FastAPI()
+    app.include_router(optimized_clients.router, prefix="/api/v1/optimized")
+    app.dependency_overrides[get_container] = lambda: FakeContainer(repository)
+    return TestClient(app)
+
+
+class TestBulkExport:
+    """Test GET /clients/bulk-export"""
+
+    def test_csv_streams_every_page(self, client, repository):
+        response = client.get("/api/v1/optimized/clients/bulk-export", params={"format": "csv"})
+
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert response.headers["content-type"].startswith("text/csv")
+        assert rows[0][:3] == ["ID", "Name", "Email"]
+        assert [row[0] for row in rows[1:]] == [f"client-{i}" for i in range(5)]
+        assert repository.limits == [2, 2, 2]
+
+    def test_ndjson_with_filter(self, client):
+        response = client.get(
+            "/api/v1/optimized/clients/bulk-export",
+            params={"format": "ndjson", "status": "active"}
+        )
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["id"] for line in lines] == ["client-1", "client-3"]
+        assert lines[0]["status"] == "active"
+
+    def test_json_keeps_envelope(self, client):
+        response = client.get("/api/v1/optimized/clients/bulk-export")
+
+        body = response.json()
+        assert body["status"] == "success"
+        assert body["data"]["total_records"] == 5
+        assert len(body["data"]["clients"]) == 5
+
+    def test_gzip_compresses_on_the_fly(self, client):
+        response = client.get(
+            "/api/v1/optimized/clients/bulk-export", params={"format": "ndjson", "gzip": "true"}
+        )
+
+        assert response.headers["content-type"] == "application/gzip"
+        assert "clients-export.ndjson.gz" in response.headers["content-disposition"]
+        lines = gzip.decompress(response.content).decode().splitlines()
+        assert len(lines) == 5
+
+    def test_empty_export(self, client):
+        response = client.get(
+            "/api/v1/optimized/clients/bulk-export", params={"format": "json", "status": "paused"}
+        )
+
+        assert response.json()["data"]["clients"] == []
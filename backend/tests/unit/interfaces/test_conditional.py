@@ -0,0 +1,91 @@
+"""
+Unit tests for conditional GET (ETag / 304) support
+"""
+
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.infrastructure.cache import MemoryCache, ResourceVersions, etag_matches, hashed_json
+from src.infrastructure.cache import conditional
+from src.interfaces.api.conditional import conditional_get
+
+
+def test_etag_matching_follows_if_none_match_rules():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"a"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"a"')
+
+
+def test_middleware_hashes_client_reads_and_answers_304():
+    app = FastAPI()
+    app.middleware("http")(conditional_get)
+    reads = []
+
+    @app.get("/api/v1/clients/{client_id}")
+    async def get_client(client_id: str):
+        reads.append(client_id)
+        return {"id": client_id, "name": "Ana"}
+
+    @app.get("/other")
+    async def other():
+        return {"ok": True}
+
+    client = TestClient(app)
+    first = client.get("/api/v1/clients/c1")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    repeat = client.get("/api/v1/clients/c1", headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["etag"] == etag
+
+    assert client.get("/api/v1/clients/c2", headers={"If-None-Match": etag}).status_code == 200
+    assert "etag" not in client.get("/other").headers
+
+
+def test_versioned_route_skips_the_endpoint_until_bumped(monkeypatch):
+    versions = ResourceVersions(backend=MemoryCache())
+    monkeypatch.setattr(conditional, "resource_versions", versions)
+    app = FastAPI()
+    calls = []
+
+    @app.get("/catalog", dependencies=[Depends(conditional.versioned("catalog"))])
+    def catalog(category: str = "all"):
+        calls.append(category)
+        return {"items": [category]}
+
+    client = TestClient(app)
+    etag = client.get("/catalog").headers["etag"]
+
+    assert client.get("/catalog", headers={"If-None-Match": etag}).status_code == 304
+    assert calls == ["all"]
+    # Another query is another representation
+    assert client.get("/catalog?category=legs", headers={"If-None-Match": etag}).status_code == 200
+
+    versions.bump("catalog")
+    refreshed = client.get("/catalog", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert calls == ["all", "legs", "all"]
+
+
+def test_hashed_json_changes_its_etag_only_with_the_body():
+    app = FastAPI()
+    rows = [{"id": "p1"}]
+
+    @app.get("/templates")
+    def templates(request: Request):
+        return hashed_json(request, {"programs": rows})
+
+    client = TestClient(app)
+    first = client.get("/templates")
+    etag = first.headers["etag"]
+    assert first.json() == {"programs": [{"id": "p1"}]}
+    assert client.get("/templates", headers={"If-None-Match": etag}).status_code == 304
+
+    rows.append({"id": "p2"})
+    changed = client.get("/templates", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
@@ -0,0 +1,66 @@
+"""
+Unit tests for the request deadline middleware
+"""
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.database.performance import performance_monitor, with_performance_monitoring
+from src.interfaces.api.deadlines import enforce_request_deadline, request_budget
+
+
+@with_performance_monitoring("clients", "deadline_probe")
+async def slow_lookup(delay: float) -> str:
+    await asyncio.sleep(delay)
+    return "done"
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.middleware("http")(enforce_request_deadline)
+
+    @app.get("/lookup/{delay}")
+    async def lookup(delay: float):
+        try:
+            await slow_lookup(0)
+            return {"result": await slow_lookup(delay)}
+        except Exception as e:
+            # Endpoints often turn every error into their own response
+            return {"error": str(e)}
+
+    return app
+
+
+class TestRequestDeadline:
+    """Test the deadline middleware"""
+
+    def test_request_budget_header_only_shortens(self):
+        assert request_budget("/api/v1/clients", None) == 30
+        assert request_budget("/api/v1/clients", "2.5") == 2.5
+        assert request_budget("/api/v1/clients", "120") == 30
+        assert request_budget("/api/v1/clients", "soon") == 30
+        assert request_budget("/api/v1/mcp/clients/search", None) == 15
+        assert request_budget("/api/v1/optimized/bulk-export", "1") is None
+
+    def test_fast_request_is_untouched(self):
+        client = TestClient(make_app())
+
+        response = client.get("/lookup/0", headers={"X-Request-Timeout": "1"})
+
+        assert response.status_code == 200
+        assert response.json() == {"result": "done"}
+
+    def test_slow_request_returns_504_with_partial_work(self):
+        client = TestClient(make_app())
+
+        response = client.get("/lookup/5", headers={"X-Request-Timeout": "0.05"})
+
+        assert response.status_code == 504
+        body = response.json()
+        assert body["error_code"] == "DEADLINE_EXCEEDED"
+        assert body["details"]["route"] == "/lookup/{delay}"
+        assert body["details"]["exceeded_at"] == "clients.deadline_probe"
+        assert body["details"]["completed_calls"] == 1
+        assert performance_monitor.deadline_stats()["/lookup/{delay}"]["exceeded"] >= 1
@@ -0,0 +1,64 @@
+"""
+Unit tests for the orjson-backed response layer
+"""
+
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import List
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict
+
+from src.domain.entities import ClientStatus
+from src.interfaces.api.responses import FastJSONResponse, dump_list, json_response
+
+
+class Report(BaseModel):
+    """Model with json_encoders, like ExecutiveResponse"""
+
+    model_config = ConfigDict(json_encoders={Decimal: lambda v: float(v)})
+
+    total: Decimal
+    generated_at: datetime
+    tags: List[str]
+
+
+def default_body(content):
+    """What FastAPI renders for a returned value without this layer"""
+    return json.loads(JSONResponse(jsonable_encoder(content)).body)
+
+
+class TestFastJSONResponse:
+    """Test FastJSONResponse output matches the default encoder"""
+
+    def test_matches_default_encoding(self):
+        content = {
+            "id": uuid4(),
+            "status": ClientStatus.ACTIVE,
+            "created_at": datetime(2024, 5, 1, 10, 0, 0, 123456, tzinfo=timezone.utc),
+            "day": date(2024, 5, 1),
+            "amount": Decimal("12.50"),
+            "nested": [{"when": datetime(2024, 5, 1)}],
+        }
+
+        assert json.loads(FastJSONResponse(content).body) == default_body(content)
+
+    def test_models_use_their_json_encoders(self):
+        report = Report(total=Decimal("99.90"), generated_at=datetime(2024, 5, 1), tags=["a"])
+        content = {"report": report, "counts": {ClientStatus.PAUSED: 2}}
+
+        body = json.loads(json_response(content).body)
+
+        assert body["report"] == {"total": 99.9, "generated_at": "2024-05-01T00:00:00", "tags": ["a"]}
+        assert body["counts"] == {"paused": 2}
+
+    def test_dump_list_matches_per_model_dump(self):
+        reports = [
+            Report(total=Decimal(i), generated_at=datetime(2024, 5, i + 1), tags=[])
+            for i in range(3)
+        ]
+
+        assert dump_list(Report, reports) == [r.model_dump(mode="json") for r in reports]
@@ -0,0 +1,85 @@
+"""
+Unit tests for the process-wide Supabase client registry
+"""
+
+import pytest
+
+from app.apis.supabase_client import SupabaseClientRegistry
+
+
+class FakeSecrets:
+    """Mutable secrets store to simulate rotations"""
+
+    def __init__(self, **values):
+        self.values = values
+        self.reads = 0
+
+    def get(self, name):
+        self.reads += 1
+        return self.values.get(name)
+
+
+@pytest.fixture
+def secrets():
+    return FakeSecrets(
+        SUPABASE_URL="https://test.supabase.co",
+        SUPABASE_SERVICE_KEY="service-1",
+        SUPABASE_ANON_KEY="anon-1",
+    )
+
+
+@pytest.fixture
+def registry(secrets):
+    return SupabaseClientRegistry(
+        secrets_refresh_interval=60,
+        client_factory=lambda url, key: object(),
+        secrets_reader=secrets.get,
+    )
+
+
+def test_client_is_created_lazily_and_reused(registry, secrets):
+    assert registry.stats()["pool_size"] == 0
+
+    first = registry.get_client("service")
+    second = registry.get_client("service")
+
+    assert first is second
+    assert secrets.reads == 2  # url + key, read once
+    stats = registry.stats()
+    assert stats["clients_created"] == 1
+    assert stats["acquisitions"] == 2
+
+
+def test_roles_get_separate_clients(registry):
+    assert registry.get_client("service") is not registry.get_client("anon")
+    assert registry.stats()["pool_size"] == 2
+
+
+def test_rotated_key_rebuilds_client_after_refresh(registry, secrets):
+    original = registry.get_client("service")
+
+    secrets.values["SUPABASE_SERVICE_KEY"] = "service-2"
+    assert registry.get_client("service") is original  # still inside refresh interval
+
+    registry.refresh("service")
+    rotated = registry.get_client("service")
+
+    assert rotated is not original
+    stats = registry.stats()
+    assert stats["clients_refreshed"] == 1
+    assert stats["pool_size"] == 1
+
+
+def test_missing_credentials_raise(secrets):
+    secrets.values.pop("SUPABASE_ANON_KEY")
+    registry = SupabaseClientRegistry(
+        client_factory=lambda url, key: object(),
+        secrets_reader=secrets.get,
+    )
+
+    with pytest.raises(ValueError):
+        registry.get_client("anon")
+
+
+def test_http_session_is_shared(registry):
+    assert registry.get_http_session() is registry.get_http_session()